@@ -0,0 +1,303 @@
+"""Замеры скорости горячих путей: решатель, база расчетов, меню и графики.
+
+    python benchmarks.py                      # все замеры, таблица в stdout
+    python benchmarks.py --quick --out a.json # без базы на 100k записей
+    python benchmarks.py --compare a.json     # сравнение с прошлым прогоном
+
+Wolfram Kernel не нужен: данные для базы, меню и графиков считает
+встроенный решатель. Входные данные фиксированы (seed), каждый замер —
+лучшее время из нескольких повторов, а в JSON вместе с результатами
+пишутся коммит и версии библиотек, так что прогоны разных коммитов можно
+сравнивать между собой (--compare).
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from core import jit
+from core.models import MODELS
+from core.native_solver import ensemble_problem, integrate, solve_model
+
+GROUPS = ("solver", "ensemble", "db", "menu", "plots")
+
+# Членов ансамбля в замере пропускной способности
+ENSEMBLE_MEMBERS = 256
+# Размеры базы: все и для --quick (база на 100k записей заполняется десятки секунд)
+DB_SIZES = (10, 1000, 100000)
+QUICK_DB_SIZES = (10, 1000)
+MENU_SIZES = (10, 1000)
+# Точек в рядах данных записей базы: иначе 100k записей не помещаются в память
+DB_POINTS = 20
+# Разница со сравниваемым прогоном, которая считается изменением, а не шумом:
+# относительная и (для коротких замеров) абсолютная, с
+THRESHOLD = 0.25
+MIN_DELTA = 0.002
+
+# Данные, которых нет в записи модели (подбор, сценарии, ансамбли): график без них пропускается
+OPTIONAL_DATA = ("fit", "scenarios", "stochastic")
+
+
+def best_time(fn, repeat=3):
+    """Лучшее из repeat время вызова fn(), с"""
+    best = np.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def environment():
+    """Коммит и окружение прогона"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "commit": commit or None,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": jit.AVAILABLE,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+# ---------- Данные ----------
+
+def model_record(model, points=None, timestamp=None):
+    """Запись БД расчета модели с параметрами по умолчанию (points — обрезать ряды)"""
+    spec = MODELS[model]
+    values = list(spec.defaults.values())
+    # Те же поля, что пишет вкладка: события и поля только вкладки (летальность SEIR)
+    events = []
+    record = spec.record(values, solve_model(model, values, on_event=events.append), events)
+    if points is not None:
+        for key in ("t_data",) + tuple(key for key, _, _ in spec.columns):
+            record[key] = record[key][:points]
+    return {'id': str(uuid.uuid4()), 'model_name': spec.title,
+            'timestamp': (timestamp or datetime.now()).isoformat(), **record}
+
+
+def sweep_record():
+    """Запись параметрического анализа: сетка 20×20 для Лотки-Вольтерры"""
+    from core.sweep import METRICS, grid_samples, run_sweep
+    spec = MODELS["lotka"]
+    base = spec.defaults
+    ranges = {"alpha": (0.05, 0.15), "beta": (0.01, 0.03)}
+    samples = grid_samples(ranges, 20)
+    metrics = run_sweep("lotka", base, samples)
+    return {'id': str(uuid.uuid4()), 'model_name': 'Параметрический анализ',
+            'timestamp': datetime.now().isoformat(), 'sweep_model': 'lotka', 'sweep_title': spec.title,
+            'method': 'grid', 'n': 20, 'base': base, 'axes': list(ranges),
+            'samples': {name: values.tolist() for name, values in samples.items()},
+            'metrics': {key: values.tolist() for key, values in metrics.items()},
+            'metric': next(iter(METRICS["lotka"]))}
+
+
+def synthetic_records(n):
+    """n записей всех моделей по кругу с разным временем (ряды по DB_POINTS точек)"""
+    templates = [model_record(model, DB_POINTS) for model in MODELS]
+    start = datetime(2024, 1, 1)
+    records = []
+    for i in range(n):
+        record = dict(templates[i % len(templates)])
+        record['id'] = str(uuid.UUID(int=i))
+        record['timestamp'] = (start + timedelta(minutes=i)).isoformat()
+        records.append(record)
+    return records
+
+
+class TempDatabase:
+    """Временная база на n записей вместо config.db на время замера"""
+
+    def __init__(self, n):
+        self.n = n
+
+    def __enter__(self):
+        from tinydb import TinyDB
+        from core import database
+        self.database = database
+        self.saved = database.db
+        self.dir = tempfile.TemporaryDirectory()
+        database.db = TinyDB(os.path.join(self.dir.name, "db.json"))
+        if self.n:
+            database.save_calculations(synthetic_records(self.n))
+        return database.db
+
+    def __exit__(self, *exc):
+        self.database.db.close()
+        self.database.db = self.saved
+        self.dir.cleanup()
+
+
+# ---------- Замеры ----------
+
+def bench_solver(results, repeat):
+    """Одиночный расчет каждой модели с параметрами по умолчанию"""
+    for model, spec in MODELS.items():
+        values = list(spec.defaults.values())
+        results[f"solver.{model}"] = best_time(lambda: solve_model(model, values), repeat)
+
+
+def bench_ensemble(results, repeat):
+    """Ансамбль ENSEMBLE_MEMBERS членов с разбросом ±5% (NumPy, а при наличии Numba — и JIT)"""
+    for model, spec in MODELS.items():
+        rng = np.random.default_rng(0)
+        params = [value if name == "t_max" else value * (1 + 0.1 * (rng.random(ENSEMBLE_MEMBERS) - 0.5))
+                  for name, value in spec.defaults.items()]
+        rhs, y0, p, t_eval, project = ensemble_problem(model, params)
+        results[f"ensemble.{model}"] = best_time(
+            lambda: integrate(rhs, y0, p, t_eval, project=project, jac=spec.jacobian), repeat)
+        if jit.AVAILABLE:
+            jit.integrate_model(model, y0, p, t_eval[:2])
+            results[f"ensemble_jit.{model}"] = best_time(lambda: jit.integrate_model(model, y0, p, t_eval), repeat)
+
+
+def bench_db(results, repeat, sizes):
+    """Сохранение, загрузка по id и список всех расчетов при разном размере базы"""
+    from core.database import get_all_calculations, load_calculation, save_calculation
+    record = model_record("seir", DB_POINTS)
+    for n in sizes:
+        # На больших базах каждый вызов читает весь файл — хватает одного повтора
+        rounds = repeat if n < 100000 else 1
+        with TempDatabase(n):
+            target = str(uuid.UUID(int=n // 2))
+            results[f"db.save[{n}]"] = best_time(lambda: save_calculation(dict(record, id=str(uuid.uuid4()))), rounds)
+            results[f"db.load[{n}]"] = best_time(lambda: load_calculation(target), rounds)
+            results[f"db.list[{n}]"] = best_time(get_all_calculations, rounds)
+
+
+def bench_menu(results, repeat):
+    """Пересборка меню главного окна (refresh_menu_bar) при разном числе расчетов"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    from ui.main_window import MainWindow
+
+    with TempDatabase(0):
+        window = MainWindow()
+    for n in MENU_SIZES:
+        with TempDatabase(n):
+            results[f"menu.refresh[{n}]"] = best_time(window.refresh_menu_bar, repeat)
+    window.close()
+    app.processEvents()
+
+
+def bench_plots(results, repeat, skipped):
+    """Отрисовка каждого графика каждой вкладки без окна (Agg)"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from ui.charts import CHART_MODULES
+
+    records = {spec.title: (model, model_record(model)) for model, spec in MODELS.items()}
+    records['Параметрический анализ'] = ("sweep", sweep_record())
+
+    for title, module in CHART_MODULES.items():
+        tab, record = records[title]
+        for key, (figsize, draw_fn) in module.CHARTS.items():
+            def render():
+                fig = Figure(figsize=figsize, dpi=100)
+                canvas = FigureCanvasAgg(fig)
+                draw_fn(fig, record)
+                canvas.draw()
+
+            name = f"plots.{tab}.{key}"
+            try:
+                results[name] = best_time(render, repeat)
+            except KeyError as e:
+                # Пропускаются только графики данных подбора, сценариев и т.п.; остальное — ошибка замера
+                if e.args[0] not in OPTIONAL_DATA:
+                    raise RuntimeError(f"{name}: в записи нет поля {e.args[0]!r}") from e
+                skipped.append(f"{name}: нет данных {e.args[0]}")
+
+
+def run(groups=GROUPS, quick=False, repeat=3):
+    """Все замеры групп groups: {'environment': ..., 'results': {имя: с}, 'skipped': [...]}"""
+    results, skipped = {}, []
+    if "solver" in groups:
+        bench_solver(results, repeat)
+    if "ensemble" in groups:
+        bench_ensemble(results, repeat)
+    if "db" in groups:
+        bench_db(results, repeat, QUICK_DB_SIZES if quick else DB_SIZES)
+    if "menu" in groups:
+        bench_menu(results, repeat)
+    if "plots" in groups:
+        bench_plots(results, repeat, skipped)
+    return {"environment": environment(), "results": results, "skipped": skipped}
+
+
+def compare(current, baseline, threshold=THRESHOLD):
+    """Строки сравнения и число замедлений больше threshold"""
+    lines, slower = [], 0
+    old = baseline["results"]
+    for name, value in current["results"].items():
+        if name not in old:
+            continue
+        ratio = value / old[name] if old[name] else np.inf
+        mark = ""
+        if abs(value - old[name]) < MIN_DELTA:
+            pass
+        elif ratio > 1 + threshold:
+            mark, slower = "  медленнее", slower + 1
+        elif ratio < 1 - threshold:
+            mark = "  быстрее"
+        lines.append(f"{name:45s} {old[name] * 1e3:10.2f} -> {value * 1e3:10.2f} мс  ×{ratio:.2f}{mark}")
+    return lines, slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры скорости решателя, базы, меню и графиков")
+    parser.add_argument("--only", help="группы через запятую: " + ", ".join(GROUPS))
+    parser.add_argument("--quick", action="store_true", help="без базы на 100k записей")
+    parser.add_argument("--repeat", type=int, default=3, help="повторов на замер (берется лучший)")
+    parser.add_argument("--out", help="сохранить результаты в JSON")
+    parser.add_argument("--compare", help="JSON прошлого прогона для сравнения")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="доля изменения, не считающаяся шумом")
+    args = parser.parse_args(argv)
+
+    groups = GROUPS if not args.only else tuple(group.strip() for group in args.only.split(","))
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"неизвестные группы: {', '.join(sorted(unknown))}")
+
+    current = run(groups, args.quick, args.repeat)
+    env = current["environment"]
+    print(f"Коммит {env['commit']}, Python {env['python']}, NumPy {env['numpy']}, "
+          f"Numba {'есть' if env['numba'] else 'нет'}, процессоров {env['cpus']}")
+    for name, value in current["results"].items():
+        line = f"{name:45s} {value * 1e3:10.2f} мс"
+        if name.startswith("ensemble"):
+            line += f"   {ENSEMBLE_MEMBERS / value:10.0f} членов/с"
+        print(line)
+    for entry in current["skipped"]:
+        print(f"пропущен {entry}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        lines, slower = compare(current, baseline, args.threshold)
+        print(f"\nСравнение с {baseline['environment'].get('commit')}:")
+        print("\n".join(lines))
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Расчеты без окна: для серверов и заданий cron.
+
+    python cli.py models
+    python cli.py run seir --set beta=0.5 --set t_max=200 --out seir.csv
+    python cli.py batch runs.csv --model lorenz --out results.parquet --store
+
+Qt и matplotlib не импортируются. Результаты пишутся в CSV/Parquet
+(одна длинная таблица: run, model, параметры, t_data, столбцы данных) и/или
+в базу расчетов, откуда их открывает приложение.
+"""
+import argparse
+import sys
+
+from core.batch_solve import (BACKENDS, DEFAULT_DB, check_output, make_run, read_runs, solve_runs, store_records,
+                              to_records, to_table, write_csv, write_table)
+from core.models import MODELS
+
+
+def _overrides(pairs):
+    """['beta=0.5', ...] -> {'beta': 0.5}"""
+    values = {}
+    for pair in pairs or []:
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Ожидается имя=значение: {pair}")
+        try:
+            values[name.strip()] = float(value)
+        except ValueError:
+            raise ValueError(f"Не число: {pair}")
+    return values
+
+
+def _list_models(args):
+    for spec in MODELS.values():
+        params = ", ".join(f"{name}={value:g}" for name, value in spec.defaults.items())
+        print(f"{spec.key:12s} {spec.title}\n{'':12s} {params}")
+    return 0
+
+
+def _solve(args, runs):
+    def progress(done, total):
+        # Счетчик только в терминале: в логах cron он не нужен
+        if not args.quiet and sys.stderr.isatty():
+            print(f"\r{done}/{total}", end="" if done < total else "\n", file=sys.stderr, flush=True)
+
+    # Опечатка в --out не должна выбросить уже посчитанные расчеты
+    if args.out:
+        check_output(args.out)
+    results = solve_runs(runs, backend=args.backend, max_workers=args.workers, on_progress=progress,
+                         tolerance=args.tolerance, kernel_path=args.kernel, events=args.store)
+    failed = [(n, result) for n, result in enumerate(results) if isinstance(result, Exception)]
+    for n, error in failed:
+        print(f"Расчет {n} ({runs[n].model}): {error}", file=sys.stderr)
+
+    if args.out:
+        write_table(to_table(runs, results), args.out)
+        if not args.quiet:
+            print(f"Таблица: {args.out}", file=sys.stderr)
+    if args.store:
+        count = store_records(to_records(runs, results), args.db)
+        if not args.quiet:
+            print(f"В базу сохранено расчетов: {count}", file=sys.stderr)
+    if not args.out and not args.store:
+        # Без --out и --store таблица идет в stdout
+        write_csv(to_table(runs, results), sys.stdout)
+    return 1 if failed else 0
+
+
+def _run(args):
+    return _solve(args, [make_run(args.model, _overrides(args.set))])
+
+
+def _batch(args):
+    runs = read_runs(args.file, args.model)
+    if not runs:
+        raise ValueError(f"В файле {args.file} нет расчетов")
+    return _solve(args, runs)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Расчеты моделей без графического интерфейса")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("models", help="модели и параметры по умолчанию").set_defaults(handler=_list_models)
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--out", help="файл результатов .csv или .parquet (без --out и --store — CSV в stdout)")
+    output.add_argument("--store", action="store_true", help="сохранить расчеты в базу приложения")
+    output.add_argument("--db", default=DEFAULT_DB, help=f"файл базы для --store (по умолчанию {DEFAULT_DB})")
+    output.add_argument("--backend", choices=BACKENDS, default="native", help="решатель (по умолчанию native)")
+    output.add_argument("--kernel", help="путь к WolframKernel для --backend wolfram (по умолчанию — из PATH)")
+    output.add_argument("--workers", type=int, help="процессов для расчетов (1 — без пула)")
+    output.add_argument("--tolerance", type=float,
+                        help="адаптивная выдача точек с такой погрешностью (доля, например 0.001) "
+                             "вместо равномерной сетки модели; только для native")
+    output.add_argument("-q", "--quiet", action="store_true", help="без прогресса в stderr")
+
+    run = commands.add_parser("run", parents=[output], help="один расчет")
+    run.add_argument("model", help="ключ модели: " + ", ".join(MODELS))
+    run.add_argument("--set", action="append", metavar="ИМЯ=ЗНАЧЕНИЕ", help="параметр (можно несколько раз)")
+    run.set_defaults(handler=_run)
+
+    batch = commands.add_parser("batch", parents=[output], help="расчеты из файла параметров .csv или .json")
+    batch.add_argument("file")
+    batch.add_argument("--model", help="модель для строк без поля model")
+    batch.set_defaults(handler=_batch)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "backend", None) == "wolfram" and args.tolerance is not None:
+        parser.error("--tolerance работает только с --backend native")
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # stdout закрыт раньше времени (например, | head)
+        sys.stdout = None
+        return 1
+    except (ValueError, RuntimeError, OSError) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,5 +3,12 @@ from tinydb import TinyDB
 
 WOLFRAM_PATH = r"C:\Program Files\Wolfram Research\Wolfram\14.3\WolframKernel.exe"
 
+# Решатель по умолчанию: "native" — встроенный NumPy (с потоковой выдачей), "wolfram" — Wolfram Kernel
+SOLVER_BACKEND = "native"
+
+# Точки вывода встроенного решателя: None — равномерная сетка модели, число — адаптивная
+# выдача, при которой ломаная отклоняется от решения не больше чем на эту долю (0.001 = 0.1%)
+OUTPUT_TOLERANCE = None
+
 wolfram = WolframConnector(kernel_path=WOLFRAM_PATH)
 db = TinyDB('calculations_db.json')
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""Экспорт анимации траектории в видео (ffmpeg) или GIF (Pillow).
+
+Кадры рисуются вне экрана через Agg по одному и сразу уходят в кодировщик,
+поэтому в памяти никогда не лежит больше одного кадра.
+"""
+import os
+import shutil
+import subprocess
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from core.tasks import Cancelled, check_stop
+
+FPS = 30
+MAX_FRAMES = 300
+FRAME_SIZE = (7, 5)
+FRAME_DPI = 100
+
+
+def frame_indices(t, max_frames=MAX_FRAMES):
+    """Индексы точек траектории, которые станут кадрами: ближайшие к равномерным
+    моментам времени, чтобы и на неравномерной сетке время шло с постоянной скоростью"""
+    t = np.asarray(t, dtype=float)
+    if len(t) < 2:
+        return np.arange(len(t))
+    targets = np.linspace(t[0], t[-1], min(len(t), max_frames))
+    idx = np.searchsorted(t, targets).clip(1, len(t) - 1)
+    idx -= targets - t[idx - 1] < t[idx] - targets
+    return np.unique(idx)
+
+
+def iter_frames(calc, spec, max_frames=MAX_FRAMES):
+    """Генератор кадров (width, height, RGBA bytes).
+
+    spec: {"columns": ключи данных (2 или 3), "labels": подписи осей}
+    """
+    t = np.asarray(calc['t_data'], dtype=float)
+    data = [np.asarray(calc[key], dtype=float) for key in spec["columns"]]
+    is_3d = len(data) == 3
+
+    fig = Figure(figsize=FRAME_SIZE, dpi=FRAME_DPI)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection='3d' if is_3d else None)
+    if not is_3d:
+        fig.subplots_adjust(left=0.15, bottom=0.15)
+
+    ax.set_xlabel(spec["labels"][0])
+    ax.set_ylabel(spec["labels"][1])
+    if is_3d:
+        ax.set_zlabel(spec["labels"][2])
+    ax.grid(True, alpha=0.3)
+
+    # Полная траектория бледным фоном — как ориентир
+    ax.plot(*data, color='lightgray', linewidth=0.8)
+    line, = ax.plot(*[d[:1] for d in data], 'b-', linewidth=2)
+    point, = ax.plot(*[d[:1] for d in data], 'ro')
+    text = ax.text2D(0.02, 0.95, '', transform=ax.transAxes) if is_3d \
+        else ax.text(0.02, 0.95, '', transform=ax.transAxes)
+
+    for idx in frame_indices(t, max_frames):
+        if is_3d:
+            line.set_data_3d(*(d[:idx + 1] for d in data))
+            point.set_data_3d(*([d[idx]] for d in data))
+        else:
+            line.set_data(data[0][:idx + 1], data[1][:idx + 1])
+            point.set_data([data[0][idx]], [data[1][idx]])
+        text.set_text(f'Время: {t[idx]:.1f}')
+
+        canvas.draw()
+        width, height = canvas.get_width_height(physical=True)
+        yield width, height, bytes(canvas.buffer_rgba())
+
+
+def _encode_ffmpeg(frames, path, fps, on_frame):
+    ffmpeg = shutil.which("ffmpeg")
+    process = None
+    try:
+        for i, (width, height, rgba) in enumerate(frames):
+            if process is None:
+                args = [ffmpeg, "-y", "-loglevel", "error",
+                        "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps),
+                        "-i", "-"]
+                if path.lower().endswith(".gif"):
+                    args += ["-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse"]
+                else:
+                    args += ["-pix_fmt", "yuv420p", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+                process = subprocess.Popen(args + [path], stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+            process.stdin.write(rgba)
+            on_frame(i)
+    except BaseException:
+        if process is not None:
+            process.kill()
+        raise
+    finally:
+        if process is not None and process.poll() is None:
+            process.stdin.close()
+            process.wait()
+
+    if process is not None and process.returncode != 0:
+        raise RuntimeError(f"ffmpeg завершился с ошибкой: {process.stderr.read().decode(errors='ignore')}")
+
+
+def _encode_gif(frames, path, fps, on_frame):
+    """Потоковая запись GIF: каждый кадр сразу кодируется и пишется в файл"""
+    from PIL import Image, GifImagePlugin
+
+    duration = int(round(1000 / fps))
+    palette = None
+
+    with open(path, "wb") as fp:
+        for i, (width, height, rgba) in enumerate(frames):
+            image = Image.frombuffer("RGBA", (width, height), rgba, "raw", "RGBA", 0, 1).convert("RGB")
+            if palette is None:
+                # Цвета в кадрах одни и те же, поэтому палитры первого кадра хватает на весь ролик
+                palette = image.quantize(colors=256)
+                header, _ = GifImagePlugin.getheader(palette, info={"loop": 0})
+                fp.write(b"".join(header))
+            frame = image.quantize(palette=palette, dither=Image.Dither.NONE)
+            for chunk in GifImagePlugin.getdata(frame, duration=duration):
+                fp.write(chunk)
+            on_frame(i)
+        fp.write(b";")
+
+
+def export_animation(calc, spec, path, fps=FPS, max_frames=MAX_FRAMES, on_progress=None, should_stop=None):
+    """Рендерит анимацию траектории в файл .mp4/.avi/.webm или .gif"""
+    total = len(frame_indices(calc['t_data'], max_frames))
+
+    def on_frame(i):
+        if on_progress is not None:
+            on_progress(i + 1, total)
+
+    def frames():
+        for frame in iter_frames(calc, spec, max_frames):
+            check_stop(should_stop)
+            yield frame
+
+    if shutil.which("ffmpeg"):
+        encode = _encode_ffmpeg
+    elif path.lower().endswith(".gif"):
+        encode = _encode_gif
+    else:
+        raise RuntimeError("Для экспорта видео нужен ffmpeg в PATH (без него доступен только GIF)")
+
+    try:
+        encode(frames(), path, fps, on_frame)
+    except Cancelled:
+        # Недописанный файл не нужен
+        if os.path.exists(path):
+            os.remove(path)
+        raise
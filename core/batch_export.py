@@ -0,0 +1,68 @@
+"""Пакетный экспорт графиков сохраненных расчетов в PNG/SVG.
+
+Каждый расчет рисуется в отдельном процессе теми же функциями, что и
+вкладки (модули ui/*_charts.py), без Qt и без окна.
+"""
+import os
+import re
+
+from core.tasks import pool_results
+
+FORMATS = ("png", "svg")
+EXPORT_DPI = 150
+
+
+def record_folder(record):
+    """Имя папки расчета: модель, время и начало id"""
+    model = re.sub(r"[^\w-]+", "_", record.get("model_name", "Модель")).strip("_")
+    timestamp = record.get("timestamp", "")[:16].replace(":", "-").replace("T", "_")
+    return f"{model}_{timestamp}_{str(record.get('id', ''))[:8]}".replace("__", "_")
+
+
+def render_record(record, out_dir, fmt="png", dpi=EXPORT_DPI):
+    """Рисует все графики одного расчета; возвращает (файлы, ошибки)"""
+    # Импорт внутри функции: рабочий процесс тянет только matplotlib и модули графиков
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from ui.charts import charts_for
+
+    charts = charts_for(record.get("model_name"))
+    if charts is None:
+        return [], [f"Неизвестная модель: {record.get('model_name')}"]
+
+    folder = os.path.join(out_dir, record_folder(record))
+    os.makedirs(folder, exist_ok=True)
+
+    files, errors = [], []
+    for key, (figsize, draw_fn) in charts.CHARTS.items():
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        try:
+            draw_fn(fig, record)
+            path = os.path.join(folder, f"{key}.{fmt}")
+            fig.savefig(path, format=fmt)
+            files.append(path)
+        except Exception as e:
+            errors.append(f"{key}: {e}")
+    return files, errors
+
+
+def export_batch(records, out_dir, fmt="png", dpi=EXPORT_DPI, max_workers=None,
+                 on_progress=None, should_stop=None):
+    """Экспортирует графики набора расчетов параллельно в пуле процессов.
+
+    on_progress(done, total) вызывается после каждого расчета;
+    возвращает {id расчета: (файлы, ошибки)}.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Неподдерживаемый формат: {fmt}")
+
+    results = {}
+    # Пул spawn: дочерние процессы не наследуют состояние Qt родителя
+    tasks = [(record, out_dir, fmt, dpi) for record in records]
+    done = pool_results(render_record, tasks, max_workers, should_stop, ordered=False, return_exceptions=True)
+    for count, (n, result) in enumerate(done, 1):
+        results[records[n]["id"]] = ([], [str(result)]) if isinstance(result, Exception) else result
+        if on_progress is not None:
+            on_progress(count, len(tasks))
+    return results
@@ -0,0 +1,230 @@
+"""Пакетные расчеты моделей без интерфейса: для cli.py, серверов и cron.
+
+Не импортирует Qt, matplotlib и config приложения: сессия Wolfram и база
+расчетов создаются по аргументам. Расчеты идут в пуле процессов через
+core.jit.solve_model (Numba, если установлена, иначе NumPy), результаты
+собираются в одну длинную таблицу для CSV/Parquet или в записи БД.
+"""
+import csv
+import json
+import os
+import uuid
+from datetime import datetime
+
+from core import jit, native_solver
+from core.models import MODELS, MODELS_BY_TITLE
+from core.tasks import pool_results
+
+BACKENDS = ("native", "wolfram")
+OUTPUT_FORMATS = (".csv", ".parquet")
+# База расчетов приложения (тот же файл в рабочей папке, что в config.py)
+DEFAULT_DB = "calculations_db.json"
+
+
+class RunSpec:
+    """Один расчет: модель и значения параметров в порядке param_names"""
+
+    def __init__(self, model, values):
+        self.model = model
+        self.values = list(values)
+
+    @property
+    def spec(self):
+        return MODELS[self.model]
+
+    @property
+    def params(self):
+        return dict(zip(self.spec.param_names, self.values))
+
+
+def model_key(name):
+    """Ключ модели по ключу (seir) или названию из записей БД"""
+    if name in MODELS:
+        return name
+    if name in MODELS_BY_TITLE:
+        return MODELS_BY_TITLE[name].key
+    raise ValueError(f"Неизвестная модель: {name}. Доступны: {', '.join(MODELS)}")
+
+
+def make_run(model, overrides=None):
+    """Расчет с параметрами по умолчанию, замененными overrides {имя: значение}"""
+    key = model_key(model)
+    spec = MODELS[key]
+    values = spec.defaults
+    unknown = set(overrides or {}) - set(values)
+    if unknown:
+        raise ValueError(f"Модель {key}: неизвестные параметры {', '.join(sorted(unknown))}. "
+                         f"Доступны: {', '.join(spec.param_names)}")
+    values.update({name: float(value) for name, value in (overrides or {}).items()})
+    return RunSpec(key, [values[name] for name in spec.param_names])
+
+
+def read_runs(path, model=None):
+    """Расчеты из файла параметров.
+
+    JSON — список объектов, CSV — строка заголовка и строка на расчет.
+    Поле model (ключ или название) можно не указывать, если задан model;
+    остальные поля — параметры модели, пустые берутся по умолчанию.
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".json"):
+            entries = json.load(f)
+            if not isinstance(entries, list):
+                raise ValueError("Файл JSON должен содержать список расчетов")
+        else:
+            entries = list(csv.DictReader(f))
+
+    runs = []
+    for n, entry in enumerate(entries, 1):
+        entry = {name: value for name, value in entry.items() if value not in ("", None)}
+        name = entry.pop("model", model)
+        if name is None:
+            raise ValueError(f"Расчет {n}: не указана модель")
+        try:
+            runs.append(make_run(name, entry))
+        except ValueError as e:
+            raise ValueError(f"Расчет {n}: {e}")
+    return runs
+
+
+def solve_run(model, values, backend="native", tolerance=None, wolfram=None, events=False):
+    """Один расчет (как у вкладок): (строки, события) встроенным решателем или Wolfram.
+
+    tolerance — адаптивная выдача точек встроенного решателя (без JIT:
+    ядро Numba считает только на равномерной сетке); wolfram — сессия
+    WolframConnector для backend="wolfram". events — собрать события модели
+    для записи БД (встроенный решатель без JIT); иначе вместо списка None.
+    """
+    if backend == "native":
+        if tolerance is None and not events:
+            return jit.solve_model(model, values), None
+        hits = [] if events else None
+        rows = native_solver.solve_model(model, values, tolerance=tolerance,
+                                         on_event=hits.append if events else None)
+        return rows, hits
+    if wolfram is None:
+        raise ValueError("Для решателя wolfram нужна сессия WolframConnector")
+    result = wolfram.evaluate(MODELS[model].wolfram_expression(values))
+    if not result:
+        raise ValueError("Не удалось получить результаты от Wolfram Kernel")
+    # У Wolfram событий нет — как у записей вкладок с этим решателем
+    return [list(row) for row in result], None
+
+
+def solve_runs(runs, backend="native", max_workers=None, on_progress=None, tolerance=None, kernel_path=None,
+               events=False, should_stop=None):
+    """Решает расчеты; возвращает список пар (строки, события) или исключений в порядке runs.
+
+    Встроенный решатель считает в пуле процессов (max_workers=1 — в текущем
+    процессе), Wolfram — по очереди в одной сессии ядра kernel_path (None —
+    ядро из PATH). on_progress(done, total) вызывается после каждого расчета;
+    tolerance и events — как в solve_run(), tolerance — только для встроенного решателя;
+    should_stop — отмена расчетов в пуле (Cancelled).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Неизвестный решатель: {backend}")
+    if backend == "wolfram" and tolerance is not None:
+        raise ValueError("Адаптивная выдача точек (tolerance) есть только у решателя native")
+    results = [None] * len(runs)
+
+    if backend == "wolfram" or max_workers == 1 or len(runs) == 1:
+        wolfram = None
+        if backend == "wolfram":
+            from wolfram_connector import WolframConnector
+            wolfram = WolframConnector(kernel_path=kernel_path)
+        for n, run in enumerate(runs):
+            try:
+                results[n] = solve_run(run.model, run.values, backend, tolerance, wolfram, events)
+            except Exception as e:
+                results[n] = e
+            if on_progress is not None:
+                on_progress(n + 1, len(runs))
+        return results
+
+    # Общий пул, как у пакетного экспорта и параметрического анализа; ошибка расчета — вместо результата
+    tasks = [(run.model, run.values, backend, tolerance, None, events) for run in runs]
+    for done, (n, result) in enumerate(pool_results(solve_run, tasks, max_workers, should_stop, ordered=False,
+                                                    return_exceptions=True), 1):
+        results[n] = result
+        if on_progress is not None:
+            on_progress(done, len(runs))
+    return results
+
+
+def store_records(records, path=DEFAULT_DB):
+    """Добавляет записи одной записью файла в базу расчетов path; возвращает их число"""
+    from tinydb import TinyDB
+    db = TinyDB(path)
+    try:
+        db.insert_multiple(records)
+    finally:
+        db.close()
+    return len(records)
+
+
+def to_records(runs, results):
+    """Записи БД для успешных расчетов (тот же формат, что сохраняют вкладки)"""
+    timestamp = datetime.now().isoformat()
+    return [{'id': str(uuid.uuid4()), 'model_name': run.spec.title, 'timestamp': timestamp,
+             **run.spec.record(run.values, *result)}
+            for run, result in zip(runs, results) if not isinstance(result, Exception)]
+
+
+def to_table(runs, results):
+    """Длинная таблица {столбец: значения}: run, model, параметры, t_data и столбцы данных.
+
+    Время — t_data, как в записях БД: у конкуренции видов есть параметр t.
+    У расчетов разных моделей набор столбцов разный — отсутствующие
+    значения равны None.
+    """
+    done = [(n, run, result[0]) for n, (run, result) in enumerate(zip(runs, results))
+            if not isinstance(result, Exception)]
+    param_names, data_names = [], []
+    for _, run, _ in done:
+        param_names += [name for name in run.spec.param_names if name not in param_names]
+        data_names += [key for key, _, _ in run.spec.columns if key not in data_names]
+
+    table = {name: [] for name in ["run", "model", *param_names, "t_data", *data_names]}
+    for n, run, rows in done:
+        params = run.params
+        data = run.spec.columns_of(rows)
+        count = len(rows)
+        table["run"] += [n] * count
+        table["model"] += [run.model] * count
+        for name in param_names:
+            table[name] += [params.get(name)] * count
+        for name in ["t_data", *data_names]:
+            table[name] += data.get(name, [None] * count)
+    return table
+
+
+def check_output(path):
+    """Проверяет формат файла результатов до расчетов; возвращает расширение"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in OUTPUT_FORMATS:
+        raise ValueError(f"Неподдерживаемый формат: {ext or path}. Доступны: {', '.join(OUTPUT_FORMATS)}")
+    if ext == ".parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise RuntimeError("Для записи Parquet нужен pyarrow: pip install pyarrow")
+    return ext
+
+
+def write_table(table, path):
+    """Записывает таблицу в CSV или Parquet (по расширению файла)"""
+    if check_output(path) == ".parquet":
+        import pyarrow
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(pyarrow.table(table), path)
+        return
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        write_csv(table, f)
+
+
+def write_csv(table, f):
+    """Таблица в CSV в открытый файл (пустые ячейки вместо None)"""
+    writer = csv.writer(f)
+    writer.writerow(table)
+    writer.writerows(zip(*[["" if value is None else value for value in column] for column in table.values()]))
@@ -0,0 +1,97 @@
+"""Бифуркационная диаграмма системы Лоренца.
+
+Все значения параметра одной пачки интегрируются вместе как ансамбль
+встроенного решателя (или ядром Numba, если она установлена); пачки
+считаются параллельно в пуле процессов.
+После отбрасывания переходного процесса собираются последовательные
+локальные максимумы z или точки пересечения сечения Пуанкаре z = rho - 1.
+"""
+import math
+import os
+
+import numpy as np
+
+from core import jit
+from core.tasks import pool_results
+
+PARAMS = ("sigma", "rho", "beta")
+MODES = ("zmax", "section")
+
+T_TRANSIENT = 50
+T_RECORD = 30
+DT = 0.01
+# Цена шага почти не зависит от размера ансамбля, поэтому пачки крупные:
+# по одной на процесс, но не больше CHUNK_SIZE значений (ограничение памяти)
+CHUNK_SIZE = 1000
+
+# Для облака точек диаграммы такой точности достаточно, а шагов заметно меньше
+RTOL = 1e-6
+ATOL = 1e-8
+
+
+def _local_maxima(z):
+    """Локальные максимумы по столбцам z (n_t, n_members) с параболическим уточнением"""
+    z0, z1, z2 = z[:-2], z[1:-1], z[2:]
+    rows, members = np.nonzero((z1 > z0) & (z1 >= z2))
+    a, b, c = z0[rows, members], z1[rows, members], z2[rows, members]
+    curvature = a - 2 * b + c
+    safe = np.where(curvature == 0, -1.0, curvature)
+    peaks = np.where(curvature == 0, b, b - (a - c) ** 2 / (8 * safe))
+    return members, peaks
+
+
+def _section_hits(ys, rho):
+    """Пересечения плоскости z = rho - 1 снизу вверх; значение — x в точке пересечения"""
+    x, z = ys[:, 0], ys[:, 2] - (rho - 1)
+    rows, members = np.nonzero((z[:-1] < 0) & (z[1:] >= 0))
+    z_before, z_after = z[rows, members], z[rows + 1, members]
+    theta = z_before / (z_before - z_after)
+    x_hit = x[rows, members] + theta * (x[rows + 1, members] - x[rows, members])
+    return members, x_hit
+
+
+def bifurcation_chunk(param, values, base, mode="zmax", t_transient=T_TRANSIENT, t_record=T_RECORD):
+    """Точки диаграммы для пачки значений параметра: (значения параметра, точки)"""
+    values = np.asarray(values, dtype=float)
+    p = {name: np.full(len(values), float(base[name])) for name in PARAMS}
+    p[param] = values
+    p = (p["sigma"], p["rho"], p["beta"])
+
+    start = np.repeat(np.array([[base["x0"]], [base["y0"]], [base["z0"]]], dtype=float), len(values), axis=1)
+
+    # Переходный процесс: нужна только конечная точка
+    state = jit.integrate_model("lorenz", start, p, [0.0, t_transient], rtol=RTOL, atol=ATOL)[-1]
+
+    t_eval = t_transient + np.arange(int(round(t_record / DT)) + 1) * DT
+    ys = jit.integrate_model("lorenz", state, p, t_eval, rtol=RTOL, atol=ATOL)
+
+    if mode == "zmax":
+        members, points = _local_maxima(ys[:, 2])
+    else:
+        members, points = _section_hits(ys, p[1])
+    return values[members], points
+
+
+def bifurcation(param, values, base, mode="zmax", chunk_size=None, max_workers=None,
+                on_chunk=None, should_stop=None):
+    """Диаграмма по всем значениям параметра; on_chunk(done, total) — после каждой пачки"""
+    if param not in PARAMS:
+        raise ValueError(f"Неизвестный параметр: {param}")
+    if mode not in MODES:
+        raise ValueError(f"Неизвестный режим: {mode}")
+
+    values = np.asarray(values, dtype=float)
+    if chunk_size is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunk_size = min(CHUNK_SIZE, math.ceil(len(values) / workers))
+    chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+    param_values, points = [], []
+
+    tasks = [(param, chunk, base, mode) for chunk in chunks]
+    for n, (chunk_values, chunk_points) in pool_results(bifurcation_chunk, tasks, max_workers, should_stop):
+        param_values.append(chunk_values)
+        points.append(chunk_points)
+        if on_chunk is not None:
+            on_chunk(n + 1, len(tasks))
+
+    return np.concatenate(param_values), np.concatenate(points)
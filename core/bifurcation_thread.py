@@ -0,0 +1,18 @@
+from core.bifurcation import bifurcation
+from core.task_thread import TaskThread
+
+
+class BifurcationThread(TaskThread):
+    """Фоновый расчет бифуркационной диаграммы в пуле процессов; результат — (значения, точки)"""
+
+    def __init__(self, param, values, base, mode):
+        super().__init__()
+        self.param = param
+        self.values = values
+        self.base = base
+        self.mode = mode
+
+    def compute(self):
+        values, points = bifurcation(self.param, self.values, self.base, self.mode,
+                                     on_chunk=self.report, should_stop=self.should_stop)
+        return values.tolist(), points.tolist()
@@ -0,0 +1,137 @@
+"""Исход конкуренции видов без перебора стартов.
+
+Режим определяется по отрезкам, которые изоклины отсекают на осях:
+изоклина X (p - qx - ry = 0) — p/q и p/r, изоклина Y (s - tx - uy = 0) —
+s/t и s/u. Это то же самое, что устойчивость равновесий из core.stability:
+(p/q, 0) устойчиво при p/q > s/t, (0, s/u) — при s/u > p/r, внутреннее
+равновесие — устойчивый узел при сосуществовании и седло при бистабильности.
+
+Вне бистабильного режима исход один для всех стартов с x0, y0 > 0;
+при совпадающих изоклинах это линия равновесий — отдельный исход.
+При бистабильности бассейны разделяет устойчивое многообразие седла —
+его ветви прослеживаются интегрированием в обратном времени, и
+старт классифицируется по тому, с какой стороны сепаратрисы он лежит.
+"""
+import numpy as np
+
+from core import stability
+from core.native_solver import competition_rhs, dense_output, steps
+
+# Режимы по параметрам и исходы по стартам
+X_WINS, Y_WINS, COEXISTENCE, BISTABLE, NEUTRAL, EXTINCTION = range(6)
+LABELS = {
+    X_WINS: "побеждает X",
+    Y_WINS: "побеждает Y",
+    COEXISTENCE: "сосуществование",
+    BISTABLE: "бистабильность",
+    NEUTRAL: "изоклины совпадают (линия равновесий)",
+    EXTINCTION: "вымирание",
+}
+
+PARAMS = stability.MODEL_PARAMS["competition"]
+
+# Отступ от седла вдоль собственного вектора и точность трассировки
+SEPARATRIX_EPS = 1e-6
+RTOL = 1e-9
+ATOL = 1e-12
+MAX_STEPS = 20000
+# Предел обратного времени: к началу координат ветвь подходит экспоненциально
+T_MAX = 1e4
+# Точек плотного вывода на шаг — чтобы кривая была гладкой и при крупных шагах
+DENSE_POINTS = 4
+
+
+def intercepts(params):
+    """Отрезки изоклин на осях: (p/q, p/r, s/t, s/u); при нулевом делителе — nan"""
+    p, q, r, s, t, u = np.broadcast_arrays(*[np.asarray(params[name], dtype=float) for name in PARAMS])
+    q, r, t, u = (np.where(np.abs(den) > 1e-12, den, np.nan) for den in (q, r, t, u))
+    return p / q, p / r, s / t, s / u
+
+
+def regime(params):
+    """Код режима для параметров (любые из них могут быть массивами)"""
+    x_on_x, x_on_y, y_on_x, y_on_y = intercepts(params)
+    # Сравнение отрезков с относительным допуском: равенство — касание изоклин
+    scale = np.maximum(np.abs(x_on_x) + np.abs(y_on_x), np.abs(x_on_y) + np.abs(y_on_y))
+    tol = stability.ZERO_TOL * np.where(np.isfinite(scale), scale, 1.0)
+    on_x = np.where(np.abs(x_on_x - y_on_x) <= tol, 0, np.sign(x_on_x - y_on_x))
+    on_y = np.where(np.abs(x_on_y - y_on_y) <= tol, 0, np.sign(x_on_y - y_on_y))
+    # Отрезок не определен (изоклина параллельна оси) — режим решает другая ось
+    on_x, on_y = np.nan_to_num(on_x), np.nan_to_num(on_y)
+
+    # Изоклина X выше изоклины Y (хотя бы на одной оси) — побеждает X, и наоборот
+    codes = np.full(on_x.shape, NEUTRAL)
+    codes = np.where((on_x >= 0) & (on_y >= 0) & ((on_x > 0) | (on_y > 0)), X_WINS, codes)
+    codes = np.where((on_x <= 0) & (on_y <= 0) & ((on_x < 0) | (on_y < 0)), Y_WINS, codes)
+    # Изоклины пересекаются: знак на осях разный
+    codes = np.where((on_x < 0) & (on_y > 0), COEXISTENCE, codes)
+    codes = np.where((on_x > 0) & (on_y < 0), BISTABLE, codes)
+    return codes
+
+
+def _reversed_rhs(t, y, p):
+    return -competition_rhs(t, y, p)
+
+
+def _trace_branch(start, p, x_limit, y_limit, stop_radius):
+    """Ветвь устойчивого многообразия в обратном времени до выхода за рамку или до начала координат"""
+    points = [start]
+    thetas = np.arange(1, DENSE_POINTS + 1) / DENSE_POINTS
+    for n, (t, h, y, y_new, K) in enumerate(steps(_reversed_rhs, start, p, 0.0, T_MAX, rtol=RTOL, atol=ATOL)):
+        points.extend(dense_output(t, h, y, K, t + theta * h) for theta in thetas)
+        outside = y_new[0] > x_limit or y_new[1] > y_limit or y_new[0] < 0 or y_new[1] < 0
+        if outside or np.hypot(*y_new) < stop_radius or n >= MAX_STEPS:
+            break
+    return np.array(points)
+
+
+def separatrix(params, x_max, y_max):
+    """Сепаратриса бассейнов (x (n,), y (n,)) по возрастанию x; только для бистабильного режима.
+
+    x_max, y_max — размер области, до края которой прослеживается кривая.
+    """
+    values = tuple(float(params[name]) for name in PARAMS)
+    named = dict(zip(PARAMS, values))
+    if regime(named) != BISTABLE:
+        raise ValueError("Сепаратриса есть только в бистабильном режиме")
+
+    points, _ = stability.equilibria("competition", named)
+    saddle = points[3]
+    J = stability.jacobian("competition", saddle, named)
+    lam = stability.eigenvalues(J).real.min()
+
+    # Собственный вектор устойчивого направления (выбираем строку без вырождения)
+    v = np.array([J[0, 1], lam - J[0, 0]])
+    if np.hypot(*v) < 1e-12:
+        v = np.array([lam - J[1, 1], J[1, 0]])
+    v /= np.hypot(*v)
+
+    eps = SEPARATRIX_EPS * max(1.0, np.hypot(*saddle))
+    # Рамка с запасом, чтобы кривая покрывала всю область карты
+    limits = (1.5 * max(x_max, saddle[0]), 1.5 * max(y_max, saddle[1]), eps)
+    branches = [_trace_branch(saddle + sign * eps * v, values, *limits) for sign in (1, -1)]
+
+    curve = np.concatenate([branches[0][::-1], saddle[None, :], branches[1]])
+    order = np.argsort(curve[:, 0])
+    return curve[order, 0], curve[order, 1]
+
+
+def outcome_map(params, x_values, y_values):
+    """Исход для каждого старта сетки: (коды (len(y), len(x)), режим, сепаратриса или None)"""
+    x0, y0 = np.meshgrid(np.asarray(x_values, dtype=float), np.asarray(y_values, dtype=float))
+    code = int(regime(params))
+    curve = None
+
+    if code == BISTABLE:
+        curve = separatrix(params, x0.max(), y0.max())
+        # Сепаратриса монотонна: выше нее — бассейн (0, s/u), ниже — (p/q, 0)
+        y_sep = np.interp(x0, curve[0], curve[1], right=np.inf)
+        codes = np.where(y0 > y_sep, Y_WINS, X_WINS)
+    else:
+        codes = np.full(x0.shape, code)
+
+    # Старты на осях: выживает только присутствующий вид
+    codes = np.where(y0 == 0, X_WINS, codes)
+    codes = np.where(x0 == 0, Y_WINS, codes)
+    codes = np.where((x0 == 0) & (y0 == 0), EXTINCTION, codes)
+    return codes, code, curve
@@ -2,7 +2,9 @@
 
 from tinydb import TinyDB, Query
 from config import db
+from core.profiling import timed
 
+@timed("db.save")
 def save_calculation(calc_data):
     calculation = Query()
     existing = db.search(calculation.id == calc_data['id'])
@@ -15,12 +17,20 @@ def save_calculation(calc_data):
         return "Расчет сохранен!"
 
 
+def save_calculations(records):
+    """Сохраняет пачку новых расчетов одной записью файла"""
+    db.insert_multiple(records)
+    return len(records)
+
+
+@timed("db.load")
 def load_calculation(calc_id):
     calculation = Query()
     result = db.search(calculation.id == calc_id)
     return result[0] if result else None
 
 
+@timed("db.list")
 def get_all_calculations():
     calculations = db.all()
     calculations.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
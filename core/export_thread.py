@@ -0,0 +1,31 @@
+from core.animation_export import export_animation
+from core.batch_export import export_batch
+from core.task_thread import TaskThread
+
+
+class AnimationExportThread(TaskThread):
+    """Фоновый экспорт анимации траектории в видео/GIF; результат — путь к файлу"""
+
+    def __init__(self, calc, spec, path):
+        super().__init__()
+        self.calc = calc
+        self.spec = spec
+        self.path = path
+
+    def compute(self):
+        export_animation(self.calc, self.spec, self.path, on_progress=self.report, should_stop=self.should_stop)
+        return self.path
+
+
+class BatchExportThread(TaskThread):
+    """Фоновый пакетный экспорт графиков в пуле процессов; результат — {id: (файлы, ошибки)}"""
+
+    def __init__(self, records, out_dir, fmt):
+        super().__init__()
+        self.records = records
+        self.out_dir = out_dir
+        self.fmt = fmt
+
+    def compute(self):
+        return export_batch(self.records, self.out_dir, self.fmt, on_progress=self.report,
+                            should_stop=self.should_stop)
@@ -0,0 +1,97 @@
+"""Кэш векторных полей и линий тока.
+
+Поле зависит только от модели, параметров, области и разрешения сетки,
+поэтому при смене начальных условий повторные расчеты берут готовые массивы.
+"""
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from core.models import MODELS
+
+# Сколько полей держим в памяти (самые старые вытесняются)
+MAX_ENTRIES = 64
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def _get(key, compute):
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    value = compute()
+
+    with _lock:
+        _cache[key] = value
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return value
+
+
+def clear():
+    with _lock:
+        _cache.clear()
+
+
+def snap_extent(x_min, x_max, y_min, y_max, divisions=10):
+    """Расширяет область до «круглых» границ, чтобы близкие траектории
+    попадали в одну и ту же запись кэша"""
+    def snap(lo, hi):
+        span = hi - lo
+        if span <= 0:
+            span = abs(hi) or 1.0
+        raw = span / divisions
+        magnitude = 10 ** math.floor(math.log10(raw))
+        step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+        return math.floor(lo / step) * step, math.ceil(hi / step) * step
+
+    return snap(x_min, x_max) + snap(y_min, y_max)
+
+
+def vector_field(model, params, extent, resolution):
+    """Сетка (X, Y) и компоненты поля (U, V) на области extent = (x0, x1, y0, y1)"""
+    params = tuple(float(v) for v in params)
+    extent = tuple(float(v) for v in extent)
+    key = ("field", model, params, extent, resolution)
+
+    def compute():
+        x_min, x_max, y_min, y_max = extent
+        X, Y = np.meshgrid(np.linspace(x_min, x_max, resolution), np.linspace(y_min, y_max, resolution))
+        # Правая часть двумерной модели из реестра; params — ее параметры без констант
+        spec = MODELS[model]
+        U, V = spec.rhs(0.0, (X, Y), params + spec.constant_values)
+        return X, Y, U, V
+
+    return _get(key, compute)
+
+
+def streamlines(model, params, extent, resolution, density=0.75):
+    """Геометрия линий тока (список массивов точек) для отрисовки через LineCollection"""
+    params = tuple(float(v) for v in params)
+    extent = tuple(float(v) for v in extent)
+    key = ("stream", model, params, extent, resolution, density)
+
+    def compute():
+        from matplotlib.figure import Figure
+
+        X, Y, U, V = vector_field(model, params, extent, resolution)
+        xr, yr = X[0], Y[:, 0]
+        U, V = np.nan_to_num(U), np.nan_to_num(V)
+
+        # Линии тока считает matplotlib, рисуем во временную фигуру и забираем сегменты
+        ax = Figure().add_subplot(111)
+        try:
+            stream = ax.streamplot(xr, yr, U, V, density=density, arrowstyle='-',
+                                   integration_direction='both', broken_streamlines=False)
+        except TypeError:
+            # Старые версии matplotlib не знают broken_streamlines
+            stream = ax.streamplot(xr, yr, U, V, density=2.5, arrowstyle='-')
+        return [np.asarray(segment) for segment in stream.lines.get_segments()]
+
+    return _get(key, compute)
@@ -0,0 +1,18 @@
+from core.seir_fit import fit_seir
+from core.task_thread import TaskThread
+
+
+class FitThread(TaskThread):
+    """Фоновый мультистарт-подбор параметров SEIR по наблюдаемой заболеваемости"""
+
+    def __init__(self, t_obs, cases, population, method):
+        super().__init__()
+
+        self.t_obs = t_obs
+        self.cases = cases
+        self.population = population
+        self.method = method
+
+    def compute(self):
+        return fit_seir(self.t_obs, self.cases, self.population, self.method,
+                        on_chunk=self.report, should_stop=self.should_stop)
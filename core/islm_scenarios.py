@@ -0,0 +1,46 @@
+"""Сравнение сценариев IS-LM одним пакетным расчетом.
+
+Встроенный решатель интегрирует все сценарии одним ансамблем (параметры —
+массивы по сценариям), Wolfram получает все сценарии одним выражением,
+так что время расчета не растет с числом обращений к ядру.
+"""
+import numpy as np
+
+from config import wolfram
+from core.models import MODELS
+from core.native_solver import PARAM_NAMES, ensemble_problem, integrate
+
+PARAMS = PARAM_NAMES["islm"]
+
+
+def _native(scenarios, should_stop):
+    params = [np.array([scenario[name] for scenario in scenarios], dtype=float) for name in PARAMS]
+    rhs, y0, p, t_eval, project = ensemble_problem("islm", params)
+    ys = integrate(rhs, y0, p, t_eval, project=project, should_stop=should_stop, jac=MODELS["islm"].jacobian)
+
+    # Те же столбцы, что у одиночного расчета: строки строит описание модели по параметрам сценария
+    spec = MODELS["islm"]
+    return [spec.rows(t_eval, ys[:, :, m], tuple(np.ravel(v)[m] if np.ndim(v) else v for v in p))
+            for m in range(len(scenarios))]
+
+
+def _wolfram(scenarios):
+    # Один запрос к ядру на все сценарии
+    spec = MODELS["islm"]
+    blocks = [spec.wolfram_expression([scenario[name] for name in PARAMS]) for scenario in scenarios]
+    result = wolfram.evaluate("{" + ",".join(blocks) + "}")
+    if not result or len(result) != len(scenarios):
+        raise ValueError("Не удалось получить результаты от Wolfram Kernel")
+    return [list(rows) for rows in result]
+
+
+def solve_scenarios(scenarios, backend="native", should_stop=None):
+    """Строки {t, Y, rate, Y', rate'} для каждого сценария (словари с параметрами PARAMS).
+
+    Встроенному решателю нужна общая длительность расчета у всех сценариев.
+    """
+    if not scenarios:
+        return []
+    if backend == "native":
+        return _native(scenarios, should_stop)
+    return _wolfram(scenarios)
@@ -0,0 +1,274 @@
+"""Необязательное ускорение встроенного решателя через Numba.
+
+Из описания модели (core.models) генерируется скалярная правая часть и
+компилируется вместе с ядром DOPRI5. В ядре каждый член ансамбля
+интегрируется своим шагом в собственном цикле, а члены распределяются по
+ядрам процессора (prange). Ансамбль в NumPy идет синхронно с шагом по
+самому трудному члену, здесь же легкие члены не ждут трудных.
+
+Без Numba (или при ENABLED = False) те же функции считают через
+native_solver.integrate, поэтому вызывающему коду проверять ничего не нужно.
+Ядро — только явный DOPRI5: члены, на которых его шаг стал слишком мал
+(жесткая задача), пересчитываются через native_solver.integrate с матрицей
+Якоби модели, то есть с переходом на Radau IIA.
+"""
+import ast
+import time
+
+import numpy as np
+
+from core.models import MODELS
+from core.native_solver import A, ATOL, B, C, E, P, RTOL, integrate, projection, single_problem
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+AVAILABLE = numba is not None
+ENABLED = AVAILABLE
+
+if AVAILABLE:
+    njit, prange = numba.njit, numba.prange
+else:
+    # Без Numba ядро остается обычным Python-кодом (медленно, только для проверки)
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+    prange = range
+
+# Таблица Бутчера в виде плотных массивов для ядра
+A_FULL = np.zeros((7, 7))
+for _s, _row in enumerate(A):
+    A_FULL[_s, :len(_row)] = _row
+B_FULL = np.append(B, 0.0)
+
+_kernels = {}
+
+
+def _scalar_rhs(spec):
+    """Скалярная правая часть f(t, u, p, out) для одного члена ансамбля"""
+    names = spec.rate_names + tuple(spec.constants)
+    lines = ["def rhs(_t, _u, _p, _out):"]
+    lines += [f"    {state} = _u[{i}]" for i, state in enumerate(spec.states)]
+    lines += [f"    {name} = _p[{i}]" for i, name in enumerate(names)]
+    lines += [f"    _out[{i}] = {ast.unparse(tree)}" for i, tree in enumerate(spec.trees)]
+    namespace = {}
+    exec(compile("\n".join(lines) + "\n", f"<jit {spec.key}.rhs>", "exec"), namespace)
+    return njit(namespace["rhs"])
+
+
+def _build_kernel(spec):
+    rhs = _scalar_rhs(spec)
+    n_vars = len(spec.states)
+    clamp = np.array([spec.states.index(state) for state in spec.clamp], dtype=np.int64)
+    a, b, c, e, p_dense = A_FULL, B_FULL, C, E, P
+
+    @njit
+    def rms(values, scale):
+        total = 0.0
+        for i in range(values.shape[0]):
+            total += (values[i] / scale[i]) ** 2
+        return np.sqrt(total / values.shape[0])
+
+    @njit
+    def member(y, p, t_eval, rtol, atol, out, m):
+        """DOPRI5 для одного члена; 0 — успех, 1 — шаг стал слишком мал"""
+        K = np.empty((7, n_vars))
+        y_tmp = np.empty(n_vars)
+        y_new = np.empty(n_vars)
+        err_vec = np.empty(n_vars)
+        scale = np.empty(n_vars)
+
+        t = t_eval[0]
+        t_end = t_eval[-1]
+        for i in range(n_vars):
+            out[0, i, m] = y[i]
+        rhs(t, y, p, K[0])
+
+        # Начальный шаг по Хайреру (как в native_solver)
+        for i in range(n_vars):
+            scale[i] = atol + abs(y[i]) * rtol
+        d0 = rms(y, scale)
+        d1 = rms(K[0], scale)
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        for i in range(n_vars):
+            y_tmp[i] = y[i] + h0 * K[0, i]
+        rhs(t + h0, y_tmp, p, K[1])
+        for i in range(n_vars):
+            err_vec[i] = K[1, i] - K[0, i]
+        d2 = rms(err_vec, scale) / h0
+        if d1 <= 1e-15 and d2 <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2)) ** 0.2
+        h = min(100 * h0, h1)
+
+        next_idx = 1
+        while t_end - t > 1e-12 * abs(t_end):
+            h = min(h, t_end - t)
+            if h <= 1e-14 * max(1.0, abs(t)):
+                return 1
+
+            for s in range(1, 6):
+                for i in range(n_vars):
+                    acc = 0.0
+                    for j in range(s):
+                        acc += a[s, j] * K[j, i]
+                    y_tmp[i] = y[i] + h * acc
+                rhs(t + c[s] * h, y_tmp, p, K[s])
+            for i in range(n_vars):
+                acc = 0.0
+                for j in range(6):
+                    acc += b[j] * K[j, i]
+                y_new[i] = y[i] + h * acc
+            rhs(t + h, y_new, p, K[6])
+
+            for i in range(n_vars):
+                acc = 0.0
+                for j in range(7):
+                    acc += e[j] * K[j, i]
+                err_vec[i] = h * acc
+                scale[i] = atol + max(abs(y[i]), abs(y_new[i])) * rtol
+            err = rms(err_vec, scale)
+
+            if not np.isfinite(err):
+                h *= 0.2
+                continue
+            if err > 1:
+                h *= max(0.2, 0.9 * err ** -0.2)
+                continue
+
+            # Плотная выдача во все узлы сетки внутри принятого шага
+            t_new = t + h
+            while next_idx < t_eval.shape[0] and t_eval[next_idx] <= t_new + 1e-12 * abs(t_new):
+                theta = (t_eval[next_idx] - t) / h
+                for i in range(n_vars):
+                    acc = 0.0
+                    for j in range(7):
+                        weight = 0.0
+                        power = 1.0
+                        for k in range(4):
+                            power *= theta
+                            weight += p_dense[j, k] * power
+                        acc += weight * K[j, i]
+                    out[next_idx, i, m] = y[i] + h * acc
+                next_idx += 1
+
+            t = t_new
+            for i in range(n_vars):
+                y[i] = y_new[i]
+                K[0, i] = K[6, i]
+
+            clamped = False
+            for i in clamp:
+                if y[i] < 0:
+                    y[i] = 0.0
+                    clamped = True
+            if clamped:
+                rhs(t, y, p, K[0])
+
+            h *= 10.0 if err == 0 else min(10.0, 0.9 * err ** -0.2)
+        return 0
+
+    @njit(parallel=True)
+    def kernel(y0, p, t_eval, rtol, atol, out, status):
+        for m in prange(y0.shape[1]):
+            status[m] = member(y0[:, m].copy(), p[:, m].copy(), t_eval, rtol, atol, out, m)
+
+    return kernel
+
+
+def kernel_for(model):
+    """Скомпилированное ядро модели (компилируется при первом обращении в процессе)"""
+    if model not in _kernels:
+        _kernels[model] = _build_kernel(MODELS[model])
+    return _kernels[model]
+
+
+def integrate_model(model, y0, p, t_eval, rtol=RTOL, atol=ATOL):
+    """Как native_solver.integrate, но правая часть берется из описания модели.
+
+    y0 — (n_vars,) или (n_vars, *члены), p — параметры правой части и константы
+    модели (скаляры или массивы членов). Возвращает (n_t, n_vars, *члены).
+    """
+    t_eval = np.asarray(t_eval, dtype=float)
+    spec = MODELS[model]
+    if not ENABLED:
+        return integrate(spec.rhs, y0, p, t_eval, project=projection(model), rtol=rtol, atol=atol, jac=spec.jacobian)
+
+    y0 = np.asarray(y0, dtype=float)
+    members = y0.shape[1:]
+    n_members = int(np.prod(members, dtype=np.int64))
+    start = np.ascontiguousarray(y0.reshape(y0.shape[0], n_members))
+    params = np.array([np.broadcast_to(np.asarray(v, dtype=float), members).ravel() for v in p])
+
+    out = np.full((len(t_eval), y0.shape[0], n_members), np.nan)
+    status = np.zeros(n_members, dtype=np.int64)
+    kernel_for(model)(start, params, t_eval, float(rtol), float(atol), out, status)
+
+    # Жесткие члены, на которых DOPRI5 ядра не справился, — через NumPy с переходом на Radau IIA
+    stiff = np.flatnonzero(status)
+    if stiff.size:
+        out[:, :, stiff] = integrate(spec.rhs, start[:, stiff], tuple(params[:, stiff]), t_eval,
+                                     project=projection(model), rtol=rtol, atol=atol, jac=spec.jacobian)
+    return out.reshape((len(t_eval), y0.shape[0]) + members)
+
+
+def solve_model(model, params):
+    """Строки одиночного расчета, как native_solver.solve_model, но без выдачи порциями"""
+    rhs, y0, p, t_eval, project, to_rows = single_problem(model, params)
+    return to_rows(t_eval, integrate_model(model, y0, p, t_eval))
+
+
+def _best_time(fn, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def benchmark(n_members=1000, models=None, repeat=3):
+    """Время ансамбля из n_members членов: {модель: (NumPy, с, JIT, с или None)}; компиляция не входит"""
+    global ENABLED
+    from core.native_solver import ensemble_problem
+
+    enabled = ENABLED
+    results = {}
+    try:
+        for model in models or MODELS:
+            spec = MODELS[model]
+            rng = np.random.default_rng(0)
+            # Разброс ±5% вокруг значений по умолчанию
+            params = [value if name == "t_max" else value * (1 + 0.1 * (rng.random(n_members) - 0.5))
+                      for name, value in spec.defaults.items()]
+            _, y0, p, t_eval, _ = ensemble_problem(model, params)
+
+            def run():
+                integrate_model(model, y0, p, t_eval)
+
+            ENABLED = False
+            numpy_time = _best_time(run, repeat)
+            jit_time = None
+            if AVAILABLE:
+                ENABLED = True
+                integrate_model(model, y0, p, t_eval[:2])
+                jit_time = _best_time(run, repeat)
+            results[model] = (numpy_time, jit_time)
+    finally:
+        ENABLED = enabled
+    return results
+
+
+if __name__ == "__main__":
+    if not AVAILABLE:
+        print("Numba не установлена: JIT недоступен, расчеты идут через NumPy")
+    for model, (numpy_time, jit_time) in benchmark().items():
+        line = f"{model:12s} NumPy {numpy_time:8.3f} с"
+        if jit_time is not None:
+            line += f"   JIT {jit_time:8.3f} с   ускорение ×{numpy_time / jit_time:.1f}"
+        print(line)
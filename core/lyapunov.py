@@ -0,0 +1,106 @@
+"""Показатели Ляпунова системы Лоренца.
+
+Вместе с траекторией интегрируются уравнения в вариациях dΦ/dt = J(x)·Φ
+для k касательных векторов; каждые TAU единиц времени векторы заново
+ортонормируются QR-разложением, а логарифмы диагонали R копятся в
+оценку спектра. Все члены ансамбля (разные sigma, rho, beta) считаются
+одним вызовом решателя, карта хаоса — пачками в пуле процессов.
+"""
+import math
+import os
+
+import numpy as np
+
+from core.models import MODELS
+from core.native_solver import integrate, lorenz_rhs
+from core.tasks import pool_results
+
+T_TRANSIENT = 20
+T_TOTAL = 200
+TAU = 0.5
+RTOL = 1e-6
+ATOL = 1e-8
+
+# Карта хаоса: короче расчет и не больше стольких точек в пачке
+MAP_T_TOTAL = 100
+CHUNK_SIZE = 1000
+
+
+def _variational_rhs(k):
+    """Правая часть системы «траектория + k касательных векторов» (состояние 3 + 3k)"""
+    def rhs(t, u, p):
+        x = u[:3]
+        phi = u[3:].reshape((3, k) + u.shape[1:])
+        d_phi = np.einsum('ij...,jk...->ik...', MODELS["lorenz"].jacobian(t, x, p), phi)
+        return np.concatenate([lorenz_rhs(t, x, p), d_phi.reshape((3 * k,) + u.shape[1:])])
+    return rhs
+
+
+def lyapunov_ensemble(p, start, k=3, t_transient=T_TRANSIENT, t_total=T_TOTAL, tau=TAU, should_stop=None):
+    """Спектр (k старших показателей) для ансамбля.
+
+    p — (sigma, rho, beta), скаляры или массивы (n_members,); start — (3, n_members).
+    Возвращает (спектр (k, n_members), моменты ортонормировки, история оценок (n, k, n_members)).
+    """
+    p = tuple(np.asarray(v, dtype=float) for v in p)
+    x = integrate(lorenz_rhs, start, p, [0.0, t_transient], should_stop=should_stop, rtol=RTOL, atol=ATOL)[-1]
+
+    n_members = x.shape[1]
+    phi = np.repeat(np.eye(3)[:, :k, None], n_members, axis=2)
+    rhs = _variational_rhs(k)
+
+    n_steps = int(round(t_total / tau))
+    log_sum = np.zeros((k, n_members))
+    times, history = [], []
+
+    for step in range(1, n_steps + 1):
+        u = np.concatenate([x, phi.reshape(3 * k, n_members)])
+        u = integrate(rhs, u, p, [0.0, tau], should_stop=should_stop, rtol=RTOL, atol=ATOL)[-1]
+        x = u[:3]
+
+        # QR по каждому члену ансамбля: (n_members, 3, k)
+        q, r = np.linalg.qr(np.moveaxis(u[3:].reshape(3, k, n_members), 2, 0))
+        log_sum += np.log(np.abs(np.diagonal(r, axis1=1, axis2=2))).T
+        phi = np.moveaxis(q, 0, 2)
+
+        times.append(step * tau)
+        history.append(log_sum / (step * tau))
+
+    return log_sum / (n_steps * tau), np.array(times), np.array(history)
+
+
+def lyapunov_spectrum(sigma, rho, beta, x0=1.0, y0=1.0, z0=1.0, t_total=T_TOTAL, should_stop=None):
+    """Полный спектр для одного набора параметров: (спектр (3,), моменты, история (n, 3))"""
+    start = np.array([[x0], [y0], [z0]], dtype=float)
+    spectrum, times, history = lyapunov_ensemble((sigma, rho, beta), start, t_total=t_total,
+                                                 should_stop=should_stop)
+    return spectrum[:, 0], times, history[:, :, 0]
+
+
+def max_exponent_chunk(sigmas, rhos, beta, start):
+    """Старший показатель для пачки пар (sigma, rho) — задача рабочего процесса"""
+    sigmas = np.asarray(sigmas, dtype=float)
+    initial = np.repeat(np.asarray(start, dtype=float).reshape(3, 1), len(sigmas), axis=1)
+    spectrum, _, _ = lyapunov_ensemble((sigmas, np.asarray(rhos, dtype=float), beta), initial, k=1,
+                                       t_total=MAP_T_TOTAL)
+    return spectrum[0]
+
+
+def chaos_map(sigma_values, rho_values, beta, start=(1.0, 1.0, 1.0), max_workers=None,
+              on_chunk=None, should_stop=None):
+    """Старший показатель на сетке (sigma, rho): массив (len(rho_values), len(sigma_values))"""
+    sigma_grid, rho_grid = np.meshgrid(sigma_values, rho_values)
+    sigmas, rhos = sigma_grid.ravel(), rho_grid.ravel()
+
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = min(CHUNK_SIZE, math.ceil(len(sigmas) / workers))
+    starts = range(0, len(sigmas), chunk_size)
+    result = np.empty(len(sigmas))
+
+    tasks = [(sigmas[i:i + chunk_size], rhos[i:i + chunk_size], beta, start) for i in starts]
+    for n, values in pool_results(max_exponent_chunk, tasks, max_workers, should_stop):
+        result[starts[n]:starts[n] + chunk_size] = values
+        if on_chunk is not None:
+            on_chunk(n + 1, len(tasks))
+
+    return result.reshape(sigma_grid.shape)
@@ -0,0 +1,22 @@
+from core.lyapunov import chaos_map, lyapunov_spectrum
+from core.task_thread import TaskThread
+
+
+class LyapunovThread(TaskThread):
+    """Фоновый расчет спектра Ляпунова или карты хаоса"""
+
+    def __init__(self, mode, **params):
+        super().__init__()
+
+        # mode: "spectrum" — спектр для одного набора параметров, "map" — карта по (sigma, rho)
+        self.mode = mode
+        self.params = params
+
+    def compute(self):
+        if self.mode == "spectrum":
+            spectrum, times, history = lyapunov_spectrum(**self.params, should_stop=self.should_stop)
+            return {'lyap_spectrum': spectrum.tolist(), 'lyap_times': times.tolist(),
+                    'lyap_history': history.tolist()}
+        values = chaos_map(**self.params, should_stop=self.should_stop, on_chunk=self.report)
+        return {'map_sigma': list(self.params['sigma_values']), 'map_rho': list(self.params['rho_values']),
+                'map_values': values.tolist()}
@@ -0,0 +1,410 @@
+"""Декларативный реестр моделей.
+
+Модель описывается один раз: переменные состояния, параметры со значениями
+по умолчанию, правые части (выражения-строки) и столбцы вывода. Из
+описания при создании ModelSpec строятся векторизованная правая часть на
+NumPy и матрица Якоби с ее структурой ненулевых элементов (символьным
+дифференцированием выражений) для неявного метода решателя, а по
+запросу — выражение NDSolve для Wolfram и схема записи в БД.
+"""
+import ast
+
+import numpy as np
+
+# Виды столбцов вывода: значение переменной, ее производная, расхождение с возмущенной копией
+STATE, DERIVATIVE, DIVERGENCE = "state", "derivative", "divergence"
+# Виды событий: экстремум переменной, пересечение порога снизу вверх и сверху вниз
+MAXIMUM, MINIMUM, RISING, FALLING = "maximum", "minimum", "rising", "falling"
+
+
+# ---------- Символьное дифференцирование выражений ----------
+
+def _const(node):
+    return node.value if isinstance(node, ast.Constant) else None
+
+
+def _num(value):
+    return ast.Constant(value)
+
+
+def _add(a, b):
+    if _const(a) == 0:
+        return b
+    if _const(b) == 0:
+        return a
+    return ast.BinOp(a, ast.Add(), b)
+
+
+def _sub(a, b):
+    if _const(b) == 0:
+        return a
+    if _const(a) == 0:
+        return _neg(b)
+    return ast.BinOp(a, ast.Sub(), b)
+
+
+def _neg(a):
+    if _const(a) is not None:
+        return _num(-_const(a))
+    if isinstance(a, ast.UnaryOp) and isinstance(a.op, ast.USub):
+        return a.operand
+    return ast.UnaryOp(ast.USub(), a)
+
+
+def _mul(a, b):
+    if _const(a) == 0 or _const(b) == 0:
+        return _num(0)
+    if _const(a) == 1:
+        return b
+    if _const(b) == 1:
+        return a
+    if _const(a) == -1:
+        return _neg(b)
+    if _const(b) == -1:
+        return _neg(a)
+    return ast.BinOp(a, ast.Mult(), b)
+
+
+def _div(a, b):
+    if _const(a) == 0:
+        return _num(0)
+    if _const(b) == 1:
+        return a
+    return ast.BinOp(a, ast.Div(), b)
+
+
+def _diff(node, var):
+    """Производная выражения (узел AST) по переменной var"""
+    if isinstance(node, ast.Constant):
+        return _num(0)
+    if isinstance(node, ast.Name):
+        return _num(1 if node.id == var else 0)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        d = _diff(node.operand, var)
+        return _neg(d) if isinstance(node.op, ast.USub) else d
+    if isinstance(node, ast.BinOp):
+        a, b = node.left, node.right
+        da, db = _diff(a, var), _diff(b, var)
+        if isinstance(node.op, ast.Add):
+            return _add(da, db)
+        if isinstance(node.op, ast.Sub):
+            return _sub(da, db)
+        if isinstance(node.op, ast.Mult):
+            return _add(_mul(da, b), _mul(a, db))
+        if isinstance(node.op, ast.Div):
+            return _sub(_div(da, b), _div(_mul(a, db), ast.BinOp(b, ast.Pow(), _num(2))))
+        if isinstance(node.op, ast.Pow) and _const(b) is not None:
+            n = _const(b)
+            return _mul(_mul(_num(n), ast.BinOp(a, ast.Pow(), _num(n - 1))), da)
+    raise ValueError(f"Не поддерживается в выражении модели: {ast.unparse(node)}")
+
+
+# ---------- Запись выражений для Wolfram ----------
+
+WOLFRAM_OPS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/", ast.Pow: "^"}
+
+
+def wolfram_number(value):
+    """Число в синтаксисе Wolfram (1e-05 -> 1.*^-5)"""
+    text = repr(float(value))
+    mantissa, _, exponent = text.partition("e")
+    return f"{mantissa}*^{int(exponent)}" if exponent else text
+
+
+def _wolfram(node, names):
+    """Выражение AST в синтаксисе Wolfram; names — замена имен (переменные -> x[t], параметры -> числа)"""
+    if isinstance(node, ast.Constant):
+        return wolfram_number(node.value)
+    if isinstance(node, ast.Name):
+        return names[node.id]
+    if isinstance(node, ast.UnaryOp):
+        sign = "-" if isinstance(node.op, ast.USub) else "+"
+        return f"({sign}{_wolfram(node.operand, names)})"
+    if isinstance(node, ast.BinOp):
+        return f"({_wolfram(node.left, names)} {WOLFRAM_OPS[type(node.op)]} {_wolfram(node.right, names)})"
+    raise ValueError(f"Не поддерживается в выражении модели: {ast.unparse(node)}")
+
+
+# ---------- Описание модели ----------
+
+class ModelSpec:
+    """Описание модели и построенные по нему функции.
+
+    params и initial — пары (имя, значение по умолчанию) для параметров
+    правой части и начальных условий (по одному на переменную состояния);
+    constants — фиксированные коэффициенты, которые не вводятся на вкладке.
+    columns — столбцы вывода после t: (ключ записи БД, вид, переменная).
+    clamp — переменные, которые не опускаются ниже нуля (WhenEvent),
+    twin — (переменная, отклонение) для возмущенной копии траектории.
+    t_max_param — вводится ли длительность расчета (иначе всегда t_max).
+    events — отмечаемые события: (имя, вид, переменная, порог, подпись);
+    порог нужен только для RISING и FALLING.
+    extras — поля записи БД, которые вводятся только на вкладке и в уравнения
+    не входят (имя -> значение по умолчанию).
+    """
+
+    def __init__(self, key, title, states, params, initial, equations, columns, dt, t_max,
+                 t_max_param=True, constants=None, clamp=(), twin=None, wolfram_names=None, events=(),
+                 extras=None):
+        self.key = key
+        self.title = title
+        self.states = tuple(states)
+        self.params = tuple(params)
+        self.initial = tuple(initial)
+        self.equations = tuple(equations)
+        self.columns = tuple(columns)
+        self.dt = dt
+        self.t_max = t_max
+        self.t_max_param = t_max_param
+        self.constants = dict(constants or {})
+        self.clamp = tuple(clamp)
+        self.twin = twin
+        self.wolfram_names = dict(wolfram_names or {})
+        self.events = tuple(events)
+        self.extras = dict(extras or {})
+
+        if len(self.equations) != len(self.states) or len(self.initial) != len(self.states):
+            raise ValueError(f"Модель {key}: число уравнений и начальных условий должно совпадать с числом переменных")
+
+        self.trees = [ast.parse(equation, mode="eval").body for equation in self.equations]
+        self.jacobian_trees = [[_diff(tree, var) for var in self.states] for tree in self.trees]
+        self.param_jacobian_trees = [[_diff(tree, name) for name, _ in self.params] for tree in self.trees]
+        # Структура матрицы Якоби: элементы, которые не равны нулю тождественно
+        self.sparsity = np.array([[_const(entry) != 0 for entry in row] for row in self.jacobian_trees])
+        self.rhs = self._compile("rhs", self.trees)
+        self.jacobian = self._compile_matrix("jacobian", self.jacobian_trees)
+        # Производные правой части по ее параметрам — для уравнений чувствительности
+        self.param_jacobian = self._compile_matrix("param_jacobian", self.param_jacobian_trees)
+
+    # ----- Имена и значения параметров -----
+
+    @property
+    def rate_names(self):
+        """Параметры правой части (без начальных условий и длительности)"""
+        return tuple(name for name, _ in self.params)
+
+    @property
+    def param_names(self):
+        """Все вводимые параметры в порядке решателя (совпадают с ключами записей БД)"""
+        names = self.rate_names + tuple(name for name, _ in self.initial)
+        return names + ("t_max",) if self.t_max_param else names
+
+    @property
+    def defaults(self):
+        values = dict(self.params + self.initial)
+        if self.t_max_param:
+            values["t_max"] = self.t_max
+        return values
+
+    @property
+    def constant_values(self):
+        return tuple(self.constants.values())
+
+    @property
+    def schema(self):
+        """Ключи записи БД: параметры и столбцы данных"""
+        return self.param_names + ("t_data",) + tuple(key for key, _, _ in self.columns)
+
+    def split(self, values):
+        """Значения в порядке param_names -> (параметры правой части, начальные условия, t_max)"""
+        values = list(values)
+        if len(values) != len(self.param_names):
+            raise ValueError(f"Модель {self.key} ожидает {len(self.param_names)} параметров, получено {len(values)}")
+        n_rates, n_states = len(self.params), len(self.states)
+        t_max = values[n_rates + n_states] if self.t_max_param else self.t_max
+        return values[:n_rates], values[n_rates:n_rates + n_states], t_max
+
+    # ----- Скомпилированные функции -----
+
+    def _compile(self, name, trees):
+        """Функция f(t, u, p) с массивом выражений той же вложенности, что trees.
+
+        Переменные и параметры могут быть массивами (ансамбли, сетки
+        параметров), поэтому выражения без переменных состояния (например,
+        постоянный приток) дополняются нулем общей формы.
+        """
+        states = set(self.states)
+        needs_zero = False
+
+        def render(item):
+            nonlocal needs_zero
+            if isinstance(item, list):
+                return "[" + ", ".join(render(entry) for entry in item) + "]"
+            if any(isinstance(node, ast.Name) and node.id in states for node in ast.walk(item)):
+                return ast.unparse(item)
+            needs_zero = True
+            return f"({ast.unparse(item)}) + _zero"
+
+        body = render(trees)
+        names = self.rate_names + tuple(self.constants)
+        source = (
+            f"def {name}(_t, _u, _p):\n"
+            f"    {', '.join(self.states)}, = _u\n"
+            f"    {', '.join(names)}, = _p\n"
+            + ("    _zero = np.zeros(np.broadcast_shapes(*[np.shape(v) for v in (*_u, *_p)]))\n" if needs_zero else "")
+            + f"    return np.array({body})\n"
+        )
+        namespace = {"np": np}
+        exec(compile(source, f"<model {self.key}.{name}>", "exec"), namespace)
+        return namespace[name]
+
+    def _compile_matrix(self, name, trees):
+        """Матрица производных f(t, u, p) формы (n_vars, n_столбцов, *члены) по деревьям trees;
+        вычисляются только элементы, которые не равны нулю тождественно"""
+        names = self.rate_names + tuple(self.constants)
+        lines = [
+            f"def {name}(_t, _u, _p):",
+            f"    {', '.join(self.states)}, = _u",
+            f"    {', '.join(names)}, = _p",
+            f"    _J = np.zeros(({len(trees)}, {len(trees[0])}) + np.broadcast_shapes(*[np.shape(v) for v in (*_u, *_p)]))",
+        ]
+        lines += [f"    _J[{i}, {j}] = {ast.unparse(entry)}"
+                  for i, row in enumerate(trees) for j, entry in enumerate(row) if _const(entry) != 0]
+        lines.append("    return _J")
+        namespace = {"np": np}
+        exec(compile("\n".join(lines) + "\n", f"<model {self.key}.{name}>", "exec"), namespace)
+        return namespace[name]
+
+    # ----- Строки вывода -----
+
+    def rows(self, ts, ys, p):
+        """Строки {t, столбцы...} по значениям ys (n_t, n_vars) или (n_t, n_vars, 2) с копией twin"""
+        main = ys[:, :, 0] if self.twin else ys
+        derivs = None
+        out = [ts]
+        for _, kind, state in self.columns:
+            i = self.states.index(state)
+            if kind == STATE:
+                out.append(np.maximum(0, main[:, i]) if state in self.clamp else main[:, i])
+            elif kind == DERIVATIVE:
+                if derivs is None:
+                    derivs = self.rhs(ts, main.T, p)
+                out.append(derivs[i])
+            elif kind == DIVERGENCE:
+                out.append(np.abs(ys[:, i, 0] - ys[:, i, 1]))
+        return np.column_stack(out).tolist()
+
+    def columns_of(self, rows):
+        """Строки расчета -> столбцы записи БД {t_data: [...], ...}"""
+        keys = ("t_data",) + tuple(key for key, _, _ in self.columns)
+        return {key: [float(row[j]) for row in rows] for j, key in enumerate(keys)}
+
+    def record(self, values, rows, events=None):
+        """Запись БД с теми же полями, что пишет вкладка: параметры, поля extras, столбцы данных
+        и, если у модели есть события, список events (как от solve_model(on_event=...))"""
+        record = {**dict(zip(self.param_names, (float(v) for v in values))), **self.extras, **self.columns_of(rows)}
+        if self.events:
+            record['events'] = list(events or [])
+        return record
+
+    # ----- Wolfram -----
+
+    def wolfram_expression(self, values):
+        """Выражение NDSolve + Table, возвращающее те же строки, что и встроенный решатель"""
+        rates, initial, t_max = self.split([float(v) for v in values])
+        names = {state: f"{self.wolfram_names.get(state, state)}[t]" for state in self.states}
+        names.update((name, wolfram_number(v)) for name, v in zip(self.rate_names, rates))
+        names.update((name, wolfram_number(v)) for name, v in self.constants.items())
+        symbols = [self.wolfram_names.get(state, state) for state in self.states]
+        t_max = wolfram_number(t_max)
+
+        def solve(sol, start):
+            equations = [f"{symbol}'[t] == {_wolfram(tree, names)}" for symbol, tree in zip(symbols, self.trees)]
+            equations += [f"WhenEvent[{symbols[self.states.index(state)]}[t] < 0, "
+                          f"{symbols[self.states.index(state)]}[t] -> 0]" for state in self.clamp]
+            equations += [f"{symbol}[0] == {wolfram_number(v)}" for symbol, v in zip(symbols, start)]
+            return (f"{sol} = NDSolve[{{{', '.join(equations)}}}, "
+                    f"{{{', '.join(symbols)}}}, {{t, 0, {t_max}}}];")
+
+        blocks = [solve("sol", initial)]
+        if self.twin:
+            state, eps = self.twin
+            shifted = list(initial)
+            shifted[self.states.index(state)] += eps
+            blocks.append(solve("sol2", shifted))
+
+        cells = ["t"]
+        for _, kind, state in self.columns:
+            symbol = symbols[self.states.index(state)]
+            if kind == STATE:
+                value = f"{symbol}[t] /. sol[[1]]"
+                cells.append(f"Evaluate[Max[0, {value}]]" if state in self.clamp else f"Evaluate[{value}]")
+            elif kind == DERIVATIVE:
+                cells.append(f"Evaluate[{symbol}'[t] /. sol[[1]]]")
+            elif kind == DIVERGENCE:
+                cells.append(f"Evaluate[Abs[({symbol}[t] /. sol[[1]]) - ({symbol}[t] /. sol2[[1]])]]")
+
+        local = "sol, sol2" if self.twin else "sol"
+        table = f"Table[{{{', '.join(cells)}}}, {{t, 0, {t_max}, {wolfram_number(self.dt)}}}]"
+        return f"Module[{{{local}}}, {' '.join(blocks)} {table}]"
+
+
+# ---------- Реестр ----------
+
+MODELS = {spec.key: spec for spec in (
+    ModelSpec(
+        "lotka", "Лотка-Вольтерра",
+        states=("x", "y"),
+        params=(("alpha", 0.1), ("beta", 0.02), ("gamma", 0.3), ("delta", 0.01)),
+        initial=(("x0", 10), ("y0", 5)),
+        equations=("alpha*x - beta*x*y", "delta*x*y - gamma*y"),
+        columns=(("x_data", STATE, "x"), ("y_data", STATE, "y")),
+        dt=0.1, t_max=50, t_max_param=False,
+        events=(("x_peak", MAXIMUM, "x", None, "Пик жертв"), ("y_peak", MAXIMUM, "y", None, "Пик хищников")),
+    ),
+    ModelSpec(
+        "competition", "Конкуренция видов",
+        states=("x", "y"),
+        params=(("p", 2), ("q", 0.66), ("r", 2), ("s", 2), ("t", 1.33), ("u", 1)),
+        initial=(("x0", 3.5), ("y0", 2)),
+        equations=("x*(p - q*x - r*y)", "y*(s - t*x - u*y)"),
+        columns=(("x_data", STATE, "x"), ("y_data", STATE, "y")),
+        dt=0.1, t_max=7, t_max_param=False,
+    ),
+    ModelSpec(
+        "seir", "Модель эпидемии SEIR",
+        states=("S", "E", "I", "R"),
+        params=(("beta", 0.8), ("alpha", 0.2), ("gamma", 0.1)),
+        initial=(("S0", 0.98), ("E0", 0.01), ("I0", 0.01), ("R0", 0.0)),
+        equations=("-beta*S*I", "beta*S*I - alpha*E", "alpha*E - gamma*I", "gamma*I"),
+        columns=(("S_data", STATE, "S"), ("E_data", STATE, "E"), ("I_data", STATE, "I"), ("R_data", STATE, "R")),
+        dt=0.5, t_max=100,
+        # E и I в Wolfram — встроенные символы
+        wolfram_names={"E": "Ex", "I": "Inf"},
+        events=(("I_peak", MAXIMUM, "I", None, "Пик эпидемии"),
+                ("S_half", FALLING, "S", 0.5, "Восприимчивых меньше половины")),
+        # Летальность — только для графика смертей
+        extras={"mu": 0.02},
+    ),
+    ModelSpec(
+        "islm", "Макроэкономическая модель IS-LM",
+        states=("Y", "rate"),
+        params=(("G", 250), ("C0", 200), ("MPC", 0.75), ("I0", 200), ("d", 15),
+                ("Ms", 500), ("P", 1.0), ("k", 0.35), ("h", 50)),
+        initial=(("Y0", 1800), ("rate0", 6)),
+        equations=("s_y*(C0 + MPC*Y + I0 - d*rate + G - Y)", "s_i*(k*Y - h*rate - Ms/P)"),
+        columns=(("Y_data", STATE, "Y"), ("i_data", STATE, "rate"),
+                 ("dY_dt_data", DERIVATIVE, "Y"), ("di_dt_data", DERIVATIVE, "rate")),
+        dt=0.5, t_max=150,
+        # Скорости подстройки рынков товаров и денег
+        constants={"s_y": 0.1, "s_i": 0.05},
+        clamp=("rate",),
+        events=(("rate_zero", FALLING, "rate", 0.0, "Ставка упала до нуля"),
+                ("Y_peak", MAXIMUM, "Y", None, "Пик выпуска")),
+    ),
+    ModelSpec(
+        "lorenz", "Система Лоренца",
+        states=("x", "y", "z"),
+        params=(("sigma", 10.0), ("rho", 28.0), ("beta", 2.66)),
+        initial=(("x0", 1.0), ("y0", 1.0), ("z0", 1.0)),
+        equations=("sigma*(y - x)", "x*(rho - z) - y", "x*y - beta*z"),
+        columns=(("x_data", STATE, "x"), ("y_data", STATE, "y"), ("z_data", STATE, "z"),
+                 ("diff_data", DIVERGENCE, "x")),
+        dt=0.01, t_max=50,
+        # Копия со сдвигом x0 — для графика «эффекта бабочки»
+        twin=("x", 1e-5),
+    ),
+)}
+
+# Название модели (как в записях БД) -> описание
+MODELS_BY_TITLE = {spec.title: spec for spec in MODELS.values()}
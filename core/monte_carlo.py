@@ -0,0 +1,174 @@
+"""Полосы неопределенности прогноза SEIR методом Монте-Карло.
+
+Параметры и начальные условия разыгрываются из логнормальных
+распределений вокруг значений вкладки, и пачка членов интегрируется
+одним ансамблем встроенного решателя. Траектории не хранятся: на каждом
+принятом шаге значения I в узлах сетки сразу раскладываются по
+гистограммам (своя на каждый момент времени), а пик отслеживается
+текущим максимумом. Гистограммы пачек складываются, квантили берутся из
+накопленных частот, поэтому память не зависит от размера ансамбля.
+"""
+import math
+import os
+
+import numpy as np
+
+from core.native_solver import dense_output, ensemble_problem, steps
+from core.tasks import pool_results
+
+# Разыгрываемые величины; S0 подстраивается так, чтобы сумма долей не менялась
+PARAMS = ("beta", "alpha", "gamma", "E0", "I0")
+QUANTILES = (0.05, 0.5, 0.95)
+
+N_MEMBERS = 10000
+# Членов ансамбля в пачке: память пачки — несколько массивов (4, CHUNK_SIZE)
+CHUNK_SIZE = 20000
+
+# Логарифмические корзины для I и высоты пика: 10^LOG_MIN .. 1
+LOG_MIN = -10
+N_BINS = 1000
+
+# Повторных розыгрышей членов с E0 + I0 больше исходной суммы долей
+MAX_RESAMPLES = 100
+
+# Для полос такой точности достаточно
+RTOL = 1e-6
+ATOL = 1e-10
+
+
+def _lognormal(base, spreads, name, n, rng):
+    cv = spreads.get(name, 0.0)
+    sigma = math.sqrt(math.log1p(cv * cv))
+    return float(base[name]) * np.exp(sigma * rng.standard_normal(n))
+
+
+def sample_members(base, spreads, n, rng):
+    """Розыгрыш n членов: логнормально с медианой base[name] и коэф. вариации spreads[name].
+
+    Члены, у которых E0 + I0 не помещается в сумму долей (S0 < 0),
+    разыгрываются заново; остаток после MAX_RESAMPLES (и ошибка округления) — S0 = 0.
+    """
+    members = {name: _lognormal(base, spreads, name, n, rng) for name in PARAMS}
+    total = float(base["S0"]) + float(base["E0"]) + float(base["I0"])
+    for _ in range(MAX_RESAMPLES):
+        bad = np.flatnonzero(members["E0"] + members["I0"] > total)
+        if not len(bad):
+            break
+        for name in ("E0", "I0"):
+            members[name][bad] = _lognormal(base, spreads, name, len(bad), rng)
+    members["S0"] = np.maximum(total - members["E0"] - members["I0"], 0.0)
+    return members
+
+
+def _log_bin(values):
+    """Номер логарифмической корзины (значения вне диапазона — в крайние)"""
+    position = (np.log10(np.maximum(values, 1e-300)) - LOG_MIN) / -LOG_MIN * N_BINS
+    return np.clip(position.astype(np.int64), 0, N_BINS - 1)
+
+
+def log_edges():
+    return np.logspace(LOG_MIN, 0, N_BINS + 1)
+
+
+def monte_carlo_chunk(base, spreads, n, seed):
+    """Гистограммы одной пачки: (I по времени (n_t, N_BINS), время пика (n_t,), высота пика (N_BINS,), сумма I)"""
+    rng = np.random.default_rng(seed)
+    members = sample_members(base, spreads, n, rng)
+    params = [members.get(name, base[name]) for name in ("beta", "alpha", "gamma", "S0", "E0", "I0", "R0")]
+    rhs, y0, p, t_eval, _ = ensemble_problem("seir", params + [base["t_max"]])
+
+    n_t = len(t_eval)
+    hist_I = np.zeros(n_t * N_BINS, dtype=np.int64)
+    I_sum = np.zeros(n_t)
+    peak = y0[2].copy()
+    peak_idx = np.zeros(n, dtype=np.int64)
+
+    def reduce(idx, I):
+        nonlocal peak
+        hist_I[:] += np.bincount(idx * N_BINS + _log_bin(I), minlength=n_t * N_BINS)
+        I_sum[idx] += I.sum()
+        higher = I > peak
+        peak = np.where(higher, I, peak)
+        peak_idx[higher] = idx
+
+    reduce(0, y0[2])
+    next_idx = 1
+    for t, h, y, y_new, K in steps(rhs, y0, p, t_eval[0], t_eval[-1], rtol=RTOL, atol=ATOL):
+        t_new = t + h
+        while next_idx < n_t and t_eval[next_idx] <= t_new + 1e-12 * abs(t_new):
+            reduce(next_idx, dense_output(t, h, y, K, t_eval[next_idx])[2])
+            next_idx += 1
+
+    hist_peak_t = np.bincount(peak_idx, minlength=n_t)
+    hist_peak = np.bincount(_log_bin(peak), minlength=N_BINS)
+    return hist_I.reshape(n_t, N_BINS), hist_peak_t, hist_peak, I_sum
+
+
+def histogram_quantiles(counts, edges, qs=QUANTILES, log=False):
+    """Квантили по частотам (..., n_bins) с линейной (или логарифмической) интерполяцией в корзине"""
+    counts = np.asarray(counts, dtype=float)
+    cum = np.cumsum(counts, axis=-1)
+    total = cum[..., -1:]
+    lo_edges = np.log10(edges) if log else np.asarray(edges, dtype=float)
+
+    result = []
+    for q in qs:
+        target = q * total
+        idx = np.minimum((cum < target).sum(axis=-1, keepdims=True), counts.shape[-1] - 1)
+        before = np.take_along_axis(cum, idx, axis=-1) - np.take_along_axis(counts, idx, axis=-1)
+        inside = np.take_along_axis(counts, idx, axis=-1)
+        frac = np.clip((target - before) / np.where(inside > 0, inside, 1), 0, 1)
+        value = (lo_edges[idx] + frac * (lo_edges[idx + 1] - lo_edges[idx]))[..., 0]
+        result.append(10 ** value if log else value)
+    return np.array(result)
+
+
+def monte_carlo(base, spreads, n_members=N_MEMBERS, seed=None, chunk_size=None, max_workers=None,
+                on_chunk=None, should_stop=None):
+    """Полосы квантилей I(t), времени и высоты пика по ансамблю из n_members членов.
+
+    base — параметры SEIR вкладки, spreads {имя: коэф. вариации}.
+    on_chunk(done, total) вызывается после каждой пачки.
+    """
+    if n_members < 1:
+        raise ValueError("Число членов ансамбля должно быть больше нуля")
+    if chunk_size is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunk_size = min(CHUNK_SIZE, math.ceil(n_members / workers))
+    sizes = [min(chunk_size, n_members - i) for i in range(0, n_members, chunk_size)]
+    # Независимые потоки случайных чисел для пачек
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    t_eval = ensemble_problem("seir", [base[name] for name in
+                                       ("beta", "alpha", "gamma", "S0", "E0", "I0", "R0", "t_max")])[3]
+    hist_I = np.zeros((len(t_eval), N_BINS), dtype=np.int64)
+    hist_peak_t = np.zeros(len(t_eval), dtype=np.int64)
+    hist_peak = np.zeros(N_BINS, dtype=np.int64)
+    I_sum = np.zeros(len(t_eval))
+
+    tasks = [(base, spreads, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    for n, (chunk_I, chunk_peak_t, chunk_peak, chunk_sum) in pool_results(monte_carlo_chunk, tasks,
+                                                                          max_workers, should_stop):
+        hist_I += chunk_I
+        hist_peak_t += chunk_peak_t
+        hist_peak += chunk_peak
+        I_sum += chunk_sum
+        if on_chunk is not None:
+            on_chunk(n + 1, len(tasks))
+
+    edges = log_edges()
+    # Корзины времени пика — узлы сетки; середины корзин попадают ровно в узлы
+    dt = t_eval[1] - t_eval[0] if len(t_eval) > 1 else 1.0
+    t_edges = np.append(t_eval, t_eval[-1] + dt) - dt / 2
+
+    return {
+        'mc_n': int(n_members),
+        'mc_spreads': dict(spreads),
+        'mc_t': t_eval.tolist(),
+        'mc_I_bands': histogram_quantiles(hist_I, edges, log=True).tolist(),
+        'mc_I_mean': (I_sum / n_members).tolist(),
+        'mc_peak_time': histogram_quantiles(hist_peak_t, t_edges).tolist(),
+        'mc_peak_height': histogram_quantiles(hist_peak, edges, log=True).tolist(),
+        'mc_peak_time_hist': hist_peak_t.tolist(),
+        'mc_peak_height_hist': hist_peak.tolist(),
+    }
@@ -0,0 +1,16 @@
+from core.monte_carlo import monte_carlo
+from core.task_thread import TaskThread
+
+
+class MonteCarloThread(TaskThread):
+    """Фоновый расчет полос неопределенности SEIR в пуле процессов"""
+
+    def __init__(self, base, spreads, n_members):
+        super().__init__()
+        self.base = base
+        self.spreads = spreads
+        self.n_members = n_members
+
+    def compute(self):
+        return monte_carlo(self.base, self.spreads, self.n_members,
+                           on_chunk=self.report, should_stop=self.should_stop)
@@ -0,0 +1,715 @@
+"""Встроенный решатель ОДУ на NumPy (метод Дормана–Принса 5(4)).
+
+Работает без Wolfram Kernel, выдает значения на той же сетке, что и
+Table[...] в выражениях Wolfram, и умеет отдавать строки порциями
+по мере интегрирования. На жестких участках (например, IS-LM с сильно
+разными скоростями подстройки) расчет переходит на неявный метод
+Radau IIA с аналитической матрицей Якоби модели и возвращается
+обратно, когда жесткость пропадает.
+"""
+import time
+
+import numpy as np
+
+from core.tasks import Cancelled
+from core.models import MAXIMUM, MINIMUM, MODELS, RISING
+
+# ---------- Таблица Бутчера DOPRI5 ----------
+C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+]
+A_ROWS = [np.array(row) for row in A]
+B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+# Разность решений 5-го и 4-го порядка (7-я стадия — FSAL)
+E = np.array([-71 / 57600, 0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40])
+# Коэффициенты плотной выдачи 4-го порядка
+P = np.array([
+    [1, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200 / 32700410799, -68118460800 / 10900136933, 87487479700 / 32700410799],
+    [0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+    [0, 127303824393 / 49829197408, -318862633887 / 49829197408, 701980252875 / 199316789632],
+    [0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+    [0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+])
+
+RTOL = 1e-8
+ATOL = 1e-10
+
+# Адаптивная выдача (integrate_adaptive): допустимое отклонение ломаной от
+# решения (доля наибольшего модуля переменной) и проверок внутри шага
+OUTPUT_TOLERANCE = 1e-3
+OUTPUT_SAMPLES = 3
+
+# Итераций уточнения момента события внутри шага (метод Иллинойса)
+ROOT_ITERATIONS = 30
+
+# Не чаще стольких секунд между порциями строк
+CHUNK_INTERVAL = 0.1
+
+
+class SolverCancelled(Cancelled):
+    """Расчет остановлен по запросу"""
+
+
+# ---------- Правые части моделей ----------
+# Скомпилированы из описаний core.models. u имеет форму (n_vars,) или
+# (n_vars, n_members); параметры — скаляры или массивы (n_members,),
+# поэтому те же функции годятся для ансамблей.
+
+lotka_rhs = MODELS["lotka"].rhs
+competition_rhs = MODELS["competition"].rhs
+seir_rhs = MODELS["seir"].rhs
+islm_rhs = MODELS["islm"].rhs
+lorenz_rhs = MODELS["lorenz"].rhs
+
+
+# ---------- Явный метод DOPRI5 ----------
+
+def _rms_norm(x):
+    return np.sqrt(np.mean(x * x))
+
+
+def _error_norm(x):
+    """Норма ошибки шага: у ансамбля — по худшему члену, чтобы трудные члены не растворялись в среднем"""
+    if x.ndim == 1:
+        return _rms_norm(x)
+    return np.sqrt(np.mean(x * x, axis=0)).max()
+
+
+def _initial_step(rhs, t0, y0, f0, p, direction, rtol, atol):
+    """Начальный шаг по Хайреру (как в scipy.integrate)"""
+    scale = atol + np.abs(y0) * rtol
+    d0 = _rms_norm(y0 / scale)
+    d1 = _rms_norm(f0 / scale)
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+
+    y1 = y0 + h0 * direction * f0
+    f1 = rhs(t0 + h0 * direction, y1, p)
+    d2 = _rms_norm((f1 - f0) / scale) / h0
+
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+    return min(100 * h0, h1)
+
+
+def _combine(w, K):
+    """Сумма w[..., i] K[i] по стадиям: то же, что tensordot, без его накладных расходов"""
+    w = np.asarray(w)
+    return (w @ K.reshape(K.shape[0], -1)).reshape(w.shape[:-1] + K.shape[1:])
+
+
+def dense_output(t, h, y, K, t_query):
+    """Значение решения внутри принятого шага [t, t + h] по интерполянту 4-го порядка
+    (t_query — число или массив моментов; для массива первая ось — моменты)"""
+    theta = (np.asarray(t_query) - t) / h
+    powers = theta[..., None] ** np.arange(1, 5)
+    return y + h * _combine(powers @ P.T, K)
+
+
+def steps(rhs, y0, p, t0, t_end, project=None, should_stop=None, rtol=RTOL, atol=ATOL):
+    """Генератор принятых шагов DOPRI5: (t, h, y, y_new, K).
+
+    K — стадии шага для dense_output; массив переиспользуется, поэтому
+    пользоваться им можно только до запроса следующего шага. project(y)
+    может корректировать состояние после шага (например, обнулять
+    отрицательную ставку); should_stop() прерывает расчет.
+    """
+    t = float(t0)
+    y = np.array(y0, dtype=float)
+
+    f = rhs(t, y, p)
+    h = _initial_step(rhs, t, y, f, p, 1.0, rtol, atol)
+    K = np.empty((7,) + y.shape)
+
+    while t_end - t > 1e-12 * abs(t_end):
+        if should_stop is not None and should_stop():
+            raise SolverCancelled()
+
+        h = min(h, t_end - t)
+        if h <= 1e-14 * max(1.0, abs(t)):
+            raise RuntimeError(f"Шаг интегрирования стал слишком мал (t = {t:.6g})")
+
+        K[0] = f
+        for s in range(1, 6):
+            dy = _combine(A_ROWS[s], K[:s])
+            K[s] = rhs(t + C[s] * h, y + h * dy, p)
+        y_new = y + h * _combine(B, K[:6])
+        f_new = rhs(t + h, y_new, p)
+        K[6] = f_new
+
+        scale = atol + np.maximum(np.abs(y), np.abs(y_new)) * rtol
+        err = _error_norm(h * _combine(E, K) / scale)
+
+        if not np.isfinite(err):
+            h *= 0.2
+            continue
+
+        if err > 1:
+            h *= max(0.2, 0.9 * err ** (-1 / 5))
+            continue
+
+        yield t, h, y, y_new, K
+
+        t, y, f = t + h, y_new, f_new
+
+        if project is not None:
+            y_projected = project(y)
+            if y_projected is not None:
+                y = y_projected
+                f = rhs(t, y, p)
+
+        factor = 10 if err == 0 else min(10, 0.9 * err ** (-1 / 5))
+        h *= factor
+
+
+# ---------- Неявный метод Radau IIA (порядок 5) ----------
+# Для жестких режимов: матрица Якоби берется аналитическая из описания
+# модели, а не оценивается конечными разностями.
+
+S6 = 6 ** 0.5
+C_RADAU = np.array([(4 - S6) / 10, (4 + S6) / 10, 1])
+A_RADAU = np.array([
+    [(88 - 7 * S6) / 360, (296 - 169 * S6) / 1800, (-2 + 3 * S6) / 225],
+    [(296 + 169 * S6) / 1800, (88 + 7 * S6) / 360, (-2 - 3 * S6) / 225],
+    [(16 - S6) / 36, (16 + S6) / 36, 1 / 9],
+])
+# Вещественное собственное число A^-1 и веса встроенной оценки ошибки (как в scipy.integrate.Radau)
+MU_REAL = 3 + 3 ** (2 / 3) - 3 ** (1 / 3)
+E_RADAU = np.array([-13 - 7 * S6, -13 + 7 * S6, -1]) / 3
+# Коэффициенты коллокационного многочлена для плотной выдачи
+P_RADAU = np.array([
+    [13 / 3 + 7 * S6 / 3, -23 / 3 - 22 * S6 / 3, 10 / 3 + 5 * S6],
+    [13 / 3 - 7 * S6 / 3, -23 / 3 + 22 * S6 / 3, 10 / 3 - 5 * S6],
+    [1 / 3, -8 / 3, 10 / 3],
+])
+NEWTON_MAXITER = 6
+
+# Переключение методов (как в DOPRI5 Хайрера): STIFF_STEPS шагов с |h λ| выше
+# границы устойчивости DOPRI5 — задача жесткая; счетчик сбрасывается после
+# CALM_STEPS нежестких шагов подряд. Обратно на DOPRI5 — после STIFF_STEPS
+# шагов Radau подряд, которые явный метод сделал бы устойчиво.
+STIFF_RATIO = 3.25
+STIFF_STEPS = 15
+CALM_STEPS = 6
+
+
+def _members(x, n):
+    """(n, *члены) -> (члены, n) для пакетной линейной алгебры"""
+    return x.reshape(n, -1).T
+
+
+def _newton_matrix(J, h, n):
+    """Обратные матрицы (члены, 3n, 3n) для I - h A⊗J и (n, n) для MU_REAL/h I - J"""
+    J = np.moveaxis(J.reshape(n, n, -1), -1, 0)
+    full = np.eye(3 * n) - h * np.einsum('ij,mab->miajb', A_RADAU, J).reshape(-1, 3 * n, 3 * n)
+    return np.linalg.inv(full), np.linalg.inv(MU_REAL / h * np.eye(n) - J)
+
+
+def radau_dense_output(t, h, y, Z, t_query):
+    """Значение решения внутри принятого шага Radau [t, t + h] по коллокационному многочлену"""
+    theta = (np.asarray(t_query) - t) / h
+    powers = theta[..., None] ** np.arange(1, 4)
+    return y + _combine(powers @ P_RADAU.T, Z)
+
+
+def radau_steps(rhs, jac, y0, p, t0, t_end, project=None, should_stop=None, rtol=RTOL, atol=ATOL, h=None):
+    """Генератор принятых шагов Radau IIA: (t, h, y, y_new, Z).
+
+    jac(t, y, p) — матрица Якоби (n_vars, n_vars, *члены); Z — приращения
+    стадий для radau_dense_output. Остальное — как в steps().
+    """
+    t = float(t0)
+    y = np.array(y0, dtype=float)
+    n = y.shape[0]
+    newton_tol = max(10 * np.finfo(float).eps / rtol, min(0.03, rtol ** 0.5))
+
+    f = rhs(t, y, p)
+    if h is None:
+        h = _initial_step(rhs, t, y, f, p, 1.0, rtol, atol)
+    J = jac(t, y, p)
+
+    while t_end - t > 1e-12 * abs(t_end):
+        if should_stop is not None and should_stop():
+            raise SolverCancelled()
+
+        h = min(h, t_end - t)
+        if h <= 1e-14 * max(1.0, abs(t)):
+            raise RuntimeError(f"Шаг интегрирования стал слишком мал (t = {t:.6g})")
+
+        inv_full, inv_real = _newton_matrix(J, h, n)
+        scale = atol + np.abs(y) * rtol
+
+        # Упрощенный метод Ньютона для приращений стадий Z
+        Z = np.zeros((3,) + y.shape)
+        converged = False
+        norm_old = None
+        for _ in range(NEWTON_MAXITER):
+            F = np.array([rhs(t + c * h, y + Z[i], p) for i, c in enumerate(C_RADAU)])
+            if not np.all(np.isfinite(F)):
+                break
+            R = -Z + h * _combine(A_RADAU, F)
+            dZ = inv_full @ np.concatenate([_members(R[i], n) for i in range(3)], axis=1)[..., None]
+            dZ = np.stack([dZ[:, i * n:(i + 1) * n, 0].T.reshape(y.shape) for i in range(3)])
+            Z += dZ
+            norm = _error_norm(dZ / scale)
+            rate = None if norm_old is None else norm / norm_old
+            if norm == 0 or (rate is not None and rate < 1 and rate / (1 - rate) * norm < newton_tol):
+                converged = True
+                break
+            if rate is not None and rate >= 1:
+                break
+            norm_old = norm
+
+        if not converged:
+            h *= 0.5
+            continue
+
+        y_new = y + Z[-1]
+        ZE = _combine(E_RADAU, Z) / h
+        error = (inv_real @ _members(f + ZE, n)[..., None])[..., 0].T.reshape(y.shape)
+        scale = atol + np.maximum(np.abs(y), np.abs(y_new)) * rtol
+        err = _error_norm(error / scale)
+        if err > 1:
+            # Уточненная оценка (Хайрер, Ваннер): сглаживает завышенную ошибку жестких компонент
+            error = (inv_real @ _members(rhs(t, y + error, p) + ZE, n)[..., None])[..., 0].T.reshape(y.shape)
+            err = _error_norm(error / scale)
+
+        if not np.isfinite(err):
+            h *= 0.2
+            continue
+
+        if err > 1:
+            h *= max(0.2, 0.9 * err ** (-1 / 4))
+            continue
+
+        yield t, h, y, y_new, Z
+
+        t, y = t + h, y_new
+        if project is not None:
+            y_projected = project(y)
+            if y_projected is not None:
+                y = y_projected
+        f = rhs(t, y, p)
+        J = jac(t, y, p)
+
+        factor = 10 if err == 0 else min(10, 0.9 * err ** (-1 / 4))
+        h *= factor
+
+
+def _explicit_stiffness(h, y, y_new, K):
+    """Оценка |h λ| по двум последним стадиям DOPRI5 (Хайрер, Ваннер), худший член ансамбля"""
+    stage = y + h * _combine(A[5], K[:5])
+    num = np.sqrt(np.sum((K[6] - K[5]) ** 2, axis=0))
+    den = np.sqrt(np.sum((y_new - stage) ** 2, axis=0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(den > 0, h * num / den, 0.0)
+    return float(np.max(ratio))
+
+
+def _implicit_stiffness(h, J):
+    """Верхняя оценка |h λ| по строчной норме матрицы Якоби, худший член ансамбля"""
+    return float(h * np.max(np.abs(J).sum(axis=1)))
+
+
+# ---------- Интегратор ----------
+
+# ---------- События ----------
+
+class Event:
+    """Событие g(t, y, p) = 0 для integrate() и integrate_adaptive().
+
+    direction: 1 — g переходит через ноль снизу вверх, -1 — сверху вниз,
+    0 — в обе стороны; terminal — расчет останавливается в момент события.
+    У ансамбля g считается по первому члену (основная траектория).
+    """
+
+    def __init__(self, name, g, direction=0, terminal=False, label=None):
+        self.name = name
+        self.g = g
+        self.direction = direction
+        self.terminal = terminal
+        self.label = label or name
+
+    def __call__(self, t, y, p):
+        return float(np.ravel(self.g(t, y, p))[0])
+
+    def crosses(self, g0, g1):
+        upward = g0 < 0 <= g1
+        downward = g0 > 0 >= g1
+        return (self.direction >= 0 and upward) or (self.direction <= 0 and downward)
+
+
+def locate_root(g, interpolate, t, h, y, K, g0, g1):
+    """Момент и состояние, где g(t, y) = 0 внутри принятого шага [t, t + h]:
+    метод Иллинойса по плотной выдаче шага; g0, g1 — значения на концах"""
+    a, b = t, t + h
+    ga, gb = g0, g1
+    side = 0
+    for _ in range(ROOT_ITERATIONS):
+        c = b - gb * (b - a) / (gb - ga)
+        gc = g(c, interpolate(t, h, y, K, c))
+        if gc == 0 or abs(b - a) <= 1e-13 * max(1.0, abs(c)):
+            break
+        if np.sign(gc) == np.sign(gb):
+            b, gb = c, gc
+            if side == -1:
+                ga /= 2
+            side = -1
+        else:
+            a, ga = c, gc
+            if side == 1:
+                gb /= 2
+            side = 1
+    return c, interpolate(t, h, y, K, c)
+
+
+def model_events(model, names=None, terminal=()):
+    """События модели (ModelSpec.events) в виде Event.
+
+    names — только события с этими именами, terminal — имена событий,
+    которые останавливают расчет.
+    """
+    spec = MODELS[model]
+    events = []
+    for name, kind, state, value, label in spec.events:
+        if names is not None and name not in names:
+            continue
+        i = spec.states.index(state)
+        if kind in (MAXIMUM, MINIMUM):
+            # Экстремум переменной — ноль ее производной
+            g = lambda t, y, p, i=i: spec.rhs(t, y, p)[i]
+            direction = -1 if kind == MAXIMUM else 1
+        else:
+            g = lambda t, y, p, i=i, value=value: y[i] - value
+            direction = 1 if kind == RISING else -1
+        events.append(Event(name, g, direction, name in terminal, label))
+    return events
+
+
+def _event_steps(step_iter, events, p, on_event):
+    """Шаги _accepted_steps с поиском событий: к шагу добавляется t_stop — конец
+    шага или момент терминального события, и список событий шага [(t, y, событие)]"""
+    last_y, last_g = None, None
+    for t, h, y, y_new, K, interpolate in step_iter:
+        hits = []
+        # g в начале шага — это g в конце предыдущего, если состояние то же
+        starts = last_g if y is last_y else [event(t, y, p) for event in events]
+        ends = [event(t + h, y_new, p) for event in events]
+        last_y, last_g = y_new, ends
+        for event, g0, g1 in zip(events, starts, ends):
+            if event.crosses(g0, g1):
+                if g1 == 0:
+                    # Конец шага прижат к границе (project): корень ищется по самому решению шага
+                    g1 = event(t + h, interpolate(t, h, y, K, t + h), p) or g1
+                t_hit, y_hit = locate_root(lambda tc, yc: event(tc, yc, p), interpolate, t, h, y, K, g0, g1)
+                hits.append((t_hit, y_hit, event))
+        hits.sort(key=lambda hit: hit[0])
+
+        t_stop = t + h
+        for n, (t_hit, y_hit, event) in enumerate(hits):
+            if on_event is not None:
+                on_event(event, t_hit, y_hit)
+            if event.terminal:
+                t_stop, hits = t_hit, hits[:n + 1]
+                break
+
+        yield t, h, y, y_new, K, interpolate, t_stop, hits
+        if t_stop < t + h:
+            step_iter.close()
+            return
+
+
+def _accepted_steps(rhs, y0, p, t0, t_end, project, should_stop, rtol, atol, jac, method):
+    """Принятые шаги с переключением DOPRI5 / Radau IIA: (t, h, y, y_new, K, interpolate)"""
+    if method not in ("auto", "explicit", "implicit"):
+        raise ValueError(f"Неизвестный метод: {method}")
+    if method == "implicit" and jac is None:
+        raise ValueError("Неявному методу нужна матрица Якоби")
+    switching = method == "auto" and jac is not None
+
+    t, y = t0, y0
+    stiff = method == "implicit"
+    h_next = None
+    while True:
+        if stiff:
+            stepper = radau_steps(rhs, jac, y, p, t, t_end, project, should_stop, rtol, atol, h_next)
+            interpolate = radau_dense_output
+        else:
+            stepper = steps(rhs, y, p, t, t_end, project, should_stop, rtol, atol)
+            interpolate = dense_output
+        votes = calm = 0
+
+        for t, h, y, y_new, K in stepper:
+            yield t, h, y, y_new, K, interpolate
+            t_new = t + h
+
+            if not switching:
+                continue
+            if stiff:
+                # Обратно — только если явный метод устойчив на всем отрезке подряд
+                votes = votes + 1 if _implicit_stiffness(h, jac(t_new, y_new, p)) < STIFF_RATIO else 0
+            elif _explicit_stiffness(h, y, y_new, K) > STIFF_RATIO:
+                votes, calm = votes + 1, 0
+            else:
+                calm += 1
+                if calm >= CALM_STEPS:
+                    votes = calm = 0
+            if votes >= STIFF_STEPS:
+                break
+        else:
+            return
+
+        # Смена метода: продолжаем с конца принятого шага
+        stepper.close()
+        t, y, h_next = t_new, y_new, h
+        if project is not None:
+            y_projected = project(y)
+            if y_projected is not None:
+                y = y_projected
+        stiff = not stiff
+
+
+def integrate(rhs, y0, p, t_eval, on_step=None, project=None, should_stop=None,
+              rtol=RTOL, atol=ATOL, jac=None, method="auto", events=(), on_event=None):
+    """Интегрирует систему и возвращает значения на сетке t_eval.
+
+    on_step(ts, ys) вызывается после каждого принятого шага с новыми узлами
+    сетки и значениями в них; project и should_stop — как в steps().
+    method: "explicit" — DOPRI5, "implicit" — Radau IIA с матрицей Якоби
+    jac, "auto" — DOPRI5 с переходом на Radau IIA, пока задача жесткая
+    (без jac — всегда DOPRI5).
+    events — список Event: on_event(event, t, y) получает точный момент и
+    состояние каждого события; после терминального события расчет
+    останавливается и возвращаются только узлы сетки до него.
+    """
+    t_eval = np.asarray(t_eval, dtype=float)
+    y = np.array(y0, dtype=float)
+
+    out = np.empty((len(t_eval),) + y.shape)
+    out[0] = y
+    next_idx = 1
+    if on_step is not None:
+        on_step(t_eval[:1], out[:1])
+
+    stepper = _accepted_steps(rhs, y, p, t_eval[0], t_eval[-1], project, should_stop, rtol, atol, jac, method)
+    for t, h, y, y_new, K, interpolate, t_stop, _ in _event_steps(stepper, events, p, on_event):
+        # Плотная выдача во все узлы сетки внутри принятого шага
+        first = next_idx
+        next_idx = int(np.searchsorted(t_eval, t_stop + 1e-12 * abs(t_stop), side='right'))
+        if next_idx > first:
+            out[first:next_idx] = interpolate(t, h, y, K, t_eval[first:next_idx])
+            if on_step is not None:
+                on_step(t_eval[first:next_idx], out[first:next_idx])
+    return out[:next_idx]
+
+
+def integrate_adaptive(rhs, y0, p, t0, t_end, tolerance=OUTPUT_TOLERANCE, on_step=None, project=None,
+                       should_stop=None, rtol=RTOL, atol=ATOL, jac=None, method="auto", events=(), on_event=None):
+    """Интегрирует систему и сам выбирает моменты выдачи; возвращает (ts, ys).
+
+    Точка выдается, только когда без нее ломаная через выданные точки
+    отклонилась бы от решения больше чем на tolerance (доля наибольшего
+    модуля переменной): на плато точек мало, на резких участках (пик
+    эпидемии) — сколько нужно. Решение проверяется в концах шагов и в
+    OUTPUT_SAMPLES точках плотной выдачи внутри каждого шага. Моменты
+    событий всегда становятся узлами (пик выводится точно). on_step(ts, ys)
+    получает новые выданные точки; остальное — как в integrate().
+    """
+    y = np.array(y0, dtype=float)
+    t0, t_end = float(t0), float(t_end)
+    ts, ys = [t0], [y]
+    if on_step is not None:
+        on_step(np.array(ts), np.array(ys))
+
+    scale = np.maximum(np.abs(y), atol)
+    # Точки после последней выданной, которые пока заменяет отрезок ломаной
+    pending_t, pending_y = [], []
+    thetas = np.arange(1, OUTPUT_SAMPLES + 1) / (OUTPUT_SAMPLES + 1)
+
+    stepper = _accepted_steps(rhs, y, p, t0, t_end, project, should_stop, rtol, atol, jac, method)
+    for t, h, y, y_new, K, interpolate, t_stop, hits in _event_steps(stepper, events, p, on_event):
+        inside = t + h * thetas
+        inside = inside[inside < t_stop]
+        end = y_new if t_stop == t + h else interpolate(t, h, y, K, t_stop)
+        samples = [(t_q, y_q, False) for t_q, y_q in zip(inside, interpolate(t, h, y, K, inside))]
+        samples += [(t_hit, y_hit, True) for t_hit, y_hit, _ in hits if t_hit < t_stop]
+        samples.sort(key=lambda sample: sample[0])
+        samples.append((t_stop, end, bool(hits) and t_stop < t + h))
+
+        first = len(ts)
+        for t_q, y_q, is_event in samples:
+            scale = np.maximum(scale, np.abs(y_q))
+            if is_event:
+                if t_q > ts[-1]:
+                    ts.append(t_q)
+                    ys.append(y_q)
+                pending_t, pending_y = [], []
+                continue
+            if pending_t:
+                t_a, y_a = ts[-1], ys[-1]
+                weights = ((np.array(pending_t) - t_a) / (t_q - t_a)).reshape((-1,) + (1,) * y.ndim)
+                chord = y_a + weights * (y_q - y_a)
+                if np.max(np.abs(chord - np.array(pending_y)) / scale) > tolerance:
+                    # Отрезок до y_q уже не годится: последняя точка становится узлом ломаной
+                    ts.append(pending_t[-1])
+                    ys.append(pending_y[-1])
+                    pending_t, pending_y = [], []
+            pending_t.append(t_q)
+            pending_y.append(y_q)
+
+        if on_step is not None and len(ts) > first:
+            on_step(np.array(ts[first:]), np.array(ys[first:]))
+
+    if pending_t:
+        ts.append(pending_t[-1])
+        ys.append(pending_y[-1])
+        if on_step is not None:
+            on_step(np.array(ts[-1:]), np.array(ys[-1:]))
+    return np.array(ts), np.array(ys)
+
+
+# ---------- Модели в формате строк Table[...] ----------
+
+def _grid(t_max, dt):
+    n = int(round(t_max / dt))
+    return np.arange(n + 1) * dt
+
+
+class _ChunkEmitter:
+    """Копит строки и отдает их не чаще CHUNK_INTERVAL"""
+
+    def __init__(self, on_chunk, to_rows, t_end):
+        self.on_chunk = on_chunk
+        self.to_rows = to_rows
+        self.t_end = t_end
+        self.pending = []
+        self.last_emit = 0.0
+
+    def __call__(self, ts, ys):
+        if self.on_chunk is None:
+            return
+        self.pending.extend(self.to_rows(ts, ys))
+        now = time.monotonic()
+        if now - self.last_emit >= CHUNK_INTERVAL:
+            self.flush()
+            self.last_emit = now
+
+    def flush(self):
+        if self.on_chunk is not None and self.pending:
+            fraction = float(self.pending[-1][0] / self.t_end) if self.t_end else 1.0
+            self.on_chunk(self.pending, fraction)
+            self.pending = []
+
+
+def _run(rhs, y0, p, t_eval, to_rows, on_chunk, should_stop, project=None, jac=None, tolerance=None,
+         events=(), on_event=None):
+    emitter = _ChunkEmitter(on_chunk, to_rows, t_eval[-1])
+    if tolerance is None:
+        out = integrate(rhs, y0, p, t_eval, on_step=emitter, project=project, should_stop=should_stop, jac=jac,
+                        events=events, on_event=on_event)
+        ts = t_eval[:len(out)]
+    else:
+        ts, out = integrate_adaptive(rhs, y0, p, t_eval[0], t_eval[-1], tolerance, on_step=emitter,
+                                     project=project, should_stop=should_stop, jac=jac,
+                                     events=events, on_event=on_event)
+    emitter.flush()
+    return to_rows(ts, out)
+
+
+# Имена параметров в порядке solve_model (совпадают с ключами записей БД)
+PARAM_NAMES = {key: spec.param_names for key, spec in MODELS.items()}
+
+# Коэффициенты скорости подстройки IS-LM — те же, что в выражении Wolfram
+ISLM_SPEEDS = MODELS["islm"].constant_values
+
+
+def _clamp(indices):
+    """Аналог WhenEvent[v[t] < 0, v[t] -> 0] для переменных indices (и для одного расчета, и для ансамбля)"""
+    def project(y):
+        if any(np.any(y[i] < 0) for i in indices):
+            y = y.copy()
+            for i in indices:
+                y[i] = np.maximum(y[i], 0.0)
+            return y
+        return None
+    return project
+
+
+def projection(model):
+    """Функция project для steps()/integrate() или None, если переменные модели не ограничены"""
+    spec = MODELS[model]
+    return _clamp([spec.states.index(state) for state in spec.clamp]) if spec.clamp else None
+
+
+def ensemble_problem(model, params):
+    """Постановка задачи (rhs, y0, p, t_eval, project) для одного расчета или ансамбля.
+
+    Любой параметр может быть массивом (n_members,) — тогда y0 имеет форму
+    (n_vars, n_members). Длительность расчета у всех членов должна совпадать.
+    """
+    if model not in MODELS:
+        raise ValueError(f"Unknown model: {model}")
+    spec = MODELS[model]
+    rates, initial, t_max = spec.split(params)
+    values = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in (*rates, *initial)])
+
+    if np.ndim(t_max) and np.ptp(t_max) > 0:
+        raise ValueError("Длительность расчета у членов ансамбля должна совпадать")
+    t_max = float(np.ravel(t_max)[0])
+
+    p = tuple(values[:len(rates)]) + spec.constant_values
+    return spec.rhs, np.array(values[len(rates):]), p, _grid(t_max, spec.dt), projection(model)
+
+
+def single_problem(model, params):
+    """Постановка одиночного расчета: (rhs, y0, p, t_eval, project, to_rows).
+
+    У моделей с возмущенной копией (Лоренц) y0 содержит два члена ансамбля;
+    to_rows(ts, ys) превращает решение в строки, как у Wolfram.
+    """
+    spec = MODELS.get(model)
+    if spec is None:
+        raise ValueError(f"Unknown model: {model}")
+    rhs, y0, p, t_eval, project = ensemble_problem(model, [float(v) for v in params])
+
+    if spec.twin:
+        # Основная и возмущенная траектории интегрируются вместе (два члена ансамбля)
+        state, eps = spec.twin
+        y0 = np.stack([y0, y0], axis=1)
+        y0[spec.states.index(state), 1] += eps
+
+    return rhs, y0, p, t_eval, project, lambda ts, ys: spec.rows(ts, ys, p)
+
+
+def solve_model(model, params, on_chunk=None, should_stop=None, tolerance=None, events=None, on_event=None):
+    """Решает модель встроенным решателем и возвращает строки как Wolfram.
+
+    on_chunk(rows, fraction) получает новые строки и долю пройденного t_max.
+    tolerance — адаптивная выдача с такой погрешностью (integrate_adaptive)
+    вместо равномерной сетки модели.
+    on_event(hit) получает каждое событие как словарь {name, label, t,
+    values} (значения переменных основной траектории в момент события);
+    events — список Event, по умолчанию — события модели (model_events).
+    """
+    spec = MODELS[model]
+    rhs, y0, p, t_eval, project, to_rows = single_problem(model, params)
+    if events is None:
+        events = model_events(model) if on_event is not None else ()
+
+    report = None
+    if on_event is not None:
+        def report(event, t, y):
+            values = {state: float(np.ravel(y[i])[0]) for i, state in enumerate(spec.states)}
+            on_event({'name': event.name, 'label': event.label, 't': float(t), 'values': values})
+
+    return _run(rhs, y0, p, t_eval, to_rows, on_chunk, should_stop, project, spec.jacobian, tolerance,
+                events, report)
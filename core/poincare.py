@@ -0,0 +1,57 @@
+"""Сечение Пуанкаре и отображение первого возвращения.
+
+Траектория не хранится: решатель отдает принятые шаги (с тем же
+переключением DOPRI5 / Radau IIA, что и у integrate), пересечения
+плоскости g(y) = y[var] - value ищет общий механизм событий по плотной
+выдаче шага. Найденные точки отдаются порциями, поэтому длина расчета
+ограничена только временем.
+"""
+import numpy as np
+
+from core.models import MODELS
+from core.native_solver import ATOL, PARAM_NAMES, RTOL, Event, _accepted_steps, _event_steps, ensemble_problem
+
+T_MAX = 2000
+T_TRANSIENT = 50
+CHUNK_POINTS = 500
+
+
+def section_crossings(model, params, variable, value, direction=1, t_max=T_MAX, t_transient=T_TRANSIENT,
+                      on_chunk=None, should_stop=None, chunk_points=CHUNK_POINTS):
+    """Пересечения плоскости y[variable] = value после переходного процесса.
+
+    direction: 1 — снизу вверх, -1 — сверху вниз, 0 — в обе стороны.
+    on_chunk(points, fraction) получает порции строк {t, y1, y2, ...}.
+    Возвращает массив всех пересечений (n, 1 + n_vars).
+    """
+    params = [params[name] for name in PARAM_NAMES[model]] if isinstance(params, dict) else list(params)
+    rhs, y0, p, _, project = ensemble_problem(model, params)
+    spec = MODELS[model]
+    index = spec.states.index(variable)
+
+    section = Event("section", lambda t, state, p: state[index] - value, direction)
+    found, pending = [], []
+
+    def on_event(event, t_hit, y_hit):
+        if t_hit >= t_transient:
+            pending.append([t_hit, *y_hit])
+
+    stepper = _accepted_steps(rhs, y0, p, 0.0, t_transient + t_max, project, should_stop, RTOL, ATOL,
+                              spec.jacobian, "auto")
+    for t, h, *_ in _event_steps(stepper, [section], p, on_event):
+        if len(pending) >= chunk_points:
+            found.extend(pending)
+            if on_chunk is not None:
+                on_chunk(np.array(pending), max(0.0, (t + h - t_transient) / t_max))
+            pending = []
+
+    found.extend(pending)
+    if on_chunk is not None and pending:
+        on_chunk(np.array(pending), 1.0)
+    return np.array(found).reshape(-1, 1 + len(spec.states))
+
+
+def return_map(crossings, column):
+    """Пары (u_k, u_{k+1}) для отображения первого возвращения по столбцу состояния"""
+    values = crossings[:, 1 + column]
+    return values[:-1], values[1:]
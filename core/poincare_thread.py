@@ -0,0 +1,29 @@
+from PyQt6.QtCore import pyqtSignal
+
+from core.poincare import section_crossings
+from core.task_thread import TaskThread
+
+
+class PoincareThread(TaskThread):
+    """Фоновый расчет сечения Пуанкаре с выдачей точек порциями; результат — число пересечений"""
+
+    # Порция точек, процент выполнения
+    section_chunk = pyqtSignal(list, int)
+
+    def __init__(self, model, params, variable, value, direction, t_max):
+        super().__init__()
+        self.model = model
+        self.params = params
+        self.variable = variable
+        self.value = value
+        self.direction = direction
+        self.t_max = t_max
+
+    def _on_chunk(self, points, fraction):
+        if not self._cancelled:
+            self.section_chunk.emit(points.tolist(), int(100 * fraction))
+
+    def compute(self):
+        crossings = section_crossings(self.model, self.params, self.variable, self.value, self.direction,
+                                      self.t_max, on_chunk=self._on_chunk, should_stop=self.should_stop)
+        return len(crossings)
@@ -0,0 +1,137 @@
+"""Замеры времени горячих путей внутри процесса.
+
+    with span("wolfram.evaluate"):
+        ...
+
+    @timed("db.save")
+    def save_calculation(...): ...
+
+Каждый интервал попадает в сводку по имени (число вызовов, сумма,
+максимум, последнее значение) и в кольцевой журнал событий, который
+выгружается в формате Chrome Trace (chrome://tracing, Perfetto).
+Модуль не зависит от Qt и безопасен для вызова из рабочих потоков.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Событий в журнале для трассы: старые вытесняются
+MAX_EVENTS = 20000
+
+_lock = threading.Lock()
+_events = deque(maxlen=MAX_EVENTS)
+_stats = {}
+_origin = time.perf_counter()
+# Растет при каждом новом замере: интерфейсу достаточно сравнить с прошлым значением
+version = 0
+
+
+class Stat:
+    """Сводка замеров одного имени, с"""
+
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+def record(name, start, duration, args=None):
+    """Добавляет готовый замер (start — по time.perf_counter(), с)"""
+    global version
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = Stat()
+        stat.count += 1
+        stat.total += duration
+        stat.max = max(stat.max, duration)
+        stat.last = duration
+        _events.append((name, start - _origin, duration, threading.get_ident(), args))
+        version += 1
+
+
+class span:
+    """Контекстный менеджер замера; args — подробности для трассы (модель, график)"""
+
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, **args):
+        self.name = name
+        self.args = args or None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, self.start, time.perf_counter() - self.start, self.args)
+        return False
+
+
+def timed(name):
+    """Декоратор: каждый вызов функции — интервал name"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def summary():
+    """Сводка [(имя, Stat)] по убыванию суммарного времени"""
+    with _lock:
+        items = [(name, _copy(stat)) for name, stat in _stats.items()]
+    return sorted(items, key=lambda item: item[1].total, reverse=True)
+
+
+def last(name):
+    """Последний замер name, с (None, если замеров не было)"""
+    with _lock:
+        stat = _stats.get(name)
+        return stat.last if stat is not None else None
+
+
+def reset():
+    global version
+    with _lock:
+        _events.clear()
+        _stats.clear()
+        version += 1
+
+
+def chrome_trace():
+    """Журнал событий в формате Chrome Trace Event (полные события "X", мкс)"""
+    pid = os.getpid()
+    with _lock:
+        events = list(_events)
+    threads = {tid: n for n, tid in enumerate(dict.fromkeys(tid for _, _, _, tid, _ in events))}
+    trace = [{"name": name, "ph": "X", "ts": round(start * 1e6, 3), "dur": round(duration * 1e6, 3),
+              "pid": pid, "tid": threads[tid], **({"args": args} if args else {})}
+             for name, start, duration, tid, args in events]
+    return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path):
+    """Записывает трассу в JSON-файл; возвращает число событий"""
+    trace = chrome_trace()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trace, f, ensure_ascii=False, default=str)
+    return len(trace["traceEvents"])
+
+
+def _copy(stat):
+    copy = Stat()
+    copy.count, copy.total, copy.max, copy.last = stat.count, stat.total, stat.max, stat.last
+    return copy
@@ -0,0 +1,57 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from core.profiling import span
+
+
+def chart_name(draw_fn):
+    """Имя графика для замеров: модуль графиков и функция (SIR_charts.draw_time)"""
+    return f"{draw_fn.__module__.rsplit('.', 1)[-1]}.{draw_fn.__name__}"
+
+
+def render_to_image(draw_fn, calc, figsize, dpi=100):
+    """Рисует фигуру в буфер Agg и возвращает QImage (без участия GUI-потока)"""
+    with span(f"plot.{chart_name(draw_fn)}"):
+        fig = Figure(figsize=figsize, dpi=dpi)
+        canvas = FigureCanvasAgg(fig)
+        draw_fn(fig, calc)
+        canvas.draw()
+
+    width, height = canvas.get_width_height(physical=True)
+    buffer = canvas.buffer_rgba()
+
+    # copy() обязателен: буфер Agg живет только вместе с фигурой
+    return QImage(bytes(buffer), width, height, QImage.Format.Format_RGBA8888).copy()
+
+
+class RenderThread(QThread):
+    """Фоновая растеризация набора графиков в изображения"""
+
+    image_ready = pyqtSignal(int, QImage)
+    render_error = pyqtSignal(int, str)
+
+    def __init__(self, jobs):
+        super().__init__()
+
+        # jobs: список (draw_fn, calc, figsize, dpi)
+        self.jobs = jobs
+        self._cancelled = False
+
+    def cancel(self):
+        """Прерывает отрисовку после текущей фигуры"""
+        self._cancelled = True
+
+    def run(self):
+        with span("plot.batch", figures=len(self.jobs)):
+            for index, (draw_fn, calc, figsize, dpi) in enumerate(self.jobs):
+                if self._cancelled:
+                    return
+                try:
+                    image = render_to_image(draw_fn, calc, figsize, dpi)
+                except Exception as e:
+                    self.render_error.emit(index, str(e))
+                    continue
+                self.image_ready.emit(index, image)
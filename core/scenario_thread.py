@@ -0,0 +1,20 @@
+from config import SOLVER_BACKEND
+from core.islm_scenarios import solve_scenarios
+from core.task_thread import TaskThread
+
+
+class ScenarioThread(TaskThread):
+    """Фоновый пакетный расчет сценариев IS-LM"""
+
+    def __init__(self, scenarios, backend=None):
+        super().__init__()
+        self.scenarios = scenarios
+        self.backend = backend or SOLVER_BACKEND
+
+    @property
+    def resource(self):
+        """Сценарии Wolfram идут одним запросом в общую сессию ядра (core.scheduler)"""
+        return "wolfram" if self.backend != "native" else None
+
+    def compute(self):
+        return solve_scenarios(self.scenarios, self.backend, should_stop=self.should_stop)
@@ -0,0 +1,141 @@
+"""Очередь фоновых расчетов.
+
+Все вкладки отдают потоки расчетов одному планировщику, а не запускают
+их сами. Планировщик:
+- держит не больше max_running потоков одновременно, а потоки Wolfram —
+  по одному (сессия ядра одна);
+- первым запускает расчет видимой вкладки, затем — по приоритету и по
+  очереди поступления;
+- заменяет устаревшее: новый расчет вкладки снимает ее ожидающий расчет
+  и останавливает идущий (cancel()), так что результат старых
+  параметров не досчитывается и не приходит во вкладку.
+
+Через планировщик идут все долгие расчеты: потоки моделей
+(CalculationThread) и потоки core.task_thread.TaskThread. Поток должен
+иметь метод cancel(); после него он не отправляет сигналы с результатами.
+Владелец — виджет, который запустил расчет (вкладка или ее панель).
+"""
+import itertools
+import os
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# Надбавка к приоритету расчетов видимой вкладки
+FOCUS_PRIORITY = 100
+# Ресурсы, которые нельзя делить между потоками
+EXCLUSIVE_RESOURCES = ("wolfram",)
+
+
+class Job:
+    """Поток в очереди: владелец и вид расчета определяют, что он заменяет"""
+
+    def __init__(self, owner, kind, thread, priority, resource, order):
+        self.owner = owner
+        self.kind = kind
+        self.thread = thread
+        self.priority = priority
+        self.resource = resource
+        self.order = order
+        self.cancelled = False
+
+    def same_slot(self, owner, kind):
+        return self.owner is owner and self.kind == kind
+
+
+class JobScheduler(QObject):
+    """Очередь потоков с ограничением числа одновременных расчетов"""
+
+    # Идет расчетов, ждет в очереди
+    queue_changed = pyqtSignal(int, int)
+
+    def __init__(self, max_running=None):
+        super().__init__()
+        self.max_running = max_running or max(1, (os.cpu_count() or 2) - 1)
+        self.running = []
+        self.pending = []
+        self.focus = None
+        self._order = itertools.count()
+
+    def submit(self, owner, thread, kind="calculation", priority=0, resource=None):
+        """Ставит поток в очередь, заменяя ожидающий и идущий расчет того же владельца и вида;
+        resource по умолчанию — атрибут resource потока"""
+        if resource is None:
+            resource = getattr(thread, "resource", None)
+        self.cancel(owner, kind, notify=False)
+        self.pending.append(Job(owner, kind, thread, priority, resource, next(self._order)))
+        self._dispatch()
+        return thread
+
+    def cancel(self, owner, kind="calculation", notify=True):
+        """Снимает ожидающий и останавливает идущий расчет владельца.
+
+        Возвращает True, если остановлен идущий поток: его finished еще
+        придет. Снятый из очереди поток не запускался, и finished у него не будет.
+        """
+        self.pending = [job for job in self.pending if not job.same_slot(owner, kind)]
+        stopped = False
+        for job in self.running:
+            if job.same_slot(owner, kind) and not job.cancelled:
+                job.cancelled = True
+                job.thread.cancel()
+                stopped = True
+        if notify:
+            self._dispatch()
+        return stopped
+
+    def cancel_all(self):
+        self.pending = []
+        for job in self.running:
+            job.cancelled = True
+            job.thread.cancel()
+        self._notify()
+
+    def is_busy(self, owner, kind="calculation"):
+        """Есть ли у владельца неотмененный расчет (в очереди или идущий)"""
+        return any(job.same_slot(owner, kind) and not job.cancelled for job in self.running + self.pending)
+
+    def set_focus(self, owner):
+        """Видимая вкладка: ее расчеты и расчеты ее панелей идут первыми"""
+        self.focus = owner
+
+    def _focused(self, owner):
+        if self.focus is None:
+            return False
+        return owner is self.focus or (hasattr(self.focus, "isAncestorOf") and self.focus.isAncestorOf(owner))
+
+    def _rank(self, job):
+        boost = FOCUS_PRIORITY if self._focused(job.owner) else 0
+        return job.priority + boost, -job.order
+
+    def _dispatch(self):
+        while self.pending and len(self.running) < self.max_running:
+            busy = {job.resource for job in self.running if job.resource in EXCLUSIVE_RESOURCES}
+            ready = [job for job in self.pending if job.resource not in busy]
+            if not ready:
+                break
+            job = max(ready, key=self._rank)
+            self.pending.remove(job)
+            self.running.append(job)
+            job.thread.finished.connect(lambda job=job: self._on_finished(job))
+            job.thread.start()
+        self._notify()
+
+    def _on_finished(self, job):
+        if job in self.running:
+            self.running.remove(job)
+        self._dispatch()
+
+    def _notify(self):
+        active = sum(not job.cancelled for job in self.running)
+        self.queue_changed.emit(active, len(self.pending))
+
+
+_scheduler = None
+
+
+def scheduler():
+    """Общий планировщик приложения (создается при первом обращении)"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = JobScheduler()
+    return _scheduler
@@ -0,0 +1,248 @@
+"""Подбор параметров SEIR по наблюдаемой заболеваемости.
+
+Модельная заболеваемость — поток E -> I: mu(t) = N * alpha * E(t).
+Подбираются beta, alpha, gamma, E0, I0 (S0 = 1 - E0 - I0, R0 = 0)
+методом Левенберга–Марквардта в логарифмах параметров. Градиенты
+берутся из уравнений чувствительности, интегрируемых вместе с моделью.
+Все старты одной пачки идут синхронно одним ансамблем решателя, пачки
+считаются в пуле процессов.
+"""
+import csv
+import math
+import os
+
+import numpy as np
+
+from core.models import MODELS
+from core.native_solver import integrate
+from core.tasks import pool_results
+
+PARAMS = ("beta", "alpha", "gamma", "E0", "I0")
+METHODS = ("lsq", "poisson")
+
+# Границы параметров (и диапазон случайных стартов)
+BOUNDS = np.array([
+    [1e-3, 10.0],
+    [1e-3, 5.0],
+    [1e-3, 5.0],
+    [1e-7, 0.2],
+    [1e-7, 0.2],
+])
+START_BOUNDS = np.array([
+    [0.05, 3.0],
+    [0.05, 1.0],
+    [0.02, 1.0],
+    [1e-5, 0.05],
+    [1e-5, 0.05],
+])
+
+N_STARTS = 64
+MAX_ITER = 60
+RTOL = 1e-7
+ATOL = 1e-12
+
+# 95% доверительный интервал
+Z_95 = 1.959963984540054
+
+
+def load_incidence_csv(path):
+    """Читает CSV из двух столбцов (время, число новых случаев); строки-заголовки пропускаются"""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        rows = []
+        for row in csv.reader(f, dialect):
+            try:
+                rows.append((float(row[0].replace(',', '.')), float(row[1].replace(',', '.'))))
+            except (ValueError, IndexError):
+                continue
+
+    if len(rows) < len(PARAMS) + 1:
+        raise ValueError("В файле слишком мало строк с данными")
+    data = np.array(sorted(rows))
+    return data[:, 0], data[:, 1]
+
+
+def seir_sensitivity_rhs(t, u, p):
+    """SEIR вместе с матрицей чувствительности dy/d(beta, alpha, gamma, E0, I0) (состояние 4 + 20).
+
+    Правая часть и обе матрицы производных берутся из описания модели (core.models).
+    """
+    spec = MODELS["seir"]
+    state = u[:4]
+    sens = u[4:].reshape((4, 5) + u.shape[1:])
+
+    d_sens = np.einsum('ij...,jk...->ik...', spec.jacobian(t, state, p), sens)
+    # Явная зависимость правой части от beta, alpha, gamma (у E0 и I0 ее нет)
+    d_sens[:, :3] += spec.param_jacobian(t, state, p)
+    return np.concatenate([spec.rhs(t, state, p), d_sens.reshape((20,) + u.shape[1:])])
+
+
+def model_incidence(theta, t_obs, population):
+    """Заболеваемость и ее производные по параметрам для ансамбля theta (5, n_members).
+
+    Возвращает mu (n_obs, n_members) и d_mu (n_obs, 5, n_members).
+    """
+    beta, alpha, gamma, E0, I0 = theta
+    n_members = theta.shape[1]
+
+    state = np.array([1 - E0 - I0, E0, I0, np.zeros(n_members)])
+    sens = np.zeros((4, 5, n_members))
+    sens[:, 3] = np.array([-1, 1, 0, 0])[:, None]
+    sens[:, 4] = np.array([-1, 0, 1, 0])[:, None]
+    u0 = np.concatenate([state, sens.reshape(20, n_members)])
+
+    # Интегрируем от нуля, даже если наблюдения начинаются позже
+    t_eval = np.concatenate([[0.0], t_obs]) if t_obs[0] > 0 else t_obs
+    ys = integrate(seir_sensitivity_rhs, u0, (beta, alpha, gamma), t_eval, rtol=RTOL, atol=ATOL)
+    ys = ys[-len(t_obs):]
+
+    E = ys[:, 1]
+    dE = ys[:, 4 + 5:4 + 10]
+    mu = population * alpha * E
+    d_mu = population * alpha * dE
+    d_mu[:, 1] += population * E
+    return mu, d_mu
+
+
+def _objective(mu, d_mu, cases, method):
+    """Целевая функция, ее градиент и информационная матрица (Гаусс–Ньютон / Фишер)"""
+    if method == "lsq":
+        r = mu - cases[:, None]
+        obj = 0.5 * np.sum(r * r, axis=0)
+        grad = np.einsum('tm,tjm->mj', r, d_mu)
+        info = np.einsum('tim,tjm->mij', d_mu, d_mu)
+    else:
+        # Пуассоновское правдоподобие: -log L = sum(mu - c log mu) + const
+        mu_safe = np.maximum(mu, 1e-12)
+        obj = np.sum(mu_safe - cases[:, None] * np.log(mu_safe), axis=0)
+        grad = np.einsum('tm,tjm->mj', 1 - cases[:, None] / mu_safe, d_mu)
+        info = np.einsum('tim,tjm,tm->mij', d_mu, d_mu, 1 / mu_safe)
+    return obj, grad, info
+
+
+def _in_log_space(theta, grad, info):
+    """Переход к phi = log(theta): d/dphi = theta * d/dtheta"""
+    scale = theta.T
+    return grad * scale, info * scale[:, :, None] * scale[:, None, :]
+
+
+def fit_starts(starts, t_obs, cases, population, method="lsq", max_iter=MAX_ITER):
+    """Левенберг–Марквардт для пачки стартов (5, n_members) синхронно одним ансамблем.
+
+    Возвращает (theta (5, n), значения целевой функции (n,)).
+    """
+    t_obs = np.asarray(t_obs, dtype=float)
+    cases = np.asarray(cases, dtype=float)
+    log_lo, log_hi = np.log(BOUNDS[:, 0])[:, None], np.log(BOUNDS[:, 1])[:, None]
+
+    phi = np.clip(np.log(starts), log_lo, log_hi)
+    theta = np.exp(phi)
+    mu, d_mu = model_incidence(theta, t_obs, population)
+    obj, grad, info = _objective(mu, d_mu, cases, method)
+    grad, info = _in_log_space(theta, grad, info)
+
+    n_members = phi.shape[1]
+    lam = np.full(n_members, 1e-2)
+    active = np.ones(n_members, dtype=bool)
+    eye = np.eye(len(PARAMS))
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+
+        damped = info + lam[:, None, None] * (np.diagonal(info, axis1=1, axis2=2)[:, :, None] * eye + 1e-12 * eye)
+        # pinv вместо solve: у отдельных стартов матрица может быть вырожденной
+        delta = (np.linalg.pinv(damped) @ -grad[:, :, None])[:, :, 0].T
+        delta = np.clip(delta, -2, 2) * active
+
+        phi_try = np.clip(phi + delta, log_lo, log_hi)
+        theta_try = np.exp(phi_try)
+        mu_t, d_mu_t = model_incidence(theta_try, t_obs, population)
+        obj_t, grad_t, info_t = _objective(mu_t, d_mu_t, cases, method)
+        grad_t, info_t = _in_log_space(theta_try, grad_t, info_t)
+
+        better = active & np.isfinite(obj_t) & (obj_t < obj)
+        improvement = np.where(better, (obj - obj_t) / np.maximum(np.abs(obj), 1e-300), 0)
+
+        phi[:, better] = phi_try[:, better]
+        obj[better] = obj_t[better]
+        grad[better] = grad_t[better]
+        info[better] = info_t[better]
+        lam = np.where(better, lam * 0.3, lam * 10)
+
+        # Сошлись: шаг почти ничего не дает или демпфирование стало огромным
+        converged = (better & (improvement < 1e-10)) | (lam > 1e10)
+        active &= ~converged
+
+    return np.exp(phi), obj
+
+
+def _confidence(theta, t_obs, cases, population, method):
+    """Ковариация по обратной информационной матрице в логарифмах -> 95% интервалы"""
+    mu, d_mu = model_incidence(theta[:, None], t_obs, population)
+    obj, grad, info = _objective(mu, d_mu, cases, method)
+    _, info = _in_log_space(theta[:, None], grad, info)
+    info = info[0]
+
+    if method == "lsq":
+        # Дисперсию шума оцениваем по остаткам
+        dof = max(1, len(t_obs) - len(PARAMS))
+        info = info / (2 * obj[0] / dof)
+
+    cov = np.linalg.pinv(info)
+    std = np.sqrt(np.maximum(np.diag(cov), 0))
+    return theta * np.exp(-Z_95 * std), theta * np.exp(Z_95 * std), mu[:, 0]
+
+
+def fit_seir(t_obs, cases, population=1.0, method="lsq", n_starts=N_STARTS, seed=None,
+             max_workers=None, on_chunk=None, should_stop=None):
+    """Мультистарт-подбор: лучшие параметры, 95% интервалы и модельная кривая.
+
+    on_chunk(done, total) вызывается по мере завершения пачек стартов.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Неизвестный метод: {method}")
+    t_obs = np.asarray(t_obs, dtype=float)
+    cases = np.asarray(cases, dtype=float)
+
+    rng = np.random.default_rng(seed)
+    log_lo, log_hi = np.log(START_BOUNDS[:, 0]), np.log(START_BOUNDS[:, 1])
+    starts = np.exp(log_lo[:, None] + rng.random((len(PARAMS), n_starts)) * (log_hi - log_lo)[:, None])
+
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = math.ceil(n_starts / workers)
+    chunks = [starts[:, i:i + chunk_size] for i in range(0, n_starts, chunk_size)]
+
+    thetas, objectives = [], []
+    tasks = [(chunk, t_obs, cases, population, method) for chunk in chunks]
+    for n, (theta, obj) in pool_results(fit_starts, tasks, max_workers, should_stop):
+        thetas.append(theta)
+        objectives.append(obj)
+        if on_chunk is not None:
+            on_chunk(n + 1, len(tasks))
+
+    thetas = np.concatenate(thetas, axis=1)
+    objectives = np.concatenate(objectives)
+    best = int(np.nanargmin(objectives))
+    theta = thetas[:, best]
+    lower, upper, fitted = _confidence(theta, t_obs, cases, population, method)
+
+    return {
+        'method': method,
+        'population': float(population),
+        'params': dict(zip(PARAMS, theta.tolist())),
+        'lower': dict(zip(PARAMS, lower.tolist())),
+        'upper': dict(zip(PARAMS, upper.tolist())),
+        'objective': float(objectives[best]),
+        # Сколько стартов пришли в ту же точку (в пределах 1% по целевой функции)
+        'agreeing_starts': int(np.sum(objectives <= objectives[best] + 0.01 * abs(objectives[best]))),
+        'n_starts': int(n_starts),
+        't_obs': t_obs.tolist(),
+        'cases': cases.tolist(),
+        'fitted': fitted.tolist(),
+    }
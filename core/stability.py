@@ -0,0 +1,224 @@
+"""Положения равновесия моделей, собственные числа и тип устойчивости.
+
+Все функции векторизованы: любой параметр может быть массивом, и тогда
+анализ выполняется сразу на всей сетке параметров — без интегрирования,
+только формулы равновесий, матрицы Якоби и np.linalg.eigvals по стопке
+матриц. Карта режимов на сетке 200×200 строится за десятки миллисекунд.
+"""
+import numpy as np
+
+from core.models import MODELS
+
+# Типы точек равновесия
+STABLE_NODE, STABLE_FOCUS, UNSTABLE_NODE, UNSTABLE_FOCUS, SADDLE, SADDLE_FOCUS, CENTER, DEGENERATE = range(8)
+CLASS_LABELS = {
+    STABLE_NODE: "устойчивый узел",
+    STABLE_FOCUS: "устойчивый фокус",
+    UNSTABLE_NODE: "неустойчивый узел",
+    UNSTABLE_FOCUS: "неустойчивый фокус",
+    SADDLE: "седло",
+    SADDLE_FOCUS: "седло-фокус",
+    CENTER: "центр",
+    DEGENERATE: "негиперболическая",
+}
+STABLE_CLASSES = (STABLE_NODE, STABLE_FOCUS)
+
+# Параметры, от которых зависят равновесия (начальные условия и t_max не нужны)
+MODEL_PARAMS = {model: MODELS[model].rate_names for model in ("lotka", "competition", "islm", "lorenz")}
+
+# Имена точек равновесия в порядке, в котором их возвращает equilibria()
+EQUILIBRIUM_NAMES = {
+    "lotka": ("(0, 0)", "внутреннее"),
+    "competition": ("(0, 0)", "только X", "только Y", "сосуществование"),
+    "islm": ("E",),
+    "lorenz": ("O", "C±"),
+}
+
+# Относительные пороги «нулевой» вещественной и мнимой части (кратные корни
+# находятся с точностью порядка sqrt(eps), поэтому мнимый порог грубее)
+ZERO_TOL = 1e-9
+IMAG_TOL = 1e-6
+
+
+def _params(model, params):
+    """Параметры модели как массивы одной формы"""
+    return np.broadcast_arrays(*[np.asarray(params[name], dtype=float) for name in MODEL_PARAMS[model]])
+
+
+def equilibria(model, params):
+    """Точки равновесия: (точки (n_eq, n_vars, *сетка), допустимость (n_eq, *сетка))"""
+    values = _params(model, params)
+    shape = values[0].shape
+    zero, one = np.zeros(shape), np.ones(shape)
+
+    if model == "lotka":
+        alpha, beta, gamma, delta = values
+        points = [(zero, zero), (gamma / delta, alpha / beta)]
+        valid = [one > 0, (gamma / delta > 0) & (alpha / beta > 0)]
+
+    elif model == "competition":
+        p, q, r, s, t, u = values
+        den = q * u - r * t
+        safe = np.where(np.abs(den) > 1e-12, den, np.nan)
+        x_star, y_star = (p * u - r * s) / safe, (s * q - p * t) / safe
+        x_axis = p / np.where(np.abs(q) > 1e-12, q, np.nan)
+        y_axis = s / np.where(np.abs(u) > 1e-12, u, np.nan)
+        points = [(zero, zero), (x_axis, zero), (zero, y_axis), (x_star, y_star)]
+        valid = [one > 0, x_axis > 0, y_axis > 0, (x_star > 0) & (y_star > 0)]
+
+    elif model == "islm":
+        G, C0, MPC, I0, d, Ms, P, k, h = values
+        # (1 - MPC) Y + d i = C0 + I0 + G;  k Y - h i = Ms / P
+        den = (1 - MPC) * h + d * k
+        safe = np.where(np.abs(den) > 1e-12, den, np.nan)
+        Y = ((C0 + I0 + G) * h + d * Ms / P) / safe
+        rate = (k * Y - Ms / P) / h
+        points = [(Y, rate)]
+        valid = [np.isfinite(Y)]
+
+    elif model == "lorenz":
+        sigma, rho, beta = values
+        c = np.sqrt(np.maximum(beta * (rho - 1), 0))
+        points = [(zero, zero, zero), (c, c, rho - 1)]
+        valid = [one > 0, rho > 1]
+
+    else:
+        raise ValueError(f"Модель {model} не поддерживает анализ равновесий")
+
+    return np.array([np.array(point) for point in points]), np.array(valid)
+
+
+def jacobian(model, point, params):
+    """Матрица Якоби в точке: форма (n_vars, n_vars, *сетка)"""
+    if model not in MODEL_PARAMS:
+        raise ValueError(f"Модель {model} не поддерживает анализ равновесий")
+    spec = MODELS[model]
+    return spec.jacobian(0.0, point, tuple(_params(model, params)) + spec.constant_values)
+
+
+def _eigenvalues_2x2(m):
+    half_trace = (m[0, 0] + m[1, 1]) / 2
+    det = m[0, 0] * m[1, 1] - m[0, 1] * m[1, 0]
+    root = np.sqrt((half_trace ** 2 - det).astype(complex))
+    return np.array([half_trace + root, half_trace - root])
+
+
+def _eigenvalues_3x3(m):
+    """Корни характеристического многочлена λ³ + aλ² + bλ + c по Кардано с шагом Ньютона"""
+    a = -(m[0, 0] + m[1, 1] + m[2, 2])
+    b = (m[0, 0] * m[1, 1] - m[0, 1] * m[1, 0] + m[0, 0] * m[2, 2] - m[0, 2] * m[2, 0]
+         + m[1, 1] * m[2, 2] - m[1, 2] * m[2, 1])
+    c = -(m[0, 0] * (m[1, 1] * m[2, 2] - m[1, 2] * m[2, 1])
+          - m[0, 1] * (m[1, 0] * m[2, 2] - m[1, 2] * m[2, 0])
+          + m[0, 2] * (m[1, 0] * m[2, 1] - m[1, 1] * m[2, 0]))
+
+    # Приведение к t³ + pt + q = 0 подстановкой λ = t - a/3
+    p = b - a * a / 3
+    q = 2 * a ** 3 / 27 - a * b / 3 + c
+    disc = np.sqrt((q * q / 4 + p ** 3 / 27).astype(complex))
+    # Ветвь с большим модулем — без потери точности на вычитании
+    w = np.where(np.abs(-q / 2 + disc) >= np.abs(-q / 2 - disc), -q / 2 + disc, -q / 2 - disc)
+    u = w ** (1 / 3)
+
+    omega = np.exp(2j * np.pi / 3)
+    roots = []
+    for k in range(3):
+        uk = u * omega ** k
+        safe = np.where(uk == 0, 1, uk)
+        t = np.where(uk == 0, 0, uk - p / (3 * safe))
+        lam = t - a / 3
+        # Один шаг Ньютона убирает погрешность формулы
+        f = ((lam + a) * lam + b) * lam + c
+        df = (3 * lam + 2 * a) * lam + b
+        lam = np.where(np.abs(df) > 1e-300, lam - f / np.where(df == 0, 1, df), lam)
+        roots.append(lam)
+    return np.array(roots)
+
+
+def eigenvalues(matrices):
+    """Собственные числа стопки матриц (n, n, *сетка) -> (n, *сетка).
+
+    Для 2×2 и 3×3 — явные формулы (на порядок быстрее eigvals по стопке).
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        if matrices.shape[0] == 2:
+            return _eigenvalues_2x2(matrices)
+        if matrices.shape[0] == 3:
+            return _eigenvalues_3x3(matrices)
+
+        stacked = np.moveaxis(matrices, (0, 1), (-2, -1))
+        finite = np.isfinite(stacked).all(axis=(-2, -1))
+        values = np.full(stacked.shape[:-1], np.nan, dtype=complex)
+        values[finite] = np.linalg.eigvals(stacked[finite])
+    return np.moveaxis(values, -1, 0)
+
+
+def classify(eig):
+    """Тип точки по собственным числам (n, *сетка) -> коды (*сетка)"""
+    re, im = eig.real, eig.imag
+    scale = np.maximum(np.nanmax(np.abs(eig), axis=0), 1.0)
+    tol = ZERO_TOL * scale
+
+    n_pos = (re > tol).sum(axis=0)
+    n_neg = (re < -tol).sum(axis=0)
+    n_zero = eig.shape[0] - n_pos - n_neg
+    oscillating = (np.abs(im) > IMAG_TOL * scale).any(axis=0)
+
+    codes = np.where(oscillating, SADDLE_FOCUS, SADDLE)
+    codes = np.where(n_pos == 0, np.where(oscillating, STABLE_FOCUS, STABLE_NODE), codes)
+    codes = np.where(n_neg == 0, np.where(oscillating, UNSTABLE_FOCUS, UNSTABLE_NODE), codes)
+    # Нулевые вещественные части: центр (только мнимые пары) или вырожденный случай
+    center = (n_zero == eig.shape[0]) & oscillating
+    codes = np.where(n_zero > 0, np.where(center, CENTER, DEGENERATE), codes)
+    return codes
+
+
+def analyze(model, params):
+    """Полный анализ: точки, допустимость, собственные числа и типы всех равновесий"""
+    points, valid = equilibria(model, params)
+    eig = np.array([eigenvalues(jacobian(model, point, params)) for point in points])
+    codes = np.array([classify(e) for e in eig])
+    return {'points': points, 'valid': valid, 'eigenvalues': eig, 'classes': codes}
+
+
+def regime_map(model, params):
+    """Карта режимов: (коды режимов (*сетка), подписи режимов).
+
+    Режим — набор допустимых равновесий вместе с их типами; одинаковые
+    наборы получают одинаковый код.
+    """
+    result = analyze(model, params)
+    signature = np.where(result['valid'], result['classes'], -1)
+
+    # Набор типов -> одно целое (цифры в системе по основанию len(CLASS_LABELS) + 1)
+    base = len(CLASS_LABELS) + 1
+    weights = base ** np.arange(signature.shape[0])
+    keys = np.tensordot(weights, signature + 1, axes=1)
+    unique, inverse = np.unique(keys.ravel(), return_inverse=True)
+
+    names = EQUILIBRIUM_NAMES[model]
+    labels = []
+    for key in unique:
+        codes = [(int(key) // weight) % base - 1 for weight in weights]
+        labels.append("; ".join(f"{names[e]}: {CLASS_LABELS[code]}" for e, code in enumerate(codes) if code >= 0)
+                      or "нет равновесий")
+    return inverse.reshape(signature.shape[1:]), labels
+
+
+def spectral_abscissa(model, params, index):
+    """Наибольшая вещественная часть собственных чисел равновесия index (NaN, если оно недопустимо)"""
+    points, valid = equilibria(model, params)
+    eig = eigenvalues(jacobian(model, points[index], params))
+    abscissa = np.nanmax(eig.real, axis=0)
+    # Шум округления вокруг нуля (например, у центра) считаем нулем, как в classify()
+    scale = np.maximum(np.nanmax(np.abs(eig), axis=0), 1.0)
+    abscissa = np.where(np.abs(abscissa) <= ZERO_TOL * scale, 0.0, abscissa)
+    return np.where(valid[index], abscissa, np.nan)
+
+
+def lorenz_hopf_rho(sigma, beta):
+    """Порог субкритической бифуркации Хопфа для C±: rho_H = sigma (sigma + beta + 3) / (sigma - beta - 1)"""
+    sigma, beta = np.asarray(sigma, dtype=float), np.asarray(beta, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(sigma > beta + 1, sigma * (sigma + beta + 3) / (sigma - beta - 1), np.inf)
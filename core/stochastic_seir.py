@@ -0,0 +1,184 @@
+"""Стохастическая модель SEIR на целых числах людей.
+
+При малой численности используется точный алгоритм Гиллеспи, при
+большой — тау-скачки с биномиальными переходами (численности не уходят
+в минус). Реализации одной пачки идут синхронно: состояния всех
+реализаций хранятся массивами (n_real,), случайные числа берутся
+сразу для всей пачки. Пачки считаются в пуле процессов, результат
+пачки — суммы для средней траектории, размеры вспышек и несколько
+траекторий для графика.
+"""
+import math
+import os
+
+import numpy as np
+
+from core.tasks import pool_results
+
+METHODS = ("auto", "gillespie", "tau")
+# До такой численности "auto" выбирает точный алгоритм
+GILLESPIE_MAX_N = 2000
+
+N_REALIZATIONS = 2000
+CHUNK_SIZE = 5000
+DT = 0.5
+# Шагов тау-скачков на интервал сетки
+TAU_SUBSTEPS = 5
+
+# Вспышка считается угасшей, если инфекция исчезла, задев меньше этой доли восприимчивых
+MINOR_FRACTION = 0.1
+SAMPLE_PATHS = 40
+FINAL_SIZE_BINS = 100
+QUANTILES = (0.05, 0.5, 0.95)
+
+
+def _grid(t_max):
+    return np.arange(int(round(t_max / DT)) + 1) * DT
+
+
+def _gillespie(beta, alpha, gamma, N, state, t_grid, rng):
+    """Точный алгоритм Гиллеспи; state (4, n) — S, E, I, R. Возвращает (n_t, 4, n)"""
+    S, E, I, R = state
+    n = S.shape[0]
+    out = np.empty((len(t_grid), 4, n), dtype=np.int64)
+    t = np.zeros(n)
+    next_idx = np.zeros(n, dtype=np.int64)
+    columns = np.arange(n)
+
+    while True:
+        infection = beta * S * I / N
+        onset = alpha * E
+        recovery = gamma * I
+        total = infection + onset + recovery
+
+        # Время до следующего события; без событий состояние больше не меняется
+        with np.errstate(divide='ignore'):
+            t_new = t + rng.exponential(1.0, n) / total
+
+        # Узлы сетки до следующего события получают текущее состояние
+        while True:
+            pending = next_idx < len(t_grid)
+            pending[pending] &= t_grid[next_idx[pending]] < t_new[pending]
+            if not pending.any():
+                break
+            out[next_idx[pending], :, columns[pending]] = np.stack([S, E, I, R], axis=1)[pending]
+            next_idx[pending] += 1
+
+        if (next_idx >= len(t_grid)).all():
+            return out
+
+        fire = (total > 0) & (next_idx < len(t_grid))
+        u = rng.random(n) * total
+        to_E = fire & (u < infection)
+        to_I = fire & ~to_E & (u < infection + onset)
+        to_R = fire & ~to_E & ~to_I
+        S = S - to_E
+        E = E + to_E - to_I
+        I = I + to_I - to_R
+        R = R + to_R
+        t = t_new
+
+
+def _tau_leap(beta, alpha, gamma, N, state, t_grid, rng):
+    """Тау-скачки с биномиальными переходами; state (4, n). Возвращает (n_t, 4, n)"""
+    S, E, I, R = state
+    out = np.empty((len(t_grid), 4, S.shape[0]), dtype=np.int64)
+    out[0] = state
+    tau = DT / TAU_SUBSTEPS
+    p_onset = 1 - math.exp(-alpha * tau)
+    p_recovery = 1 - math.exp(-gamma * tau)
+
+    for k in range(1, len(t_grid)):
+        for _ in range(TAU_SUBSTEPS):
+            new_E = rng.binomial(S, 1 - np.exp(-beta * I / N * tau))
+            new_I = rng.binomial(E, p_onset)
+            new_R = rng.binomial(I, p_recovery)
+            S = S - new_E
+            E = E + new_E - new_I
+            I = I + new_I - new_R
+            R = R + new_R
+        out[k] = (S, E, I, R)
+    return out
+
+
+def stochastic_chunk(params, population, n, method, seed):
+    """Пачка реализаций: (сумма долей (n_t, 4), размеры вспышек (n,), угасшие (n,), траектории I)"""
+    beta, alpha, gamma, S0, E0, I0, R0, t_max = params
+    rng = np.random.default_rng(seed)
+    t_grid = _grid(t_max)
+
+    initial = np.array([round(S0 * population), round(E0 * population),
+                        round(I0 * population), round(R0 * population)], dtype=np.int64)
+    state = np.repeat(initial[:, None], n, axis=1)
+    N = float(initial.sum())
+
+    simulate = _gillespie if method == "gillespie" else _tau_leap
+    out = simulate(beta, alpha, gamma, N, state, t_grid, rng)
+
+    final = out[-1]
+    final_size = initial[0] - final[0]
+    extinct = (final[1] + final[2] == 0) & (final_size < MINOR_FRACTION * initial[0])
+    return out.sum(axis=2) / N, final_size, extinct, out[:, 2, :SAMPLE_PATHS] / N
+
+
+def simulate_stochastic(params, population, n_realizations=N_REALIZATIONS, method="auto", seed=None,
+                        chunk_size=None, max_workers=None, on_chunk=None, should_stop=None):
+    """Ансамбль стохастических реализаций SEIR.
+
+    params — (beta, alpha, gamma, S0, E0, I0, R0, t_max) в долях, как у детерминированной
+    модели; population — численность N. Возвращает словарь: средняя траектория в
+    формате строк {t, S, E, I, R}, вероятность угасания и распределение размера вспышки.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Неизвестный метод: {method}")
+    if method == "auto":
+        method = "gillespie" if population <= GILLESPIE_MAX_N else "tau"
+    params = [float(v) for v in params]
+
+    if chunk_size is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunk_size = min(CHUNK_SIZE, math.ceil(n_realizations / workers))
+    sizes = [min(chunk_size, n_realizations - i) for i in range(0, n_realizations, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    t_grid = _grid(params[-1])
+    total = np.zeros((len(t_grid), 4))
+    final_sizes, extinct, paths = [], [], []
+
+    tasks = [(params, population, size, method, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    for n, (chunk_total, chunk_final, chunk_extinct, chunk_paths) in pool_results(stochastic_chunk, tasks,
+                                                                                  max_workers, should_stop):
+        total += chunk_total
+        final_sizes.append(chunk_final)
+        extinct.append(chunk_extinct)
+        if len(paths) < SAMPLE_PATHS:
+            paths.extend(chunk_paths.T[:SAMPLE_PATHS - len(paths)].tolist())
+        if on_chunk is not None:
+            on_chunk(n + 1, len(tasks))
+
+    final_sizes = np.concatenate(final_sizes)
+    extinct = np.concatenate(extinct)
+    mean = total / n_realizations
+    major = final_sizes[~extinct]
+
+    # При малой численности — корзина на каждое целое значение
+    susceptible = max(1, round(params[3] * population))
+    if susceptible <= FINAL_SIZE_BINS:
+        bins = np.arange(susceptible + 2) - 0.5
+    else:
+        bins = np.linspace(0, susceptible, FINAL_SIZE_BINS + 1)
+    counts, edges = np.histogram(final_sizes, bins=bins)
+
+    return {
+        'rows': np.column_stack([t_grid, mean]).tolist(),
+        'method': method,
+        'population': float(population),
+        'n_realizations': int(n_realizations),
+        'extinction_probability': float(extinct.mean()),
+        'final_size_counts': counts.tolist(),
+        'final_size_edges': edges.tolist(),
+        'final_size_quantiles': np.quantile(final_sizes, QUANTILES).tolist(),
+        'major_mean_final_size': float(major.mean()) if len(major) else 0.0,
+        't_paths': t_grid.tolist(),
+        'I_paths': paths,
+    }
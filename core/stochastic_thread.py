@@ -0,0 +1,16 @@
+from core.stochastic_seir import simulate_stochastic
+from core.task_thread import TaskThread
+
+
+class StochasticThread(TaskThread):
+    """Фоновый расчет ансамбля стохастических реализаций SEIR"""
+
+    def __init__(self, params, population, n_realizations):
+        super().__init__()
+        self.params = params
+        self.population = population
+        self.n_realizations = n_realizations
+
+    def compute(self):
+        return simulate_stochastic(self.params, self.population, self.n_realizations,
+                                   on_chunk=self.report, should_stop=self.should_stop)
@@ -0,0 +1,133 @@
+"""Параметрический анализ: метрики модели на сетке или латинском гиперкубе параметров.
+
+Точки считаются пачками: по умолчанию вся пачка интегрируется одним
+ансамблем встроенного решателя (параметры — массивы), а если это
+невозможно (например, меняется длительность расчета), — в пуле процессов.
+"""
+import numpy as np
+
+from core import jit
+from core.models import MODELS
+from core.native_solver import PARAM_NAMES, ensemble_problem, integrate
+from core.tasks import check_stop, pool_results
+
+# Точек в пачке: ансамбль выгодно делать крупным, задачи пула — мелкими
+CHUNK_SIZE = 256
+POOL_CHUNK_SIZE = 16
+
+# Метрики: ключ -> (подпись, fn(t, ys)); ys имеет форму (n_t, n_vars, n_members)
+METRICS = {
+    "lotka": {
+        "x_max": ("Максимум жертв", lambda t, ys: ys[:, 0].max(axis=0)),
+        "y_max": ("Максимум хищников", lambda t, ys: ys[:, 1].max(axis=0)),
+        "x_min": ("Минимум жертв", lambda t, ys: ys[:, 0].min(axis=0)),
+    },
+    "competition": {
+        "x_final": ("Итоговая численность X", lambda t, ys: ys[-1, 0]),
+        "y_final": ("Итоговая численность Y", lambda t, ys: ys[-1, 1]),
+    },
+    "seir": {
+        "I_peak": ("Пик инфицированных", lambda t, ys: ys[:, 2].max(axis=0)),
+        "t_peak": ("Время пика", lambda t, ys: t[ys[:, 2].argmax(axis=0)]),
+        "R_final": ("Итого переболевших", lambda t, ys: ys[-1, 3]),
+    },
+    "islm": {
+        "Y_final": ("Равновесный доход Y", lambda t, ys: ys[-1, 0]),
+        "rate_final": ("Равновесная ставка i", lambda t, ys: np.maximum(0, ys[-1, 1])),
+    },
+    "lorenz": {
+        "z_max": ("Максимум z", lambda t, ys: ys[:, 2].max(axis=0)),
+        "x_std": ("Разброс x", lambda t, ys: ys[:, 0].std(axis=0)),
+    },
+}
+
+N_VARS = {key: len(spec.states) for key, spec in MODELS.items()}
+
+
+def grid_samples(ranges, n):
+    """Равномерная сетка: ranges {имя: (min, max)}, n точек по каждой оси"""
+    axes = [np.linspace(lo, hi, n) for lo, hi in ranges.values()]
+    mesh = np.meshgrid(*axes, indexing="ij")
+    return {name: values.ravel() for name, values in zip(ranges, mesh)}
+
+
+def latin_hypercube(ranges, n, seed=None):
+    """Латинский гиперкуб: по одной точке в каждом из n слоев каждой оси"""
+    rng = np.random.default_rng(seed)
+    samples = {}
+    for name, (lo, hi) in ranges.items():
+        strata = (rng.permutation(n) + rng.random(n)) / n
+        samples[name] = lo + strata * (hi - lo)
+    return samples
+
+
+def _compute_metrics(model, t, ys):
+    return {key: np.asarray(fn(t, ys), dtype=float) for key, (_, fn) in METRICS[model].items()}
+
+
+def _ensemble_chunk(model, params, should_stop):
+    rhs, y0, p, t_eval, project = ensemble_problem(model, params)
+    if jit.ENABLED:
+        # Ядро Numba не прерывается, поэтому отмена срабатывает между пачками
+        check_stop(should_stop)
+        ys = jit.integrate_model(model, y0, p, t_eval)
+    else:
+        ys = integrate(rhs, y0, p, t_eval, project=project, should_stop=should_stop, jac=MODELS[model].jacobian)
+    return _compute_metrics(model, t_eval, ys)
+
+
+def _pool_chunk(model, points):
+    """Рабочий процесс: решает точки по одной и считает метрики"""
+    n_vars = N_VARS[model]
+    per_point = []
+    for params in points:
+        rows = np.array(jit.solve_model(model, params))
+        per_point.append(_compute_metrics(model, rows[:, 0], rows[:, 1:1 + n_vars, None]))
+    return {key: np.concatenate([m[key] for m in per_point]) for key in METRICS[model]}
+
+
+def run_sweep(model, base, samples, backend="auto", chunk_size=None, max_workers=None,
+              on_chunk=None, should_stop=None):
+    """Считает метрики во всех точках samples; остальные параметры берутся из base.
+
+    backend: "ensemble" — векторизованный ансамбль, "pool" — пул процессов,
+    "auto" — ансамбль, если длительность расчета не меняется.
+    on_chunk(start, metrics, fraction) получает метрики очередной пачки.
+    Возвращает {ключ метрики: массив значений по точкам}.
+    """
+    names = PARAM_NAMES[model]
+    unknown = set(samples) - set(names)
+    if unknown:
+        raise ValueError(f"Неизвестные параметры: {', '.join(sorted(unknown))}")
+
+    n_points = len(next(iter(samples.values())))
+    columns = [np.asarray(samples[name], dtype=float) if name in samples else np.full(n_points, float(base[name]))
+               for name in names]
+
+    if backend == "auto":
+        backend = "pool" if "t_max" in samples else "ensemble"
+
+    if chunk_size is None:
+        chunk_size = CHUNK_SIZE if backend == "ensemble" else POOL_CHUNK_SIZE
+
+    results = {key: np.full(n_points, np.nan) for key in METRICS[model]}
+    starts = range(0, n_points, chunk_size)
+
+    def store(start, metrics):
+        for key, values in metrics.items():
+            results[key][start:start + len(values)] = values
+        if on_chunk is not None:
+            on_chunk(start, metrics, min(1.0, (start + chunk_size) / n_points))
+
+    if backend == "ensemble":
+        for start in starts:
+            check_stop(should_stop)
+            chunk = [column[start:start + chunk_size] for column in columns]
+            store(start, _ensemble_chunk(model, chunk, should_stop))
+        return results
+
+    points = np.column_stack(columns).tolist()
+    tasks = [(model, points[start:start + chunk_size]) for start in starts]
+    for n, metrics in pool_results(_pool_chunk, tasks, max_workers, should_stop):
+        store(starts[n], metrics)
+    return results
@@ -0,0 +1,28 @@
+from PyQt6.QtCore import pyqtSignal
+
+from core.sweep import run_sweep
+from core.task_thread import TaskThread
+
+
+class SweepThread(TaskThread):
+    """Фоновый параметрический анализ с выдачей результатов пачками"""
+
+    # Начальный индекс пачки, {метрика: список значений}, процент выполнения
+    sweep_chunk = pyqtSignal(int, dict, int)
+
+    def __init__(self, model, base, samples, backend="auto"):
+        super().__init__()
+        self.model = model
+        self.base = base
+        self.samples = samples
+        self.backend = backend
+
+    def _on_chunk(self, start, metrics, fraction):
+        if not self._cancelled:
+            self.sweep_chunk.emit(start, {key: values.tolist() for key, values in metrics.items()},
+                                  int(round(100 * fraction)))
+
+    def compute(self):
+        results = run_sweep(self.model, self.base, self.samples, backend=self.backend,
+                            on_chunk=self._on_chunk, should_stop=self.should_stop)
+        return {key: values.tolist() for key, values in results.items()}
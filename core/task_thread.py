@@ -0,0 +1,51 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from core.tasks import Cancelled
+
+
+class TaskThread(QThread):
+    """Фоновый поток долгого расчета с общей отменой и обработкой ошибок.
+
+    Подкласс задает compute(): считает, передавая self.should_stop и
+    self.report(done, total) в расчет, и возвращает результат для
+    task_finished. Отмена (cancel(), в том числе из core.scheduler)
+    заглушает все сигналы с результатами; Cancelled из расчета не считается
+    ошибкой. resource — общий ресурс для планировщика (None — только процессор).
+    """
+
+    # Процент выполнения, результат compute(), текст ошибки
+    task_progress = pyqtSignal(int)
+    task_finished = pyqtSignal(object)
+    task_error = pyqtSignal(str)
+
+    resource = None
+
+    def __init__(self):
+        super().__init__()
+        self._cancelled = False
+
+    def cancel(self):
+        """Расчет останавливается на ближайшей проверке should_stop"""
+        self._cancelled = True
+
+    def should_stop(self):
+        return self._cancelled
+
+    def report(self, done, total):
+        if not self._cancelled and total:
+            self.task_progress.emit(int(100 * done / total))
+
+    def compute(self):
+        raise NotImplementedError
+
+    def run(self):
+        try:
+            result = self.compute()
+        except Cancelled:
+            return
+        except Exception as e:
+            if not self._cancelled:
+                self.task_error.emit(str(e))
+            return
+        if not self._cancelled:
+            self.task_finished.emit(result)
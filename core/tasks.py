@@ -0,0 +1,46 @@
+"""Общие части долгих расчетов: отмена и пул процессов.
+
+Расчет принимает should_stop() и при отмене поднимает Cancelled (или
+наследника, как SolverCancelled решателя); пачки, которые считаются
+параллельно, отдаются pool_results. Модуль не зависит от Qt: он
+импортируется и в рабочих процессах пула. Поток с общими сигналами и
+cancel() для этих расчетов — core.task_thread.TaskThread.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+class Cancelled(Exception):
+    """Расчет остановлен пользователем"""
+
+
+def check_stop(should_stop):
+    """Поднимает Cancelled, если should_stop() сообщает об отмене"""
+    if should_stop is not None and should_stop():
+        raise Cancelled()
+
+
+def pool_results(fn, tasks, max_workers=None, should_stop=None, ordered=True, return_exceptions=False):
+    """Выполняет fn(*args) для каждого args из tasks в пуле процессов (spawn).
+
+    Генератор пар (номер задачи, результат): по порядку задач или, если
+    ordered=False, по готовности. Перед каждым результатом проверяется
+    should_stop: при отмене задачи, которые еще не начаты, снимаются и
+    поднимается Cancelled. С return_exceptions ошибка задачи выдается
+    вместо ее результата, иначе прерывает весь расчет.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = [pool.submit(fn, *args) for args in tasks]
+        index = {future: n for n, future in enumerate(futures)}
+        for future in futures if ordered else as_completed(futures):
+            if should_stop is not None and should_stop():
+                pool.shutdown(cancel_futures=True)
+                raise Cancelled()
+            try:
+                result = future.result()
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                result = e
+            yield index[future], result
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Тесты импортируют пакеты core и ui из корня репозитория
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from core import animation_export
+from core.animation_export import export_animation, frame_indices
+from core.tasks import Cancelled
+
+SPEC = {"columns": ("x_data", "y_data"), "labels": ("x", "y")}
+
+
+def _calc(n=50):
+    t = np.linspace(0.0, 5.0, n)
+    return {'t_data': t.tolist(), 'x_data': np.cos(t).tolist(), 'y_data': np.sin(t).tolist()}
+
+
+def test_frames_follow_time_not_points():
+    # Первая половина времени — 90 % точек: кадры все равно делятся по времени поровну
+    t = np.concatenate([np.linspace(0.0, 1.0, 900, endpoint=False), np.linspace(1.0, 2.0, 100)])
+    idx = frame_indices(t, max_frames=21)
+    assert idx[0] == 0 and idx[-1] == len(t) - 1
+    assert np.abs(t[idx] - np.linspace(0.0, 2.0, 21)).max() < 0.02
+
+
+def test_short_trajectory_gives_a_frame_per_point():
+    assert frame_indices([0.0, 1.0, 2.0]).tolist() == [0, 1, 2]
+
+
+@pytest.fixture
+def without_ffmpeg(monkeypatch):
+    monkeypatch.setattr(animation_export.shutil, "which", lambda name: None)
+
+
+def test_gif_has_every_frame(tmp_path, without_ffmpeg):
+    Image = pytest.importorskip("PIL.Image")
+    path = str(tmp_path / "orbit.gif")
+    progress = []
+    export_animation(_calc(), SPEC, path, max_frames=12, on_progress=lambda done, total: progress.append((done, total)))
+    with Image.open(path) as gif:
+        assert gif.n_frames == 12
+    assert progress[-1] == (12, 12)
+
+
+def test_cancelled_export_leaves_no_file(tmp_path, without_ffmpeg):
+    pytest.importorskip("PIL")
+    path = tmp_path / "orbit.gif"
+    progress = []
+    with pytest.raises(Cancelled):
+        export_animation(_calc(), SPEC, str(path), max_frames=12, on_progress=lambda done, total: progress.append(done),
+                         should_stop=lambda: len(progress) >= 3)
+    assert not path.exists()
+
+
+def test_video_without_ffmpeg_is_an_error(tmp_path, without_ffmpeg):
+    with pytest.raises(RuntimeError):
+        export_animation(_calc(), SPEC, str(tmp_path / "orbit.mp4"))
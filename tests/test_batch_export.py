@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from core.batch_export import export_batch, record_folder
+from core.batch_solve import make_run, solve_runs, to_records
+from ui.charts import charts_for
+
+
+@pytest.fixture(scope="module")
+def records():
+    runs = [make_run("lotka"), make_run("competition")]
+    return to_records(runs, solve_runs(runs, max_workers=1))
+
+
+def test_every_chart_of_every_record_is_exported(records, tmp_path):
+    unknown = {'id': "0" * 36, 'model_name': "Нет такой модели", 'timestamp': "2024-01-01T00:00:00"}
+    progress = []
+    results = export_batch(records + [unknown], str(tmp_path), fmt="svg", max_workers=2,
+                           on_progress=lambda done, total: progress.append((done, total)))
+
+    assert progress[-1] == (3, 3)
+    for record in records:
+        files, errors = results[record['id']]
+        assert errors == []
+        charts = charts_for(record['model_name']).CHARTS
+        assert sorted(os.path.basename(path) for path in files) == sorted(f"{key}.svg" for key in charts)
+        assert all(os.path.dirname(path) == str(tmp_path / record_folder(record)) for path in files)
+        assert all(os.path.getsize(path) > 0 for path in files)
+    assert results[unknown['id']][0] == [] and results[unknown['id']][1]
+
+
+def test_folder_name_is_filesystem_safe():
+    record = {'id': "abcdef0123456789", 'model_name': "Модель эпидемии SEIR", 'timestamp': "2024-05-01T12:30:45.1"}
+    assert record_folder(record) == "Модель_эпидемии_SEIR_2024-05-01_12-30_abcdef01"
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_batch([], str(tmp_path), fmt="bmp")
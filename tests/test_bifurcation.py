@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from core.bifurcation import _local_maxima, _section_hits, bifurcation, bifurcation_chunk
+from core.models import MODELS
+
+BASE = MODELS["lorenz"].defaults
+
+
+def test_parabolic_refinement_finds_the_true_peak():
+    t = np.linspace(0.0, 1.0, 11)
+    z = (3.0 - (t - 0.537) ** 2)[:, None]
+    members, peaks = _local_maxima(z)
+    assert members.tolist() == [0] and peaks[0] == pytest.approx(3.0, abs=1e-12)
+
+
+def test_section_hits_interpolate_upward_crossings():
+    # z = rho - 1 пересекается снизу вверх между строками 1 и 2 (на четверти шага) и сверху вниз — не считается
+    ys = np.zeros((4, 3, 1))
+    ys[:, 0, 0] = [0.0, 1.0, 5.0, 9.0]
+    ys[:, 2, 0] = [0.0, 1.0, 5.0, 0.0]
+    members, x_hit = _section_hits(ys, rho=3.0)
+    assert members.tolist() == [0] and x_hit[0] == pytest.approx(2.0)
+
+
+def test_regimes_of_the_diagram():
+    values, points = bifurcation_chunk("rho", [0.5, 15.0, 28.0], BASE)
+    # rho < 1 — покой в начале координат, максимумов нет
+    assert not np.any(values == 0.5)
+    # 1 < rho < 24.74 — устойчивые точки C±: все максимумы в z = rho - 1
+    assert np.allclose(points[values == 15.0], 14.0, atol=1e-3)
+    # rho = 28 — хаос: максимумы разбросаны по отрезку
+    chaos = points[values == 28.0]
+    assert len(np.unique(chaos.round(3))) > 20 and np.ptp(chaos) > 5
+
+
+def test_section_visits_both_wings_of_the_attractor():
+    _, x = bifurcation_chunk("rho", [28.0], BASE, mode="section")
+    assert x.min() < -5 and x.max() > 5
+
+
+def test_chunks_in_the_pool_cover_every_value():
+    rho = np.array([5.0, 10.0, 15.0])
+    progress = []
+    values, points = bifurcation("rho", rho, BASE, chunk_size=2, max_workers=2,
+                                 on_chunk=lambda done, total: progress.append((done, total)))
+    assert progress == [(1, 2), (2, 2)]
+    assert sorted(set(values)) == rho.tolist()
+    # Все три значения — в области устойчивых C±
+    assert np.allclose(points, values - 1, atol=1e-3)
+
+
+def test_unknown_parameter_and_mode_are_rejected():
+    with pytest.raises(ValueError):
+        bifurcation("gamma", [1.0], BASE)
+    with pytest.raises(ValueError):
+        bifurcation("rho", [1.0], BASE, mode="xmax")
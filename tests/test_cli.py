@@ -0,0 +1,88 @@
+import csv
+import io
+
+import numpy as np
+import pytest
+
+import cli
+from core import batch_solve
+from core.models import MODELS
+from core.native_solver import solve_model
+
+
+def _read_csv(text):
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert rows
+    return rows
+
+
+def _columns(rows, run, keys):
+    return np.array([[float(row[key]) for key in keys] for row in rows if row['run'] == str(run)])
+
+
+def test_batch_csv_round_trip(tmp_path):
+    params = tmp_path / "runs.csv"
+    params.write_text("model,sigma,rho\nlorenz,10,28\nlorenz,,15\ncompetition,,\n", encoding="utf-8")
+    out = tmp_path / "out.csv"
+    assert cli.main(["batch", str(params), "--out", str(out), "--workers", "1", "-q"]) == 0
+
+    rows = _read_csv(out.read_text(encoding="utf-8"))
+    assert {row['model'] for row in rows} == {"lorenz", "competition"}
+    expected_runs = [("lorenz", {"rho": 28.0}), ("lorenz", {"rho": 15.0}), ("competition", {})]
+    for run, (model, overrides) in enumerate(expected_runs):
+        spec = MODELS[model]
+        values = spec.defaults
+        values.update(overrides)
+        keys = ["t_data"] + [key for key, _, _ in spec.columns]
+        assert np.allclose(_columns(rows, run, keys), solve_model(model, list(values.values())), rtol=1e-12)
+        assert np.allclose(_columns(rows, run, spec.param_names), list(values.values()))
+    # У конкуренции нет sigma — ячейка пустая
+    assert all(row['sigma'] == "" for row in rows if row['model'] == "competition")
+
+
+def test_run_writes_csv_to_stdout(capsys):
+    assert cli.main(["run", "seir", "--set", "beta=0.5", "--set", "t_max=20", "-q"]) == 0
+    rows = _read_csv(capsys.readouterr().out)
+    assert len(rows) == 41 and float(rows[-1]['t_data']) == 20
+    assert all(float(row['beta']) == 0.5 for row in rows)
+
+
+def test_bad_output_format_fails_before_solving(tmp_path, monkeypatch, capsys):
+    def solve_runs(*args, **kwargs):
+        raise AssertionError("расчет не должен запускаться")
+    monkeypatch.setattr(cli, "solve_runs", solve_runs)
+    assert cli.main(["run", "lotka", "--out", str(tmp_path / "out.xlsx")]) == 2
+    assert ".xlsx" in capsys.readouterr().err
+
+
+def test_unknown_parameter_is_an_error(capsys):
+    assert cli.main(["run", "lotka", "--set", "omega=1"]) == 2
+    assert "omega" in capsys.readouterr().err
+
+
+def test_store_writes_tab_records(tmp_path):
+    tinydb = pytest.importorskip("tinydb")
+    db_path = tmp_path / "db.json"
+    assert cli.main(["run", "seir", "--store", "--db", str(db_path), "-q"]) == 0
+    db = tinydb.TinyDB(str(db_path))
+    try:
+        (record,) = db.all()
+    finally:
+        db.close()
+    assert record['model_name'] == MODELS["seir"].title
+    assert record['mu'] == MODELS["seir"].extras['mu']
+    assert {event['name'] for event in record['events']} == {"I_peak", "S_half"}
+    assert set(MODELS["seir"].schema) <= set(record)
+
+
+def test_tolerance_needs_native_backend():
+    with pytest.raises(SystemExit):
+        cli.main(["run", "lotka", "--backend", "wolfram", "--tolerance", "0.01"])
+
+
+def test_json_runs_need_a_model(tmp_path):
+    params = tmp_path / "runs.json"
+    params.write_text('[{"beta": 0.5}]', encoding="utf-8")
+    with pytest.raises(ValueError):
+        batch_solve.read_runs(str(params))
+    assert batch_solve.read_runs(str(params), model="seir")[0].params["beta"] == 0.5
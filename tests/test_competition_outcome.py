@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from core import competition_outcome as outcome
+from core import stability
+from core.native_solver import competition_rhs, integrate
+
+
+def _params(p, q, r, s, t, u):
+    return dict(zip(outcome.PARAMS, (p, q, r, s, t, u)))
+
+
+@pytest.mark.parametrize("values, expected", [
+    ((1, 1, 0.5, 0.5, 1, 1), outcome.X_WINS),
+    ((0.5, 1, 1, 1, 0.5, 1), outcome.Y_WINS),
+    ((1, 1, 0.5, 1, 0.5, 1), outcome.COEXISTENCE),
+    ((1, 1, 2, 1, 2, 1), outcome.BISTABLE),
+    ((1, 1, 1, 1, 1, 1), outcome.NEUTRAL),
+])
+def test_regime_from_nullcline_intercepts(values, expected):
+    assert outcome.regime(_params(*values)) == expected
+
+
+def test_regime_is_vectorized():
+    params = _params(1, 1, np.array([0.5, 2.0]), 1, np.array([0.5, 2.0]), 1)
+    assert outcome.regime(params).tolist() == [outcome.COEXISTENCE, outcome.BISTABLE]
+
+
+def test_symmetric_bistable_separatrix_is_the_diagonal():
+    # При p = s, q = u, r = t система симметрична относительно x = y
+    params = _params(1, 1, 2, 1, 2, 1)
+    x, y = outcome.separatrix(params, 2.0, 2.0)
+    assert np.abs(x - y).max() < 1e-6
+
+    values = np.linspace(0.05, 1.95, 20)
+    codes, code, _ = outcome.outcome_map(params, values, values + 0.01)
+    x0, y0 = np.meshgrid(values, values + 0.01)
+    assert code == outcome.BISTABLE
+    assert np.array_equal(codes, np.where(y0 > x0, outcome.Y_WINS, outcome.X_WINS))
+
+
+def test_bistable_map_agrees_with_integration():
+    params = _params(1.0, 1.0, 1.5, 0.8, 1.2, 1.0)
+    values = tuple(params[name] for name in outcome.PARAMS)
+    starts = np.array([[0.2, 0.9], [0.9, 0.2], [0.5, 0.6], [1.2, 1.0], [0.1, 0.1]])
+    for x0, y0 in starts:
+        codes, _, _ = outcome.outcome_map(params, [x0], [y0])
+        final = integrate(competition_rhs, np.array([x0, y0]), values, [0.0, 200.0])[-1]
+        winner = outcome.X_WINS if final[0] > final[1] else outcome.Y_WINS
+        assert codes[0, 0] == winner
+
+
+def test_axis_starts_keep_only_present_species():
+    codes, _, _ = outcome.outcome_map(_params(1, 1, 0.5, 1, 0.5, 1), [0.0, 1.0], [0.0, 1.0])
+    assert codes.tolist() == [[outcome.EXTINCTION, outcome.X_WINS], [outcome.Y_WINS, outcome.COEXISTENCE]]
+
+
+def test_coinciding_nullclines_are_their_own_outcome():
+    codes, code, curve = outcome.outcome_map(_params(1, 1, 1, 1, 1, 1), [0.0, 0.5, 1.0], [0.0, 0.5, 1.0])
+    assert code == outcome.NEUTRAL and curve is None
+    assert (codes[1:, 1:] == outcome.NEUTRAL).all()
+
+
+@pytest.mark.filterwarnings("error")
+def test_zero_self_limitation_is_not_divided_by():
+    # q = 0: изоклина X горизонтальна (y = p/r) и выше изоклины Y на оси y
+    params = _params(1, 0, 0.5, 1, 1, 1)
+    assert np.isnan(outcome.intercepts(params)[0])
+    assert outcome.regime(params) == outcome.X_WINS
+    points, valid = stability.equilibria("competition", params)
+    assert not valid[1]
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from core import field_cache
+from core.models import MODELS
+
+LOTKA = (1.0, 0.5, 0.75, 0.25)
+EXTENT = (0.0, 10.0, 0.0, 10.0)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    field_cache.clear()
+    yield
+    field_cache.clear()
+
+
+def test_repeated_field_is_a_cache_hit():
+    first = field_cache.vector_field("lotka", LOTKA, EXTENT, 20)
+    # Те же значения другими типами — тот же ключ
+    again = field_cache.vector_field("lotka", [np.float64(v) for v in LOTKA], [int(v) for v in EXTENT], 20)
+    assert again is first
+    assert field_cache.vector_field("lotka", LOTKA, EXTENT, 21) is not first
+
+
+def test_field_matches_model_rhs():
+    X, Y, U, V = field_cache.vector_field("lotka", LOTKA, EXTENT, 5)
+    spec = MODELS["lotka"]
+    u, v = spec.rhs(0.0, np.array([X[2, 3], Y[2, 3]]), LOTKA + spec.constant_values)
+    assert (U[2, 3], V[2, 3]) == pytest.approx((u, v))
+
+
+def test_oldest_entry_is_evicted(monkeypatch):
+    monkeypatch.setattr(field_cache, "MAX_ENTRIES", 2)
+    first = field_cache.vector_field("lotka", LOTKA, EXTENT, 5)
+    second = field_cache.vector_field("lotka", LOTKA, EXTENT, 6)
+    # Обращение освежает первую запись — вытесняется вторая
+    assert field_cache.vector_field("lotka", LOTKA, EXTENT, 5) is first
+    field_cache.vector_field("lotka", LOTKA, EXTENT, 7)
+    assert field_cache.vector_field("lotka", LOTKA, EXTENT, 5) is first
+    assert field_cache.vector_field("lotka", LOTKA, EXTENT, 6) is not second
+
+
+def test_snapped_extent_covers_the_original():
+    x0, x1, y0, y1 = field_cache.snap_extent(0.13, 9.71, -2.2, 3.3)
+    assert x0 <= 0.13 and x1 >= 9.71 and y0 <= -2.2 and y1 >= 3.3
+    assert (x0, x1, y0, y1) == field_cache.snap_extent(0.14, 9.69, -2.1, 3.25)
+
+
+def test_streamlines_reuse_the_cached_field():
+    lines = field_cache.streamlines("lotka", LOTKA, EXTENT, 15)
+    assert lines and all(segment.shape[1] == 2 for segment in lines)
+    assert field_cache.streamlines("lotka", LOTKA, EXTENT, 15) is lines
@@ -0,0 +1,34 @@
+import numpy as np
+
+from core.islm_scenarios import PARAMS, solve_scenarios
+from core.models import MODELS
+from core.native_solver import solve_model
+
+
+def _scenarios():
+    base = MODELS["islm"].defaults
+    return [base, {**base, "G": base["G"] * 1.5}, {**base, "Ms": base["Ms"] * 0.7}]
+
+
+def test_batch_matches_single_runs():
+    scenarios = _scenarios()
+    batch = solve_scenarios(scenarios)
+    assert len(batch) == len(scenarios)
+    for scenario, rows in zip(scenarios, batch):
+        single = np.array(solve_model("islm", [scenario[name] for name in PARAMS]))
+        # Шаг у ансамбля общий, поэтому совпадение — с точностью решателя, а не побитовое
+        assert np.array(rows).shape == single.shape
+        assert np.allclose(rows, single, rtol=1e-6, atol=1e-6)
+
+
+def test_rate_stays_clamped_in_every_scenario():
+    # Ms = 900 уводит ставку в ноль: ограничение действует по каждому члену ансамбля
+    scenarios = _scenarios() + [{**MODELS["islm"].defaults, "Ms": 900}]
+    rate = MODELS["islm"].states.index("rate")
+    batch = [np.array(rows) for rows in solve_scenarios(scenarios)]
+    assert all(rows[:, 1 + rate].min() >= 0 for rows in batch)
+    assert batch[-1][:, 1 + rate].min() == 0 and batch[0][:, 1 + rate].min() > 0
+
+
+def test_no_scenarios_no_solve():
+    assert solve_scenarios([]) == []
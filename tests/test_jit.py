@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from core import jit
+from core.models import MODELS
+from core.native_solver import ensemble_problem, integrate, solve_model
+
+
+@pytest.fixture
+def kernel(monkeypatch):
+    """Ядро включено; без Numba оно выполняется как обычный Python-код"""
+    monkeypatch.setattr(jit, "ENABLED", True)
+    monkeypatch.setattr(jit, "_kernels", {})
+
+
+def _problem(model, **overrides):
+    values = MODELS[model].defaults
+    values.update(overrides)
+    return ensemble_problem(model, list(values.values()))
+
+
+@pytest.mark.parametrize("model", list(MODELS))
+def test_scalar_rhs_matches_model_rhs(model):
+    spec = MODELS[model]
+    _, y0, p, _, _ = _problem(model)
+    out = np.empty(len(spec.states))
+    jit._scalar_rhs(spec)(0.0, y0.astype(float), np.array(p, dtype=float), out)
+    assert np.allclose(out, spec.rhs(0.0, y0, p))
+
+
+def test_kernel_matches_integrate(kernel):
+    rhs, y0, p, _, _ = _problem("lotka")
+    start = np.stack([y0, 1.5 * y0], axis=1)
+    t_eval = np.linspace(0.0, 10.0, 21)
+    expected = integrate(rhs, start, p, t_eval)
+    assert np.allclose(jit.integrate_model("lotka", start, p, t_eval), expected, rtol=1e-6)
+
+
+def test_kernel_keeps_the_rate_clamp(kernel):
+    rhs, y0, p, _, project = _problem("islm", Ms=900)
+    t_eval = np.linspace(0.0, 20.0, 11)
+    # Ставка прижимается к нулю в конце шагов — как project у integrate
+    expected = integrate(rhs, y0, p, t_eval, project=project)
+    assert np.allclose(jit.integrate_model("islm", y0[:, None], p, t_eval)[:, :, 0], expected, rtol=1e-6, atol=1e-6)
+    values = MODELS["islm"].defaults
+    values["Ms"] = 900
+    assert np.array(jit.solve_model("islm", list(values.values())))[:, 2].min() == 0
+
+
+def test_disabled_jit_falls_back_to_native_solver(monkeypatch):
+    monkeypatch.setattr(jit, "ENABLED", False)
+    values = list(MODELS["competition"].defaults.values())
+    assert np.allclose(jit.solve_model("competition", values), solve_model("competition", values))
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QLineEdit, QTabWidget, QVBoxLayout, QWidget
+
+from core.native_solver import solve_model
+from ui import live_controls
+from ui.live_controls import LiveControls
+from ui.lotka_volterra_charts import STREAMS
+
+app = QApplication.instance() or QApplication([])
+
+
+class FakeScheduler:
+    """Планировщик без запуска: потоки только запоминаются"""
+
+    def __init__(self):
+        self.submitted = []
+        self.cancelled = []
+
+    def submit(self, owner, thread, kind="calculation", priority=0):
+        self.submitted.append((kind, thread))
+
+    def cancel(self, owner, kind="calculation"):
+        self.cancelled.append(kind)
+        return False
+
+
+@pytest.fixture
+def live(monkeypatch):
+    jobs = FakeScheduler()
+    monkeypatch.setattr(live_controls, "scheduler", lambda: jobs)
+    owner = QWidget()
+    inputs = {name: QLineEdit(value) for name, value in
+              (("alpha", "0.1"), ("beta", "0.02"), ("gamma", "0.3"), ("delta", "0.01"), ("x0", "10"), ("y0", "5"))}
+    graph_tabs = QTabWidget()
+    hosts = []
+    for _ in range(2):
+        host = QWidget()
+        host.setLayout(QVBoxLayout())
+        graph_tabs.addTab(host, "")
+        hosts.append(host)
+    released = []
+    controls = LiveControls(owner, "lotka", inputs, graph_tabs, [(hosts[0], STREAMS["time"])],
+                            lambda: released.append(inputs["alpha"].text()))
+    controls.toggle.setChecked(True)
+    yield controls, jobs, inputs, released
+    controls.toggle.setChecked(False)
+
+
+def test_sliders_start_at_field_values(live):
+    controls, _, inputs, _ = live
+    # Диапазон — от нуля до удвоенного значения: ползунок посередине
+    assert all(slider.value() == live_controls.SLIDER_STEPS // 2 for slider in controls.sliders.values())
+    assert controls.graph_tabs.currentIndex() == 0
+
+
+def test_dragging_resolves_once_per_pause(live):
+    controls, jobs, inputs, released = live
+    slider = controls.sliders["alpha"]
+    slider.setSliderDown(True)
+    for step in (120, 130, 150):
+        slider.setValue(step)
+    assert inputs["alpha"].text() == "0.15"
+    QTest.qWait(5 * live_controls.DEBOUNCE_MS)
+    # Три сдвига подряд — один живой расчет, полный расчет — только после отпускания
+    assert [kind for kind, _ in jobs.submitted] == ["live"] and released == []
+    assert jobs.submitted[0][1].params[0] == "0.15"
+
+    slider.setSliderDown(False)
+    assert released == ["0.15"]
+
+
+def test_keyboard_change_runs_the_full_solve(live):
+    controls, jobs, _, released = live
+    controls.sliders["beta"].setValue(50)
+    QTest.qWait(5 * live_controls.DEBOUNCE_MS)
+    assert jobs.submitted == [] and released == ["0.1"]
+    assert "live" in jobs.cancelled
+
+
+def test_only_the_latest_live_result_is_drawn(live):
+    controls, jobs, _, _ = live
+    controls.sliders["alpha"].setSliderDown(True)
+    controls.sliders["alpha"].setValue(150)
+    QTest.qWait(5 * live_controls.DEBOUNCE_MS)
+    controls.sliders["alpha"].setValue(160)
+    QTest.qWait(5 * live_controls.DEBOUNCE_MS)
+    (_, stale), (_, latest) = jobs.submitted
+
+    rows = solve_model("lotka", [0.16, 0.02, 0.3, 0.01, 10, 5])
+    controls.on_result(stale, rows[:3])
+    assert not controls.views
+    latest.moved_at = controls.moved_at
+    controls.on_result(latest, rows)
+    view = controls.views[controls.graph_tabs.widget(0)]
+    assert len(view.columns[0]) == len(rows)
+
+
+def test_live_error_is_shown_until_the_next_result(live):
+    controls, jobs, _, _ = live
+    controls.sliders["alpha"].setSliderDown(True)
+    controls.sliders["alpha"].setValue(150)
+    QTest.qWait(5 * live_controls.DEBOUNCE_MS)
+    (_, thread), = jobs.submitted
+    controls.on_error(object(), "чужая ошибка")
+    assert controls.error_label.isHidden()
+    controls.on_error(thread, "деление на ноль")
+    assert not controls.error_label.isHidden() and "деление на ноль" in controls.error_label.text()
+    thread.moved_at = controls.moved_at
+    controls.on_result(thread, solve_model("lotka", [0.15, 0.02, 0.3, 0.01, 10, 5]))
+    assert controls.error_label.isHidden()
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from core import stability
+from core.lyapunov import chaos_map, lyapunov_ensemble, lyapunov_spectrum
+
+SIGMA, BETA = 10.0, 8 / 3
+
+
+@pytest.fixture(scope="module")
+def chaotic():
+    return lyapunov_spectrum(SIGMA, 28.0, BETA, t_total=100)
+
+
+def test_spectrum_sums_to_the_divergence(chaotic):
+    # div f = -(sigma + 1 + beta) постоянна: сумма показателей равна ей точно
+    spectrum, _, _ = chaotic
+    assert spectrum.sum() == pytest.approx(-(SIGMA + 1 + BETA), rel=1e-5)
+
+
+def test_classic_lorenz_spectrum(chaotic):
+    spectrum, times, history = chaotic
+    assert spectrum[0] == pytest.approx(0.906, abs=0.05)
+    assert abs(spectrum[1]) < 0.05
+    assert np.all(np.diff(spectrum) < 0)
+    assert times[-1] == pytest.approx(100) and np.allclose(history[-1], spectrum)
+
+
+def test_stable_point_exponents_are_eigenvalue_real_parts():
+    params = dict(sigma=SIGMA, rho=15.0, beta=BETA)
+    points, _ = stability.equilibria("lorenz", params)
+    eig = stability.eigenvalues(stability.jacobian("lorenz", points[1], params))
+    spectrum, _, _ = lyapunov_spectrum(SIGMA, 15.0, BETA, t_total=50)
+    assert np.allclose(spectrum, np.sort(eig.real)[::-1], atol=0.05)
+
+
+def test_ensemble_members_are_independent():
+    start = np.ones((3, 2))
+    spectrum, _, _ = lyapunov_ensemble((SIGMA, np.array([15.0, 28.0]), BETA), start, k=1, t_total=50)
+    single, _, _ = lyapunov_ensemble((SIGMA, 15.0, BETA), start[:, :1], k=1, t_total=50)
+    assert spectrum[0, 0] == pytest.approx(single[0, 0], abs=1e-3)
+    assert spectrum[0, 0] < 0 < spectrum[0, 1]
+
+
+def test_chaos_map_layout():
+    result = chaos_map([SIGMA], [15.0, 28.0], BETA, max_workers=1)
+    assert result.shape == (2, 1)
+    assert result[0, 0] < 0 < result[1, 0]
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from core.models import MODELS, MODELS_BY_TITLE, STATE, ModelSpec
+
+
+def _point(spec, seed=0):
+    """Случайное состояние и параметры правой части (с константами модели)"""
+    rng = np.random.default_rng(seed)
+    u = 0.5 + rng.random(len(spec.states))
+    rates = tuple(spec.defaults[name] * (1 + 0.1 * rng.random()) for name in spec.rate_names)
+    return u, rates + spec.constant_values
+
+
+def test_lorenz_jacobian_is_analytic():
+    x, y, z = 1.5, -2.0, 20.0
+    sigma, rho, beta = 10.0, 28.0, 8 / 3
+    J = MODELS["lorenz"].jacobian(0.0, np.array([x, y, z]), (sigma, rho, beta))
+    expected = [[-sigma, sigma, 0], [rho - z, -1, -x], [y, x, -beta]]
+    assert np.allclose(J, expected, rtol=0, atol=1e-14)
+
+
+def test_seir_param_jacobian_is_analytic():
+    S, E, I, R = 0.9, 0.05, 0.04, 0.01
+    J = MODELS["seir"].param_jacobian(0.0, np.array([S, E, I, R]), (0.5, 0.2, 0.1))
+    expected = [[-S * I, 0, 0], [S * I, -E, 0], [0, E, -I], [0, 0, I]]
+    assert np.allclose(J, expected, rtol=0, atol=1e-14)
+
+
+@pytest.mark.parametrize("model", list(MODELS))
+def test_jacobians_match_central_differences(model):
+    spec = MODELS[model]
+    u, p = _point(spec)
+    J = np.array(spec.jacobian(0.3, u, p), dtype=float)
+    dp = np.array(spec.param_jacobian(0.3, u, p), dtype=float)
+    for j in range(len(u)):
+        h = 1e-6 * max(1.0, abs(u[j]))
+        step = np.zeros_like(u)
+        step[j] = h
+        numeric = (np.array(spec.rhs(0.3, u + step, p)) - np.array(spec.rhs(0.3, u - step, p))) / (2 * h)
+        assert np.allclose(J[:, j], numeric, rtol=1e-6, atol=1e-6)
+    for j in range(dp.shape[1]):
+        h = 1e-6 * max(1.0, abs(p[j]))
+        shifted = [list(p), list(p)]
+        shifted[0][j] += h
+        shifted[1][j] -= h
+        numeric = (np.array(spec.rhs(0.3, u, tuple(shifted[0]))) - np.array(spec.rhs(0.3, u, tuple(shifted[1])))) / (2 * h)
+        assert np.allclose(dp[:, j], numeric, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize("model", list(MODELS))
+def test_sparsity_marks_every_nonzero_entry(model):
+    spec = MODELS[model]
+    u, p = _point(spec, seed=1)
+    J = np.array(spec.jacobian(0.0, u, p), dtype=float)
+    assert not np.any((J != 0) & ~spec.sparsity)
+
+
+def test_jacobian_of_ensemble_has_member_axis():
+    spec = MODELS["seir"]
+    u = np.array([[0.9, 0.8], [0.05, 0.1], [0.04, 0.05], [0.01, 0.05]])
+    beta = np.array([0.5, 0.7])
+    J = spec.jacobian(0.0, u, (beta, 0.2, 0.1))
+    assert J.shape == (4, 4, 2)
+    for m in range(2):
+        assert np.allclose(J[..., m], spec.jacobian(0.0, u[:, m], (beta[m], 0.2, 0.1)))
+
+
+# ---------- Описание моделей ----------
+
+def test_registry_by_key_and_title():
+    assert set(MODELS) == {"lotka", "competition", "seir", "islm", "lorenz"}
+    assert all(MODELS_BY_TITLE[spec.title] is spec for spec in MODELS.values())
+
+
+def test_defaults_are_a_fresh_copy():
+    spec = MODELS["seir"]
+    values = spec.defaults
+    values["beta"] = -1
+    assert spec.defaults["beta"] == 0.8
+    assert list(values) == list(spec.param_names)
+
+
+def test_split_by_param_names():
+    lotka, seir = MODELS["lotka"], MODELS["seir"]
+    # У Лотки-Вольтерры длительность не вводится — берется из описания
+    assert lotka.split([1, 2, 3, 4, 5, 6]) == ([1, 2, 3, 4], [5, 6], 50)
+    assert seir.split(range(8)) == ([0, 1, 2], [3, 4, 5, 6], 7)
+    with pytest.raises(ValueError):
+        seir.split(range(7))
+
+
+def test_compiled_rhs_matches_equations():
+    alpha, beta, gamma, delta = 0.1, 0.02, 0.3, 0.01
+    dx, dy = MODELS["lotka"].rhs(0.0, np.array([10.0, 5.0]), (alpha, beta, gamma, delta))
+    assert (dx, dy) == pytest.approx((alpha * 10 - beta * 50, delta * 50 - gamma * 5))
+
+
+@pytest.mark.parametrize("model", list(MODELS))
+def test_record_has_the_tab_fields(model):
+    spec = MODELS[model]
+    n_columns = 1 + len(spec.columns)
+    rows = [[float(t)] + [1.0] * (n_columns - 1) for t in range(3)]
+    record = spec.record(spec.defaults.values(), rows, events=[{'name': "x"}])
+    expected = set(spec.schema) | set(spec.extras) | ({'events'} if spec.events else set())
+    assert set(record) == expected
+    assert record['t_data'] == [0.0, 1.0, 2.0]
+
+
+def test_rows_clamp_and_twin_divergence():
+    islm = MODELS["islm"]
+    ys = np.array([[1800.0, -0.5], [1810.0, 0.25]])
+    p = tuple(islm.defaults[name] for name in islm.rate_names) + islm.constant_values
+    rows = np.array(islm.rows(np.array([0.0, 1.0]), ys, p))
+    assert rows[:, 2].tolist() == [0.0, 0.25]
+
+    lorenz = MODELS["lorenz"]
+    ys = np.zeros((2, 3, 2))
+    ys[:, 0, 1] = [1e-5, 2e-3]
+    rows = np.array(lorenz.rows(np.array([0.0, 1.0]), ys, (10.0, 28.0, 2.66)))
+    assert rows[:, -1] == pytest.approx([1e-5, 2e-3])
+
+
+def test_equations_must_match_states():
+    with pytest.raises(ValueError):
+        ModelSpec("bad", "Плохая", states=("x", "y"), params=(("a", 1.0),), initial=(("x0", 1.0), ("y0", 1.0)),
+                  equations=("a*x",), columns=(("x_data", STATE, "x"),), dt=0.1, t_max=1)
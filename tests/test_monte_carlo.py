@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from core.models import MODELS
+from core.monte_carlo import histogram_quantiles, log_edges, monte_carlo, sample_members
+from core.native_solver import solve_model
+
+# Почти все население уже заражено: без повторного розыгрыша S0 часто уходила бы в минус
+CROWDED = dict(beta=0.5, alpha=0.2, gamma=0.1, S0=0.05, E0=0.5, I0=0.45, R0=0.0, t_max=10)
+
+
+def test_sampled_members_keep_population_and_stay_nonnegative():
+    members = sample_members(CROWDED, {"E0": 1.0, "I0": 1.0}, 100000, np.random.default_rng(0))
+    assert members["S0"].min() >= 0
+    assert np.allclose(members["S0"] + members["E0"] + members["I0"], 1.0)
+
+
+def test_empty_ensemble_is_rejected():
+    with pytest.raises(ValueError):
+        monte_carlo(CROWDED, {}, n_members=0)
+
+
+@pytest.fixture(scope="module")
+def deterministic():
+    base = MODELS["seir"].defaults
+    rows = np.array(solve_model("seir", list(base.values())))
+    return base, rows[:, 0], rows[:, 1 + MODELS["seir"].states.index("I")]
+
+
+def test_zero_spread_reproduces_the_deterministic_curve(deterministic):
+    base, t, I = deterministic
+    result = monte_carlo(base, {}, n_members=40, max_workers=1)
+    assert np.allclose(result['mc_t'], t)
+    # Медиана — с точностью логарифмической корзины, среднее — с точностью решателя
+    low, median, high = np.array(result['mc_I_bands'])
+    assert np.allclose(median, I, rtol=0.025)
+    assert np.all(low <= median) and np.all(median <= high)
+    assert np.allclose(result['mc_I_mean'], I, rtol=1e-5)
+    # Корзины времени пика — узлы сетки шириной dt вокруг узла
+    low, median, high = result['mc_peak_time']
+    assert median == pytest.approx(t[I.argmax()])
+    assert high - low <= t[1] - t[0]
+
+
+def test_spread_widens_the_bands(deterministic):
+    base, _, I = deterministic
+    progress = []
+    result = monte_carlo(base, {"beta": 0.3}, n_members=400, seed=1, chunk_size=100, max_workers=1,
+                         on_chunk=lambda done, total: progress.append((done, total)))
+    assert progress[-1] == (4, 4)
+    low, median, high = np.array(result['mc_I_bands'])
+    peak = I.argmax()
+    assert low[peak] < 0.9 * I[peak] and high[peak] > 1.02 * I[peak]
+    assert sum(result['mc_peak_time_hist']) == sum(result['mc_peak_height_hist']) == 400
+
+
+def test_histogram_quantiles_interpolate_inside_a_bin():
+    edges = np.array([0.0, 1.0, 2.0, 3.0])
+    low, median, high = histogram_quantiles([0, 4, 0], edges)
+    assert (low, median, high) == pytest.approx((1.05, 1.5, 1.95))
+    assert histogram_quantiles([[1, 0, 0]], edges, qs=(0.5,))[0, 0] == pytest.approx(0.5)
+    assert len(log_edges()) == 1001
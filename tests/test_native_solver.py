@@ -0,0 +1,196 @@
+import numpy as np
+import pytest
+
+from core import native_solver
+from core.models import MODELS
+from core.native_solver import Event, SolverCancelled, _accepted_steps, integrate, integrate_adaptive, radau_dense_output, solve_model
+
+# Жесткая задача y' = -lam (y - cos t) - sin t, точное решение y = cos t + (y0 - 1) e^(-lam t)
+LAM = 1e4
+
+
+def stiff_rhs(t, y, p):
+    return -p[0] * (y - np.cos(t)) - np.sin(t)
+
+
+def stiff_jac(t, y, p):
+    return np.full((1, 1) + np.shape(y)[1:], -p[0])
+
+
+def stiff_exact(t, y0=2.0):
+    return np.cos(t) + (y0 - 1) * np.exp(-LAM * t)
+
+
+def _steps(method, t_end=10.0):
+    """Принятые шаги (h, метод Radau?): по интерполяции видно, каким методом сделан шаг"""
+    steps = _accepted_steps(stiff_rhs, np.array([2.0]), (LAM,), 0.0, t_end, None, None, 1e-8, 1e-10,
+                            stiff_jac, method)
+    return [(h, interpolate is radau_dense_output) for _, h, *_, interpolate in steps]
+
+
+def test_auto_switches_to_radau_on_stiff_problem():
+    steps = _steps("auto")
+    assert not steps[0][1]
+    assert steps[-1][1]
+    # Явному методу устойчивость не дает шагать больше ~3.3 / lam, Radau — шагает по гладкости решения
+    assert max(h for h, radau in steps if not radau) < 4 / LAM
+    assert max(h for h, radau in steps if radau) > 1000 / LAM
+
+
+@pytest.mark.parametrize("method, tol", [("explicit", 1e-6), ("implicit", 1e-3), ("auto", 1e-3)])
+def test_stiff_solution_matches_exact(method, tol):
+    # Radau IIA на очень жесткой задаче теряет порядок (порядок стадий 3) — допуск грубее rtol
+    t_eval = np.linspace(0.0, 2.0, 41)
+    y = integrate(stiff_rhs, np.array([2.0]), (LAM,), t_eval, jac=stiff_jac, method=method)
+    assert np.abs(y[:, 0] - stiff_exact(t_eval)).max() < tol
+
+
+def test_radau_is_accurate_on_smooth_problem():
+    t_eval = np.linspace(0.0, 5.0, 26)
+    y = integrate(lambda t, y, p: -p[0] * y, np.array([1.0, 2.0]), (0.7,), t_eval,
+                  jac=lambda t, y, p: np.array([[-p[0], 0.0], [0.0, -p[0]]]), method="implicit")
+    assert np.allclose(y, np.exp(-0.7 * t_eval)[:, None] * [1.0, 2.0], rtol=1e-6, atol=0)
+
+
+def test_auto_without_jacobian_stays_explicit():
+    t_eval = np.linspace(0.0, 0.1, 11)
+    y = integrate(stiff_rhs, np.array([2.0]), (LAM,), t_eval)
+    assert np.abs(y[:, 0] - stiff_exact(t_eval)).max() < 1e-6
+
+
+def test_ensemble_members_follow_their_own_exact_solutions():
+    t_eval = np.linspace(0.0, 2.0, 21)
+    y0 = np.array([[2.0, 0.5, 1.0]])
+    y = integrate(stiff_rhs, y0, (LAM,), t_eval, jac=stiff_jac)
+    for m, start in enumerate(y0[0]):
+        assert np.abs(y[:, 0, m] - stiff_exact(t_eval, start)).max() < 1e-6
+
+
+# ---------- Адаптивная выдача ----------
+
+def oscillator(t, y, p):
+    return np.array([y[1], -p[0] ** 2 * y[0]])
+
+
+@pytest.mark.parametrize("tolerance", [1e-2, 1e-3, 1e-4])
+def test_adaptive_polyline_stays_within_tolerance(tolerance):
+    ts, ys = integrate_adaptive(oscillator, np.array([1.0, 0.0]), (1.0,), 0.0, 10.0, tolerance=tolerance)
+    assert ts[0] == 0.0 and ts[-1] == pytest.approx(10.0)
+    assert np.all(np.diff(ts) > 0)
+
+    # Ломаная через выданные точки против точного решения (cos t, -sin t) на мелкой сетке
+    fine = np.linspace(0.0, 10.0, 20001)
+    exact = np.stack([np.cos(fine), -np.sin(fine)], axis=1)
+    polyline = np.stack([np.interp(fine, ts, ys[:, i]) for i in range(2)], axis=1)
+    # Ошибка проверяется в OUTPUT_SAMPLES точках шага, между ними возможен небольшой выход
+    assert np.abs(polyline - exact).max() <= 1.5 * tolerance
+
+
+def test_adaptive_points_follow_curvature():
+    # e^(-t): крутой участок в начале, плато в конце
+    ts, ys = integrate_adaptive(lambda t, y, p: -y, np.array([1.0]), (), 0.0, 10.0, tolerance=1e-3)
+    assert np.allclose(ys[:, 0], np.exp(-ts), atol=1e-8)
+    assert np.sum(ts < 2) > 3 * np.sum(ts > 8)
+    assert len(ts) < 100
+
+
+# ---------- События ----------
+
+def _hits(model, **overrides):
+    values = MODELS[model].defaults
+    values.update(overrides)
+    hits = []
+    solve_model(model, list(values.values()), on_event=hits.append)
+    return hits
+
+
+def test_zero_crossings_by_direction():
+    found = []
+    events = [Event("down", lambda t, y, p: y[0], direction=-1), Event("up", lambda t, y, p: y[0], direction=1)]
+    integrate(oscillator, np.array([1.0, 0.0]), (1.0,), np.linspace(0.0, 10.0, 11), events=events,
+              on_event=lambda event, t, y: found.append((event.name, t)))
+    # cos t проходит ноль вниз в pi/2 + 2 pi k, вверх — в 3 pi/2 + 2 pi k
+    expected = [("down", np.pi / 2), ("up", 3 * np.pi / 2), ("down", 5 * np.pi / 2)]
+    assert [name for name, _ in found] == [name for name, _ in expected]
+    # Точность — как у самого решения (rtol решателя), а не у поиска корня
+    assert np.allclose([t for _, t in found], [t for _, t in expected], rtol=0, atol=1e-7)
+
+
+def test_terminal_event_stops_integration():
+    t_eval = np.linspace(0.0, 10.0, 101)
+    stop = Event("stop", lambda t, y, p: y[0] - 0.5, direction=-1, terminal=True)
+    ys = integrate(oscillator, np.array([1.0, 0.0]), (1.0,), t_eval, events=[stop])
+    # cos t = 0.5 при t = pi/3: выдаются только узлы сетки до события
+    assert len(ys) == np.sum(t_eval <= np.pi / 3)
+
+
+def test_lotka_peaks_sit_on_the_other_nullcline():
+    spec = MODELS["lotka"]
+    alpha, beta, gamma, delta = (spec.defaults[name] for name in spec.rate_names)
+    hits = _hits("lotka")
+    x_peaks = [hit for hit in hits if hit['name'] == "x_peak"]
+    y_peaks = [hit for hit in hits if hit['name'] == "y_peak"]
+    assert x_peaks and y_peaks
+    # dx/dt = 0 при y = alpha/beta, dy/dt = 0 при x = gamma/delta
+    assert all(abs(hit['values']['y'] - alpha / beta) < 1e-8 for hit in x_peaks)
+    assert all(abs(hit['values']['x'] - gamma / delta) < 1e-8 for hit in y_peaks)
+
+    # Первый интеграл сохраняется и в моменты событий
+    def invariant(x, y):
+        return delta * x - gamma * np.log(x) + beta * y - alpha * np.log(y)
+    start = invariant(spec.defaults["x0"], spec.defaults["y0"])
+    assert all(abs(invariant(hit['values']['x'], hit['values']['y']) - start) < 1e-6 for hit in hits)
+
+
+def test_seir_peak_and_threshold():
+    spec = MODELS["seir"]
+    hits = {hit['name']: hit for hit in _hits("seir")}
+    peak = hits["I_peak"]['values']
+    # dI/dt = alpha E - gamma I = 0 в пике
+    assert abs(spec.defaults["alpha"] * peak['E'] - spec.defaults["gamma"] * peak['I']) < 1e-10
+    assert abs(hits["S_half"]['values']['S'] - 0.5) < 1e-10
+    assert hits["S_half"]['t'] < hits["I_peak"]['t']
+
+
+def test_islm_rate_clamp_is_located():
+    hits = _hits("islm", Ms=900)
+    assert [hit['name'] for hit in hits][:1] == ["rate_zero"]
+    assert abs(hits[0]['values']['rate']) < 1e-10
+
+
+def test_adaptive_output_includes_event_times():
+    event = Event("down", lambda t, y, p: y[0], direction=-1)
+    ts, _ = integrate_adaptive(oscillator, np.array([1.0, 0.0]), (1.0,), 0.0, 10.0, tolerance=1e-2, events=[event])
+    assert np.min(np.abs(ts - np.pi / 2)) < 1e-7
+    assert np.min(np.abs(ts - 5 * np.pi / 2)) < 1e-7
+
+
+# ---------- Порции строк ----------
+
+def test_streamed_chunks_add_up_to_the_result(monkeypatch):
+    monkeypatch.setattr(native_solver, "CHUNK_INTERVAL", 0.0)
+    chunks = []
+    rows = solve_model("lotka", list(MODELS["lotka"].defaults.values()),
+                       on_chunk=lambda rows, fraction: chunks.append((rows, fraction)))
+    assert len(chunks) > 10
+    assert np.array_equal(np.array([row for part, _ in chunks for row in part]), np.array(rows))
+    fractions = [fraction for _, fraction in chunks]
+    assert fractions == sorted(fractions) and fractions[-1] == pytest.approx(1.0)
+
+
+def test_streaming_is_throttled():
+    chunks = []
+    solve_model("lotka", list(MODELS["lotka"].defaults.values()), on_chunk=lambda rows, fraction: chunks.append(rows))
+    # Быстрый расчет уходит одной-двумя порциями, а не по порции на шаг
+    assert 1 <= len(chunks) <= 3
+
+
+def test_should_stop_cancels_the_solve():
+    calls = []
+
+    def should_stop():
+        calls.append(None)
+        return len(calls) > 5
+
+    with pytest.raises(SolverCancelled):
+        solve_model("lorenz", list(MODELS["lorenz"].defaults.values()), should_stop=should_stop)
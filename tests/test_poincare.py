@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from core.models import MODELS
+from core.poincare import return_map, section_crossings
+
+BASE = MODELS["lorenz"].defaults
+PLANE = 27.0
+
+
+@pytest.fixture(scope="module")
+def upward():
+    chunks = []
+    crossings = section_crossings("lorenz", BASE, "z", PLANE, direction=1, t_max=100, chunk_points=20,
+                                  on_chunk=lambda points, fraction: chunks.append((points, fraction)))
+    return crossings, chunks
+
+
+def test_crossings_lie_on_the_plane_going_up(upward):
+    crossings, _ = upward
+    t, x, y, z = crossings.T
+    assert len(crossings) > 50
+    assert np.abs(z - PLANE).max() < 1e-9
+    # dz/dt = x y - beta z > 0 при пересечении снизу вверх
+    assert np.all(x * y - BASE["beta"] * z > 0)
+    assert t.min() >= 50 and np.all(np.diff(t) > 0)
+
+
+def test_chunks_add_up_to_the_result(upward):
+    crossings, chunks = upward
+    assert np.array_equal(np.concatenate([points for points, _ in chunks]), crossings)
+    fractions = [fraction for _, fraction in chunks]
+    assert fractions == sorted(fractions) and fractions[-1] == 1.0
+
+
+def test_both_directions_alternate(upward):
+    both = section_crossings("lorenz", BASE, "z", PLANE, direction=0, t_max=100)
+    down = section_crossings("lorenz", BASE, "z", PLANE, direction=-1, t_max=100)
+    assert len(both) == len(upward[0]) + len(down)
+    velocity = both[:, 1] * both[:, 2] - BASE["beta"] * both[:, 3]
+    assert np.all(np.sign(velocity[1:]) != np.sign(velocity[:-1]))
+
+
+def test_return_map_pairs_consecutive_crossings(upward):
+    crossings, _ = upward
+    u, u_next = return_map(crossings, 0)
+    assert np.array_equal(u, crossings[:-1, 1]) and np.array_equal(u_next, crossings[1:, 1])
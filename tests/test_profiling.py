@@ -0,0 +1,67 @@
+import json
+import threading
+
+import pytest
+
+from core import profiling
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    profiling.reset()
+    yield
+    profiling.reset()
+
+
+def test_spans_are_summarized_by_name():
+    profiling.record("solve", 0.0, 0.5)
+    profiling.record("solve", 0.0, 1.5)
+    profiling.record("plot", 0.0, 0.25)
+    (name, stat), (other, _) = profiling.summary()
+    assert (name, other) == ("solve", "plot")
+    assert (stat.count, stat.total, stat.max, stat.last, stat.mean) == (2, 2.0, 1.5, 1.5, 1.0)
+    assert profiling.last("plot") == 0.25 and profiling.last("db.save") is None
+
+
+def test_span_and_timed_measure_even_on_error():
+    @profiling.timed("db.save")
+    def save():
+        raise OSError("диск")
+
+    with pytest.raises(OSError):
+        save()
+    with profiling.span("wolfram.evaluate", model="seir"):
+        pass
+    assert profiling.last("db.save") >= 0 and profiling.last("wolfram.evaluate") >= 0
+    assert save.__name__ == "save"
+
+
+def test_version_changes_with_every_measurement():
+    before = profiling.version
+    with profiling.span("solve"):
+        pass
+    assert profiling.version == before + 1
+
+
+def test_chrome_trace_export(tmp_path):
+    with profiling.span("plot.batch", figures=3):
+        pass
+    thread = threading.Thread(target=lambda: profiling.record("solve", 0.0, 0.001))
+    thread.start()
+    thread.join()
+
+    path = tmp_path / "trace.json"
+    assert profiling.export_chrome_trace(str(path)) == 2
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events] == ["plot.batch", "solve"]
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+    assert events[0]["args"] == {"figures": 3} and "args" not in events[1]
+    # Потоки нумеруются по порядку появления
+    assert [event["tid"] for event in events] == [0, 1]
+
+
+def test_journal_is_a_ring_buffer():
+    for _ in range(profiling.MAX_EVENTS + 10):
+        profiling.record("tick", 0.0, 0.0)
+    assert len(profiling.chrome_trace()["traceEvents"]) == profiling.MAX_EVENTS
+    assert dict(profiling.summary())["tick"].count == profiling.MAX_EVENTS + 10
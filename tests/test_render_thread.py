@@ -0,0 +1,45 @@
+from core.render_thread import RenderThread, chart_name, render_to_image
+
+
+def draw_line(fig, calc):
+    fig.add_subplot(111).plot(calc['t'], calc['y'], color="black")
+
+
+def draw_broken(fig, calc):
+    raise ValueError("нет данных")
+
+
+CALC = {'t': [0, 1, 2], 'y': [0, 1, 4]}
+
+
+def test_image_has_figure_size_in_pixels():
+    image = render_to_image(draw_line, CALC, (4, 3), dpi=50)
+    assert (image.width(), image.height()) == (200, 150)
+    # Фон белый, линия черная — на картинке есть и то и другое
+    colors = {image.pixelColor(x, y).name() for x in range(0, 200, 4) for y in range(0, 150, 4)}
+    assert "#ffffff" in colors and len(colors) > 1
+
+
+def test_thread_reports_every_job_and_skips_broken_ones():
+    thread = RenderThread([(draw_line, CALC, (2, 2), 40), (draw_broken, CALC, (2, 2), 40),
+                           (draw_line, CALC, (3, 2), 40)])
+    images, errors = {}, {}
+    thread.image_ready.connect(lambda index, image: images.update({index: image.size()}))
+    thread.render_error.connect(lambda index, message: errors.update({index: message}))
+    # run() прямо в потоке теста: сигналы доставляются сразу
+    thread.run()
+    assert sorted(images) == [0, 2]
+    assert images[2].width() == 120 and errors == {1: "нет данных"}
+
+
+def test_cancelled_thread_renders_nothing():
+    thread = RenderThread([(draw_line, CALC, (2, 2), 40)])
+    images = []
+    thread.image_ready.connect(lambda index, image: images.append(index))
+    thread.cancel()
+    thread.run()
+    assert images == []
+
+
+def test_chart_name_uses_module_and_function():
+    assert chart_name(draw_line) == "test_render_thread.draw_line"
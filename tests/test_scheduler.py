@@ -0,0 +1,119 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from core.scheduler import JobScheduler
+
+
+class FakeThread(QObject):
+    """Поток без потока: запуск и отмена только запоминаются, finished отправляет тест"""
+
+    finished = pyqtSignal()
+
+    def __init__(self, resource=None):
+        super().__init__()
+        self.resource = resource
+        self.started = False
+        self.cancelled = False
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Owner:
+    pass
+
+
+def test_new_calculation_supersedes_running_one():
+    jobs = JobScheduler(max_running=1)
+    owner = Owner()
+    old, new = FakeThread(), FakeThread()
+    jobs.submit(owner, old)
+    jobs.submit(owner, new)
+
+    assert old.cancelled
+    # Отмененный поток еще занимает место до своего finished
+    assert not new.started
+    old.finished.emit()
+    assert new.started and not new.cancelled
+
+
+def test_new_calculation_replaces_pending_one():
+    jobs = JobScheduler(max_running=1)
+    busy, owner = Owner(), Owner()
+    blocker, stale, fresh = FakeThread(), FakeThread(), FakeThread()
+    jobs.submit(busy, blocker)
+    jobs.submit(owner, stale)
+    jobs.submit(owner, fresh)
+
+    blocker.finished.emit()
+    assert fresh.started
+    assert not stale.started and not stale.cancelled
+
+
+def test_other_kinds_and_owners_are_not_superseded():
+    jobs = JobScheduler(max_running=3)
+    first, second = Owner(), Owner()
+    calculation, fit, other = FakeThread(), FakeThread(), FakeThread()
+    jobs.submit(first, calculation)
+    jobs.submit(first, fit, kind="fit")
+    jobs.submit(second, other)
+    assert all(thread.started and not thread.cancelled for thread in (calculation, fit, other))
+
+
+def test_cancel_reports_whether_running_thread_was_stopped():
+    jobs = JobScheduler(max_running=1)
+    busy, owner = Owner(), Owner()
+    blocker, queued = FakeThread(), FakeThread()
+    jobs.submit(busy, blocker)
+    jobs.submit(owner, queued)
+
+    assert jobs.is_busy(owner)
+    # Снятый из очереди поток не запускался — finished у него не будет
+    assert jobs.cancel(owner) is False
+    assert not jobs.is_busy(owner)
+    assert jobs.cancel(busy) is True
+    assert blocker.cancelled and not jobs.is_busy(busy)
+
+
+def test_wolfram_jobs_run_one_at_a_time():
+    jobs = JobScheduler(max_running=3)
+    first, second = FakeThread(resource="wolfram"), FakeThread(resource="wolfram")
+    native = FakeThread()
+    jobs.submit(Owner(), first)
+    jobs.submit(Owner(), second)
+    jobs.submit(Owner(), native)
+
+    assert first.started and native.started and not second.started
+    first.finished.emit()
+    assert second.started
+
+
+def test_focused_owner_runs_first():
+    jobs = JobScheduler(max_running=1)
+    background, visible = Owner(), Owner()
+    blocker, waiting, focused = FakeThread(), FakeThread(), FakeThread()
+    jobs.submit(Owner(), blocker)
+    jobs.submit(background, waiting, priority=10)
+    jobs.submit(visible, focused)
+    jobs.set_focus(visible)
+
+    blocker.finished.emit()
+    assert focused.started and not waiting.started
+    focused.finished.emit()
+    assert waiting.started
+
+
+def test_queue_changed_counts_active_and_pending():
+    jobs = JobScheduler(max_running=1)
+    counts = []
+    jobs.queue_changed.connect(lambda running, pending: counts.append((running, pending)))
+    owner = Owner()
+    first = FakeThread()
+    jobs.submit(owner, first)
+    jobs.submit(Owner(), FakeThread())
+    jobs.cancel(owner)
+    assert counts[-1] == (0, 1)
+    first.finished.emit()
+    assert counts[-1] == (1, 0)
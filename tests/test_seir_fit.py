@@ -0,0 +1,38 @@
+import numpy as np
+
+from core.seir_fit import fit_starts, model_incidence
+
+# Параметры, по которым строятся синтетические наблюдения: beta, alpha, gamma, E0, I0
+TRUE = np.array([0.6, 0.25, 0.15, 2e-3, 1e-3])
+T_OBS = np.arange(1.0, 81.0)
+POPULATION = 1e5
+
+
+def test_sensitivities_match_finite_differences():
+    theta = TRUE[:, None]
+    mu, d_mu = model_incidence(theta, T_OBS, POPULATION)
+    for j in range(len(TRUE)):
+        h = 1e-5 * TRUE[j]
+        step = np.zeros_like(theta)
+        step[j] = h
+        numeric = (model_incidence(theta + step, T_OBS, POPULATION)[0]
+                   - model_incidence(theta - step, T_OBS, POPULATION)[0]) / (2 * h)
+        assert np.abs(d_mu[:, j] - numeric).max() < 1e-5 * np.abs(numeric).max()
+
+
+def test_levenberg_marquardt_recovers_parameters():
+    cases = model_incidence(TRUE[:, None], T_OBS, POPULATION)[0][:, 0]
+    # Старты в пределах ±30% от истинных значений
+    starts = TRUE[:, None] * np.array([[0.7, 1.3, 1.2], [1.3, 0.8, 1.1], [0.8, 1.2, 0.7],
+                                       [1.3, 0.7, 1.2], [0.7, 1.3, 0.8]])
+    theta, objective = fit_starts(starts, T_OBS, cases, POPULATION)
+    best = int(np.argmin(objective))
+    assert np.allclose(theta[:, best], TRUE, rtol=1e-4)
+    assert objective[best] < 1e-6 * np.sum(cases ** 2)
+
+
+def test_poisson_fit_on_exact_data():
+    cases = model_incidence(TRUE[:, None], T_OBS, POPULATION)[0][:, 0]
+    starts = TRUE[:, None] * np.array([[1.2], [0.8], [1.1], [0.9], [1.2]])
+    theta, _ = fit_starts(starts, T_OBS, cases, POPULATION, method="poisson")
+    assert np.allclose(theta[:, 0], TRUE, rtol=1e-3)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from core import stability
+
+LORENZ = dict(sigma=10.0, beta=8 / 3)
+
+
+def _classes(model, params):
+    result = stability.analyze(model, params)
+    return [int(code) if ok else None for code, ok in zip(result['classes'], result['valid'])]
+
+
+@pytest.mark.parametrize("rho, expected", [
+    (0.5, [stability.STABLE_NODE, None]),
+    (15.0, [stability.SADDLE, stability.STABLE_FOCUS]),
+    (28.0, [stability.SADDLE, stability.SADDLE_FOCUS]),
+])
+def test_lorenz_equilibria(rho, expected):
+    assert _classes("lorenz", dict(LORENZ, rho=rho)) == expected
+
+
+def test_lotka_volterra_has_a_saddle_and_a_center():
+    params = dict(alpha=1.0, beta=0.5, gamma=0.75, delta=0.25)
+    assert _classes("lotka", params) == [stability.SADDLE, stability.CENTER]
+    points, _ = stability.equilibria("lotka", params)
+    assert np.allclose(points[1], [3.0, 2.0])
+
+
+def test_competition_coexistence_is_a_stable_node():
+    params = dict(p=1.0, q=1.0, r=0.5, s=1.0, t=0.5, u=1.0)
+    assert _classes("competition", params) == [stability.UNSTABLE_NODE, stability.SADDLE, stability.SADDLE,
+                                              stability.STABLE_NODE]
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_closed_form_eigenvalues_match_numpy(n):
+    matrices = np.random.default_rng(n).normal(size=(200, n, n))
+    ours = stability.eigenvalues(np.moveaxis(matrices, 0, 2)).T
+    reference = np.linalg.eigvals(matrices)
+    # Порядок корней разный: каждому корню numpy — ближайший из наших
+    distance = np.abs(ours[:, :, None] - reference[:, None, :]).min(axis=1)
+    assert distance.max() < 1e-9
+
+
+def test_hopf_threshold_separates_stable_and_unstable_c():
+    rho_h = float(stability.lorenz_hopf_rho(LORENZ['sigma'], LORENZ['beta']))
+    assert rho_h == pytest.approx(470 / 19)
+    abscissa = stability.spectral_abscissa("lorenz", dict(LORENZ, rho=np.array([rho_h - 0.1, rho_h + 0.1])), 1)
+    assert abscissa[0] < 0 < abscissa[1]
+
+
+def test_regime_map_is_vectorized():
+    rho = np.array([0.5, 0.9, 10.0, 20.0, 28.0, 40.0])
+    codes, labels = stability.regime_map("lorenz", dict(LORENZ, rho=rho))
+    assert codes.shape == rho.shape
+    # Покой в O, устойчивые C± и неустойчивые C± за порогом Хопфа
+    assert codes[0] == codes[1] and codes[2] == codes[3] and codes[4] == codes[5]
+    assert len({codes[0], codes[2], codes[4]}) == 3 == len(labels)
+    assert "C±: устойчивый фокус" in labels[codes[2]]
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from core.stochastic_seir import stochastic_chunk
+
+# R0 = beta / gamma = 2: вспышка от k заболевших угасает с вероятностью (1/R0)^k
+BETA, ALPHA, GAMMA = 0.4, 0.5, 0.2
+R0 = BETA / GAMMA
+N_REALIZATIONS = 1000
+
+
+def _chunk(method, population, infected, seed=1):
+    params = (BETA, ALPHA, GAMMA, 1 - infected / population, 0.0, infected / population, 0.0, 200.0)
+    return stochastic_chunk(params, population, N_REALIZATIONS, method, seed)
+
+
+@pytest.mark.parametrize("method, population", [("gillespie", 200), ("tau", 1000)])
+@pytest.mark.parametrize("infected", [1, 2])
+def test_extinction_probability_matches_branching_process(method, population, infected):
+    _, _, extinct, _ = _chunk(method, population, infected)
+    assert extinct.mean() == pytest.approx((1 / R0) ** infected, abs=0.05)
+
+
+@pytest.mark.parametrize("method", ["gillespie", "tau"])
+def test_population_is_conserved(method):
+    total, final_size, _, _ = _chunk(method, 200, 1)
+    # Сумма долей по реализациям: в каждой S + E + I + R = 1
+    assert np.allclose(total.sum(axis=1), N_REALIZATIONS)
+    assert final_size.min() >= 0 and final_size.max() <= 199
+
+
+def test_same_seed_gives_same_realizations():
+    first, second = _chunk("gillespie", 200, 1, seed=7), _chunk("gillespie", 200, 1, seed=7)
+    assert np.array_equal(first[1], second[1])
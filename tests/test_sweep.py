@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from core.models import MODELS
+from core.sweep import grid_samples, latin_hypercube, run_sweep
+
+
+def test_grid_covers_every_combination():
+    samples = grid_samples({"beta": (0.2, 0.6), "gamma": (0.1, 0.3)}, 3)
+    pairs = set(zip(samples["beta"].round(6), samples["gamma"].round(6)))
+    assert len(pairs) == 9
+    assert pairs == {(b, g) for b in (0.2, 0.4, 0.6) for g in (0.1, 0.2, 0.3)}
+
+
+def test_latin_hypercube_puts_one_point_in_every_stratum():
+    n = 50
+    samples = latin_hypercube({"beta": (0.2, 0.6), "gamma": (1.0, 2.0)}, n, seed=3)
+    for values, (lo, hi) in ((samples["beta"], (0.2, 0.6)), (samples["gamma"], (1.0, 2.0))):
+        strata = np.floor((values - lo) / (hi - lo) * n).astype(int)
+        assert sorted(strata) == list(range(n))
+
+
+@pytest.fixture(scope="module")
+def seir_sweep():
+    base = MODELS["seir"].defaults
+    samples = grid_samples({"beta": (0.3, 0.9)}, 5)
+    return base, samples, run_sweep("seir", base, samples, backend="ensemble", chunk_size=2)
+
+
+def test_ensemble_matches_process_pool(seir_sweep):
+    base, samples, ensemble = seir_sweep
+    pooled = run_sweep("seir", base, samples, backend="pool", chunk_size=3, max_workers=2)
+    for key in ensemble:
+        assert np.allclose(ensemble[key], pooled[key], rtol=1e-5, atol=1e-8)
+
+
+def test_final_size_grows_with_transmission(seir_sweep):
+    _, _, metrics = seir_sweep
+    assert not np.isnan(metrics["R_final"]).any()
+    assert np.all(np.diff(metrics["R_final"]) > 0)
+    assert np.all(np.diff(metrics["I_peak"]) > 0)
+
+
+def test_chunks_are_reported_in_order():
+    seen = []
+    samples = grid_samples({"alpha": (0.5, 1.5)}, 5)
+    run_sweep("lotka", MODELS["lotka"].defaults, samples, chunk_size=2,
+              on_chunk=lambda start, metrics, fraction: seen.append((start, len(metrics["x_max"]), fraction)))
+    assert seen == [(0, 2, 0.4), (2, 2, 0.8), (4, 1, 1.0)]
+
+
+def test_unknown_parameter_is_rejected():
+    with pytest.raises(ValueError):
+        run_sweep("seir", MODELS["seir"].defaults, {"delta": [1.0]})
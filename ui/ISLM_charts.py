@@ -0,0 +1,346 @@
+"""Графики динамической модели IS-LM (без зависимости от Qt)."""
+import numpy as np
+
+from ui.event_markers import mark_events
+
+
+def _series(calc):
+    Y = np.array(calc['Y_data'])
+    i_rate = np.array(calc['i_data'])
+    t = np.array(calc['t_data'])
+    return t, Y, i_rate
+
+
+def _curve_ranges(calc, Y, i_rate):
+    """Глобальные границы и статические кривые IS-LM (FORCE ZOOM OUT)"""
+    G, C0, mpc, I0, d = calc['G'], calc['C0'], calc['MPC'], calc['I0'], calc['d']
+    Ms, P, k, h = calc['Ms'], calc['P'], calc['k'], calc['h']
+
+    # Мы хотим видеть диапазон от 0 до как минимум 3500 по Доходу (Y)
+    # И от 0 до как минимум 10-15 по Ставке (i)
+    x_min_limit = 0
+    x_max_limit = max(np.max(Y) * 1.2, 3500)  # С запасом 20% или минимум 3500
+    y_min_limit = min(np.min(i_rate) - 2, 0)  # Позволяем уходить в минус
+    y_max_limit = max(np.max(i_rate) + 2, 15)
+
+    # Генерируем статические кривые IS-LM
+    Y_static = np.linspace(x_min_limit, x_max_limit, 200)
+
+    # Генерируем кривые IS-LM во всем этом широком диапазоне
+    Y_range = np.linspace(x_min_limit, x_max_limit, 100)
+    IS_curve = (C0 + I0 + G - (1 - mpc) * Y_range) / d
+    LM_curve = (k * Y_range - Ms / P) / h
+
+    return Y_static, Y_range, IS_curve, LM_curve, y_min_limit, y_max_limit
+
+
+def draw_main(fig, calc):
+    t, Y, i_rate = _series(calc)
+    Y_static, Y_range, IS_curve, LM_curve, y_min_limit, y_max_limit = _curve_ranges(calc, Y, i_rate)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax1 = fig.add_subplot(111)
+
+    # Отрисовка линий
+    ax1.plot(Y_range, IS_curve, 'r-', label='IS (Товары)', linewidth=2)
+    ax1.plot(Y_range, LM_curve, 'b-', label='LM (Деньги)', linewidth=2)
+    ax1.plot(Y, i_rate, 'g--', linewidth=2.5, label='Путь к равновесию', alpha=0.9)
+
+    # Точки
+    ax1.scatter([Y[0]], [i_rate[0]], color='green', s=80, label='Старт (Y0, i0)', zorder=5)
+    ax1.scatter([Y[-1]], [i_rate[-1]], color='black', s=120, label='Точка E (Финал)', zorder=6)
+
+    # ВЫЧИСЛЯЕМ ОПТИМАЛЬНЫЕ ГРАНИЦЫ
+    # По X: добавляем 15% отступа слева и справа
+    x_range = Y_range[-1] - Y_range[0]
+    x_min = Y_range[0] - 1.2 * x_range
+    x_max = Y_range[-1] + 1.2 * x_range
+
+    # По Y: используем ваши пределы, но тоже можно добавить отступ
+    y_range_data = y_max_limit - y_min_limit
+    y_min = y_min_limit - 1.2 * y_range_data
+    y_max = y_max_limit + 1.2 * y_range_data
+
+    ax1.set_xlim(x_min, x_max)
+    ax1.set_ylim(y_min, y_max)  # или оставьте ваши y_min_limit, y_max_limit
+
+    ax1.set_xlabel("Доход (Y)")
+    ax1.set_ylabel("Ставка (i)")
+    ax1.set_title("Глобальное равновесие модели IS-LM")
+    ax1.legend(loc='upper right')
+    ax1.grid(True, which='both', linestyle='--', alpha=0.5)
+
+
+def draw_dynamics(fig, calc):
+    t, Y, i_rate = _series(calc)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax2 = fig.add_subplot(211)
+    ax2.plot(t, Y, color='darkgreen', linewidth=2)
+    mark_events(ax2, calc, ["Y_peak"], "Y", color='darkred')
+    if ax2.get_legend_handles_labels()[0]:
+        ax2.legend(fontsize=8)
+    ax2.set_ylabel("Доход (Y)")
+    ax2.grid(True, alpha=0.2)
+
+    ax3 = fig.add_subplot(212)
+    ax3.plot(t, i_rate, color='darkblue', linewidth=2)
+    mark_events(ax3, calc, ["rate_zero"], "rate", color='darkred')
+    if ax3.get_legend_handles_labels()[0]:
+        ax3.legend(fontsize=8)
+    ax3.set_ylabel("Ставка (i)")
+    ax3.set_xlabel("Время (t)")
+    ax3.grid(True, alpha=0.2)
+
+
+def draw_investment(fig, calc):
+    """Упрощенный рынок инвестиций (убираем базу, оставляем только факт)"""
+    t, Y, i_rate = _series(calc)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax4 = fig.add_subplot(111)
+
+    # Считаем реальные инвестиции в каждый момент времени
+    real_inv = calc['I0'] - calc['d'] * i_rate
+
+    ax4.plot(t, real_inv, color='orange', linewidth=2.5, label='Инвестиции бизнеса (I)')
+
+    ax4.set_xlabel("Время t")
+    ax4.set_ylabel("Объем I")
+    ax4.set_title("Динамика реальных инвестиций")
+    ax4.legend(loc='lower right')
+    ax4.grid(True, alpha=0.2)
+
+
+def draw_money(fig, calc):
+    """Упрощенный рынок денег (убираем старт/середину, оставляем только ФИНАЛ)"""
+    t, Y, i_rate = _series(calc)
+    k, h = calc['k'], calc['h']
+
+    fig.subplots_adjust(bottom=0.20)
+    ax5 = fig.add_subplot(111)
+
+    M_supply = calc['Ms'] / calc['P']
+
+    # Ось денег
+    M_axis = np.linspace(M_supply * 0.5, M_supply * 1.5, 100)
+
+    # Несколько моментов времени
+    indices = [0, len(Y) // 2, -1]
+    colors = ['gray', 'orange', 'green']
+    labels = ['Начало', 'Середина', 'Финал']
+
+    for idx, color, label in zip(indices, colors, labels):
+        demand_curve = (k * Y[idx] - M_axis) / h
+        ax5.plot(M_axis, demand_curve, color=color, linewidth=2, label=f'L ({label})')
+
+    # Предложение денег
+    ax5.axvline(x=M_supply, color='blue', linewidth=3, label='Ms/P')
+
+    # Финальная точка
+    ax5.scatter([M_supply], [i_rate[-1]], color='red', s=100, zorder=5)
+
+    ax5.set_xlabel("Деньги (M)")
+    ax5.set_ylabel("Ставка i")
+    ax5.set_title("Рынок денег (динамика)")
+    ax5.legend()
+    ax5.grid(True, alpha=0.2)
+
+
+def draw_goods(fig, calc):
+    """Упрощенный кейнсианский крест (убираем старт, оставляем только ФИНАЛ)"""
+    t, Y, i_rate = _series(calc)
+    Y_static = _curve_ranges(calc, Y, i_rate)[0]
+    G, C0, mpc, I0, d = calc['G'], calc['C0'], calc['MPC'], calc['I0'], calc['d']
+
+    fig.subplots_adjust(bottom=0.20)
+    ax6 = fig.add_subplot(111)
+
+    # Линия 45°
+    ax6.plot(Y_static, Y_static, color='black', linestyle='--', label='Y = AD')
+
+    # Несколько кривых AD
+    indices = [0, len(i_rate) // 2, -1]
+    colors = ['gray', 'orange', 'red']
+    labels = ['Начало', 'Середина', 'Финал']
+
+    for idx, color, label in zip(indices, colors, labels):
+        inv = I0 - d * i_rate[idx]
+        AD = C0 + mpc * Y_static + inv + G
+        ax6.plot(Y_static, AD, color=color, linewidth=2, label=f'AD ({label})')
+
+    # Финальная точка равновесия
+    ax6.scatter([Y[-1]], [Y[-1]], color='black', s=120, zorder=5)
+
+    ax6.set_xlabel("Доход Y")
+    ax6.set_ylabel("Спрос AD")
+    ax6.set_title("Кейнсианский крест (динамика)")
+    ax6.legend()
+    ax6.grid(True, alpha=0.2)
+
+
+def draw_phase(fig, calc):
+    fig.subplots_adjust(bottom=0.20)
+    ax8 = fig.add_subplot(111)
+
+    # Получаем производные как массивы
+    dY_dt = np.array(calc['dY_dt_data'])
+    di_dt = np.array(calc['di_dt_data'])
+
+    # Траектория скоростей (Зеленая спираль)
+    ax8.plot(dY_dt, di_dt, color='darkgreen', linewidth=2.5, label='Фазовая траектория', alpha=0.8)
+
+    # Точка старта и финала скоростей
+    # Финал всегда в (0, 0), когда подстройка завершена.
+    ax8.scatter([dY_dt[0]], [di_dt[0]], color='green', s=100, zorder=5, label='Старт')
+    ax8.scatter([0], [0], color='black', s=150, zorder=6, label='Равновесие (0,0)')
+
+    # Оси координат (крест через ноль)
+    ax8.axhline(y=0, color='black', linewidth=1, linestyle='-')
+    ax8.axvline(x=0, color='black', linewidth=1, linestyle='-')
+
+    # Сетка и подписи
+    ax8.set_xlabel("Скорость изменения Дохода (dY/dt)", fontsize=7)
+    ax8.set_ylabel("Скорость изменения Ставки (di/dt)", fontsize=7)
+    ax8.set_title("Фазовый портрет: Устойчивость системы")
+    ax8.legend(loc='upper right', fontsize='small')
+    ax8.grid(True, which='both', linestyle='--', alpha=0.3)
+
+
+def draw_elasticity(fig, calc):
+    """Эластичность спроса на деньги по ставке.
+
+    E_i = (dL/di) * (i/L); в нашей модели L = kY - hi, значит dL/di = -h
+    и E_i = -h * (i_rate / money_demand)
+    """
+    t, Y, i_rate = _series(calc)
+    k, h = calc['k'], calc['h']
+
+    fig.subplots_adjust(bottom=0.20)
+    ax7 = fig.add_subplot(111)
+
+    # Считаем спрос на деньги в каждый момент времени
+    L_demand = k * Y - h * i_rate
+
+    # Избегаем деления на ноль (хотя в L деления нет, на всякий случай)
+    safe_L = np.where(L_demand == 0, 1e-9, L_demand)
+
+    # Считаем эластичность (она всегда отрицательная, так как i и L ходят в разные стороны)
+    elasticity_i = -h * (i_rate / safe_L)
+
+    # Траектория эластичности во времени
+    ax7.plot(t, elasticity_i, color='purple', linewidth=2.5, label='Текущая эластичность')
+
+    # Горизонтальная линия -1 (Условная граница эластичности)
+    ax7.axhline(y=-1, color='red', linestyle='--', alpha=0.5, label='Граница (-1)')
+
+    # Точка Финала
+    ax7.scatter([t[-1]], [elasticity_i[-1]], color='black', s=120, zorder=5, label='Финал (E)')
+
+    # Сетка и подписи
+    ax7.set_xlabel("Время (t)", fontsize=11)
+    ax7.set_ylabel("Эластичность спроса по ставке (Ei)", fontsize=7)
+    ax7.set_title("Эластичность спроса на деньги во времени")
+    ax7.legend(loc='lower right', fontsize='small')
+    ax7.grid(True, alpha=0.3)
+
+    # По умолчанию экономисты смотрят наEi, которая обычно < 0.
+    # Ei > -1 (ближе к 0) - спрос неэластичен (люди не реагируют на ставку).
+    # Ei < -1 (дальше от 0) - спрос эластичен (люди сильно реагируют).
+
+
+# Ключ вкладки -> (размер фигуры, функция отрисовки)
+CHARTS = {
+    "main": ((7, 4), draw_main),
+    "dynamics": ((7, 4), draw_dynamics),
+    "investment": ((7, 4), draw_investment),
+    "money": ((7, 4), draw_money),
+    "goods": ((7, 4), draw_goods),
+    "phase": ((7, 4), draw_phase),
+    "elasticity": ((7, 4), draw_elasticity),
+}
+
+# Живые графики во время расчета: столбцы строк {t, Y, rate, Y', rate'}
+STREAMS = {
+    "dynamics": {"labels": ("Время (t)", "Доход (Y)"), "lines": [(0, 1, None)]},
+    "phase": {"labels": ("dY/dt", "di/dt"), "lines": [(3, 4, None)]},
+}
+
+# Анимация траектории при экспорте в видео/GIF
+ANIMATION = {"columns": ("Y_data", "i_data"), "labels": ("Доход (Y)", "Ставка (i)")}
+
+
+# ---------- Сравнение сценариев ----------
+# calc: {'scenarios': [{'name': ..., параметры..., 'rows': [[t, Y, rate, Y', rate'], ...]}, ...]}
+
+def _scenario_series(calc):
+    for index, scenario in enumerate(calc['scenarios']):
+        rows = np.array(scenario['rows'])
+        yield scenario, rows, f"C{index % 10}"
+
+
+def draw_scenario_dynamics(fig, calc):
+    fig.subplots_adjust(bottom=0.12, hspace=0.3)
+    ax_y = fig.add_subplot(211)
+    ax_i = fig.add_subplot(212, sharex=ax_y)
+
+    for scenario, rows, color in _scenario_series(calc):
+        ax_y.plot(rows[:, 0], rows[:, 1], color=color, linewidth=2, label=scenario['name'])
+        ax_i.plot(rows[:, 0], rows[:, 2], color=color, linewidth=2)
+
+    ax_y.set_ylabel("Доход (Y)")
+    ax_y.set_title("Сравнение сценариев")
+    ax_y.legend(fontsize='small')
+    ax_y.grid(True, alpha=0.2)
+    ax_i.set_ylabel("Ставка (i)")
+    ax_i.set_xlabel("Время (t)")
+    ax_i.grid(True, alpha=0.2)
+
+
+def draw_scenario_cross(fig, calc):
+    fig.subplots_adjust(bottom=0.15)
+    ax = fig.add_subplot(111)
+
+    all_rows = np.concatenate([np.array(s['rows']) for s in calc['scenarios']])
+    Y_range = np.linspace(0, max(all_rows[:, 1].max() * 1.3, 3500), 200)
+
+    for scenario, rows, color in _scenario_series(calc):
+        IS_curve = (scenario['C0'] + scenario['I0'] + scenario['G'] - (1 - scenario['MPC']) * Y_range) / scenario['d']
+        LM_curve = (scenario['k'] * Y_range - scenario['Ms'] / scenario['P']) / scenario['h']
+        ax.plot(Y_range, IS_curve, color=color, linestyle='-', linewidth=1.5, alpha=0.8)
+        ax.plot(Y_range, LM_curve, color=color, linestyle=':', linewidth=1.5, alpha=0.8)
+        ax.plot(rows[:, 1], rows[:, 2], color=color, linestyle='--', linewidth=2, label=scenario['name'])
+        ax.scatter([rows[-1, 1]], [rows[-1, 2]], color=color, s=80, edgecolor='black', zorder=5)
+
+    rates = all_rows[:, 2]
+    ax.set_ylim(min(rates.min() - 2, 0), max(rates.max() + 2, 15))
+    ax.set_xlabel("Доход (Y)")
+    ax.set_ylabel("Ставка (i)")
+    ax.set_title("IS (—) и LM (···) по сценариям")
+    ax.legend(fontsize='small')
+    ax.grid(True, linestyle='--', alpha=0.5)
+
+
+def draw_scenario_phase(fig, calc):
+    fig.subplots_adjust(bottom=0.15)
+    ax = fig.add_subplot(111)
+
+    for scenario, rows, color in _scenario_series(calc):
+        ax.plot(rows[:, 3], rows[:, 4], color=color, linewidth=2, label=scenario['name'], alpha=0.8)
+        ax.scatter([rows[0, 3]], [rows[0, 4]], color=color, s=60, zorder=5)
+
+    ax.scatter([0], [0], color='black', s=120, zorder=6, label='Равновесие (0,0)')
+    ax.axhline(y=0, color='black', linewidth=1)
+    ax.axvline(x=0, color='black', linewidth=1)
+    ax.set_xlabel("dY/dt")
+    ax.set_ylabel("di/dt")
+    ax.set_title("Фазовые портреты сценариев")
+    ax.legend(fontsize='small')
+    ax.grid(True, linestyle='--', alpha=0.3)
+
+
+SCENARIOS = {
+    "dynamics": ((7, 5), draw_scenario_dynamics),
+    "cross": ((7, 5), draw_scenario_cross),
+    "phase": ((7, 5), draw_scenario_phase),
+}
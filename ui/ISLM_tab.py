@@ -2,8 +2,9 @@ import uuid
 import numpy as np
 from datetime import datetime
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QFormLayout, QLabel,
-    QLineEdit, QPushButton, QProgressBar, QMessageBox, QTabWidget
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel,
+    QLineEdit, QPushButton, QProgressBar, QMessageBox, QTabWidget,
+    QTableWidget, QTableWidgetItem
 )
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
@@ -13,16 +14,30 @@ from matplotlib.figure import Figure
 
 from core.calculation_thread import CalculationThread
 from core.database import save_calculation, load_calculation
+from core.models import MODELS
+from core.profiling import span
+from core.scheduler import scheduler
+from core.islm_scenarios import PARAMS
+from core.scenario_thread import ScenarioThread
+from ui.figure_view import show_charts, start_streams
+from ui.ISLM_charts import CHARTS, SCENARIOS, STREAMS
 
 
 class ISLMTab(QWidget):
     """Вкладка: Динамическая модель IS-LM (Равновесие товарного и денежного рынков)"""
 
+    MODEL = MODELS["islm"]
+    MODEL_NAME = MODEL.title
+
     def __init__(self):
         super().__init__()
         self.t_data, self.Y_data, self.i_data = [], [], []
         self.dY_dt_data, self.di_dt_data = [], []
+        # События расчета (ставка достигла нуля, пик выпуска) для отметок на графиках
+        self.events = []
         self.calculation_thread = None
+        self.render_thread = None
+        self.stream_views = None
         self.current_calc_id = None
         self.init_ui()
 
@@ -90,6 +105,9 @@ class ISLMTab(QWidget):
         self.graph_tabs.addTab(self.phase_tab, "Фазовый портрет")
         self.graph_tabs.addTab(self.elastic_tab, "Эластичность спроса")
 
+        self.scenario_panel = ScenarioPanel(self.base_params)
+        self.graph_tabs.addTab(self.scenario_panel, "Сравнение сценариев")
+
         layout.addWidget(title)
         layout.addLayout(form_layout)
         layout.addWidget(self.progress_bar)
@@ -113,306 +131,104 @@ class ISLMTab(QWidget):
             rate_start = float(self.rate0_input.text())
             t_max = float(self.t_max_input.text())
 
-            self.calc_button.setEnabled(False)
-            self.calc_button.setText("⏳ Вычисление в Wolfram...")
+            self.calc_button.setText("⏳ Вычисление...")
             self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 0)
+            self.stream_views = None
 
             # ПЕРЕДАЕМ ПАРАМЕТРЫ ПО ПОРЯДКУ (их ровно 12)
             self.calculation_thread = CalculationThread(
                 g, c0, mpc, i0_inv, d, ms, p_price, k, h, y_start, rate_start, t_max,
-                model="islm"
+                model=self.MODEL.key
             )
+            self.calculation_thread.calculation_events.connect(self.on_events)
             self.calculation_thread.calculation_finished.connect(self.on_finished)
             self.calculation_thread.calculation_error.connect(self.on_error)
-            self.calculation_thread.start()
+            self.calculation_thread.calculation_chunk.connect(self.on_chunk)
+            self.calculation_thread.calculation_progress.connect(self.on_progress)
+            scheduler().submit(self, self.calculation_thread)
         except Exception as e:
             self.on_error(str(e))
 
+    def on_events(self, events):
+        self.events = events
+
     def on_finished(self, result):
         self.calc_button.setEnabled(True)
         self.calc_button.setText("Рассчитать")
         self.progress_bar.setVisible(False)
-        self.t_data = [float(r[0]) for r in result]
-        self.Y_data = [float(r[1]) for r in result]
-        self.i_data = [float(r[2]) for r in result]
-        self.dY_dt_data = [float(r[3]) for r in result]
-        self.di_dt_data = [float(r[4]) for r in result]
+        self.stream_views = None
+        # Столбцы строк -> атрибуты *_data по схеме модели
+        with span("result.convert", model=self.MODEL.key):
+            for key, values in self.MODEL.columns_of(result).items():
+                setattr(self, key, values)
         self.plot_graphs()
 
+    def on_chunk(self, rows):
+        """Дорисовывает графики по мере прихода строк от решателя"""
+        if self.stream_views is None:
+            self.stream_views = start_streams(self, [
+                (self.dyn_tab, STREAMS["dynamics"]),
+                (self.phase_tab, STREAMS["phase"]),
+            ])
+        for view in self.stream_views:
+            view.append(rows)
+
+    def on_progress(self, percent):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+
     def on_error(self, error):
         self.calc_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         QMessageBox.critical(self, "Ошибка", f"Крах экономики:\n{error}")
 
+    def base_params(self):
+        """Параметры из формы (основа для новых сценариев)"""
+        return {name: float(getattr(self, f"{name}_input").text()) for name in PARAMS}
+
+    def current_record(self):
+        """Параметры и данные текущего расчета в формате записи БД"""
+        return {
+            # Параметры ввода
+            'G': float(self.G_input.text()),
+            'C0': float(self.C0_input.text()),
+            'MPC': float(self.MPC_input.text()),
+            'I0': float(self.I0_input.text()),
+            'd': float(self.d_input.text()),
+            'Ms': float(self.Ms_input.text()),
+            'P': float(self.P_input.text()),
+            'k': float(self.k_input.text()),
+            'h': float(self.h_input.text()),
+            'Y0': float(self.Y0_input.text()),
+            'rate0': float(self.rate0_input.text()),
+            't_max': float(self.t_max_input.text()),
+
+            # Результаты вычислений
+            't_data': [float(v) for v in self.t_data],
+            'Y_data': [float(v) for v in self.Y_data],
+            'i_data': [float(v) for v in self.i_data],
+
+            'dY_dt_data': [float(v) for v in self.dY_dt_data],
+            'di_dt_data': [float(v) for v in self.di_dt_data],
+            'events': self.events
+        }
+
     def plot_graphs(self):
         for tab in self.tabs_list:
             layout = tab.layout()
             while layout.count():
                 layout.takeAt(0).widget().deleteLater()
 
-        Y = np.array(self.Y_data)
-        i_rate = np.array(self.i_data)
-        t = np.array(self.t_data)
-
-        # 1. Сбор параметров
-        G = float(self.G_input.text())
-        C0 = float(self.C0_input.text())
-        mpc = float(self.MPC_input.text())
-        I0 = float(self.I0_input.text())
-        d = float(self.d_input.text())
-        Ms = float(self.Ms_input.text())
-        P = float(self.P_input.text())
-        k = float(self.k_input.text())
-        h = float(self.h_input.text())
-
-        real_money_supply = Ms / P
-        money_demand = k * Y - h * i_rate
-        investments = I0 - d * i_rate
-        consumption = C0 + mpc * Y
-        aggregate_demand = consumption + investments + G
-
-        # 2. ОПРЕДЕЛЯЕМ ГЛОБАЛЬНЫЕ ГРАНИЦЫ (FORCE ZOOM OUT)
-        # Мы хотим видеть диапазон от 0 до как минимум 3500 по Доходу (Y)
-        # И от 0 до как минимум 10-15 по Ставке (i)
-        x_min_limit = 0
-        x_max_limit = max(np.max(Y) * 1.2, 3500)  # С запасом 20% или минимум 3500
-        y_min_limit = min(np.min(i_rate) - 2, 0)  # Позволяем уходить в минус
-        y_max_limit = max(np.max(i_rate) + 2, 15)
-
-        # Генерируем статические кривые IS-LM
-        Y_static = np.linspace(x_min_limit, x_max_limit, 200)
-        IS_static = (C0 + I0 + G - (1 - mpc) * Y_static) / d
-        LM_static = (k * Y_static - real_money_supply) / h
-
-        # Генерируем кривые IS-LM во всем этом широком диапазоне
-        Y_range = np.linspace(x_min_limit, x_max_limit, 100)
-        IS_curve = (C0 + I0 + G - (1 - mpc) * Y_range) / d
-        LM_curve = (k * Y_range - Ms / P) / h
-
-        # -------- ГРАФИК 1: IS-LM Кросс --------
-        fig1 = Figure(figsize=(7, 4))
-        fig1.subplots_adjust(bottom=0.20)
-        canvas1 = FigureCanvas(fig1)
-        ax1 = fig1.add_subplot(111)
-
-        # Отрисовка линий
-        ax1.plot(Y_range, IS_curve, 'r-', label='IS (Товары)', linewidth=2)
-        ax1.plot(Y_range, LM_curve, 'b-', label='LM (Деньги)', linewidth=2)
-        ax1.plot(Y, i_rate, 'g--', linewidth=2.5, label='Путь к равновесию', alpha=0.9)
-
-        # Точки
-        ax1.scatter([Y[0]], [i_rate[0]], color='green', s=80, label='Старт (Y0, i0)', zorder=5)
-        ax1.scatter([Y[-1]], [i_rate[-1]], color='black', s=120, label='Точка E (Финал)', zorder=6)
-
-        # ВЫЧИСЛЯЕМ ОПТИМАЛЬНЫЕ ГРАНИЦЫ
-        # По X: добавляем 15% отступа слева и справа
-        x_range = Y_range[-1] - Y_range[0]
-        x_min = Y_range[0] - 1.2 * x_range
-        x_max = Y_range[-1] + 1.2 * x_range
-
-        # По Y: используем ваши пределы, но тоже можно добавить отступ
-        y_range_data = y_max_limit - y_min_limit
-        y_min = y_min_limit - 1.2 * y_range_data
-        y_max = y_max_limit + 1.2 * y_range_data
-
-        ax1.set_xlim(x_min, x_max)
-        ax1.set_ylim(y_min, y_max)  # или оставьте ваши y_min_limit, y_max_limit
-
-        ax1.set_xlabel("Доход (Y)")
-        ax1.set_ylabel("Ставка (i)")
-        ax1.set_title("Глобальное равновесие модели IS-LM")
-        ax1.legend(loc='upper right')
-        ax1.grid(True, which='both', linestyle='--', alpha=0.5)
-
-        self.main_tab.layout().addWidget(NavigationToolbar(canvas1, self))
-        self.main_tab.layout().addWidget(canvas1)
-
-        # -------- ГРАФИК 2: Временные ряды (Динамика) --------
-        fig2 = Figure(figsize=(7, 4))
-        fig2.subplots_adjust(bottom=0.20)
-        canvas2 = FigureCanvas(fig2)
-        ax2 = fig2.add_subplot(211)
-        ax2.plot(t, Y, color='darkgreen', linewidth=2)
-        ax2.set_ylabel("Доход (Y)")
-        ax2.grid(True, alpha=0.2)
-
-        ax3 = fig2.add_subplot(212)
-        ax3.plot(t, i_rate, color='darkblue', linewidth=2)
-        ax3.set_ylabel("Ставка (i)")
-        ax3.set_xlabel("Время (t)")
-        ax3.grid(True, alpha=0.2)
-
-        self.dyn_tab.layout().addWidget(NavigationToolbar(canvas2, self))
-        self.dyn_tab.layout().addWidget(canvas2)
-
-        # =========================================================================
-        # 3. УПРОЩЕННЫЙ РЫНОК ИНВЕСТИЦИЙ (Убираем базу, оставляем только факт)
-        # =========================================================================
-        fig3 = Figure(figsize=(7, 4))
-        fig3.subplots_adjust(bottom=0.20)
-        canvas3 = FigureCanvas(fig3)
-        ax4 = fig3.add_subplot(111)
-
-        # Считаем реальные инвестиции в каждый момент времени
-        real_inv = I0 - d * i_rate
-
-        ax4.plot(t, real_inv, color='orange', linewidth=2.5, label='Инвестиции бизнеса (I)')
-
-        ax4.set_xlabel("Время t");
-        ax4.set_ylabel("Объем I")
-        ax4.set_title("Динамика реальных инвестиций")
-        ax4.legend(loc='lower right');
-        ax4.grid(True, alpha=0.2)
-
-        self.inv_tab.layout().addWidget(NavigationToolbar(canvas3, self));
-        self.inv_tab.layout().addWidget(canvas3)
-
-        # =========================================================================
-        # 4. УПРОЩЕННЫЙ РЫНОК ДЕНЕГ (Убираем старт/середину, оставляем только ФИНАЛ)
-        # =========================================================================
-        fig4 = Figure(figsize=(7, 4))
-        fig4.subplots_adjust(bottom=0.20)
-        canvas4 = FigureCanvas(fig4)
-        ax5 = fig4.add_subplot(111)
-
-        M_supply = Ms / P
-
-        # Ось денег
-        M_axis = np.linspace(M_supply * 0.5, M_supply * 1.5, 100)
-
-        # Несколько моментов времени
-        indices = [0, len(Y) // 2, -1]
-        colors = ['gray', 'orange', 'green']
-        labels = ['Начало', 'Середина', 'Финал']
-
-        for idx, color, label in zip(indices, colors, labels):
-            demand_curve = (k * Y[idx] - M_axis) / h
-            ax5.plot(M_axis, demand_curve, color=color, linewidth=2, label=f'L ({label})')
-
-        # Предложение денег
-        ax5.axvline(x=M_supply, color='blue', linewidth=3, label='Ms/P')
-
-        # Финальная точка
-        ax5.scatter([M_supply], [i_rate[-1]], color='red', s=100, zorder=5)
-
-        ax5.set_xlabel("Деньги (M)")
-        ax5.set_ylabel("Ставка i")
-        ax5.set_title("Рынок денег (динамика)")
-        ax5.legend()
-        ax5.grid(True, alpha=0.2)
-
-        self.money_tab.layout().addWidget(NavigationToolbar(canvas4, self));
-        self.money_tab.layout().addWidget(canvas4)
-
-        # =========================================================================
-        # 5. УПРОЩЕННЫЙ КЕЙНСИАНСКИЙ КРЕСТ (Убираем старт, оставляем только ФИНАЛ)
-        # =========================================================================
-        fig5 = Figure(figsize=(7, 4))
-        fig5.subplots_adjust(bottom=0.20)
-        canvas5 = FigureCanvas(fig5)
-        ax6 = fig5.add_subplot(111)
-
-        # Линия 45°
-        ax6.plot(Y_static, Y_static, color='black', linestyle='--', label='Y = AD')
-
-        # Несколько кривых AD
-        indices = [0, len(i_rate) // 2, -1]
-        colors = ['gray', 'orange', 'red']
-        labels = ['Начало', 'Середина', 'Финал']
-
-        for idx, color, label in zip(indices, colors, labels):
-            inv = I0 - d * i_rate[idx]
-            AD = C0 + mpc * Y_static + inv + G
-            ax6.plot(Y_static, AD, color=color, linewidth=2, label=f'AD ({label})')
-
-        # Финальная точка равновесия
-        ax6.scatter([Y[-1]], [Y[-1]], color='black', s=120, zorder=5)
-
-        ax6.set_xlabel("Доход Y")
-        ax6.set_ylabel("Спрос AD")
-        ax6.set_title("Кейнсианский крест (динамика)")
-        ax6.legend()
-        ax6.grid(True, alpha=0.2)
-
-        self.goods_tab.layout().addWidget(NavigationToolbar(canvas5, self));
-        self.goods_tab.layout().addWidget(canvas5)
-        ##################################################################################
-        fig6 = Figure(figsize=(7, 4))  # Сделаем квадратным для честности фаз
-        fig6.subplots_adjust(bottom=0.20)
-        canvas6 = FigureCanvas(fig6)
-        ax8 = fig6.add_subplot(111)
-
-        # Получаем производные как массивы
-        dY_dt = np.array(self.dY_dt_data)
-        di_dt = np.array(self.di_dt_data)
-
-        # Траектория скоростей (Зеленая спираль)
-        ax8.plot(dY_dt, di_dt, color='darkgreen', linewidth=2.5, label='Фазовая траектория', alpha=0.8)
-
-        # Точка старта и финала скоростей
-        # Финал всегда в (0, 0), когда подстройка завершена.
-        ax8.scatter([dY_dt[0]], [di_dt[0]], color='green', s=100, zorder=5, label='Старт')
-        ax8.scatter([0], [0], color='black', s=150, zorder=6, label='Равновесие (0,0)')
-
-        # Оси координат (крест через ноль)
-        ax8.axhline(y=0, color='black', linewidth=1, linestyle='-')
-        ax8.axvline(x=0, color='black', linewidth=1, linestyle='-')
-
-        # Сетка и подписи
-        ax8.set_xlabel("Скорость изменения Дохода (dY/dt)", fontsize=7)
-        ax8.set_ylabel("Скорость изменения Ставки (di/dt)", fontsize=7)
-        ax8.set_title("Фазовый портрет: Устойчивость системы")
-        ax8.legend(loc='upper right', fontsize='small')
-        ax8.grid(True, which='both', linestyle='--', alpha=0.3)
-
-        self.phase_tab.layout().addWidget(NavigationToolbar(canvas6, self))
-        self.phase_tab.layout().addWidget(canvas6)
-
-        # =========================================================================
-        # 7. ГРАФИК ЭЛАСТИЧНОСТИ СПРОСА НА ДЕНЬГИ ПО СТАВКЕ
-        # =========================================================================
-        # Эластичность = % изменения Спроса / % изменения Ставки
-        # E_i = (dL/di) * (i/L)
-        # В нашей модели L = kY - hi, значит dL/di = -h.
-        # E_i = -h * (i_rate / money_demand)
-
-        fig7 = Figure(figsize=(7, 4))
-        fig7.subplots_adjust(bottom=0.20)
-        canvas7 = FigureCanvas(fig7)
-        ax7 = fig7.add_subplot(111)
-
-        # Считаем спрос на деньги в каждый момент времени
-        real_money_supply = Ms / P
-        L_demand = k * Y - h * i_rate
-
-        # Избегаем деления на ноль (хотя в L деления нет, на всякий случай)
-        safe_L = np.where(L_demand == 0, 1e-9, L_demand)
-
-        # Считаем эластичность (она всегда отрицательная, так как i и L ходят в разные стороны)
-        elasticity_i = -h * (i_rate / safe_L)
-
-        # Траектория эластичности во времени
-        ax7.plot(t, elasticity_i, color='purple', linewidth=2.5, label='Текущая эластичность')
-
-        # Горизонтальная линия -1 (Условная граница эластичности)
-        ax7.axhline(y=-1, color='red', linestyle='--', alpha=0.5, label='Граница (-1)')
-
-        # Точка Финала
-        ax7.scatter([t[-1]], [elasticity_i[-1]], color='black', s=120, zorder=5, label='Финал (E)')
-
-        # Сетка и подписи
-        ax7.set_xlabel("Время (t)", fontsize=11)
-        ax7.set_ylabel("Эластичность спроса по ставке (Ei)", fontsize=7)
-        ax7.set_title("Эластичность спроса на деньги во времени")
-        ax7.legend(loc='lower right', fontsize='small')
-        ax7.grid(True, alpha=0.3)
-
-        # По умолчанию экономисты смотрят наEi, которая обычно < 0.
-        # Ei > -1 (ближе к 0) - спрос неэластичен (люди не реагируют на ставку).
-        # Ei < -1 (дальше от 0) - спрос эластичен (люди сильно реагируют).
-
-        self.elastic_tab.layout().addWidget(NavigationToolbar(canvas7, self))
-        self.elastic_tab.layout().addWidget(canvas7)
+        show_charts(self, self.current_record(), [
+            (self.main_tab, CHARTS["main"]),
+            (self.dyn_tab, CHARTS["dynamics"]),
+            (self.inv_tab, CHARTS["investment"]),
+            (self.money_tab, CHARTS["money"]),
+            (self.goods_tab, CHARTS["goods"]),
+            (self.phase_tab, CHARTS["phase"]),
+            (self.elastic_tab, CHARTS["elasticity"]),
+        ])
 
     # ================= СОХРАНЕНИЕ И ЗАГРУЗКА =================
 
@@ -428,30 +244,9 @@ class ISLMTab(QWidget):
         try:
             calc_data = {
                 'id': self.current_calc_id,
-                'model_name': 'Макроэкономическая модель IS-LM',
-                # Параметры ввода
-                'G': float(self.G_input.text()),
-                'C0': float(self.C0_input.text()),
-                'MPC': float(self.MPC_input.text()),
-                'I0': float(self.I0_input.text()),
-                'd': float(self.d_input.text()),
-                'Ms': float(self.Ms_input.text()),
-                'P': float(self.P_input.text()),
-                'k': float(self.k_input.text()),
-                'h': float(self.h_input.text()),
-                'Y0': float(self.Y0_input.text()),
-                'rate0': float(self.rate0_input.text()),
-                't_max': float(self.t_max_input.text()),
-
+                'model_name': self.MODEL_NAME,
                 'timestamp': datetime.now().isoformat(),
-
-                # Результаты вычислений
-                't_data': [float(v) for v in self.t_data],
-                'Y_data': [float(v) for v in self.Y_data],
-                'i_data': [float(v) for v in self.i_data],
-
-                'dY_dt_data': [float(v) for v in self.dY_dt_data],
-                'di_dt_data': [float(v) for v in self.di_dt_data]
+                **self.current_record()
             }
 
             result = save_calculation(calc_data)
@@ -490,6 +285,128 @@ class ISLMTab(QWidget):
 
                 self.dY_dt_data = calc.get('dY_dt_data', [])
                 self.di_dt_data = calc.get('di_dt_data', [])
+                self.events = calc.get('events', [])
                 self.plot_graphs()
             return True
-        return False
\ No newline at end of file
+        return False
+
+
+class ScenarioPanel(QWidget):
+    """Таблица сценариев (строки — наборы параметров), считаемых одним пакетом"""
+
+    # Длительность общая для всех сценариев и берется из формы
+    COLUMNS = tuple(name for name in PARAMS if name != 't_max')
+
+    def __init__(self, base_params):
+        super().__init__()
+        self.base_params = base_params
+        self.scenario_thread = None
+        self.render_thread = None
+        self.scenarios = []
+
+        layout = QVBoxLayout()
+
+        self.table = QTableWidget(0, len(self.COLUMNS) + 1)
+        self.table.setHorizontalHeaderLabels(["Сценарий", *self.COLUMNS])
+        self.table.setMaximumHeight(160)
+
+        buttons = QHBoxLayout()
+        self.add_button = QPushButton("➕ Из формы")
+        self.add_button.clicked.connect(lambda: self.add_scenario(f"Сценарий {self.table.rowCount() + 1}",
+                                                                  self.base_params()))
+        self.remove_button = QPushButton("➖ Удалить")
+        self.remove_button.clicked.connect(self.remove_scenario)
+        self.calc_button = QPushButton("Рассчитать все")
+        self.calc_button.clicked.connect(self.on_calculate)
+        for button in [self.add_button, self.remove_button, self.calc_button]:
+            buttons.addWidget(button)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setRange(0, 0)
+
+        self.chart_tabs = QTabWidget()
+        self.dynamics_tab = QWidget()
+        self.cross_tab = QWidget()
+        self.phase_tab = QWidget()
+        for tab in [self.dynamics_tab, self.cross_tab, self.phase_tab]:
+            tab.setLayout(QVBoxLayout())
+        self.chart_tabs.addTab(self.dynamics_tab, "Y(t) и i(t)")
+        self.chart_tabs.addTab(self.cross_tab, "Кривые IS-LM")
+        self.chart_tabs.addTab(self.phase_tab, "Фазовые портреты")
+
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.chart_tabs, 1)
+        self.setLayout(layout)
+
+        # Для начала — базовый вариант, фискальная и монетарная экспансия
+        base = self.base_params()
+        self.add_scenario("Базовый", base)
+        self.add_scenario("Фискальный: G +20%", {**base, 'G': base['G'] * 1.2})
+        self.add_scenario("Монетарный: Ms +20%", {**base, 'Ms': base['Ms'] * 1.2})
+
+    def add_scenario(self, name, params):
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self.table.setItem(row, 0, QTableWidgetItem(name))
+        for column, key in enumerate(self.COLUMNS, 1):
+            self.table.setItem(row, column, QTableWidgetItem(f"{params[key]:g}"))
+
+    def remove_scenario(self):
+        rows = sorted({index.row() for index in self.table.selectedIndexes()}, reverse=True)
+        for row in rows or [self.table.rowCount() - 1]:
+            self.table.removeRow(row)
+
+    def read_scenarios(self):
+        """Сценарии из таблицы; длительность — общая из формы"""
+        t_max = self.base_params()['t_max']
+        scenarios = []
+        for row in range(self.table.rowCount()):
+            scenario = {'name': self.table.item(row, 0).text()}
+            for column, key in enumerate(self.COLUMNS, 1):
+                scenario[key] = float(self.table.item(row, column).text().replace(',', '.'))
+            scenario['t_max'] = t_max
+            scenarios.append(scenario)
+        return scenarios
+
+    def on_calculate(self):
+        try:
+            self.scenarios = self.read_scenarios()
+            if not self.scenarios:
+                QMessageBox.warning(self, "Предупреждение", "Добавьте хотя бы один сценарий")
+                return
+
+            self.calc_button.setEnabled(False)
+            self.calc_button.setText("⏳ Вычисление...")
+            self.progress_bar.setVisible(True)
+
+            self.scenario_thread = ScenarioThread(self.scenarios)
+            self.scenario_thread.task_finished.connect(self.on_finished)
+            self.scenario_thread.task_error.connect(self.on_error)
+            self.scenario_thread.finished.connect(self.on_thread_done)
+            scheduler().submit(self, self.scenario_thread)
+        except Exception as e:
+            self.on_thread_done()
+            self.on_error(str(e))
+
+    def on_thread_done(self):
+        self.calc_button.setEnabled(True)
+        self.calc_button.setText("Рассчитать все")
+        self.progress_bar.setVisible(False)
+
+    def on_error(self, error):
+        QMessageBox.critical(self, "Ошибка", f"Не удалось рассчитать сценарии:\n{error}")
+
+    def on_finished(self, results):
+        calc = {'scenarios': [{**scenario, 'rows': rows} for scenario, rows in zip(self.scenarios, results)]}
+        for tab in [self.dynamics_tab, self.cross_tab, self.phase_tab]:
+            layout = tab.layout()
+            while layout.count():
+                layout.takeAt(0).widget().deleteLater()
+        show_charts(self, calc, [
+            (self.dynamics_tab, SCENARIOS["dynamics"]),
+            (self.cross_tab, SCENARIOS["cross"]),
+            (self.phase_tab, SCENARIOS["phase"]),
+        ])
@@ -0,0 +1,369 @@
+"""Графики модели эпидемии SEIR (без зависимости от Qt)."""
+import numpy as np
+
+from core.monte_carlo import log_edges
+from ui.event_markers import event_hits, mark_events
+
+
+def _series(calc):
+    t = np.array(calc['t_data'])
+    S = np.array(calc['S_data'])
+    E = np.array(calc['E_data'])
+    I = np.array(calc['I_data'])
+    R = np.array(calc['R_data'])
+    return t, S, E, I, R
+
+
+def draw_time(fig, calc):
+    t, S, E, I, R = _series(calc)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax1 = fig.add_subplot(111)
+    ax1.plot(t, S, 'b-', label='Восприимчивые (S)')
+    ax1.plot(t, E, 'y--', label='Латентные (E)')
+    ax1.plot(t, I, 'r-', label='Инфицированные (I)', linewidth=2)
+    ax1.plot(t, R, 'g-', label='Выздоровевшие (R)')
+    mark_events(ax1, calc, ["I_peak"], "I", color='darkred')
+    mark_events(ax1, calc, ["S_half"], "S", color='navy', marker='s')
+    ax1.set_title("Развитие эпидемии")
+    ax1.set_xlabel("Время")
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+
+def draw_area(fig, calc):
+    t, S, E, I, R = _series(calc)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax2 = fig.add_subplot(111)
+    # Просто заполняем области, чтобы было понятнее, чем Stackplot
+    # 1. Слой Инфицированных (от 0 до I)
+    ax2.fill_between(t, 0, I, color='red', alpha=0.5, label='Болеют (I)')
+
+    # 2. Слой Латентных (от I до I + E)
+    ax2.fill_between(t, I, I + E, color='orange', alpha=0.4, label='Инкубация (E)')
+
+    # 3. Слой Здоровых (от I + E до I + E + S)
+    ax2.fill_between(t, I + E, I + E + S, color='blue', alpha=0.2, label='Здоровые (S)')
+
+    # 4. Слой Выздоровевших (от I + E + S до 1.0)
+    # Все, кто выше границы здоровых — это выздоровевшие
+    ax2.plot(t, I + E + S, 'b-', alpha=0.2)  # Верхняя граница восприимчивых
+    ax2.set_title("Нагрузка на систему здравоохранения")
+    ax2.set_ylabel("Доля населения")
+    ax2.set_xlabel("Время")
+    ax2.legend()
+    ax2.grid(True, alpha=0.2)
+
+
+def draw_phase(fig, calc):
+    t, S, E, I, R = _series(calc)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax3 = fig.add_subplot(111)
+    ax3.plot(E, I, color="purple", linewidth=2, label="Траектория")
+    # Возвращаем точки
+    ax3.scatter([E[0]], [I[0]], color="green", s=50, label="Старт", zorder=5)
+    ax3.scatter([E[-1]], [I[-1]], color="red", s=50, label="Конец", zorder=5)
+    ax3.set_xlabel("E (Латентные)")
+    ax3.set_ylabel("I (Инфицированные)")
+    ax3.set_title("Фазовый портрет: Связь E и I")
+    ax3.legend()
+    ax3.grid(True)
+
+
+def draw_rt(fig, calc):
+    t, S, E, I, R = _series(calc)
+
+    # Rt = (beta * S) / gamma
+    Rt = (calc['beta'] * S) / calc['gamma']
+
+    fig.subplots_adjust(bottom=0.20)
+    ax_rt = fig.add_subplot(111)
+
+    ax_rt.plot(t, Rt, color='purple', linewidth=2, label='Rt(t)')
+    # Критическая линия 1.0
+    ax_rt.axhline(1.0, color='red', linestyle='--', linewidth=1.5, label='Порог эпидемии (1.0)')
+
+    # Закрасим область выше единицы (рост) и ниже (затухание)
+    ax_rt.fill_between(t, 1.0, Rt, where=(Rt > 1.0), color='red', alpha=0.1)
+    ax_rt.fill_between(t, 1.0, Rt, where=(Rt <= 1.0), color='green', alpha=0.1)
+
+    fit = calc.get('fit')
+    if fit:
+        # Базовое R0 = beta / gamma по подбору; интервал — грубая оценка по границам beta и gamma
+        lo, up = fit['lower'], fit['upper']
+        ax_rt.axhspan(lo['beta'] / up['gamma'], up['beta'] / lo['gamma'], color='purple', alpha=0.08,
+                      label='R₀ по подбору (95% ДИ)')
+
+    ax_rt.set_title("Эффективное репродуктивное число ($R_t$)")
+    ax_rt.set_xlabel("Время")
+    ax_rt.set_ylabel("Rt")
+    ax_rt.legend()
+    ax_rt.grid(True, alpha=0.3)
+
+
+def draw_incidence(fig, calc):
+    t, S, E, I, R = _series(calc)
+
+    # Скорость перехода из E в I: dI_new = alpha * E
+    incidence = calc['alpha'] * E
+
+    fig.subplots_adjust(bottom=0.20)
+    ax_inc = fig.add_subplot(111)
+
+    # Ширина столбца — шаг сетки у каждой точки (сетка может быть неравномерной)
+    widths = np.gradient(t) * 0.8 if len(t) > 1 else 0.8
+    ax_inc.bar(t, incidence, width=widths, color='salmon', alpha=0.6, label='Прирост (E -> I)')
+    ax_inc.plot(t, incidence, color='red', linewidth=1.5)  # Плавная линия поверх баров
+
+    fit = calc.get('fit')
+    if fit:
+        # Наблюдения в тех же единицах — доля населения
+        ax_inc.scatter(fit['t_obs'], np.array(fit['cases']) / fit['population'], color='black', s=12,
+                       zorder=5, label='Наблюдения')
+
+    ax_inc.set_title("Скорость появления новых инфицированных")
+    ax_inc.set_xlabel("Время")
+    ax_inc.set_ylabel("Доля новых случаев")
+    ax_inc.legend()
+    ax_inc.grid(True, alpha=0.3)
+
+
+def draw_death(fig, calc):
+    t, S, E, I, R = _series(calc)
+
+    mu = calc['mu']
+    Deaths = R * mu
+    Recovered_Actual = R * (1 - mu)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax_d = fig.add_subplot(111)
+    ax_d.stackplot(t, Recovered_Actual, Deaths, colors=['green', 'black'],
+                   labels=['Выжившие', 'Умершие'], alpha=0.7)
+    ax_d.set_title("Исход заболевания (Накопительно)")
+    ax_d.set_ylabel("Доля населения")
+    ax_d.set_xlabel("Время")
+    ax_d.legend(loc='upper left')
+
+
+def draw_growth(fig, calc):
+    t, S, E, I, R = _series(calc)
+
+    # Относительная скорость роста за единицу времени: не зависит от шага сетки
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth_rate = np.gradient(I, t) / I * 100 if len(t) > 1 else np.zeros_like(I)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax_g = fig.add_subplot(111)
+
+    # Рисуем линию темпа роста
+    ax_g.plot(t, growth_rate, color='brown', linewidth=2, label='Темп роста I')
+    ax_g.axhline(0, color='black', linestyle='--', alpha=0.5)  # Линия стабильности
+
+    # Закрашиваем области роста и спада
+    ax_g.fill_between(t, 0, growth_rate, where=(growth_rate > 0), color='red', alpha=0.1)
+    ax_g.fill_between(t, 0, growth_rate, where=(growth_rate <= 0), color='green', alpha=0.1)
+
+    ax_g.set_title("Ежедневный темп изменения числа больных")
+    ax_g.set_ylabel("Прирост (%)")
+    ax_g.set_xlabel("Время")
+    ax_g.set_ylim(-20, 50)  # Ограничим для наглядности (можно убрать)
+    ax_g.grid(True, alpha=0.2)
+
+
+def draw_stats(fig, calc):
+    t, S, E, I, R = _series(calc)
+
+    # Ключевые точки для статистики: точный пик — из событий решателя, иначе по узлам
+    peaks = event_hits(calc, "I_peak")
+    if peaks:
+        peak = max(peaks, key=lambda hit: hit['values']['I'])
+        t_peak, i_max = peak['t'], peak['values']['I']
+    else:
+        idx_peak = np.argmax(I)
+        t_peak = t[idx_peak]
+        i_max = I[idx_peak]
+    half = event_hits(calc, "S_half")
+    half_line = f"• Восприимчивых меньше половины с: {half[0]['t']:.2f} ед.\n" if half else ""
+    total_affected = (1 - S[-1]) * 100  # % тех, кто столкнулся с вирусом
+
+    ax4 = fig.add_subplot(111)
+    ax4.axis('off')  # Убираем оси, это будет текстовая панель
+
+    stats_text = (
+        f"ОТЧЕТ ПО МОДЕЛИ SEIR\n"
+        f"-------------------------------------\n"
+        f"• Время достижения пика: {t_peak:.2f} ед.\n"
+        f"• Максимальный процент зараженных: {i_max * 100:.2f}%\n"
+        f"• Итоговый процент переболевших: {total_affected:.2f}%\n"
+        f"• Оставшиеся здоровыми (S): {S[-1] * 100:.2f}%\n"
+        f"{half_line}"
+        f"-------------------------------------\n"
+        f"Статус: Эпидемия купирована" if I[-1] < 0.001 else "Статус: Процесс продолжается"
+    )
+    ax4.text(0.5, 0.5, stats_text, transform=ax4.transAxes,
+             fontsize=12, va='center', ha='center',
+             bbox=dict(boxstyle="round,pad=1", facecolor='wheat', alpha=0.3))
+
+
+FIT_LABELS = {"beta": "β", "alpha": "α", "gamma": "γ", "E0": "E₀", "I0": "I₀"}
+FIT_METHODS = {"lsq": "МНК", "poisson": "Пуассон (ML)"}
+
+
+def draw_fit(fig, calc):
+    fit = calc.get('fit')
+    if not fit:
+        ax = fig.add_subplot(111)
+        ax.axis('off')
+        ax.text(0.5, 0.5, "Подбор не выполнялся.\nЗагрузите CSV с числом новых случаев.",
+                transform=ax.transAxes, ha='center', va='center', fontsize=12)
+        return
+
+    t_obs = np.array(fit['t_obs'])
+    fig.subplots_adjust(bottom=0.15, right=0.62)
+    ax = fig.add_subplot(111)
+    ax.bar(t_obs, fit['cases'], width=np.min(np.diff(t_obs)) * 0.8 if len(t_obs) > 1 else 0.8,
+           color='salmon', alpha=0.6, label='Наблюдения')
+    ax.plot(t_obs, fit['fitted'], color='red', linewidth=2, label='Модель')
+    ax.set_title("Подбор параметров по заболеваемости")
+    ax.set_xlabel("Время")
+    ax.set_ylabel("Новых случаев")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    lines = [f"Метод: {FIT_METHODS.get(fit['method'], fit['method'])}", f"N = {fit['population']:g}", ""]
+    for name, label in FIT_LABELS.items():
+        lines.append(f"{label} = {fit['params'][name]:.4g}")
+        lines.append(f"   [{fit['lower'][name]:.4g}; {fit['upper'][name]:.4g}]")
+    lines += ["", f"R₀ = β/γ = {fit['params']['beta'] / fit['params']['gamma']:.3g}",
+              f"Сошлись: {fit['agreeing_starts']} из {fit['n_starts']} стартов"]
+    fig.text(0.65, 0.5, "\n".join(lines), va='center', fontsize=9, family='monospace',
+             bbox=dict(boxstyle="round,pad=0.6", facecolor='wheat', alpha=0.3))
+
+
+def draw_bands(fig, calc):
+    t = np.array(calc['mc_t'])
+    low, median, high = np.array(calc['mc_I_bands'])
+
+    fig.subplots_adjust(bottom=0.15, right=0.68)
+    ax = fig.add_subplot(111)
+    ax.fill_between(t, low, high, color='red', alpha=0.2, label='5–95%')
+    ax.plot(t, median, color='red', linewidth=2, label='Медиана')
+    ax.plot(t, calc['mc_I_mean'], color='black', linestyle='--', linewidth=1, label='Среднее')
+    ax.set_title(f"Прогноз I(t): ансамбль из {calc['mc_n']} расчетов")
+    ax.set_xlabel("Время")
+    ax.set_ylabel("Доля инфицированных")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    pt, ph = calc['mc_peak_time'], calc['mc_peak_height']
+    text = (
+        "Время пика\n"
+        f"  5%:  {pt[0]:.1f}\n  50%: {pt[1]:.1f}\n  95%: {pt[2]:.1f}\n\n"
+        "Высота пика\n"
+        f"  5%:  {ph[0] * 100:.2f}%\n  50%: {ph[1] * 100:.2f}%\n  95%: {ph[2] * 100:.2f}%"
+    )
+    fig.text(0.71, 0.5, text, va='center', fontsize=9, family='monospace',
+             bbox=dict(boxstyle="round,pad=0.6", facecolor='wheat', alpha=0.3))
+
+
+def draw_peaks(fig, calc):
+    t = np.array(calc['mc_t'])
+    fig.subplots_adjust(bottom=0.15, wspace=0.3)
+
+    ax_t = fig.add_subplot(121)
+    ax_t.bar(t, calc['mc_peak_time_hist'], width=(t[1] - t[0]) if len(t) > 1 else 1, color='brown', alpha=0.7)
+    for q in calc['mc_peak_time']:
+        ax_t.axvline(q, color='black', linestyle='--', linewidth=1)
+    occupied = np.nonzero(calc['mc_peak_time_hist'])[0]
+    if len(occupied):
+        ax_t.set_xlim(t[occupied[0]] - 1, t[occupied[-1]] + 1)
+    ax_t.set_title("Время пика")
+    ax_t.set_xlabel("Время")
+    ax_t.set_ylabel("Число расчетов")
+
+    edges = log_edges()
+    counts = np.array(calc['mc_peak_height_hist'])
+    used = np.nonzero(counts)[0]
+    ax_h = fig.add_subplot(122)
+    if len(used):
+        # Только занятый диапазон корзин, иначе столбцы не разглядеть
+        lo, hi = used[0], used[-1] + 1
+        ax_h.stairs(counts[lo:hi], edges[lo:hi + 1] * 100, fill=True, color='red', alpha=0.6)
+    for q in calc['mc_peak_height']:
+        ax_h.axvline(q * 100, color='black', linestyle='--', linewidth=1)
+    ax_h.set_title("Высота пика")
+    ax_h.set_xlabel("Доля инфицированных, %")
+
+
+STOCHASTIC_METHODS = {"gillespie": "Гиллеспи", "tau": "тау-скачки"}
+
+
+def draw_stochastic(fig, calc):
+    stoch = calc.get('stochastic')
+    if not stoch:
+        ax = fig.add_subplot(111)
+        ax.axis('off')
+        ax.text(0.5, 0.5, "Стохастический расчет не выполнялся.\nВыберите режим «Стохастическая» и нажмите «Рассчитать».",
+                transform=ax.transAxes, ha='center', va='center', fontsize=12)
+        return
+
+    t, S, E, I, R = _series(calc)
+    N = stoch['population']
+    fig.subplots_adjust(bottom=0.15, wspace=0.3)
+
+    ax_p = fig.add_subplot(121)
+    for path in stoch['I_paths']:
+        ax_p.plot(stoch['t_paths'], np.array(path) * N, color='red', alpha=0.15, linewidth=0.8)
+    ax_p.plot(t, I * N, color='black', linewidth=2, label='Среднее по реализациям')
+    ax_p.set_title(f"Реализации I(t), {STOCHASTIC_METHODS.get(stoch['method'], stoch['method'])}")
+    ax_p.set_xlabel("Время")
+    ax_p.set_ylabel("Инфицированных, чел.")
+    ax_p.legend(fontsize=8)
+    ax_p.grid(True, alpha=0.3)
+
+    edges = np.array(stoch['final_size_edges'])
+    ax_h = fig.add_subplot(122)
+    ax_h.stairs(stoch['final_size_counts'], edges, fill=True, color='gray', alpha=0.7)
+    ax_h.set_title("Размер вспышки")
+    ax_h.set_xlabel("Переболело, чел.")
+    ax_h.set_ylabel("Число реализаций")
+    q = stoch['final_size_quantiles']
+    ax_h.text(0.97, 0.97,
+              f"P(угасания) = {stoch['extinction_probability']:.3f}\n"
+              f"Медиана: {q[1]:.0f}\n5–95%: {q[0]:.0f}–{q[2]:.0f}\n"
+              f"Крупная вспышка: {stoch['major_mean_final_size'] / N * 100:.1f}% N",
+              transform=ax_h.transAxes, ha='right', va='top', fontsize=8,
+              bbox=dict(boxstyle="round,pad=0.4", facecolor='wheat', alpha=0.5))
+
+
+# Ключ вкладки -> (размер фигуры, функция отрисовки)
+CHARTS = {
+    "time": ((7, 4), draw_time),
+    "area": ((7, 4), draw_area),
+    "phase": ((7, 4), draw_phase),
+    "rt": ((7, 4), draw_rt),
+    "incidence": ((7, 4), draw_incidence),
+    "death": ((7, 4), draw_death),
+    "growth": ((7, 4), draw_growth),
+    "stats": ((7, 4), draw_stats),
+    "fit": ((7, 4), draw_fit),
+    "stochastic": ((8, 4), draw_stochastic),
+}
+
+# Живые графики во время расчета: столбцы строк {t, S, E, I, R}
+STREAMS = {
+    "time": {"labels": ("Время", "Доля населения"),
+             "lines": [(0, 1, "S"), (0, 2, "E"), (0, 3, "I"), (0, 4, "R")]},
+    "phase": {"labels": ("E (Латентные)", "I (Инфицированные)"), "lines": [(2, 3, None)]},
+}
+
+# Анимация траектории при экспорте в видео/GIF
+ANIMATION = {"columns": ("E_data", "I_data"), "labels": ("E (Латентные)", "I (Инфицированные)")}
+
+# Полосы неопределенности Монте-Карло
+MONTE_CARLO = {
+    "bands": ((8, 5), draw_bands),
+    "peaks": ((8, 4), draw_peaks),
+}
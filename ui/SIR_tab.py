@@ -5,7 +5,7 @@ import numpy as np
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QLineEdit, QPushButton, QSpacerItem,
-    QSizePolicy, QTabWidget, QProgressBar, QMessageBox
+    QSizePolicy, QTabWidget, QProgressBar, QMessageBox, QComboBox, QFileDialog
 )
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
@@ -16,11 +16,30 @@ from matplotlib.figure import Figure
 
 from core.calculation_thread import CalculationThread
 from core.database import save_calculation, load_calculation
+from core.models import MODELS
+from core.profiling import span
+from core.scheduler import scheduler
+from core.fit_thread import FitThread
+from core.monte_carlo import N_MEMBERS
+from core.monte_carlo_thread import MonteCarloThread
+from core.stochastic_seir import N_REALIZATIONS
+from core.stochastic_thread import StochasticThread
+from core.seir_fit import load_incidence_csv
+from ui.figure_view import show_charts, start_streams
+from ui.live_controls import LiveControls
+from ui.SIR_charts import CHARTS, MONTE_CARLO, STREAMS
 
 
 class SIRTab(QWidget):
     """Вкладка: SEIR модель эпидемии (Susceptible-Exposed-Infected-Recovered)"""
 
+    MODEL = MODELS["seir"]
+    MODEL_NAME = MODEL.title
+
+    # Подпись в списке -> метод подбора
+    FIT_METHODS = {"МНК": "lsq", "Пуассон (ML)": "poisson"}
+    MODES = ("Детерминированная", "Стохастическая")
+
     def __init__(self):
         super().__init__()
 
@@ -29,9 +48,17 @@ class SIRTab(QWidget):
         self.E_data = []
         self.I_data = []
         self.R_data = []
+        # События расчета (пик эпидемии, порог S) для отметок и отчета
+        self.events = []
 
         self.calculation_thread = None
+        self.render_thread = None
+        self.stream_views = None
         self.current_calc_id = None
+        self.fit_thread = None
+        self.fit_result = None
+        self.stochastic_thread = None
+        self.stochastic_result = None
 
         self.init_ui()
 
@@ -48,7 +75,7 @@ class SIRTab(QWidget):
         self.beta_input = QLineEdit("0.8")  # Заражение
         self.alpha_input = QLineEdit("0.2")  # Инкубационный переход
         self.gamma_input = QLineEdit("0.1")# Выздоровление
-        self.mu_input = QLineEdit("0.02")
+        self.mu_input = QLineEdit(f"{self.MODEL.extras['mu']:g}")
         self.t_max_input = QLineEdit("100")
 
         # Начальные условия (в долях от единицы)
@@ -74,6 +101,33 @@ class SIRTab(QWidget):
         self.calc_button = QPushButton("Рассчитать")
         self.calc_button.clicked.connect(self.on_calculate)
 
+        # Численность нужна стохастической модели и подбору по числу случаев
+        mode_layout = QHBoxLayout()
+        self.population_input = QLineEdit("100000")
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(list(self.MODES))
+        self.realizations_input = QLineEdit(str(N_REALIZATIONS))
+        mode_layout.addWidget(QLabel("N (население):"))
+        mode_layout.addWidget(self.population_input)
+        mode_layout.addWidget(QLabel("Модель:"))
+        mode_layout.addWidget(self.mode_combo)
+        mode_layout.addWidget(QLabel("реализаций:"))
+        mode_layout.addWidget(self.realizations_input)
+
+        # Подбор параметров по наблюдаемым данным
+        fit_layout = QHBoxLayout()
+        self.method_combo = QComboBox()
+        self.method_combo.addItems(list(self.FIT_METHODS))
+        self.fit_button = QPushButton("📈 Подобрать по CSV...")
+        self.fit_button.clicked.connect(self.on_fit)
+        self.fit_stop_button = QPushButton("Стоп")
+        self.fit_stop_button.setEnabled(False)
+        self.fit_stop_button.clicked.connect(self.on_fit_stop)
+        fit_layout.addWidget(QLabel("Подбор:"))
+        fit_layout.addWidget(self.method_combo)
+        fit_layout.addWidget(self.fit_button)
+        fit_layout.addWidget(self.fit_stop_button)
+
         self.graph_tabs = QTabWidget()
 
         self.time_tab = QWidget()
@@ -84,9 +138,11 @@ class SIRTab(QWidget):
         self.death_tab = QWidget()
         self.growth_tab = QWidget()
         self.stats_tab = QWidget()
+        self.fit_tab = QWidget()
+        self.stochastic_tab = QWidget()
 
 
-        self.tabs_list = [self.time_tab, self.phase_tab, self.area_tab, self.rt_tab, self.incidence_tab,self.death_tab,self.growth_tab,self.stats_tab]
+        self.tabs_list = [self.time_tab, self.phase_tab, self.area_tab, self.rt_tab, self.incidence_tab,self.death_tab,self.growth_tab,self.stats_tab,self.fit_tab,self.stochastic_tab]
 
         for tab in self.tabs_list:
             tab.setLayout(QVBoxLayout())
@@ -99,16 +155,33 @@ class SIRTab(QWidget):
         self.graph_tabs.addTab(self.incidence_tab, "Новые случаи")
         self.graph_tabs.addTab(self.death_tab, "Летальность")
         self.graph_tabs.addTab(self.stats_tab, "Итог")
+        self.graph_tabs.addTab(self.fit_tab, "Подбор параметров")
+        self.graph_tabs.addTab(self.stochastic_tab, "Стохастика")
+
+        self.monte_carlo_panel = MonteCarloPanel(self.base_params)
+        self.graph_tabs.addTab(self.monte_carlo_panel, "Неопределенность (Монте-Карло)")
 
         layout.addWidget(title)
         layout.addLayout(form_layout)
+        layout.addLayout(mode_layout)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.calc_button)
+        self.live_controls = LiveControls(
+            self, self.MODEL.key, {name: getattr(self, f"{name}_input") for name in self.MODEL.param_names},
+            self.graph_tabs, [(self.time_tab, STREAMS["time"]), (self.phase_tab, STREAMS["phase"])], self.on_calculate)
+        layout.addWidget(self.live_controls)
+        layout.addLayout(fit_layout)
         layout.addWidget(self.graph_tabs)
 
         self.setLayout(layout)
 
     def on_calculate(self):
+        # Подбор относится к прежним параметрам; после подбора on_fit_finished вернет его сам
+        self.fit_result = None
+        if self.mode_combo.currentText() == "Стохастическая":
+            self.on_calculate_stochastic()
+            return
+        self.stochastic_result = None
         try:
             beta = self.beta_input.text()
             alpha = self.alpha_input.text()
@@ -119,42 +192,176 @@ class SIRTab(QWidget):
             I0 = self.I0_input.text()
             R0 = self.R0_input.text()
 
-            self.calc_button.setEnabled(False)
-            self.calc_button.setText("⏳ Вычисление в Wolfram...")
+            self.calc_button.setText("⏳ Вычисление...")
             self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 0)
+            self.stream_views = None
 
             self.calculation_thread = CalculationThread(
                 beta, alpha, gamma, S0, E0, I0, R0, t_max,
-                model="seir"  # Вызываем обновленную модель
+                model=self.MODEL.key
             )
+            self.calculation_thread.calculation_events.connect(self.on_events)
             self.calculation_thread.calculation_finished.connect(self.on_finished)
             self.calculation_thread.calculation_error.connect(self.on_error)
-            self.calculation_thread.start()
+            self.calculation_thread.calculation_chunk.connect(self.on_chunk)
+            self.calculation_thread.calculation_progress.connect(self.on_progress)
+            scheduler().submit(self, self.calculation_thread)
 
         except Exception as e:
             self.on_error(str(e))
 
+    def on_calculate_stochastic(self):
+        """Ансамбль стохастических реализаций; среднее идет в обычные графики"""
+        try:
+            params = [self.base_params()[name] for name in
+                      ("beta", "alpha", "gamma", "S0", "E0", "I0", "R0", "t_max")]
+            population = float(self.population_input.text())
+            n_realizations = int(self.realizations_input.text())
+            # Пики и пороги детерминированного расчета к средней кривой ансамбля не относятся
+            self.events = []
+
+            self.calc_button.setEnabled(False)
+            self.calc_button.setText("⏳ Стохастические реализации...")
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(0)
+
+            self.stochastic_thread = StochasticThread(params, population, n_realizations)
+            self.stochastic_thread.task_progress.connect(self.progress_bar.setValue)
+            self.stochastic_thread.task_finished.connect(self.on_stochastic_finished)
+            self.stochastic_thread.task_error.connect(self.on_error)
+            # Тот же вид расчета, что и детерминированный: один заменяет другой
+            scheduler().submit(self, self.stochastic_thread)
+        except Exception as e:
+            self.on_error(str(e))
+
+    def on_stochastic_finished(self, result):
+        self.stochastic_result = {key: value for key, value in result.items() if key != 'rows'}
+        self.on_finished(result['rows'])
+
+    def on_chunk(self, rows):
+        """Дорисовывает графики по мере прихода строк от решателя"""
+        if self.stream_views is None:
+            self.stream_views = start_streams(self, [
+                (self.time_tab, STREAMS["time"]),
+                (self.phase_tab, STREAMS["phase"]),
+            ])
+        for view in self.stream_views:
+            view.append(rows)
+
+    def on_progress(self, percent):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+
     def on_error(self, error):
         self.calc_button.setEnabled(True)
         self.calc_button.setText("Рассчитать")
         self.progress_bar.setVisible(False)
         QMessageBox.critical(self, "Ошибка", f"Не удалось выполнить расчет:\n{error}")
 
+    def on_events(self, events):
+        self.events = events
+
     def on_finished(self, result):
         self.calc_button.setEnabled(True)
         self.calc_button.setText("Рассчитать")
         self.progress_bar.setVisible(False)
+        self.stream_views = None
 
-        # Парсинг 5 колонок из Wolfram (t, S, E, I, R)
-        self.t_data = [float(r[0]) for r in result]
-        self.S_data = [float(r[1]) for r in result]
-        self.E_data = [float(r[2]) for r in result]
-        self.I_data = [float(r[3]) for r in result]
-        self.R_data = [float(r[4]) for r in result]
+        # Столбцы строк -> атрибуты *_data по схеме модели
+        with span("result.convert", model=self.MODEL.key):
+            for key, values in self.MODEL.columns_of(result).items():
+                setattr(self, key, values)
 
         self.current_calc_id = None
         self.plot_graphs()
 
+    # ================= ПОДБОР ПАРАМЕТРОВ =================
+
+    def on_fit(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Данные о заболеваемости", "", "CSV (*.csv *.txt)")
+        if not path:
+            return
+        try:
+            t_obs, cases = load_incidence_csv(path)
+            population = float(self.population_input.text())
+            method = self.FIT_METHODS[self.method_combo.currentText()]
+
+            self.fit_button.setEnabled(False)
+            self.fit_button.setText("⏳ Подбор...")
+            self.fit_stop_button.setEnabled(True)
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(0)
+
+            self.fit_thread = FitThread(t_obs, cases, population, method)
+            self.fit_thread.task_progress.connect(self.progress_bar.setValue)
+            self.fit_thread.task_finished.connect(self.on_fit_finished)
+            self.fit_thread.task_error.connect(self.on_fit_error)
+            self.fit_thread.finished.connect(self.on_fit_done)
+            scheduler().submit(self, self.fit_thread, kind="fit")
+        except Exception as e:
+            self.on_fit_done()
+            self.on_fit_error(str(e))
+
+    def on_fit_stop(self):
+        # Из очереди поток снимается без запуска — finished от него не придет
+        if not scheduler().cancel(self, "fit"):
+            self.on_fit_done()
+
+    def on_fit_done(self):
+        self.fit_button.setEnabled(True)
+        self.fit_button.setText("📈 Подобрать по CSV...")
+        self.fit_stop_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+
+    def on_fit_error(self, error):
+        QMessageBox.critical(self, "Ошибка", f"Не удалось подобрать параметры:\n{error}")
+
+    def on_fit_finished(self, result):
+        """Подставляет найденные параметры в форму и пересчитывает модель"""
+        params = result['params']
+
+        self.beta_input.setText(f"{params['beta']:.6g}")
+        self.alpha_input.setText(f"{params['alpha']:.6g}")
+        self.gamma_input.setText(f"{params['gamma']:.6g}")
+        self.S0_input.setText(f"{1 - params['E0'] - params['I0']:.6g}")
+        self.E0_input.setText(f"{params['E0']:.6g}")
+        self.I0_input.setText(f"{params['I0']:.6g}")
+        self.R0_input.setText("0.0")
+        self.t_max_input.setText(f"{max(result['t_obs']):g}")
+
+        self.on_calculate()
+        self.fit_result = result
+
+    def base_params(self):
+        """Параметры и начальные условия из формы (центр распределений Монте-Карло)"""
+        return {name: float(getattr(self, f"{name}_input").text())
+                for name in ("beta", "alpha", "gamma", "S0", "E0", "I0", "R0", "t_max")}
+
+    def current_record(self):
+        """Параметры и данные текущего расчета в формате записи БД"""
+        return {
+            'beta': float(self.beta_input.text()),
+            'alpha': float(self.alpha_input.text()),
+            'gamma': float(self.gamma_input.text()),
+            'mu': float(self.mu_input.text()),
+            'S0': float(self.S0_input.text()),
+            'E0': float(self.E0_input.text()),
+            'I0': float(self.I0_input.text()),
+            'R0': float(self.R0_input.text()),
+            't_max': float(self.t_max_input.text()),
+            't_data': [float(v) for v in self.t_data],
+            'S_data': [float(v) for v in self.S_data],
+            'E_data': [float(v) for v in self.E_data],
+            'I_data': [float(v) for v in self.I_data],
+            'R_data': [float(v) for v in self.R_data],
+            'events': self.events,
+            **({'fit': self.fit_result} if self.fit_result else {}),
+            **({'stochastic': self.stochastic_result} if self.stochastic_result else {})
+        }
+
     def plot_graphs(self):
         # Очистка всех вкладок (используем ваш список self.tabs_list)
         for tab in self.tabs_list:
@@ -163,192 +370,18 @@ class SIRTab(QWidget):
                 item = layout.takeAt(0)
                 if item.widget(): item.widget().deleteLater()
 
-        t = np.array(self.t_data)
-        S = np.array(self.S_data)
-        E = np.array(self.E_data)
-        I = np.array(self.I_data)
-        R = np.array(self.R_data)
-
-        mu = float(self.mu_input.text())
-
-        Deaths = R * mu
-        Recovered_Actual = R * (1 - mu)
-
-        growth_rate = np.diff(I) / I[:-1] * 100
-        growth_rate = np.insert(growth_rate, 0, 0)  # Добавляем 0 в начало для соответствия размеру t
-
-        beta = float(self.beta_input.text())
-        alpha = float(self.alpha_input.text())
-        gamma = float(self.gamma_input.text())
-
-        # 1. Расчет Rt = (beta * S) / gamma
-        Rt = (beta * S) / gamma
-
-        # 2. Расчет новых случаев (Incidence)
-        # Это скорость перехода из E в I: dI_new = alpha * E
-        incidence = alpha * E
-
-        # 1. Расчет ключевых точек для статистики
-        idx_peak = np.argmax(I)
-        t_peak = t[idx_peak]
-        i_max = I[idx_peak]
-        total_affected = (1 - S[-1]) * 100  # % тех, кто столкнулся с вирусом
-
-        # -------- ГРАФИК 1: Динамика (Линейный) --------
-        fig1 = Figure(figsize=(7, 4))
-        fig1.subplots_adjust(bottom=0.20)
-        canvas1 = FigureCanvas(fig1)
-        ax1 = fig1.add_subplot(111)
-        ax1.plot(t, S, 'b-', label='Восприимчивые (S)')
-        ax1.plot(t, E, 'y--', label='Латентные (E)')
-        ax1.plot(t, I, 'r-', label='Инфицированные (I)', linewidth=2)
-        ax1.plot(t, R, 'g-', label='Выздоровевшие (R)')
-        ax1.set_title("Развитие эпидемии");
-        ax1.set_xlabel("Время")
-        ax1.legend();
-        ax1.grid(True, alpha=0.3)
-        self.time_tab.layout().addWidget(NavigationToolbar(canvas1, self))
-        self.time_tab.layout().addWidget(canvas1)
-
-        # -------- ГРАФИК 2: Распределение (Проценты) --------
-        fig2 = Figure(figsize=(7, 4))
-        fig2.subplots_adjust(bottom=0.20)
-        canvas2 = FigureCanvas(fig2)
-        ax2 = fig2.add_subplot(111)
-        # Просто заполняем области, чтобы было понятнее, чем Stackplot
-        # 1. Слой Инфицированных (от 0 до I)
-        ax2.fill_between(t, 0, I, color='red', alpha=0.5, label='Болеют (I)')
-
-        # 2. Слой Латентных (от I до I + E)
-        ax2.fill_between(t, I, I + E, color='orange', alpha=0.4, label='Инкубация (E)')
-
-        # 3. Слой Здоровых (от I + E до I + E + S)
-        ax2.fill_between(t, I + E, I + E + S, color='blue', alpha=0.2, label='Здоровые (S)')
-
-        # 4. Слой Выздоровевших (от I + E + S до 1.0)
-        # Все, кто выше границы здоровых — это выздоровевшие
-        ax2.plot(t, I + E + S, 'b-', alpha=0.2)  # Верхняя граница восприимчивых
-        ax2.set_title("Нагрузка на систему здравоохранения")
-        ax2.set_ylabel("Доля населения")
-        ax2.set_xlabel("Время")
-        ax2.legend()
-        ax2.grid(True, alpha=0.2)
-        self.area_tab.layout().addWidget(NavigationToolbar(canvas2, self))
-        self.area_tab.layout().addWidget(canvas2)
-
-        # -------- ГРАФИК 3: Фазовый портрет (С ТОЧКАМИ) --------
-        fig3 = Figure(figsize=(7, 4))
-        fig3.subplots_adjust(bottom=0.20)
-        canvas3 = FigureCanvas(fig3)
-        ax3 = fig3.add_subplot(111)
-        ax3.plot(E, I, color="purple", linewidth=2, label="Траектория")
-        # Возвращаем точки
-        ax3.scatter([E[0]], [I[0]], color="green", s=50, label="Старт", zorder=5)
-        ax3.scatter([E[-1]], [I[-1]], color="red", s=50, label="Конец", zorder=5)
-        ax3.set_xlabel("E (Латентные)");
-        ax3.set_ylabel("I (Инфицированные)")
-        ax3.set_title("Фазовый портрет: Связь E и I");
-        ax3.legend();
-        ax3.grid(True)
-        self.phase_tab.layout().addWidget(NavigationToolbar(canvas3, self))
-        self.phase_tab.layout().addWidget(canvas3)
-
-        # -------- ГРАФИК 4: Коэффициент воспроизводства (Rt) --------
-        fig_rt = Figure(figsize=(7, 4))
-        fig_rt.subplots_adjust(bottom=0.20)
-        canvas_rt = FigureCanvas(fig_rt)
-        ax_rt = fig_rt.add_subplot(111)
-
-        ax_rt.plot(t, Rt, color='purple', linewidth=2, label='Rt(t)')
-        # Критическая линия 1.0
-        ax_rt.axhline(1.0, color='red', linestyle='--', linewidth=1.5, label='Порог эпидемии (1.0)')
-
-        # Закрасим область выше единицы (рост) и ниже (затухание)
-        ax_rt.fill_between(t, 1.0, Rt, where=(Rt > 1.0), color='red', alpha=0.1)
-        ax_rt.fill_between(t, 1.0, Rt, where=(Rt <= 1.0), color='green', alpha=0.1)
-
-        ax_rt.set_title("Эффективное репродуктивное число ($R_t$)")
-        ax_rt.set_xlabel("Время");
-        ax_rt.set_ylabel("Rt")
-        ax_rt.legend();
-        ax_rt.grid(True, alpha=0.3)
-        self.rt_tab.layout().addWidget(NavigationToolbar(canvas_rt, self))
-        self.rt_tab.layout().addWidget(canvas_rt)
-
-        # -------- ГРАФИК 5: Новые случаи в день (Incidence) --------
-        fig_inc = Figure(figsize=(7, 4))
-        fig_inc.subplots_adjust(bottom=0.20)
-        canvas_inc = FigureCanvas(fig_inc)
-        ax_inc = fig_inc.add_subplot(111)
-
-        ax_inc.bar(t, incidence, width=(t[1] - t[0]) * 0.8, color='salmon', alpha=0.6, label='Прирост (E -> I)')
-        ax_inc.plot(t, incidence, color='red', linewidth=1.5)  # Плавная линия поверх баров
-
-        ax_inc.set_title("Скорость появления новых инфицированных")
-        ax_inc.set_xlabel("Время");
-        ax_inc.set_ylabel("Доля новых случаев")
-        ax_inc.legend();
-        ax_inc.grid(True, alpha=0.3)
-        self.incidence_tab.layout().addWidget(NavigationToolbar(canvas_inc, self))
-        self.incidence_tab.layout().addWidget(canvas_inc)
-
-        # -------- ГРАФИК: Летальность (Смертность) --------
-        fig_d = Figure(figsize=(7, 4))
-        fig_d.subplots_adjust(bottom=0.20)
-        canvas_d = FigureCanvas(fig_d)
-        ax_d = fig_d.add_subplot(111)
-        ax_d.stackplot(t, Recovered_Actual, Deaths, colors=['green', 'black'],
-                       labels=['Выжившие', 'Умершие'], alpha=0.7)
-        ax_d.set_title("Исход заболевания (Накопительно)")
-        ax_d.set_ylabel("Доля населения")
-        ax_d.set_xlabel("Время")
-        ax_d.legend(loc='upper left')
-        self.death_tab.layout().addWidget(NavigationToolbar(canvas_d, self))
-        self.death_tab.layout().addWidget(canvas_d)
-
-        # -------- ГРАФИК: Темп роста (%) --------
-        fig_g = Figure(figsize=(7, 4))
-        fig_g.subplots_adjust(bottom=0.20)
-        canvas_g = FigureCanvas(fig_g)
-        ax_g = fig_g.add_subplot(111)
-
-        # Рисуем линию темпа роста
-        ax_g.plot(t, growth_rate, color='brown', linewidth=2, label='Темп роста I')
-        ax_g.axhline(0, color='black', linestyle='--', alpha=0.5)  # Линия стабильности
-
-        # Закрашиваем области роста и спада
-        ax_g.fill_between(t, 0, growth_rate, where=(growth_rate > 0), color='red', alpha=0.1)
-        ax_g.fill_between(t, 0, growth_rate, where=(growth_rate <= 0), color='green', alpha=0.1)
-
-        ax_g.set_title("Ежедневный темп изменения числа больных")
-        ax_g.set_ylabel("Прирост (%)")
-        ax_g.set_xlabel("Время")
-        ax_g.set_ylim(-20, 50)  # Ограничим для наглядности (можно убрать)
-        ax_g.grid(True, alpha=0.2)
-        self.growth_tab.layout().addWidget(NavigationToolbar(canvas_g, self))
-        self.growth_tab.layout().addWidget(canvas_g)
-
-        # -------- ГРАФИК 6: Итоговая статистика (Вместо скоростей) --------
-        fig4 = Figure(figsize=(7, 4));
-        canvas4 = FigureCanvas(fig4)
-        ax4 = fig4.add_subplot(111)
-        ax4.axis('off')  # Убираем оси, это будет текстовая панель
-
-        stats_text = (
-            f"ОТЧЕТ ПО МОДЕЛИ SEIR\n"
-            f"-------------------------------------\n"
-            f"• Время достижения пика: {t_peak:.2f} ед.\n"
-            f"• Максимальный процент зараженных: {i_max * 100:.2f}%\n"
-            f"• Итоговый процент переболевших: {total_affected:.2f}%\n"
-            f"• Оставшиеся здоровыми (S): {S[-1] * 100:.2f}%\n"
-            f"-------------------------------------\n"
-            f"Статус: Эпидемия купирована" if I[-1] < 0.001 else "Статус: Процесс продолжается"
-        )
-        ax4.text(0.5, 0.5, stats_text, transform=ax4.transAxes,
-                 fontsize=12, va='center', ha='center',
-                 bbox=dict(boxstyle="round,pad=1", facecolor='wheat', alpha=0.3))
-
-        self.stats_tab.layout().addWidget(canvas4)
+        show_charts(self, self.current_record(), [
+            (self.time_tab, CHARTS["time"]),
+            (self.area_tab, CHARTS["area"]),
+            (self.phase_tab, CHARTS["phase"]),
+            (self.rt_tab, CHARTS["rt"]),
+            (self.incidence_tab, CHARTS["incidence"]),
+            (self.death_tab, CHARTS["death"]),
+            (self.growth_tab, CHARTS["growth"]),
+            (self.stats_tab, CHARTS["stats"], False),
+            (self.fit_tab, CHARTS["fit"]),
+            (self.stochastic_tab, CHARTS["stochastic"]),
+        ])
 
     # ================= СОХРАНЕНИЕ И ЗАГРУЗКА =================
 
@@ -362,21 +395,9 @@ class SIRTab(QWidget):
 
         calc_data = {
             'id': self.current_calc_id,
-            'model_name': 'Модель эпидемии SEIR',  # Убедитесь, что это совпадает с ожиданием в main_window
-            'beta': float(self.beta_input.text()),
-            'alpha': float(self.alpha_input.text()),
-            'gamma': float(self.gamma_input.text()),
-            'S0': float(self.S0_input.text()),
-            'E0': float(self.E0_input.text()),
-            'I0': float(self.I0_input.text()),
-            'R0': float(self.R0_input.text()),
-            't_max': float(self.t_max_input.text()),
+            'model_name': self.MODEL_NAME,  # Убедитесь, что это совпадает с ожиданием в main_window
             'timestamp': datetime.now().isoformat(),
-            't_data': [float(v) for v in self.t_data],
-            'S_data': [float(v) for v in self.S_data],
-            'E_data': [float(v) for v in self.E_data],
-            'I_data': [float(v) for v in self.I_data],
-            'R_data': [float(v) for v in self.R_data]
+            **self.current_record()
         }
 
         result = save_calculation(calc_data)
@@ -391,6 +412,7 @@ class SIRTab(QWidget):
             self.beta_input.setText(str(calc.get('beta', '0.5')))
             self.alpha_input.setText(str(calc.get('alpha', '0.2')))
             self.gamma_input.setText(str(calc.get('gamma', '0.1')))
+            self.mu_input.setText(str(calc.get('mu', self.MODEL.extras['mu'])))
 
             self.t_max_input.setText(str(calc.get('t_max', '150')))
 
@@ -398,6 +420,13 @@ class SIRTab(QWidget):
             self.E0_input.setText(str(calc.get('E0', '0.01')))
             self.I0_input.setText(str(calc.get('I0', '0.01')))
             self.R0_input.setText(str(calc.get('R0', '0.0')))
+            self.fit_result = calc.get('fit')
+            self.stochastic_result = calc.get('stochastic')
+            if self.stochastic_result:
+                self.population_input.setText(f"{self.stochastic_result['population']:g}")
+                self.realizations_input.setText(str(self.stochastic_result['n_realizations']))
+            if self.fit_result:
+                self.population_input.setText(f"{self.fit_result['population']:g}")
 
             if 't_data' in calc:
                 self.t_data = calc['t_data']
@@ -405,6 +434,109 @@ class SIRTab(QWidget):
                 self.E_data = calc['E_data']
                 self.I_data = calc['I_data']
                 self.R_data = calc['R_data']
+                self.events = calc.get('events', [])
                 self.plot_graphs()
             return True
-        return False
\ No newline at end of file
+        return False
+
+
+class MonteCarloPanel(QWidget):
+    """Полосы неопределенности прогноза: разброс параметров вокруг значений формы"""
+
+    # Величина -> (подпись, коэффициент вариации по умолчанию)
+    SPREADS = {
+        "beta": ("β", "0.2"),
+        "alpha": ("α", "0.2"),
+        "gamma": ("γ", "0.2"),
+        "E0": ("E₀", "0.5"),
+        "I0": ("I₀", "0.5"),
+    }
+
+    def __init__(self, base_params):
+        super().__init__()
+        self.base_params = base_params
+        self.mc_thread = None
+        self.render_thread = None
+
+        layout = QVBoxLayout()
+        controls = QHBoxLayout()
+
+        controls.addWidget(QLabel("Коэф. вариации:"))
+        self.spread_inputs = {}
+        for name, (label, default) in self.SPREADS.items():
+            self.spread_inputs[name] = QLineEdit(default)
+            controls.addWidget(QLabel(label))
+            controls.addWidget(self.spread_inputs[name])
+        self.count_input = QLineEdit(str(N_MEMBERS))
+        controls.addWidget(QLabel("расчетов:"))
+        controls.addWidget(self.count_input)
+
+        self.calc_button = QPushButton("Рассчитать полосы")
+        self.calc_button.clicked.connect(self.on_calculate)
+        self.stop_button = QPushButton("Стоп")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.on_stop)
+        controls.addWidget(self.calc_button)
+        controls.addWidget(self.stop_button)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+
+        self.chart_tabs = QTabWidget()
+        self.bands_tab = QWidget()
+        self.peaks_tab = QWidget()
+        for tab in [self.bands_tab, self.peaks_tab]:
+            tab.setLayout(QVBoxLayout())
+        self.chart_tabs.addTab(self.bands_tab, "Полосы I(t)")
+        self.chart_tabs.addTab(self.peaks_tab, "Распределение пика")
+
+        layout.addLayout(controls)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.chart_tabs, 1)
+        self.setLayout(layout)
+
+    def on_calculate(self):
+        try:
+            base = self.base_params()
+            spreads = {name: float(field.text()) for name, field in self.spread_inputs.items()}
+            n_members = int(self.count_input.text())
+
+            self.calc_button.setEnabled(False)
+            self.calc_button.setText("⏳ Вычисление...")
+            self.stop_button.setEnabled(True)
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setValue(0)
+
+            self.mc_thread = MonteCarloThread(base, spreads, n_members)
+            self.mc_thread.task_progress.connect(self.progress_bar.setValue)
+            self.mc_thread.task_finished.connect(self.on_finished)
+            self.mc_thread.task_error.connect(self.on_error)
+            self.mc_thread.finished.connect(self.on_thread_done)
+            scheduler().submit(self, self.mc_thread)
+        except Exception as e:
+            self.on_thread_done()
+            self.on_error(str(e))
+
+    def on_stop(self):
+        # Из очереди поток снимается без запуска — finished от него не придет
+        if not scheduler().cancel(self):
+            self.on_thread_done()
+
+    def on_thread_done(self):
+        self.calc_button.setEnabled(True)
+        self.calc_button.setText("Рассчитать полосы")
+        self.stop_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+
+    def on_error(self, error):
+        QMessageBox.critical(self, "Ошибка", f"Не удалось рассчитать полосы неопределенности:\n{error}")
+
+    def on_finished(self, result):
+        for tab in [self.bands_tab, self.peaks_tab]:
+            layout = tab.layout()
+            while layout.count():
+                layout.takeAt(0).widget().deleteLater()
+        show_charts(self, result, [
+            (self.bands_tab, MONTE_CARLO["bands"]),
+            (self.peaks_tab, MONTE_CARLO["peaks"]),
+        ])
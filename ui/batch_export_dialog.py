@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
+    QPushButton, QComboBox, QDialogButtonBox
+)
+from PyQt6.QtCore import Qt
+
+from core.batch_export import FORMATS
+
+
+class BatchExportDialog(QDialog):
+    """Выбор сохраненных расчетов и формата для пакетного экспорта графиков"""
+
+    def __init__(self, calculations, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Пакетный экспорт графиков")
+        self.resize(600, 500)
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Отметьте расчеты для экспорта:"))
+
+        self.list_widget = QListWidget()
+        for calc in calculations:
+            timestamp = calc.get("timestamp", "")
+            try:
+                timestamp = datetime.fromisoformat(timestamp).strftime("%d.%m.%Y %H:%M")
+            except ValueError:
+                pass
+
+            item = QListWidgetItem(f"{calc.get('model_name', 'Модель')} — {timestamp}")
+            item.setData(Qt.ItemDataRole.UserRole, calc["id"])
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            self.list_widget.addItem(item)
+        layout.addWidget(self.list_widget)
+
+        controls = QHBoxLayout()
+        btn_all = QPushButton("Выбрать все")
+        btn_all.clicked.connect(lambda: self.set_all(Qt.CheckState.Checked))
+        btn_none = QPushButton("Снять все")
+        btn_none.clicked.connect(lambda: self.set_all(Qt.CheckState.Unchecked))
+        controls.addWidget(btn_all)
+        controls.addWidget(btn_none)
+        controls.addStretch()
+        controls.addWidget(QLabel("Формат:"))
+        self.format_combo = QComboBox()
+        self.format_combo.addItems([fmt.upper() for fmt in FORMATS])
+        controls.addWidget(self.format_combo)
+        layout.addLayout(controls)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.setLayout(layout)
+
+    def set_all(self, state):
+        for i in range(self.list_widget.count()):
+            self.list_widget.item(i).setCheckState(state)
+
+    def selected_ids(self):
+        return [self.list_widget.item(i).data(Qt.ItemDataRole.UserRole)
+                for i in range(self.list_widget.count())
+                if self.list_widget.item(i).checkState() == Qt.CheckState.Checked]
+
+    def selected_format(self):
+        return self.format_combo.currentText().lower()
@@ -0,0 +1,16 @@
+"""Реестр модулей графиков: имя модели (как в записях БД) -> модуль с CHARTS (и STREAMS/ANIMATION у моделей)."""
+from ui import ISLM_charts, SIR_charts, competing_species_charts, lorenz_charts, lotka_volterra_charts, sweep_charts
+
+CHART_MODULES = {
+    "Лотка-Вольтерра": lotka_volterra_charts,
+    "Конкуренция видов": competing_species_charts,
+    "Модель эпидемии SEIR": SIR_charts,
+    "Макроэкономическая модель IS-LM": ISLM_charts,
+    "Система Лоренца": lorenz_charts,
+    "Параметрический анализ": sweep_charts,
+}
+
+
+def charts_for(model_name):
+    """Модуль графиков для модели или None, если модель неизвестна"""
+    return CHART_MODULES.get(model_name)
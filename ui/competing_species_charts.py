@@ -0,0 +1,164 @@
+"""Графики модели конкуренции видов (без зависимости от Qt)."""
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Patch
+
+from core import competition_outcome, field_cache, stability
+
+
+def equilibrium(calc):
+    """Внутреннее равновесие (x*, y*) или (None, None), если прямые изоклин параллельны"""
+    points, _ = stability.equilibria("competition", calc)
+    x_star, y_star = points[3]
+    if np.isfinite(x_star) and np.isfinite(y_star):
+        return float(x_star), float(y_star)
+    return None, None
+
+
+def draw_time(fig, calc):
+    t = np.array(calc['t_data'], dtype=float)
+    x = np.array(calc['x_data'], dtype=float)
+    y = np.array(calc['y_data'], dtype=float)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax1 = fig.add_subplot(111)
+    ax1.plot(t, x, label="Вид X"); ax1.plot(t, y, label="Вид Y")
+    ax1.set_xlabel("t"); ax1.set_ylabel("Популяция"); ax1.set_title("Динамика популяций")
+    ax1.legend(); ax1.grid(True)
+
+
+def draw_phase(fig, calc):
+    equilibrium_x, equilibrium_y = equilibrium(calc)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax2 = fig.add_subplot(111)
+    ax2.plot(calc['x_data'], calc['y_data'])
+    if equilibrium_x is not None and equilibrium_y is not None:
+        ax2.scatter(equilibrium_x, equilibrium_y, color="red", s=80, label="Равновесие")
+        ax2.legend()
+    ax2.set_xlabel("X"); ax2.set_ylabel("Y"); ax2.set_title("Фазовый портрет"); ax2.grid(True)
+
+
+def draw_vector(fig, calc):
+    x = np.array(calc['x_data'], dtype=float)
+    y = np.array(calc['y_data'], dtype=float)
+    p, q, r, s, t_param, u = (calc[k] for k in ('p', 'q', 'r', 's', 't', 'u'))
+
+    fig.subplots_adjust(bottom=0.20)
+    ax3 = fig.add_subplot(111)
+    extent = field_cache.snap_extent(min(x)*0.8, max(x)*1.2, min(y)*0.8, max(y)*1.2)
+    X_m, Y_m, U, V = field_cache.vector_field("competition", (p, q, r, s, t_param, u), extent, 20)
+    ax3.quiver(X_m, Y_m, U, V); ax3.plot(x, y)
+    ax3.set_xlabel("X"); ax3.set_ylabel("Y"); ax3.set_title("Векторное поле")
+
+
+def draw_total(fig, calc):
+    t = np.array(calc['t_data'], dtype=float)
+    x = np.array(calc['x_data'], dtype=float)
+    y = np.array(calc['y_data'], dtype=float)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax_total = fig.add_subplot(111)
+    ax_total.plot(t, x + y); ax_total.set_xlabel("t"); ax_total.set_ylabel("X + Y"); ax_total.set_title("Суммарная популяция"); ax_total.grid(True)
+
+
+def draw_isocline(fig, calc):
+    x, y = calc['x_data'], calc['y_data']
+    p, q, r, s, t_param, u = (calc[k] for k in ('p', 'q', 'r', 's', 't', 'u'))
+    equilibrium_x, equilibrium_y = equilibrium(calc)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax_iso = fig.add_subplot(111)
+    # Линии тока зависят только от параметров — берем из кэша
+    segments = field_cache.streamlines("competition", (p, q, r, s, t_param, u), (0.01, 3.5, 0.01, 2.5), 50)
+    ax_iso.add_collection(LineCollection(segments, colors='black', linewidths=0.5))
+    xv = np.linspace(0, 3.5, 200)
+    ax_iso.plot(xv, np.maximum(0, (p - q * xv) / r), color="blue", label="dx/dt = 0")
+    ax_iso.plot(xv, np.maximum(0, (s - t_param * xv) / u), color="red", label="dy/dt = 0")
+    if equilibrium_x is not None and equilibrium_x >= 0:
+        ax_iso.scatter([equilibrium_x], [equilibrium_y], color='green', s=60, zorder=5)
+    ax_iso.plot(x, y, linewidth=2.5, color="darkgreen", label="Решение")
+    ax_iso.set_xlim(0, 3.2); ax_iso.set_ylim(0, 2.2); ax_iso.legend()
+
+
+def draw_phase3d(fig, calc):
+    fig.subplots_adjust(bottom=0.20)
+    ax3d = fig.add_subplot(111, projection='3d')
+    ax3d.plot(calc['x_data'], calc['y_data'], calc['t_data']); ax3d.set_title("3D фазовый график")
+
+
+# Цвета исходов на карте стартов
+OUTCOME_COLORS = {
+    competition_outcome.X_WINS: "tab:blue",
+    competition_outcome.Y_WINS: "tab:orange",
+    competition_outcome.COEXISTENCE: "tab:green",
+    competition_outcome.NEUTRAL: "tab:purple",
+    competition_outcome.EXTINCTION: "lightgray",
+}
+OUTCOME_RESOLUTION = 300
+
+
+def draw_outcome(fig, calc):
+    x, y = calc['x_data'], calc['y_data']
+    p, q, r, s, t_param, u = (calc[k] for k in ('p', 'q', 'r', 's', 't', 'u'))
+
+    # Область захватывает траекторию и равновесия на осях
+    x_on_x, _, _, y_on_y = competition_outcome.intercepts(calc)
+    x_max = np.nanmax([max(x), x_on_x]) * 1.5
+    y_max = np.nanmax([max(y), y_on_y]) * 1.5
+    xv_m = np.linspace(0, x_max, OUTCOME_RESOLUTION); yv_m = np.linspace(0, y_max, OUTCOME_RESOLUTION)
+    # Исход по режиму параметров; интегрируется только сепаратриса при бистабильности
+    res, regime, curve = competition_outcome.outcome_map(calc, xv_m, yv_m)
+
+    codes = list(OUTCOME_COLORS)
+    cmap = ListedColormap([OUTCOME_COLORS[code] for code in codes])
+    index = np.searchsorted(codes, res)
+
+    fig.subplots_adjust(bottom=0.20)
+    ax_out = fig.add_subplot(111)
+    ax_out.imshow(index, extent=[0, x_max, 0, y_max], origin="lower", aspect="auto",
+                  cmap=cmap, vmin=-0.5, vmax=len(codes) - 0.5, alpha=0.6, interpolation="nearest")
+    ax_out.plot(xv_m, (p - q * xv_m) / r, color="blue", linewidth=1, label="dx/dt = 0")
+    ax_out.plot(xv_m, (s - t_param * xv_m) / u, color="red", linewidth=1, label="dy/dt = 0")
+    if curve is not None:
+        ax_out.plot(*curve, color="black", linewidth=2, label="Сепаратриса")
+
+    points, valid = stability.equilibria("competition", calc)
+    classes = stability.analyze("competition", calc)["classes"]
+    for point, ok, code in zip(points, valid, classes):
+        if ok:
+            filled = code in stability.STABLE_CLASSES
+            ax_out.scatter(*point, s=60, zorder=5, edgecolors="black",
+                           facecolors="black" if filled else "white")
+    ax_out.plot(x, y, color="darkgreen", linewidth=1.5, label="Решение")
+
+    # В легенде — исходы внутренних стартов (оси заняты одной строкой пикселей)
+    present = [code for code in codes if (res[1:, 1:] == code).any()]
+    handles = [Patch(color=OUTCOME_COLORS[code], alpha=0.6, label=competition_outcome.LABELS[code]) for code in present]
+    ax_out.legend(handles=ax_out.get_legend_handles_labels()[0] + handles, fontsize=8, loc="upper right")
+    ax_out.set_xlim(0, x_max); ax_out.set_ylim(0, y_max)
+    ax_out.set_xlabel("Начальная численность вида X")
+    ax_out.set_ylabel("Начальная численность вида Y")
+    ax_out.set_title(f"Исход в зависимости от старта: {competition_outcome.LABELS[regime]}")
+
+
+# Ключ вкладки -> (размер фигуры, функция отрисовки)
+CHARTS = {
+    "time": ((7, 4), draw_time),
+    "phase": ((7, 4), draw_phase),
+    "vector": ((7, 4), draw_vector),
+    "total": ((7, 4), draw_total),
+    "isocline": ((8, 5), draw_isocline),
+    "phase3d": ((7, 4), draw_phase3d),
+    "outcome": ((7, 4), draw_outcome),
+}
+
+# Живые графики во время расчета: столбцы строк {t, x, y}
+STREAMS = {
+    "time": {"labels": ("t", "Популяция"), "lines": [(0, 1, "Вид X"), (0, 2, "Вид Y")]},
+    "phase": {"labels": ("X", "Y"), "lines": [(1, 2, None)]},
+}
+
+# Анимация траектории при экспорте в видео/GIF
+ANIMATION = {"columns": ("x_data", "y_data"), "labels": ("Вид X", "Вид Y")}
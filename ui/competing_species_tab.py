@@ -16,11 +16,19 @@ from matplotlib.figure import Figure
 
 from core.calculation_thread import CalculationThread
 from core.database import save_calculation, load_calculation
+from core.models import MODELS
+from core.profiling import span
+from core.scheduler import scheduler
+from ui.figure_view import show_charts, start_streams
+from ui.competing_species_charts import CHARTS, STREAMS
 
 
 class CompetingSpeciesTab(QWidget):
     """Вкладка: Модель конкуренции видов"""
 
+    MODEL = MODELS["competition"]
+    MODEL_NAME = MODEL.title
+
     def __init__(self):
         super().__init__()
 
@@ -29,6 +37,8 @@ class CompetingSpeciesTab(QWidget):
         self.y_data = []
 
         self.calculation_thread = None
+        self.render_thread = None
+        self.stream_views = None
         self.current_calc_id = None
 
         self.init_ui()
@@ -114,21 +124,38 @@ class CompetingSpeciesTab(QWidget):
                 QMessageBox.warning(self, "Предупреждение", "Заполните все поля!")
                 return
 
-            self.calc_button.setEnabled(False)
             self.calc_button.setText("⏳ Вычисление...")
             self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 0)
+            self.stream_views = None
 
             self.calculation_thread = CalculationThread(
                 p, q, r, s, t, u, x0, y0,
-                model="competition"
+                model=self.MODEL.key
             )
             self.calculation_thread.calculation_finished.connect(self.on_finished)
             self.calculation_thread.calculation_error.connect(self.on_error)
-            self.calculation_thread.start()
+            self.calculation_thread.calculation_chunk.connect(self.on_chunk)
+            self.calculation_thread.calculation_progress.connect(self.on_progress)
+            scheduler().submit(self, self.calculation_thread)
 
         except Exception as e:
             self.on_error(str(e))
 
+    def on_chunk(self, rows):
+        """Дорисовывает графики по мере прихода строк от решателя"""
+        if self.stream_views is None:
+            self.stream_views = start_streams(self, [
+                (self.time_tab, STREAMS["time"]),
+                (self.phase_tab, STREAMS["phase"]),
+            ])
+        for view in self.stream_views:
+            view.append(rows)
+
+    def on_progress(self, percent):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+
     def on_error(self, error):
         self.calc_button.setEnabled(True)
         self.calc_button.setText("Рассчитать")
@@ -139,46 +166,26 @@ class CompetingSpeciesTab(QWidget):
         self.calc_button.setEnabled(True)
         self.calc_button.setText("Рассчитать")
         self.progress_bar.setVisible(False)
+        self.stream_views = None
 
-        self.t_data = [float(row[0]) for row in result]
-        self.x_data = [float(row[1]) for row in result]
-        self.y_data = [float(row[2]) for row in result]
+        # Столбцы строк -> атрибуты *_data по схеме модели
+        with span("result.convert", model=self.MODEL.key):
+            for key, values in self.MODEL.columns_of(result).items():
+                setattr(self, key, values)
 
         self.current_calc_id = None
         self.plot_graphs(self.t_data, self.x_data, self.y_data)
 
-    def simulate_competition(self, x0, y0, p, q, r, s, t, u, steps=200, dt=0.05):
-        x, y = x0, y0
-        for _ in range(steps):
-            dx = x * (p - q * x - r * y)
-            dy = y * (s - t * x - u * y)
-            x += dx * dt
-            y += dy * dt
-            if x < 0: x = 0
-            if y < 0: y = 0
-        return x, y
+    def current_record(self):
+        """Параметры и данные текущего расчета в формате записи БД"""
+        return {
+            'p': float(self.p_input.text()), 'q': float(self.q_input.text()), 'r': float(self.r_input.text()),
+            's': float(self.s_input.text()), 't': float(self.t_input.text()), 'u': float(self.u_input.text()),
+            'x0': float(self.x0_input.text()), 'y0': float(self.y0_input.text()),
+            't_data': self.t_data, 'x_data': self.x_data, 'y_data': self.y_data
+        }
 
     def plot_graphs(self, t, x, y):
-        # ВАША ОРИГИНАЛЬНАЯ ЛОГИКА РАСЧЕТОВ (без изменений)
-        t = np.array(t, dtype=float)
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-
-        p = float(self.p_input.text())
-        q = float(self.q_input.text())
-        r = float(self.r_input.text())
-        s = float(self.s_input.text())
-        t_param = float(self.t_input.text())
-        u = float(self.u_input.text())
-
-        den = q * u - r * t_param
-        equilibrium_x = None
-        equilibrium_y = None
-
-        if abs(den) > 1e-8:
-            equilibrium_x = (p * u - r * s) / den
-            equilibrium_y = (s * q - p * t_param) / den
-
         for tab in [self.time_tab, self.phase_tab, self.vector_tab,
                     self.isocline_tab, self.total_tab, self.phase3d_tab, self.outcome_tab]:
             layout = tab.layout()
@@ -187,99 +194,18 @@ class CompetingSpeciesTab(QWidget):
                 if item.widget():
                     item.widget().deleteLater()
 
-        # 1. По времени
-        fig_time = Figure(figsize=(7, 4))
-        fig_time.subplots_adjust(bottom=0.20)
-        canvas_time = FigureCanvas(fig_time)
-        ax1 = fig_time.add_subplot(111)
-        ax1.plot(t, x, label="Вид X"); ax1.plot(t, y, label="Вид Y")
-        ax1.set_xlabel("t"); ax1.set_ylabel("Популяция"); ax1.set_title("Динамика популяций")
-        ax1.legend(); ax1.grid(True)
-        self.time_tab.layout().addWidget(NavigationToolbar(canvas_time, self))
-        self.time_tab.layout().addWidget(canvas_time)
-
-        # 2. Фазовый портрет
-        fig_phase = Figure(figsize=(7, 4))
-        fig_phase.subplots_adjust(bottom=0.20)
-        canvas_phase = FigureCanvas(fig_phase)
-        ax2 = fig_phase.add_subplot(111)
-        ax2.plot(x, y)
-        if equilibrium_x is not None and equilibrium_y is not None:
-            ax2.scatter(equilibrium_x, equilibrium_y, color="red", s=80, label="Равновесие")
-            ax2.legend()
-        ax2.set_xlabel("X"); ax2.set_ylabel("Y"); ax2.set_title("Фазовый портрет"); ax2.grid(True)
-        self.phase_tab.layout().addWidget(NavigationToolbar(canvas_phase, self))
-        self.phase_tab.layout().addWidget(canvas_phase)
-
-        # 3. Векторное поле
-        fig_vector = Figure(figsize=(7, 4))
-        fig_vector.subplots_adjust(bottom=0.20)
-        canvas_vector = FigureCanvas(fig_vector)
-        ax3 = fig_vector.add_subplot(111)
-        X_m, Y_m = np.meshgrid(np.linspace(min(x)*0.8, max(x)*1.2, 20), np.linspace(min(y)*0.8, max(y)*1.2, 20))
-        U = X_m * (p - q*X_m - r*Y_m); V = Y_m * (s - t_param*X_m - u*Y_m)
-        ax3.quiver(X_m, Y_m, U, V); ax3.plot(x, y)
-        ax3.set_xlabel("X"); ax3.set_ylabel("Y"); ax3.set_title("Векторное поле")
-        self.vector_tab.layout().addWidget(NavigationToolbar(canvas_vector, self))
-        self.vector_tab.layout().addWidget(canvas_vector)
-
-        # 4. Суммарная популяция
-        fig_total = Figure(figsize=(7, 4))
-        fig_total.subplots_adjust(bottom=0.20)
-        canvas_total = FigureCanvas(fig_total)
-        ax_total = fig_total.add_subplot(111)
-        ax_total.plot(t, x + y); ax_total.set_xlabel("t"); ax_total.set_ylabel("X + Y"); ax_total.set_title("Суммарная популяция"); ax_total.grid(True)
-        self.total_tab.layout().addWidget(NavigationToolbar(canvas_total, self))
-        self.total_tab.layout().addWidget(canvas_total)
-
-        # 5. Изоклины (ваша сложная логика)
-        fig_iso = Figure(figsize=(8, 5))
-        fig_iso.subplots_adjust(bottom=0.20)
-        canvas_iso = FigureCanvas(fig_iso)
-        ax_iso = fig_iso.add_subplot(111)
-        xr = np.linspace(0.01, 3.5, 50).astype(float); yr = np.linspace(0.01, 2.5, 50).astype(float)
-        XM, YM = np.meshgrid(xr, yr)
-        DX = (XM * (p - q * XM - r * YM)); DY = (YM * (s - t_param * XM - u * YM))
-        try:
-            ax_iso.streamplot(xr, yr, np.nan_to_num(DX), np.nan_to_num(DY), color='black', linewidth=0.5, density=0.75, arrowstyle='-', integration_direction='both', broken_streamlines=False)
-        except:
-            ax_iso.streamplot(xr, yr, np.nan_to_num(DX), np.nan_to_num(DY), color='black', linewidth=0.5, density=2.5, arrowstyle='-')
-        xv = np.linspace(0, 3.5, 200)
-        ax_iso.plot(xv, np.maximum(0, (p - q * xv) / r), color="blue", label="dx/dt = 0")
-        ax_iso.plot(xv, np.maximum(0, (s - t_param * xv) / u), color="red", label="dy/dt = 0")
-        if equilibrium_x is not None and equilibrium_x >= 0:
-            ax_iso.scatter([equilibrium_x], [equilibrium_y], color='green', s=60, zorder=5)
-        ax_iso.plot(x, y, linewidth=2.5, color="darkgreen", label="Решение")
-        ax_iso.set_xlim(0, 3.2); ax_iso.set_ylim(0, 2.2); ax_iso.legend()
-        self.isocline_tab.layout().addWidget(NavigationToolbar(canvas_iso, self))
-        self.isocline_tab.layout().addWidget(canvas_iso)
-
-        # 6. 3D
-        fig3d = Figure(figsize=(7, 4))
-        fig3d.subplots_adjust(bottom=0.20)
-        canvas3d = FigureCanvas(fig3d)
-        ax3d = fig3d.add_subplot(111, projection='3d')
-        ax3d.plot(x, y, t); ax3d.set_title("3D фазовый график")
-        self.phase3d_tab.layout().addWidget(NavigationToolbar(canvas3d, self))
-        self.phase3d_tab.layout().addWidget(canvas3d)
-
-        # 7. Карта исходов
-        fig_out = Figure(figsize=(7, 4))
-        fig_out.subplots_adjust(bottom=0.20)
-        canvas_out = FigureCanvas(fig_out)
-        ax_out = fig_out.add_subplot(111)
-        xv_m = np.linspace(0, max(x) * 1.5, 40); yv_m = np.linspace(0, max(y) * 1.5, 40)
-        res = np.zeros((len(yv_m), len(xv_m)))
-        for i, x0i in enumerate(xv_m):
-            for j, y0j in enumerate(yv_m):
-                xf, yf = self.simulate_competition(x0i, y0j, p, q, r, s, t_param, u)
-                res[j, i] = 1 if xf > yf else 2
-        ax_out.imshow(res, extent=[0, xv_m.max(), 0, yv_m.max()], origin="lower", aspect="auto")
-        ax_out.set_xlabel("Начальная численность вида X")
-        ax_out.set_ylabel("Начальная численность вида Y")
-        ax_out.set_title("Карта выживания в зависимости от старта")
-        self.outcome_tab.layout().addWidget(NavigationToolbar(canvas_out, self))
-        self.outcome_tab.layout().addWidget(canvas_out)
+        calc = self.current_record()
+        calc.update({'t_data': t, 'x_data': x, 'y_data': y})
+
+        show_charts(self, calc, [
+            (self.time_tab, CHARTS["time"]),
+            (self.phase_tab, CHARTS["phase"]),
+            (self.vector_tab, CHARTS["vector"]),
+            (self.total_tab, CHARTS["total"]),
+            (self.isocline_tab, CHARTS["isocline"]),
+            (self.phase3d_tab, CHARTS["phase3d"]),
+            (self.outcome_tab, CHARTS["outcome"]),
+        ])
 
     def save_current_calculation(self):
         if not self.t_data:
@@ -287,12 +213,9 @@ class CompetingSpeciesTab(QWidget):
             return False
         if not self.current_calc_id: self.current_calc_id = str(uuid.uuid4())
         calc_data = {
-            'id': self.current_calc_id, 'model_name': 'Конкуренция видов',
-            'p': float(self.p_input.text()), 'q': float(self.q_input.text()), 'r': float(self.r_input.text()),
-            's': float(self.s_input.text()), 't': float(self.t_input.text()), 'u': float(self.u_input.text()),
-            'x0': float(self.x0_input.text()), 'y0': float(self.y0_input.text()),
+            'id': self.current_calc_id, 'model_name': self.MODEL_NAME,
             'timestamp': datetime.now().isoformat(),
-            't_data': self.t_data, 'x_data': self.x_data, 'y_data': self.y_data
+            **self.current_record()
         }
         QMessageBox.information(self, "Сохранение", save_calculation(calc_data))
         return True
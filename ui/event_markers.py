@@ -0,0 +1,21 @@
+"""Отметки событий модели (пики, пороги) на графиках (без зависимости от Qt).
+
+События приходят от встроенного решателя и хранятся в записи расчета
+списком {name, label, t, values}; у записей Wolfram и старых записей
+их нет — тогда отметки не рисуются.
+"""
+
+
+def event_hits(calc, name):
+    """События name из записи расчета в порядке времени"""
+    return [hit for hit in calc.get('events') or [] if hit['name'] == name]
+
+
+def mark_events(ax, calc, names, state, color='black', marker='o'):
+    """Точки событий names на кривой переменной state; подпись — в легенду (по разу на событие)"""
+    for name in names:
+        hits = event_hits(calc, name)
+        if hits:
+            ax.plot([hit['t'] for hit in hits], [hit['values'][state] for hit in hits], linestyle='none',
+                    marker=marker, markersize=7, markerfacecolor='none', markeredgecolor=color,
+                    markeredgewidth=1.5, label=hits[0]['label'])
@@ -0,0 +1,284 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt
+
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.figure import Figure
+
+from core.profiling import span
+from core.render_thread import RenderThread, chart_name
+
+# Базовое разрешение фигур (как у FigureCanvas по умолчанию)
+BASE_DPI = 100
+
+# Запас границ осей живого графика (доля диапазона данных)
+STICKY_MARGIN = 0.15
+
+# Потоки отрисовки держим живыми до завершения, иначе Qt уничтожит их на ходу
+_running_threads = set()
+
+
+class FigureView(QWidget):
+    """Легкий виджет: показывает готовое изображение графика,
+    а живой холст matplotlib создает только при попытке масштабирования"""
+
+    def __init__(self, draw_fn, calc, figsize, toolbar=True):
+        super().__init__()
+        self.draw_fn = draw_fn
+        self.calc = calc
+        self.figsize = figsize
+        self.toolbar = toolbar
+        self.canvas = None
+        self._pixmap = None
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        self.image_label = QLabel("⏳ Отрисовка...")
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.image_label.setToolTip("Колесо мыши или клик — интерактивный режим (масштаб, сдвиг)")
+        layout.addWidget(self.image_label)
+
+    def set_image(self, image):
+        """Принимает растр из потока отрисовки"""
+        if self.canvas is not None:
+            return
+        self._pixmap = QPixmap.fromImage(image)
+        self._update_pixmap()
+
+    def set_error(self, error):
+        if self.canvas is None:
+            self.image_label.setText(f"Ошибка отрисовки: {error}")
+
+    def _update_pixmap(self):
+        if self._pixmap is None:
+            return
+        ratio = self.devicePixelRatioF()
+        scaled = self._pixmap.scaled(
+            self.image_label.size() * ratio,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        scaled.setDevicePixelRatio(ratio)
+        self.image_label.setPixmap(scaled)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_pixmap()
+
+    def mousePressEvent(self, event):
+        self.make_interactive()
+
+    def wheelEvent(self, event):
+        self.make_interactive()
+
+    def make_interactive(self):
+        """Заменяет картинку живым холстом с панелью навигации"""
+        if self.canvas is not None:
+            return
+
+        fig = Figure(figsize=self.figsize)
+        self.canvas = FigureCanvas(fig)
+        with span("plot.interactive", chart=chart_name(self.draw_fn)):
+            self.draw_fn(fig, self.calc)
+
+        layout = self.layout()
+        layout.removeWidget(self.image_label)
+        self.image_label.deleteLater()
+        self._pixmap = None
+
+        if self.toolbar:
+            layout.addWidget(NavigationToolbar(self.canvas, self))
+        layout.addWidget(self.canvas)
+        self.canvas.draw_idle()
+
+
+class StreamingPlot(QWidget):
+    """Живой график, который дорисовывается по мере поступления строк расчета.
+
+    spec: {"labels": подписи осей (2 или 3 — для 3D),
+           "lines": [(столбец x, столбец y[, столбец z], подпись), ...]}
+    """
+
+    def __init__(self, spec, figsize=(7, 4)):
+        super().__init__()
+        self.spec = spec
+        self.columns = []
+        self.background = None
+
+        fig = Figure(figsize=figsize)
+        fig.subplots_adjust(bottom=0.20)
+        self.canvas = FigureCanvas(fig)
+
+        self.is_3d = len(spec["labels"]) == 3
+        self.ax = fig.add_subplot(111, projection='3d' if self.is_3d else None)
+        self.ax.set_xlabel(spec["labels"][0])
+        self.ax.set_ylabel(spec["labels"][1])
+        if self.is_3d:
+            self.ax.set_zlabel(spec["labels"][2])
+        self.ax.grid(True, alpha=0.3)
+
+        empty = ([], [], []) if self.is_3d else ([], [])
+        self.lines = []
+        for line_spec in spec["lines"]:
+            line, = self.ax.plot(*empty, label=line_spec[-1], lw=1)
+            self.lines.append(line)
+        if any(line_spec[-1] for line_spec in spec["lines"]):
+            self.ax.legend(loc='upper right')
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas)
+        self.setLayout(layout)
+
+    def append(self, rows):
+        if not rows:
+            return
+        if not self.columns:
+            self.columns = [[] for _ in rows[0]]
+        for column, values in zip(self.columns, zip(*rows)):
+            column.extend(values)
+        self._update_lines()
+        self.canvas.draw_idle()
+
+    def replace(self, rows):
+        """Заменяет все данные графика и сразу перерисовывает его (живой режим).
+
+        Границы осей меняются, только когда данные из них выходят или
+        сжимаются вдвое; в остальных кадрах поверх сохраненного фона
+        перерисовываются одни линии (blit).
+        """
+        if not rows:
+            return
+        self.columns = [list(values) for values in zip(*rows)]
+        if self.background is None:
+            for line in self.lines:
+                line.set_animated(True)
+            self.canvas.mpl_connect('draw_event', self._on_draw)
+        if self._update_lines(sticky=True) or self.background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.background)
+            self._draw_lines()
+            self.canvas.blit(self.canvas.figure.bbox)
+
+    def _on_draw(self, event):
+        # Фон без линий для следующих кадров
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for line in self.lines:
+            self.ax.draw_artist(line)
+
+    def _update_lines(self, sticky=False):
+        """Передает столбцы линиям и подбирает границы осей; True — границы изменились"""
+        for line, line_spec in zip(self.lines, self.spec["lines"]):
+            cols = line_spec[:-1]
+            if self.is_3d:
+                line.set_data_3d(*(self.columns[c] for c in cols))
+            else:
+                line.set_data(self.columns[cols[0]], self.columns[cols[1]])
+
+        # Границы осей считаем сами: autoscale не работает для 3D-линий
+        axis_cols = [sorted({line_spec[i] for line_spec in self.spec["lines"]})
+                     for i in range(len(self.spec["labels"]))]
+        axes = [(self.ax.get_xlim, self.ax.set_xlim), (self.ax.get_ylim, self.ax.set_ylim)]
+        if self.is_3d:
+            axes.append((self.ax.get_zlim, self.ax.set_zlim))
+        changed = False
+        for (getter, setter), cols in zip(axes, axis_cols):
+            lo = min(min(self.columns[c]) for c in cols)
+            hi = max(max(self.columns[c]) for c in cols)
+            if sticky:
+                low, high = getter()
+                if low <= lo and hi <= high and hi - lo >= 0.5 * (high - low):
+                    continue
+            # С запасом в живом режиме, чтобы границы менялись реже
+            margin = STICKY_MARGIN if sticky else 0.05
+            pad = (hi - lo) * margin or abs(hi) * margin or 1.0
+            setter(lo - pad, hi + pad)
+            changed = True
+        return changed
+
+
+def _clear_layout(layout):
+    while layout.count():
+        item = layout.takeAt(0)
+        if item.widget():
+            item.widget().deleteLater()
+
+
+def start_streams(owner, placements):
+    """Заменяет содержимое вкладок живыми графиками для потоковых данных.
+
+    placements: список (вкладка, spec) — элементы словарей STREAMS
+    """
+    # Изображения прошлого расчета больше не нужны
+    previous = getattr(owner, "render_thread", None)
+    if previous is not None:
+        previous.cancel()
+        owner.render_thread = None
+
+    views = []
+    for host, spec in placements:
+        _clear_layout(host.layout())
+        view = StreamingPlot(spec)
+        host.layout().addWidget(view)
+        views.append(view)
+    return views
+
+
+def show_charts(owner, calc, placements):
+    """Размещает графики во вкладках и запускает их фоновую растеризацию.
+
+    placements: список (вкладка, (figsize, draw_fn)) или
+    (вкладка, (figsize, draw_fn), toolbar) — элементы словарей CHARTS
+    """
+    previous = getattr(owner, "render_thread", None)
+    if previous is not None:
+        previous.cancel()
+
+    ratio = owner.devicePixelRatioF()
+    views = []
+    jobs = []
+
+    for placement in placements:
+        host, (figsize, draw_fn) = placement[:2]
+        toolbar = placement[2] if len(placement) > 2 else True
+
+        view = FigureView(draw_fn, calc, figsize, toolbar)
+        host.layout().addWidget(view)
+        views.append(view)
+
+        # Рисуем сразу в размер вкладки, чтобы картинка совпадала с живым холстом
+        size = host.size()
+        if size.width() > 200 and size.height() > 150:
+            render_size = (size.width() / BASE_DPI, size.height() / BASE_DPI)
+        else:
+            render_size = figsize
+
+        jobs.append((draw_fn, calc, render_size, BASE_DPI * ratio))
+
+    thread = RenderThread(jobs)
+
+    def on_image(index, image):
+        if owner.render_thread is thread:
+            views[index].set_image(image)
+
+    def on_error(index, error):
+        if owner.render_thread is thread:
+            views[index].set_error(error)
+
+    thread.image_ready.connect(on_image)
+    thread.render_error.connect(on_error)
+    thread.finished.connect(lambda: _running_threads.discard(thread))
+
+    owner.render_thread = thread
+    _running_threads.add(thread)
+    thread.start()
+
+    return views
@@ -0,0 +1,168 @@
+import time
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFormLayout, QCheckBox, QSlider, QLabel, QHBoxLayout
+from PyQt6.QtCore import Qt, QTimer
+
+from core import profiling
+from core.calculation_thread import CalculationThread
+from core.scheduler import scheduler
+from ui.figure_view import StreamingPlot
+
+# Пауза после последнего сдвига ползунка перед пересчетом, мс
+DEBOUNCE_MS = 10
+# Делений ползунка на весь диапазон
+SLIDER_STEPS = 200
+# Диапазон ползунка — от 0 до RANGE_FACTOR × значение поля при включении режима
+RANGE_FACTOR = 2
+
+
+class LiveControls(QWidget):
+    """Живой режим вкладки: ползунки параметров и пересчет на лету.
+
+    Сдвиг ползунка пишет значение в поле ввода и после паузы DEBOUNCE_MS
+    отдает расчет встроенному решателю через планировщик (новый сдвиг
+    отменяет недосчитанный). Результат перерисовывает только видимый
+    график из placements [(вкладка графиков, spec из STREAMS), ...].
+    Обычный полный расчет on_release запускается, когда ползунок отпущен:
+    после перетаскивания или после паузы, если значение сменили клавишами,
+    колесом или щелчком по желобу.
+    """
+
+    def __init__(self, owner, model, inputs, graph_tabs, placements, on_release):
+        super().__init__()
+        self.owner = owner
+        self.model = model
+        self.inputs = inputs
+        self.graph_tabs = graph_tabs
+        self.placements = placements
+        self.on_release = on_release
+        self.sliders = {}
+        self.views = {}
+        self.error_label = None
+        self.moved_at = None
+        self.thread = None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DEBOUNCE_MS)
+        self.timer.timeout.connect(self.on_idle)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.toggle = QCheckBox("🎚 Живой режим (ползунки)")
+        self.toggle.toggled.connect(self.set_enabled)
+        layout.addWidget(self.toggle)
+
+        self.panel = QWidget()
+        self.form = QFormLayout()
+        self.form.setContentsMargins(0, 0, 0, 0)
+        self.panel.setLayout(self.form)
+        self.panel.setVisible(False)
+        layout.addWidget(self.panel)
+        self.setLayout(layout)
+
+    def set_enabled(self, enabled):
+        if not enabled:
+            self.panel.setVisible(False)
+            self.timer.stop()
+            scheduler().cancel(self.owner, "live")
+            return
+
+        # Диапазоны — от текущих значений полей
+        while self.form.rowCount():
+            self.form.removeRow(0)
+        self.sliders = {}
+        # Ошибка живого расчета (например, недопустимое значение) — под ползунками
+        self.error_label = QLabel()
+        self.error_label.setStyleSheet("color: #c0392b;")
+        self.error_label.setWordWrap(True)
+        self.error_label.setVisible(False)
+        for name, field in self.inputs.items():
+            try:
+                value = float(field.text())
+            except ValueError:
+                value = 0.0
+            high = RANGE_FACTOR * value if value > 0 else 1.0
+            slider = QSlider(Qt.Orientation.Horizontal)
+            slider.setRange(0, SLIDER_STEPS)
+            slider.setValue(round(SLIDER_STEPS * min(max(value, 0.0), high) / high))
+            label = QLabel(field.text())
+            label.setMinimumWidth(60)
+            slider.valueChanged.connect(lambda step, name=name, high=high, label=label: self.on_moved(name, step, high, label))
+            slider.sliderReleased.connect(self.on_released)
+
+            row = QHBoxLayout()
+            row.addWidget(slider)
+            row.addWidget(label)
+            self.form.addRow(f"{name}:", row)
+            self.sliders[name] = slider
+        self.form.addRow(self.error_label)
+        self.panel.setVisible(True)
+
+        # Живые графики есть только у placements: показываем первый, если виден другой
+        if self.graph_tabs.currentWidget() not in dict(self.placements):
+            self.graph_tabs.setCurrentWidget(self.placements[0][0])
+
+    def on_moved(self, name, step, high, label):
+        text = f"{high * step / SLIDER_STEPS:.4g}"
+        self.inputs[name].setText(text)
+        label.setText(text)
+        self.moved_at = time.perf_counter()
+        self.timer.start()
+
+    def on_idle(self):
+        # Ползунок еще держат — живой пересчет; иначе значение окончательное
+        if any(slider.isSliderDown() for slider in self.sliders.values()):
+            self.solve()
+        else:
+            self.on_released()
+
+    def on_released(self):
+        # Полный расчет заменяет недосчитанный живой
+        self.timer.stop()
+        self.thread = None
+        scheduler().cancel(self.owner, "live")
+        self.on_release()
+
+    def solve(self):
+        params = [field.text() for field in self.inputs.values()]
+        thread = CalculationThread(*params, model=self.model, backend="native", stream=False)
+        thread.calculation_finished.connect(lambda result, thread=thread: self.on_result(thread, result))
+        thread.calculation_error.connect(lambda error, thread=thread: self.on_error(thread, error))
+        thread.moved_at = self.moved_at
+        self.thread = thread
+        scheduler().submit(self.owner, thread, kind="live", priority=1)
+
+    def on_error(self, thread, error):
+        if thread is self.thread:
+            self.error_label.setText(f"⚠️ {error}")
+            self.error_label.setVisible(True)
+
+    def on_result(self, thread, result):
+        if thread is not self.thread:
+            return
+        self.error_label.setVisible(False)
+        host = self.graph_tabs.currentWidget()
+        spec = dict(self.placements).get(host)
+        if spec is None:
+            return
+
+        view = self.views.get(host)
+        try:
+            alive = view is not None and host.layout().indexOf(view) >= 0
+        except RuntimeError:
+            # Полный расчет уже удалил живой график
+            alive = False
+        if not alive:
+            # Прежнее содержимое вкладки (готовые картинки) заменяется живым графиком
+            layout = host.layout()
+            while layout.count():
+                item = layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+            view = self.views[host] = StreamingPlot(spec)
+            layout.addWidget(view)
+
+        view.replace(result)
+        # Задержка от последнего сдвига ползунка до готового кадра
+        profiling.record("live.latency", thread.moved_at, time.perf_counter() - thread.moved_at)
@@ -0,0 +1,173 @@
+"""Графики системы Лоренца (без зависимости от Qt)."""
+import numpy as np
+from matplotlib.colors import TwoSlopeNorm
+
+
+def draw_time(fig, calc):
+    fig.subplots_adjust(bottom=0.20)
+    ax1 = fig.add_subplot(111)
+    ax1.plot(calc['t_data'], calc['x_data'], label='X(t)', alpha=0.8)
+    ax1.plot(calc['t_data'], calc['y_data'], label='Y(t)', alpha=0.8)
+    ax1.plot(calc['t_data'], calc['z_data'], label='Z(t)', alpha=0.8)
+    ax1.set_title("Динамика переменных во времени")
+    ax1.set_xlabel("Время")
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+
+def draw_attractor(fig, calc):
+    x, y, z = calc['x_data'], calc['y_data'], calc['z_data']
+
+    ax2 = fig.add_subplot(111, projection='3d')
+
+    # Рисуем саму "бабочку"
+    ax2.plot(x, y, z, lw=0.5, color='darkblue')
+
+    # Точки старта и финала
+    ax2.scatter(x[0], y[0], z[0], color='green', s=50, label='Старт')
+    ax2.scatter(x[-1], y[-1], z[-1], color='red', s=50, label='Финал')
+
+    ax2.set_xlabel("X")
+    ax2.set_ylabel("Y")
+    ax2.set_zlabel("Z")
+    ax2.set_title("Фазовая траектория (Аттрактор Лоренца)")
+    ax2.legend()
+
+
+def draw_butterfly(fig, calc):
+    fig.subplots_adjust(bottom=0.20)
+    ax3 = fig.add_subplot(111)
+
+    # Используем логарифмическую шкалу по Y, так как разница растет экспоненциально
+    ax3.semilogy(calc['t_data'], calc['diff_data'], color='red', lw=1.5)
+
+    ax3.set_title("Эффект бабочки: Расхождение траекторий (|X1 - X2|)")
+    ax3.set_xlabel("Время (t)")
+    ax3.set_ylabel("Разность (log масштаб)")
+    ax3.grid(True, which="both", ls="--", alpha=0.5)
+
+    # Добавляем пояснение
+    ax3.text(0.05, 0.95, "Начальное отклонение: 0.00001", transform=ax3.transAxes,
+             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.5))
+
+
+def draw_bifurcation(fig, calc):
+    fig.subplots_adjust(bottom=0.15)
+    ax4 = fig.add_subplot(111)
+
+    # Точек десятки тысяч: пиксельный маркер и прозрачность вместо линий
+    ax4.plot(calc['bif_values'], calc['bif_points'], ',', color='black', alpha=0.3)
+
+    ax4.set_xlabel(calc['bif_param'])
+    if calc['bif_mode'] == 'zmax':
+        ax4.set_ylabel("Локальные максимумы z")
+        ax4.set_title(f"Бифуркационная диаграмма: максимумы z по {calc['bif_param']}")
+    else:
+        ax4.set_ylabel("x в сечении z = ρ - 1")
+        ax4.set_title(f"Бифуркационная диаграмма: сечение Пуанкаре по {calc['bif_param']}")
+    ax4.grid(True, alpha=0.3)
+
+
+def draw_lyapunov(fig, calc):
+    fig.subplots_adjust(bottom=0.15)
+    ax5 = fig.add_subplot(111)
+
+    history = np.array(calc['lyap_history'])
+    for i, color in enumerate(['red', 'green', 'blue']):
+        ax5.plot(calc['lyap_times'], history[:, i], color=color, lw=1.5,
+                 label=f"λ{i + 1} = {calc['lyap_spectrum'][i]:.4f}")
+    ax5.axhline(0, color='black', linestyle='--', alpha=0.5)
+
+    ax5.set_title("Спектр Ляпунова: сходимость оценок")
+    ax5.set_xlabel("Время усреднения")
+    ax5.set_ylabel("Показатель")
+    ax5.set_yscale('symlog', linthresh=1)
+    ax5.legend()
+    ax5.grid(True, alpha=0.3)
+
+
+def draw_chaos_map(fig, calc):
+    ax6 = fig.add_subplot(111)
+
+    values = np.array(calc['map_values'])
+    # Ноль — граница хаоса: положительные значения красные, отрицательные синие
+    norm = TwoSlopeNorm(vcenter=0, vmin=min(values.min(), -1e-3), vmax=max(values.max(), 1e-3))
+    mesh = ax6.pcolormesh(calc['map_sigma'], calc['map_rho'], values, shading='auto', cmap='RdBu_r', norm=norm)
+    fig.colorbar(mesh, ax=ax6, label="λ max")
+
+    ax6.set_title("Карта хаоса: старший показатель Ляпунова")
+    ax6.set_xlabel("σ (sigma)")
+    ax6.set_ylabel("ρ (rho)")
+
+
+def _section_columns(calc):
+    """Столбцы строк {t, x, y, z}, лежащие в плоскости сечения"""
+    names = ['x', 'y', 'z']
+    others = [name for name in names if name != calc['variable']]
+    return others, [1 + names.index(name) for name in others]
+
+
+def draw_section(fig, calc):
+    fig.subplots_adjust(bottom=0.15)
+    ax7 = fig.add_subplot(111)
+
+    points = np.array(calc['crossings']).reshape(-1, 4)
+    (name_u, name_v), (col_u, col_v) = _section_columns(calc)
+    ax7.plot(points[:, col_u], points[:, col_v], '.', color='darkblue', markersize=2)
+
+    ax7.set_title(f"Сечение Пуанкаре {calc['variable']} = {calc['value']:g} ({len(points)} точек)")
+    ax7.set_xlabel(name_u.upper())
+    ax7.set_ylabel(name_v.upper())
+    ax7.grid(True, alpha=0.3)
+
+
+def draw_return_map(fig, calc):
+    fig.subplots_adjust(bottom=0.15)
+    ax8 = fig.add_subplot(111)
+
+    points = np.array(calc['crossings']).reshape(-1, 4)
+    (name_u, _), (col_u, _) = _section_columns(calc)
+    values = points[:, col_u]
+    ax8.plot(values[:-1], values[1:], '.', color='red', markersize=2)
+
+    # Диагональ: неподвижные точки отображения лежат на ней
+    if len(values):
+        lo, hi = values.min(), values.max()
+        ax8.plot([lo, hi], [lo, hi], 'k--', alpha=0.4)
+
+    ax8.set_title(f"Отображение первого возвращения по {name_u.upper()}")
+    ax8.set_xlabel(f"{name_u.upper()}(k)")
+    ax8.set_ylabel(f"{name_u.upper()}(k + 1)")
+    ax8.grid(True, alpha=0.3)
+
+
+# Ключ вкладки -> (размер фигуры, функция отрисовки)
+CHARTS = {
+    "time": ((8, 5), draw_time),
+    "attractor": ((8, 8), draw_attractor),
+    "butterfly": ((7, 4), draw_butterfly),
+}
+
+# Диаграмма строится отдельно от основного расчета и в записи БД не хранится
+BIFURCATION = ((8, 6), draw_bifurcation)
+
+# Анализ Ляпунова: сходимость спектра и карта хаоса
+LYAPUNOV = {
+    "spectrum": ((8, 5), draw_lyapunov),
+    "chaos_map": ((8, 6), draw_chaos_map),
+}
+
+# Сечение Пуанкаре и отображение первого возвращения
+POINCARE = {
+    "section": ((7, 6), draw_section),
+    "return_map": ((7, 6), draw_return_map),
+}
+
+# Живые графики во время расчета: столбцы строк {t, x, y, z, diff}
+STREAMS = {
+    "time": {"labels": ("Время", ""), "lines": [(0, 1, "X(t)"), (0, 2, "Y(t)"), (0, 3, "Z(t)")]},
+    "attractor": {"labels": ("X", "Y", "Z"), "lines": [(1, 2, 3, None)]},
+}
+
+# Анимация траектории при экспорте в видео/GIF
+ANIMATION = {"columns": ("x_data", "y_data", "z_data"), "labels": ("X", "Y", "Z")}
@@ -2,8 +2,8 @@ import uuid
 import numpy as np
 from datetime import datetime
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QFormLayout, QLabel,
-    QLineEdit, QPushButton, QProgressBar, QMessageBox, QTabWidget
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel,
+    QLineEdit, QPushButton, QProgressBar, QMessageBox, QTabWidget, QComboBox
 )
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
@@ -12,17 +12,31 @@ from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as Navigation
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D  # Необходимо для 3D
 
+from core.bifurcation_thread import BifurcationThread
 from core.calculation_thread import CalculationThread
+from core.lyapunov_thread import LyapunovThread
+from core.poincare_thread import PoincareThread
 from core.database import save_calculation, load_calculation
+from core.models import MODELS
+from core.profiling import span
+from core.scheduler import scheduler
+from ui.figure_view import show_charts, start_streams
+from ui.lorenz_charts import BIFURCATION, CHARTS, LYAPUNOV, POINCARE, STREAMS
 
 
 class LorenzTab(QWidget):
     """Вкладка: Аттрактор Лоренца (Детерминированный хаос)"""
 
+    MODEL = MODELS["lorenz"]
+    MODEL_NAME = MODEL.title
+
     def __init__(self):
         super().__init__()
         self.t_data, self.x_data, self.y_data, self.z_data = [], [], [], []
+        self.diff_data = []
         self.calculation_thread = None
+        self.render_thread = None
+        self.stream_views = None
         self.current_calc_id = None
         self.init_ui()
 
@@ -73,6 +87,15 @@ class LorenzTab(QWidget):
         self.graph_tabs.addTab(self.phase_tab, "3D Фазовый портрет (Аттрактор)")
         self.graph_tabs.addTab(self.butterfly_tab, "Эффект бабочки")
 
+        self.bifurcation_panel = BifurcationPanel(self.base_params)
+        self.graph_tabs.addTab(self.bifurcation_panel, "Бифуркационная диаграмма")
+
+        self.lyapunov_panel = LyapunovPanel(self.base_params)
+        self.graph_tabs.addTab(self.lyapunov_panel, "Показатели Ляпунова")
+
+        self.poincare_panel = PoincarePanel(self.base_params)
+        self.graph_tabs.addTab(self.poincare_panel, "Сечение Пуанкаре")
+
         layout.addWidget(title)
         layout.addLayout(form_layout)
         layout.addWidget(self.progress_bar)
@@ -96,17 +119,20 @@ class LorenzTab(QWidget):
                 QMessageBox.warning(self, "Предупреждение", "Заполните все поля!")
                 return
 
-            self.calc_button.setEnabled(False)
             self.calc_button.setText("⏳ Вычисление...")
             self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 0)
+            self.stream_views = None
 
             self.calculation_thread = CalculationThread(
                 sig, rho, bet, x0, y0, z0, t_max,
-                model="lorenz"
+                model=self.MODEL.key
             )
             self.calculation_thread.calculation_finished.connect(self.on_finished)
             self.calculation_thread.calculation_error.connect(self.on_error)
-            self.calculation_thread.start()
+            self.calculation_thread.calculation_chunk.connect(self.on_chunk)
+            self.calculation_thread.calculation_progress.connect(self.on_progress)
+            scheduler().submit(self, self.calculation_thread)
         except Exception as e:
             self.on_error(str(e))
 
@@ -114,83 +140,73 @@ class LorenzTab(QWidget):
         self.calc_button.setEnabled(True)
         self.calc_button.setText("Рассчитать")
         self.progress_bar.setVisible(False)
+        self.stream_views = None
 
-        self.t_data = [float(r[0]) for r in result]
-        self.x_data = [float(r[1]) for r in result]
-        self.y_data = [float(r[2]) for r in result]
-        self.z_data = [float(r[3]) for r in result]
-
-        self.diff_data = [float(r[4]) for r in result]
+        # Столбцы строк -> атрибуты *_data по схеме модели
+        with span("result.convert", model=self.MODEL.key):
+            for key, values in self.MODEL.columns_of(result).items():
+                setattr(self, key, values)
 
         self.plot_graphs()
 
+    def on_chunk(self, rows):
+        """Дорисовывает графики по мере прихода строк от решателя"""
+        if self.stream_views is None:
+            self.stream_views = start_streams(self, [
+                (self.time_tab, STREAMS["time"]),
+                (self.phase_tab, STREAMS["attractor"]),
+            ])
+        for view in self.stream_views:
+            view.append(rows)
+
+    def on_progress(self, percent):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+
     def on_error(self, error):
         self.calc_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         QMessageBox.critical(self, "Ошибка: \n{error}")
 
+    def base_params(self):
+        """Параметры и начальные условия из формы (основа для диаграммы)"""
+        return {
+            'sigma': float(self.sigma_input.text()),
+            'rho': float(self.rho_input.text()),
+            'beta': float(self.beta_input.text()),
+            'x0': float(self.x0_input.text()),
+            'y0': float(self.y0_input.text()),
+            'z0': float(self.z0_input.text()),
+        }
+
+    def current_record(self):
+        """Параметры и данные текущего расчета в формате записи БД"""
+        return {
+            'sigma': float(self.sigma_input.text()),
+            'rho': float(self.rho_input.text()),
+            'beta': float(self.beta_input.text()),
+            'x0': float(self.x0_input.text()),
+            'y0': float(self.y0_input.text()),
+            'z0': float(self.z0_input.text()),
+            't_max': float(self.t_max_input.text()),
+            't_data': self.t_data,
+            'x_data': self.x_data,
+            'y_data': self.y_data,
+            'z_data': self.z_data,
+            'diff_data': self.diff_data  # <-- Сохраняем разность для бабочки
+        }
+
     def plot_graphs(self):
         for tab in self.tabs_list:
             layout = tab.layout()
             while layout.count():
                 layout.takeAt(0).widget().deleteLater()
 
-        # 1. Временные ряды
-        fig1 = Figure(figsize=(8, 5))
-        fig1.subplots_adjust(bottom=0.20)
-        canvas1 = FigureCanvas(fig1)
-        ax1 = fig1.add_subplot(111)
-        ax1.plot(self.t_data, self.x_data, label='X(t)', alpha=0.8)
-        ax1.plot(self.t_data, self.y_data, label='Y(t)', alpha=0.8)
-        ax1.plot(self.t_data, self.z_data, label='Z(t)', alpha=0.8)
-        ax1.set_title("Динамика переменных во времени")
-        ax1.set_xlabel("Время")
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        self.time_tab.layout().addWidget(NavigationToolbar(canvas1, self))
-        self.time_tab.layout().addWidget(canvas1)
-
-        # 2. 3D Аттрактор
-        fig2 = Figure(figsize=(8, 8))
-        canvas2 = FigureCanvas(fig2)
-        ax2 = fig2.add_subplot(111, projection='3d')
-
-        # Рисуем саму "бабочку"
-        ax2.plot(self.x_data, self.y_data, self.z_data, lw=0.5, color='darkblue')
-
-        # Точки старта и финала
-        ax2.scatter(self.x_data[0], self.y_data[0], self.z_data[0], color='green', s=50, label='Старт')
-        ax2.scatter(self.x_data[-1], self.y_data[-1], self.z_data[-1], color='red', s=50, label='Финал')
-
-        ax2.set_xlabel("X")
-        ax2.set_ylabel("Y")
-        ax2.set_zlabel("Z")
-        ax2.set_title("Фазовая траектория (Аттрактор Лоренца)")
-        ax2.legend()
-
-        self.phase_tab.layout().addWidget(NavigationToolbar(canvas2, self))
-        self.phase_tab.layout().addWidget(canvas2)
-
-        # ГРАФИК ЭФФЕКТА БАБОЧКИ
-        fig3 = Figure(figsize=(7, 4))
-        fig3.subplots_adjust(bottom=0.20)
-        canvas3 = FigureCanvas(fig3)
-        ax3 = fig3.add_subplot(111)
-
-        # Используем логарифмическую шкалу по Y, так как разница растет экспоненциально
-        ax3.semilogy(self.t_data, self.diff_data, color='red', lw=1.5)
-
-        ax3.set_title("Эффект бабочки: Расхождение траекторий (|X1 - X2|)")
-        ax3.set_xlabel("Время (t)")
-        ax3.set_ylabel("Разность (log масштаб)")
-        ax3.grid(True, which="both", ls="--", alpha=0.5)
-
-        # Добавляем пояснение
-        ax3.text(0.05, 0.95, "Начальное отклонение: 0.00001", transform=ax3.transAxes,
-                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.5))
-
-        self.butterfly_tab.layout().addWidget(NavigationToolbar(canvas3, self))
-        self.butterfly_tab.layout().addWidget(canvas3)
+        show_charts(self, self.current_record(), [
+            (self.time_tab, CHARTS["time"]),
+            (self.phase_tab, CHARTS["attractor"]),
+            (self.butterfly_tab, CHARTS["butterfly"]),
+        ])
 
     def save_current_calculation(self):
         if not self.t_data: return False
@@ -198,20 +214,9 @@ class LorenzTab(QWidget):
 
         calc_data = {
             'id': self.current_calc_id,
-            'model_name': 'Система Лоренца',
-            'sigma': float(self.sigma_input.text()),
-            'rho': float(self.rho_input.text()),
-            'beta': float(self.beta_input.text()),
-            'x0': float(self.x0_input.text()),
-            'y0': float(self.y0_input.text()),
-            'z0': float(self.z0_input.text()),
-            't_max': float(self.t_max_input.text()),
+            'model_name': self.MODEL_NAME,
             'timestamp': datetime.now().isoformat(),
-            't_data': self.t_data,
-            'x_data': self.x_data,
-            'y_data': self.y_data,
-            'z_data': self.z_data,
-            'diff_data': self.diff_data  # <-- Сохраняем разность для бабочки
+            **self.current_record()
         }
         result = save_calculation(calc_data)
         QMessageBox.information(self, "Сохранение", result)
@@ -239,4 +244,339 @@ class LorenzTab(QWidget):
 
                 self.plot_graphs()
             return True
-        return False
\ No newline at end of file
+        return False
+
+
+class BifurcationPanel(QWidget):
+    """Бифуркационная диаграмма: перебор одного параметра при остальных из формы"""
+
+    PARAMS = {"ρ (rho)": "rho", "σ (sigma)": "sigma", "β (beta)": "beta"}
+    MODES = {"Максимумы z": "zmax", "Сечение Пуанкаре z = ρ - 1": "section"}
+
+    def __init__(self, base_params):
+        super().__init__()
+        self.base_params = base_params
+        self.bifurcation_thread = None
+        self.render_thread = None
+
+        layout = QVBoxLayout()
+        controls = QHBoxLayout()
+
+        self.param_combo = QComboBox()
+        self.param_combo.addItems(list(self.PARAMS))
+        self.from_input = QLineEdit("1")
+        self.to_input = QLineEdit("200")
+        self.count_input = QLineEdit("2000")
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(list(self.MODES))
+
+        self.calc_button = QPushButton("Построить")
+        self.calc_button.clicked.connect(self.on_calculate)
+        self.stop_button = QPushButton("Стоп")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.on_stop)
+
+        for label, widget in [("Параметр:", self.param_combo), ("от", self.from_input), ("до", self.to_input),
+                              ("значений:", self.count_input), ("", self.mode_combo)]:
+            if label:
+                controls.addWidget(QLabel(label))
+            controls.addWidget(widget)
+        controls.addWidget(self.calc_button)
+        controls.addWidget(self.stop_button)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+
+        self.chart_tab = QWidget()
+        self.chart_tab.setLayout(QVBoxLayout())
+
+        layout.addLayout(controls)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.chart_tab, 1)
+        self.setLayout(layout)
+
+    def on_calculate(self):
+        try:
+            base = self.base_params()
+            values = np.linspace(float(self.from_input.text()), float(self.to_input.text()),
+                                 int(self.count_input.text()))
+            self.param = self.PARAMS[self.param_combo.currentText()]
+            self.mode = self.MODES[self.mode_combo.currentText()]
+
+            self.calc_button.setEnabled(False)
+            self.calc_button.setText("⏳ Вычисление...")
+            self.stop_button.setEnabled(True)
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setValue(0)
+
+            self.bifurcation_thread = BifurcationThread(self.param, values, base, self.mode)
+            self.bifurcation_thread.task_progress.connect(self.progress_bar.setValue)
+            self.bifurcation_thread.task_finished.connect(self.on_finished)
+            self.bifurcation_thread.task_error.connect(self.on_error)
+            self.bifurcation_thread.finished.connect(self.on_thread_done)
+            scheduler().submit(self, self.bifurcation_thread)
+        except Exception as e:
+            self.on_thread_done()
+            QMessageBox.critical(self, "Ошибка", f"Не удалось построить диаграмму:\n{e}")
+
+    def on_stop(self):
+        # Из очереди поток снимается без запуска — finished от него не придет
+        if not scheduler().cancel(self):
+            self.on_thread_done()
+
+    def on_thread_done(self):
+        self.calc_button.setEnabled(True)
+        self.calc_button.setText("Построить")
+        self.stop_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+
+    def on_error(self, error):
+        QMessageBox.critical(self, "Ошибка", f"Не удалось построить диаграмму:\n{error}")
+
+    def on_finished(self, result):
+        values, points = result
+        layout = self.chart_tab.layout()
+        while layout.count():
+            layout.takeAt(0).widget().deleteLater()
+
+        calc = {'bif_param': self.param, 'bif_mode': self.mode, 'bif_values': values, 'bif_points': points}
+        show_charts(self, calc, [(self.chart_tab, BIFURCATION)])
+
+
+class LyapunovPanel(QWidget):
+    """Спектр Ляпунова для параметров из формы и карта хаоса по сетке (sigma, rho)"""
+
+    def __init__(self, base_params):
+        super().__init__()
+        self.base_params = base_params
+        self.lyapunov_thread = None
+        self.render_thread = None
+
+        layout = QVBoxLayout()
+
+        # ---------- Спектр ----------
+        spectrum_row = QHBoxLayout()
+        self.spectrum_button = QPushButton("Спектр для текущих параметров")
+        self.spectrum_button.clicked.connect(self.on_spectrum)
+        self.spectrum_label = QLabel("")
+        spectrum_row.addWidget(self.spectrum_button)
+        spectrum_row.addWidget(self.spectrum_label, 1)
+
+        # ---------- Карта хаоса ----------
+        map_row = QHBoxLayout()
+        self.sigma_from = QLineEdit("1")
+        self.sigma_to = QLineEdit("20")
+        self.rho_from = QLineEdit("1")
+        self.rho_to = QLineEdit("60")
+        self.grid_input = QLineEdit("40")
+        for label, widget in [("σ от", self.sigma_from), ("до", self.sigma_to), ("ρ от", self.rho_from),
+                              ("до", self.rho_to), ("точек на ось:", self.grid_input)]:
+            map_row.addWidget(QLabel(label))
+            map_row.addWidget(widget)
+        self.map_button = QPushButton("Карта хаоса")
+        self.map_button.clicked.connect(self.on_map)
+        self.stop_button = QPushButton("Стоп")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.on_stop)
+        map_row.addWidget(self.map_button)
+        map_row.addWidget(self.stop_button)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+
+        self.chart_tabs = QTabWidget()
+        self.spectrum_tab = QWidget()
+        self.map_tab = QWidget()
+        for tab in [self.spectrum_tab, self.map_tab]:
+            tab.setLayout(QVBoxLayout())
+        self.chart_tabs.addTab(self.spectrum_tab, "Сходимость спектра")
+        self.chart_tabs.addTab(self.map_tab, "Карта хаоса")
+
+        layout.addLayout(spectrum_row)
+        layout.addLayout(map_row)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.chart_tabs, 1)
+        self.setLayout(layout)
+
+    def start(self, mode, **params):
+        self.spectrum_button.setEnabled(False)
+        self.map_button.setEnabled(False)
+        self.stop_button.setEnabled(True)
+        self.progress_bar.setVisible(True)
+        # Спектр считается одним ансамблем — прогресс неизвестен
+        self.progress_bar.setRange(0, 0 if mode == "spectrum" else 100)
+        self.progress_bar.setValue(0)
+
+        self.lyapunov_thread = LyapunovThread(mode, **params)
+        self.lyapunov_thread.task_progress.connect(self.progress_bar.setValue)
+        self.lyapunov_thread.task_finished.connect(self.on_finished)
+        self.lyapunov_thread.task_error.connect(self.on_error)
+        self.lyapunov_thread.finished.connect(self.on_thread_done)
+        scheduler().submit(self, self.lyapunov_thread)
+
+    def on_spectrum(self):
+        try:
+            base = self.base_params()
+            self.start("spectrum", sigma=base['sigma'], rho=base['rho'], beta=base['beta'],
+                       x0=base['x0'], y0=base['y0'], z0=base['z0'])
+        except Exception as e:
+            self.on_error(str(e))
+
+    def on_map(self):
+        try:
+            base = self.base_params()
+            n = int(self.grid_input.text())
+            self.start("map",
+                       sigma_values=np.linspace(float(self.sigma_from.text()), float(self.sigma_to.text()), n),
+                       rho_values=np.linspace(float(self.rho_from.text()), float(self.rho_to.text()), n),
+                       beta=base['beta'], start=(base['x0'], base['y0'], base['z0']))
+        except Exception as e:
+            self.on_error(str(e))
+
+    def on_stop(self):
+        # Из очереди поток снимается без запуска — finished от него не придет
+        if not scheduler().cancel(self):
+            self.on_thread_done()
+
+    def on_thread_done(self):
+        self.spectrum_button.setEnabled(True)
+        self.map_button.setEnabled(True)
+        self.stop_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+
+    def on_error(self, error):
+        self.on_thread_done()
+        QMessageBox.critical(self, "Ошибка", f"Не удалось рассчитать показатели Ляпунова:\n{error}")
+
+    def on_finished(self, result):
+        if 'lyap_spectrum' in result:
+            spectrum = result['lyap_spectrum']
+            # Размерность Каплана–Йорке: j + (λ1 + ... + λj) / |λ(j+1)|
+            partial = np.cumsum(spectrum)
+            j = int(np.sum(partial >= 0))
+            dimension = j + partial[j - 1] / abs(spectrum[j]) if 0 < j < len(spectrum) else float(j)
+            self.spectrum_label.setText(
+                "  ".join(f"λ{i + 1} = {value:.4f}" for i, value in enumerate(spectrum))
+                + f"   |   D(KY) = {dimension:.3f}")
+            host, chart = self.spectrum_tab, LYAPUNOV["spectrum"]
+        else:
+            host, chart = self.map_tab, LYAPUNOV["chaos_map"]
+
+        layout = host.layout()
+        while layout.count():
+            layout.takeAt(0).widget().deleteLater()
+        self.chart_tabs.setCurrentWidget(host)
+        show_charts(self, result, [(host, chart)])
+
+
+class PoincarePanel(QWidget):
+    """Сечение Пуанкаре плоскостью {x, y, z} = const и отображение первого возвращения"""
+
+    DIRECTIONS = {"Снизу вверх": 1, "Сверху вниз": -1, "В обе стороны": 0}
+
+    def __init__(self, base_params):
+        super().__init__()
+        self.base_params = base_params
+        self.poincare_thread = None
+        self.render_thread = None
+        self.crossings = []
+
+        layout = QVBoxLayout()
+        controls = QHBoxLayout()
+
+        self.variable_combo = QComboBox()
+        self.variable_combo.addItems(["z", "x", "y"])
+        self.value_input = QLineEdit()
+        self.value_input.setPlaceholderText("ρ - 1")
+        self.direction_combo = QComboBox()
+        self.direction_combo.addItems(list(self.DIRECTIONS))
+        self.t_max_input = QLineEdit("1000")
+
+        self.calc_button = QPushButton("Построить")
+        self.calc_button.clicked.connect(self.on_calculate)
+        self.stop_button = QPushButton("Стоп")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.on_stop)
+
+        for label, widget in [("Плоскость:", self.variable_combo), ("=", self.value_input),
+                              ("", self.direction_combo), ("T:", self.t_max_input)]:
+            if label:
+                controls.addWidget(QLabel(label))
+            controls.addWidget(widget)
+        controls.addWidget(self.calc_button)
+        controls.addWidget(self.stop_button)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+
+        self.chart_tabs = QTabWidget()
+        self.section_tab = QWidget()
+        self.return_tab = QWidget()
+        for tab in [self.section_tab, self.return_tab]:
+            tab.setLayout(QVBoxLayout())
+        self.chart_tabs.addTab(self.section_tab, "Сечение")
+        self.chart_tabs.addTab(self.return_tab, "Отображение возвращения")
+
+        layout.addLayout(controls)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.chart_tabs, 1)
+        self.setLayout(layout)
+
+    def on_calculate(self):
+        try:
+            base = self.base_params()
+            self.variable = self.variable_combo.currentText()
+            # По умолчанию — плоскость через неподвижные точки C± (z = ρ - 1)
+            text = self.value_input.text().strip()
+            self.value = float(text) if text else base['rho'] - 1
+
+            params = dict(base, t_max=0)
+            self.crossings = []
+
+            self.calc_button.setEnabled(False)
+            self.calc_button.setText("⏳ Вычисление...")
+            self.stop_button.setEnabled(True)
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setValue(0)
+
+            self.poincare_thread = PoincareThread("lorenz", params, self.variable, self.value,
+                                                  self.DIRECTIONS[self.direction_combo.currentText()],
+                                                  float(self.t_max_input.text()))
+            self.poincare_thread.section_chunk.connect(self.on_chunk)
+            self.poincare_thread.task_error.connect(self.on_error)
+            self.poincare_thread.finished.connect(self.on_thread_done)
+            scheduler().submit(self, self.poincare_thread)
+        except Exception as e:
+            self.on_error(str(e))
+
+    def on_chunk(self, points, percent):
+        self.crossings.extend(points)
+        self.progress_bar.setValue(percent)
+        self.plot_graphs()
+
+    def on_stop(self):
+        # Из очереди поток снимается без запуска — finished от него не придет
+        if not scheduler().cancel(self):
+            self.on_thread_done()
+
+    def on_thread_done(self):
+        self.calc_button.setEnabled(True)
+        self.calc_button.setText("Построить")
+        self.stop_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+
+    def on_error(self, error):
+        self.on_thread_done()
+        QMessageBox.critical(self, "Ошибка", f"Не удалось построить сечение:\n{error}")
+
+    def plot_graphs(self):
+        for tab in [self.section_tab, self.return_tab]:
+            layout = tab.layout()
+            while layout.count():
+                layout.takeAt(0).widget().deleteLater()
+
+        calc = {'crossings': list(self.crossings), 'variable': self.variable, 'value': self.value}
+        show_charts(self, calc, [
+            (self.section_tab, POINCARE["section"]),
+            (self.return_tab, POINCARE["return_map"]),
+        ])
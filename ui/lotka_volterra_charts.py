@@ -0,0 +1,62 @@
+"""Графики модели Лотки–Вольтерра.
+
+Функции рисуют в переданную фигуру по записи расчета (параметры + данные)
+и не зависят от Qt, поэтому годятся и для фоновой, и для пакетной отрисовки.
+"""
+from core import field_cache
+from ui.event_markers import mark_events
+
+
+def draw_time(fig, calc):
+    fig.subplots_adjust(bottom=0.20)
+    ax1 = fig.add_subplot(111)
+    ax1.plot(calc['t_data'], calc['x_data'], label="Жертвы", color='blue')
+    ax1.plot(calc['t_data'], calc['y_data'], label="Хищники", color='red')
+    mark_events(ax1, calc, ["x_peak"], "x", color='navy')
+    mark_events(ax1, calc, ["y_peak"], "y", color='darkred')
+    ax1.set_xlabel("t")
+    ax1.set_ylabel("Популяция")
+    ax1.legend()
+    ax1.grid(True)
+
+
+def draw_phase(fig, calc):
+    fig.subplots_adjust(bottom=0.20)
+    ax2 = fig.add_subplot(111)
+    ax2.plot(calc['x_data'], calc['y_data'], color='green')
+    ax2.set_xlabel("Жертвы")
+    ax2.set_ylabel("Хищники")
+    ax2.set_title("Фазовый портрет")
+    ax2.grid(True)
+
+
+def draw_vector(fig, calc):
+    x, y = calc['x_data'], calc['y_data']
+
+    fig.subplots_adjust(bottom=0.20)
+    ax3 = fig.add_subplot(111)
+    # Область округляется, чтобы смена начальных условий не сбрасывала кэш поля
+    extent = field_cache.snap_extent(min(x) * 0.8, max(x) * 1.2, min(y) * 0.8, max(y) * 1.2)
+    params = (calc['alpha'], calc['beta'], calc['gamma'], calc['delta'])
+    X, Y, U, V = field_cache.vector_field("lotka", params, extent, 20)
+    ax3.quiver(X, Y, U, V, color='red', alpha=0.5)
+    ax3.plot(x, y, color='green')
+    ax3.set_xlabel("Жертвы")
+    ax3.set_ylabel("Хищники")
+
+
+# Ключ вкладки -> (размер фигуры, функция отрисовки)
+CHARTS = {
+    "time": ((7, 4), draw_time),
+    "phase": ((7, 4), draw_phase),
+    "vector": ((7, 4), draw_vector),
+}
+
+# Живые графики во время расчета: столбцы строк {t, x, y}
+STREAMS = {
+    "time": {"labels": ("t", "Популяция"), "lines": [(0, 1, "Жертвы"), (0, 2, "Хищники")]},
+    "phase": {"labels": ("Жертвы", "Хищники"), "lines": [(1, 2, None)]},
+}
+
+# Анимация траектории при экспорте в видео/GIF
+ANIMATION = {"columns": ("x_data", "y_data"), "labels": ("Жертвы", "Хищники")}
@@ -14,20 +14,34 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 
+from core.animation_export import frame_indices
 from core.calculation_thread import CalculationThread
 from core.database import save_calculation, load_calculation
+from core.models import MODELS
+from core.profiling import span
+from core.scheduler import scheduler
+from ui.figure_view import show_charts, start_streams
+from ui.live_controls import LiveControls
+from ui.lotka_volterra_charts import CHARTS, STREAMS
 
 
 class LotkaVolterraTab(QWidget):
     """Вкладка: Модель Лотки–Вольтерра"""
 
+    MODEL = MODELS["lotka"]
+    MODEL_NAME = MODEL.title
+
     def __init__(self):
         super().__init__()
         # Инициализация переменных ДО интерфейса
         self.t_data = []
+        # События расчета (пики популяций) для отметок на графиках
+        self.events = []
         self.x_data = []
         self.y_data = []
         self.calculation_thread = None
+        self.render_thread = None
+        self.stream_views = None
         self.current_calc_id = None
         self.is_animating = False
         self.current_frame = 0
@@ -83,45 +97,81 @@ class LotkaVolterraTab(QWidget):
         layout.addLayout(form_layout)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.calc_button)
+        self.live_controls = LiveControls(
+            self, self.MODEL.key, {name: getattr(self, f"{name}_input") for name in self.MODEL.param_names},
+            self.graph_tabs, [(self.time_tab, STREAMS["time"]), (self.phase_tab, STREAMS["phase"])], self.on_calculate)
+        layout.addWidget(self.live_controls)
         layout.addWidget(self.graph_tabs)
 
         self.setLayout(layout)
 
     def on_calculate(self):
-        if self.calculation_thread and self.calculation_thread.isRunning():
-            return
         try:
             params = [self.alpha_input.text(), self.beta_input.text(), self.gamma_input.text(),
                       self.delta_input.text(), self.x0_input.text(), self.y0_input.text()]
             if not all(params):
                 QMessageBox.warning(self, "Предупреждение", "Заполните все поля!")
                 return
-            self.calc_button.setEnabled(False)
+            # Кнопка не блокируется: новое нажатие заменяет идущий расчет (core.scheduler)
             self.calc_button.setText("⏳ Вычисление...")
             self.progress_bar.setVisible(True)
-            self.calculation_thread = CalculationThread(*params, model="lotka")
+            self.progress_bar.setRange(0, 0)
+            self.stream_views = None
+            self.calculation_thread = CalculationThread(*params, model=self.MODEL.key)
+            self.calculation_thread.calculation_events.connect(self.on_events)
             self.calculation_thread.calculation_finished.connect(self.on_finished)
             self.calculation_thread.calculation_error.connect(self.on_error)
-            self.calculation_thread.start()
+            self.calculation_thread.calculation_chunk.connect(self.on_chunk)
+            self.calculation_thread.calculation_progress.connect(self.on_progress)
+            scheduler().submit(self, self.calculation_thread)
         except Exception as e:
             self.on_error(str(e))
 
+    def on_chunk(self, rows):
+        """Дорисовывает графики по мере прихода строк от решателя"""
+        if self.stream_views is None:
+            self.stream_views = start_streams(self, [
+                (self.time_tab, STREAMS["time"]),
+                (self.phase_tab, STREAMS["phase"]),
+            ])
+        for view in self.stream_views:
+            view.append(rows)
+
+    def on_progress(self, percent):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+
     def on_error(self, error):
         self.calc_button.setEnabled(True)
         self.calc_button.setText("Рассчитать")
         self.progress_bar.setVisible(False)
         QMessageBox.critical(self, "Ошибка", f"Ошибка расчета: {error}")
 
+    def on_events(self, events):
+        self.events = events
+
     def on_finished(self, result):
         self.calc_button.setEnabled(True)
         self.calc_button.setText("Рассчитать")
         self.progress_bar.setVisible(False)
-        self.t_data = [float(row[0]) for row in result]
-        self.x_data = [float(row[1]) for row in result]
-        self.y_data = [float(row[2]) for row in result]
+        self.stream_views = None
+        # Столбцы строк -> атрибуты *_data по схеме модели
+        with span("result.convert", model=self.MODEL.key):
+            for key, values in self.MODEL.columns_of(result).items():
+                setattr(self, key, values)
         self.plot_graphs(self.t_data, self.x_data, self.y_data)
         self.create_animation(self.t_data, self.x_data, self.y_data)
 
+    def current_record(self):
+        """Параметры и данные текущего расчета в формате записи БД"""
+        return {
+            'alpha': float(self.alpha_input.text()), 'beta': float(self.beta_input.text()),
+            'gamma': float(self.gamma_input.text()), 'delta': float(self.delta_input.text()),
+            'x0': float(self.x0_input.text()), 'y0': float(self.y0_input.text()),
+            't_data': self.t_data, 'x_data': self.x_data, 'y_data': self.y_data,
+            'events': self.events
+        }
+
     def plot_graphs(self, t, x, y):
         for tab in [self.time_tab, self.phase_tab, self.vector_tab]:
             layout = tab.layout()
@@ -129,44 +179,14 @@ class LotkaVolterraTab(QWidget):
                 item = layout.takeAt(0)
                 if item.widget(): item.widget().deleteLater()
 
-        fig_time = Figure(figsize=(7, 4))
-        fig_time.subplots_adjust(bottom=0.20)
-        canvas_time = FigureCanvas(fig_time)
-        ax1 = fig_time.add_subplot(111)
-        ax1.plot(t, x, label="Жертвы", color='blue')
-        ax1.plot(t, y, label="Хищники", color='red')
-        ax1.set_xlabel("t");
-        ax1.set_ylabel("Популяция");
-        ax1.legend();
-        ax1.grid(True)
-        self.time_tab.layout().addWidget(NavigationToolbar(canvas_time, self))
-        self.time_tab.layout().addWidget(canvas_time)
-
-        fig_phase = Figure(figsize=(7, 4))
-        fig_phase.subplots_adjust(bottom=0.20)
-        canvas_phase = FigureCanvas(fig_phase)
-        ax2 = fig_phase.add_subplot(111)
-        ax2.plot(x, y, color='green')
-        ax2.set_xlabel("Жертвы");
-        ax2.set_ylabel("Хищники");
-        ax2.set_title("Фазовый портрет");
-        ax2.grid(True)
-        self.phase_tab.layout().addWidget(NavigationToolbar(canvas_phase, self))
-        self.phase_tab.layout().addWidget(canvas_phase)
-
-        fig_vec = Figure(figsize=(7, 4))
-        fig_vec.subplots_adjust(bottom=0.20)
-        canvas_vec = FigureCanvas(fig_vec)
-        ax3 = fig_vec.add_subplot(111)
-        X, Y = np.meshgrid(np.linspace(min(x) * 0.8, max(x) * 1.2, 20), np.linspace(min(y) * 0.8, max(y) * 1.2, 20))
-        U = float(self.alpha_input.text()) * X - float(self.beta_input.text()) * X * Y
-        V = float(self.delta_input.text()) * X * Y - float(self.gamma_input.text()) * Y
-        ax3.quiver(X, Y, U, V, color='red', alpha=0.5)
-        ax3.plot(x, y, color='green')
-        ax3.set_xlabel("Жертвы");
-        ax3.set_ylabel("Хищники")
-        self.vector_tab.layout().addWidget(NavigationToolbar(canvas_vec, self))
-        self.vector_tab.layout().addWidget(canvas_vec)
+        calc = self.current_record()
+        calc.update({'t_data': t, 'x_data': x, 'y_data': y})
+
+        show_charts(self, calc, [
+            (self.time_tab, CHARTS["time"]),
+            (self.phase_tab, CHARTS["phase"]),
+            (self.vector_tab, CHARTS["vector"]),
+        ])
 
     def create_animation(self, t, x, y):
         # 1. Остановка таймера и сброс состояния
@@ -175,6 +195,8 @@ class LotkaVolterraTab(QWidget):
 
         self.is_animating = False
         self.current_frame = 0
+        # Кадры — равномерно по времени: сетка выдачи может быть неравномерной
+        self.anim_frames = frame_indices(t, len(t))
 
         # 2. Полная очистка layout
         layout = self.animation_tab.layout()
@@ -268,7 +290,7 @@ class LotkaVolterraTab(QWidget):
         """Безопасное обновление кадра анимации"""
         if not self.t_data or not hasattr(self, 'anim_line'):
             return
-        idx = self.current_frame
+        idx = self.anim_frames[self.current_frame]
         try:
             self.anim_line.set_data(self.x_data[:idx + 1], self.y_data[:idx + 1])
             self.anim_point.set_data([self.x_data[idx]], [self.y_data[idx]])
@@ -288,7 +310,7 @@ class LotkaVolterraTab(QWidget):
     def advance_animation(self):
         if self.t_data:
             self.current_frame += 1
-            if self.current_frame >= len(self.t_data):
+            if self.current_frame >= len(self.anim_frames):
                 self.current_frame = 0
             self.update_anim_view()
 
@@ -319,12 +341,9 @@ class LotkaVolterraTab(QWidget):
         if not self.t_data: return False
         if not self.current_calc_id: self.current_calc_id = str(uuid.uuid4())
         data = {
-            'id': self.current_calc_id, 'model_name': 'Лотка-Вольтерра',
-            'alpha': float(self.alpha_input.text()), 'beta': float(self.beta_input.text()),
-            'gamma': float(self.gamma_input.text()), 'delta': float(self.delta_input.text()),
-            'x0': float(self.x0_input.text()), 'y0': float(self.y0_input.text()),
+            'id': self.current_calc_id, 'model_name': self.MODEL_NAME,
             'timestamp': datetime.now().isoformat(),
-            't_data': self.t_data, 'x_data': self.x_data, 'y_data': self.y_data
+            **self.current_record()
         }
         QMessageBox.information(self, "Сохранение", save_calculation(data))
         return True
@@ -340,6 +359,7 @@ class LotkaVolterraTab(QWidget):
             self.x0_input.setText(str(calc.get('x0', '10')))
             self.y0_input.setText(str(calc.get('y0', '5')))
             self.t_data, self.x_data, self.y_data = calc['t_data'], calc['x_data'], calc['y_data']
+            self.events = calc.get('events', [])
             self.plot_graphs(self.t_data, self.x_data, self.y_data)
             self.create_animation(self.t_data, self.x_data, self.y_data)
             return True
@@ -6,8 +6,17 @@ from ui.placeholders import create_placeholder_tab
 from core.database import get_all_calculations, clear_all
 from ui.competing_species_tab import CompetingSpeciesTab
 from ui.SIR_tab import SIRTab
+from ui.sweep_tab import SweepTab
+from ui.stability_tab import StabilityTab
 from core.database import load_calculation
+from core.export_thread import AnimationExportThread, BatchExportThread
+from ui.batch_export_dialog import BatchExportDialog
+from ui.charts import charts_for
+from ui.perf_dialog import PerformanceDialog, REFRESH_INTERVAL, status_text
+from core.profiling import timed
+from core.scheduler import scheduler
 from datetime import datetime
+import config
 
 
 from functools import partial
@@ -17,19 +26,41 @@ from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QLineEdit, QPushButton, QSpacerItem,
-    QSizePolicy, QTabWidget, QProgressBar, QMessageBox, QMainWindow, QMessageBox, QMenuBar, QApplication
+    QSizePolicy, QTabWidget, QProgressBar, QMessageBox, QMainWindow, QMessageBox, QMenuBar, QApplication,
+    QFileDialog, QProgressDialog
 )
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QActionGroup
 
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
 
 class MainWindow(QMainWindow):
+    # Точки вывода встроенного решателя: подпись -> config.OUTPUT_TOLERANCE
+    OUTPUT_MODES = {
+        "Равномерная сетка модели": None,
+        "Адаптивно, погрешность 0.1%": 1e-3,
+        "Адаптивно, погрешность 0.01%": 1e-4,
+    }
+
     def __init__(self):
         super().__init__()
+        self.perf_dialog = None
         self.init_ui()
         self.lotka_tab = None
         self.load_menu = None
+        self.export_thread = None
+
+        # Строка состояния: последние замеры этапов расчета (core.profiling)
+        self.perf_label = QLabel()
+        self.statusBar().addPermanentWidget(self.perf_label)
+        self.perf_timer = QTimer(self)
+        self.perf_timer.timeout.connect(self.update_perf_status)
+        self.perf_timer.start(REFRESH_INTERVAL)
+
+        # Очередь расчетов: видимая вкладка считается первой, число расчетов — в строке состояния
+        scheduler().queue_changed.connect(self.update_queue_status)
+        self.tabs.currentChanged.connect(lambda index: scheduler().set_focus(self.tabs.widget(index)))
+        scheduler().set_focus(self.tabs.currentWidget())
 
     def init_ui(self):
         self.setWindowTitle("Симуляция динамических систем")
@@ -54,11 +85,15 @@ class MainWindow(QMainWindow):
         self.SIR_tab = SIRTab()
         self.islm_tab = ISLMTab()
         self.lorenz_tab = LorenzTab()
+        self.sweep_tab = SweepTab()
+        self.stability_tab = StabilityTab()
         tabs.addTab(self.lotka_tab, "Лотка–Вольтерра")
         tabs.addTab(self.competing_species_tab, "Конкуренция видов")
         tabs.addTab(self.SIR_tab, "Распространение эпидемии")
         tabs.addTab(self.islm_tab, "IS-LM")
         tabs.addTab(self.lorenz_tab, "Аттрактор Лоренца")
+        tabs.addTab(self.sweep_tab, "Параметрический анализ")
+        tabs.addTab(self.stability_tab, "Устойчивость")
 
         main_layout.addWidget(tabs)
 
@@ -146,6 +181,10 @@ class MainWindow(QMainWindow):
             QMenu::item:selected {
                 background-color: #3C8DAD;
             }
+            QStatusBar {
+                background-color: #2E2E3F;
+                color: #AAAAAA;
+            }
         """)
 
     def create_menu_bar(self):
@@ -155,6 +194,7 @@ class MainWindow(QMainWindow):
     from datetime import datetime
     from functools import partial
 
+    @timed("menu.refresh")
     def refresh_menu_bar(self):
         """Красивое пересоздание меню с группировкой моделей."""
 
@@ -168,6 +208,14 @@ class MainWindow(QMainWindow):
         save_action.triggered.connect(self.save_current_calculation)
         file_menu.addAction(save_action)
 
+        export_action = QAction("🎞 Экспорт анимации...", self)
+        export_action.triggered.connect(self.export_animation)
+        file_menu.addAction(export_action)
+
+        batch_action = QAction("🖼 Пакетный экспорт графиков...", self)
+        batch_action.triggered.connect(self.export_batch)
+        file_menu.addAction(batch_action)
+
         file_menu.addSeparator()
 
         # -------- Загрузка --------
@@ -251,6 +299,10 @@ class MainWindow(QMainWindow):
                     if "rho" in calc:
                         params.append(f"ρ={calc['rho']}")
 
+                    # Параметрический анализ
+                    if "axes" in calc:
+                        params.append(f"{calc.get('sweep_title', '')}: {' × '.join(calc['axes'])}")
+
                     params_text = " ".join(params)
 
                     text = f"• {params_text} — {timestamp}"
@@ -266,6 +318,17 @@ class MainWindow(QMainWindow):
         clear_history_action.triggered.connect(self.clear_all_history)
         file_menu.addAction(clear_history_action)
 
+        # ========== НАСТРОЙКИ ==========
+        settings_menu = new_bar.addMenu("⚙ Настройки")
+        output_menu = settings_menu.addMenu("📈 Точки вывода")
+        output_group = QActionGroup(self)
+        for text, tolerance in self.OUTPUT_MODES.items():
+            action = QAction(text, self, checkable=True)
+            action.setChecked(config.OUTPUT_TOLERANCE == tolerance)
+            action.triggered.connect(lambda checked, tolerance=tolerance: self.set_output_tolerance(tolerance))
+            output_group.addAction(action)
+            output_menu.addAction(action)
+
         # ========== ПОМОЩЬ ==========
         help_menu = new_bar.addMenu("❓ Помощь")
 
@@ -274,6 +337,10 @@ class MainWindow(QMainWindow):
 
         help_menu.addAction(about_action)
 
+        perf_action = QAction("⏱ Производительность...", self)
+        perf_action.triggered.connect(self.show_performance)
+        help_menu.addAction(perf_action)
+
     def save_current_calculation(self):
         """Сохраняет текущий расчет"""
 
@@ -287,6 +354,86 @@ class MainWindow(QMainWindow):
             if success:
                 QTimer.singleShot(0, self.refresh_menu_bar)
 
+    def export_animation(self):
+        """Экспортирует анимацию траектории текущей вкладки в видео или GIF"""
+        if scheduler().is_busy(self, "export"):
+            QMessageBox.warning(self, "Экспорт", "Экспорт уже выполняется!")
+            return
+
+        current_tab = self.tabs.currentWidget()
+        charts = charts_for(getattr(current_tab, "MODEL_NAME", None))
+        if charts is None or not hasattr(charts, "ANIMATION") or not current_tab.t_data:
+            QMessageBox.warning(self, "Экспорт", "Сначала выполните расчет!")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Экспорт анимации", "animation.mp4",
+                                              "MP4 (*.mp4);;GIF (*.gif)")
+        if not path:
+            return
+
+        progress = QProgressDialog("Рендеринг кадров...", "Отмена", 0, 100, self)
+        progress.setWindowTitle("Экспорт анимации")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+
+        thread = AnimationExportThread(current_tab.current_record(), charts.ANIMATION, path)
+        thread.task_progress.connect(progress.setValue)
+        thread.task_finished.connect(lambda p: QMessageBox.information(self, "Экспорт", f"Анимация сохранена:\n{p}"))
+        thread.task_error.connect(lambda e: QMessageBox.critical(self, "Ошибка экспорта", e))
+        thread.finished.connect(progress.close)
+        progress.canceled.connect(lambda: scheduler().cancel(self, "export"))
+
+        self.export_thread = thread
+        scheduler().submit(self, thread, kind="export")
+
+    def export_batch(self):
+        """Экспортирует все графики выбранных сохраненных расчетов в PNG/SVG"""
+        if scheduler().is_busy(self, "export"):
+            QMessageBox.warning(self, "Экспорт", "Экспорт уже выполняется!")
+            return
+
+        calculations = get_all_calculations()
+        if not calculations:
+            QMessageBox.warning(self, "Экспорт", "Нет сохранённых расчётов!")
+            return
+
+        dialog = BatchExportDialog(calculations, self)
+        if dialog.exec() != dialog.DialogCode.Accepted:
+            return
+        selected = set(dialog.selected_ids())
+        if not selected:
+            return
+
+        out_dir = QFileDialog.getExistingDirectory(self, "Папка для графиков")
+        if not out_dir:
+            return
+
+        records = [calc for calc in calculations if calc["id"] in selected]
+
+        progress = QProgressDialog("Экспорт графиков...", "Отмена", 0, 100, self)
+        progress.setWindowTitle("Пакетный экспорт")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+
+        thread = BatchExportThread(records, out_dir, dialog.selected_format())
+        thread.task_progress.connect(progress.setValue)
+        thread.task_finished.connect(lambda results: self.on_batch_finished(results, out_dir))
+        thread.task_error.connect(lambda e: QMessageBox.critical(self, "Ошибка экспорта", e))
+        thread.finished.connect(progress.close)
+        progress.canceled.connect(lambda: scheduler().cancel(self, "export"))
+
+        self.export_thread = thread
+        scheduler().submit(self, thread, kind="export")
+
+    def on_batch_finished(self, results, out_dir):
+        n_files = sum(len(files) for files, errors in results.values())
+        errors = [e for files, errs in results.values() for e in errs]
+
+        text = f"Сохранено графиков: {n_files}\nПапка: {out_dir}"
+        if errors:
+            text += f"\n\nНе удалось построить ({len(errors)}):\n" + "\n".join(errors[:10])
+        QMessageBox.information(self, "Экспорт", text)
+
     def load_calculation(self, calc_id):
         """Загружает расчет по ID"""
 
@@ -296,64 +443,14 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Ошибка", "Расчет не найден!")
             return
 
-        model = calc.get("model_name")
-
-        # ---------- ЛОТКА ВОЛЬТЕРРА ----------
-        if model == "Лотка-Вольтерра":
-
-            for i in range(self.tabs.count()):
-                tab = self.tabs.widget(i)
-
-                if isinstance(tab, LotkaVolterraTab):
-                    self.tabs.setCurrentIndex(i)
-
-                    if tab.load_calculation_by_id(calc_id):
-                        QMessageBox.information(self, "Загрузка", "Расчет успешно загружен!")
-                    return
-
-        # ---------- КОНКУРЕНЦИЯ ВИДОВ ----------
-        if model == "Конкуренция видов":
-
-            for i in range(self.tabs.count()):
-                tab = self.tabs.widget(i)
-
-                if isinstance(tab, CompetingSpeciesTab):
-                    self.tabs.setCurrentIndex(i)
-
-                    if tab.load_calculation_by_id(calc_id):
-                        QMessageBox.information(self, "Загрузка", "Расчет успешно загружен!")
-
-                    return
-
-                # ---------- ЭПИДЕМИЯ SEIR ----------
-        if model == "Модель эпидемии SEIR":
-            for i in range(self.tabs.count()):
-                tab = self.tabs.widget(i)
-                if isinstance(tab, SIRTab):
-                    self.tabs.setCurrentIndex(i)
-                    if tab.load_calculation_by_id(calc_id):
-                        QMessageBox.information(self, "Загрузка", "Расчет успешно загружен!")
-                    return
-
-        # ----------- ISLM -------------
-        if model == "Макроэкономическая модель IS-LM":
-            for i in range(self.tabs.count()):
-                tab = self.tabs.widget(i)
-                if isinstance(tab, ISLMTab):
-                    self.tabs.setCurrentIndex(i)
-                    if tab.load_calculation_by_id(calc_id):
-                        QMessageBox.information(self, "Загрузка", "Расчет успешно загружен!")
-                    return
-
-        if model == "Система Лоренца":
-            for i in range(self.tabs.count()):
-                tab = self.tabs.widget(i)
-                # Проверяем, что это именно вкладка Лоренца
-                if isinstance(tab, LorenzTab):
-                    self.tabs.setCurrentIndex(i)
-                    if tab.load_calculation_by_id(calc_id):
-                        QMessageBox.information(self, "Загрузка", "Расчет успешно загружен!")
-                    return
+        # Вкладка, чья модель совпадает с model_name записи (MODEL_NAME берется из core.models)
+        for i in range(self.tabs.count()):
+            tab = self.tabs.widget(i)
+            if getattr(tab, "MODEL_NAME", None) == calc.get("model_name") and hasattr(tab, "load_calculation_by_id"):
+                self.tabs.setCurrentIndex(i)
+                if tab.load_calculation_by_id(calc_id):
+                    QMessageBox.information(self, "Загрузка", "Расчет успешно загружен!")
+                return
 
         QMessageBox.warning(self, "Ошибка", "Не удалось загрузить расчет!")
 
@@ -373,6 +470,33 @@ class MainWindow(QMainWindow):
 
             QMessageBox.information(self, "Очистка", "Вся история расчетов удалена!")
 
+    def update_perf_status(self):
+        text = status_text()
+        if text != self.perf_label.text():
+            self.perf_label.setText(text)
+
+    def set_output_tolerance(self, tolerance):
+        """Режим точек вывода для следующих расчетов вкладок"""
+        config.OUTPUT_TOLERANCE = tolerance
+
+    def update_queue_status(self, running, pending):
+        if running or pending:
+            self.statusBar().showMessage(f"⚙ Расчетов: {running} идет, {pending} в очереди")
+        else:
+            self.statusBar().clearMessage()
+
+    def closeEvent(self, event):
+        # Недосчитанные расчеты больше не нужны
+        scheduler().cancel_all()
+        super().closeEvent(event)
+
+    def show_performance(self):
+        """Окно со сводкой замеров времени и экспортом трассы"""
+        if self.perf_dialog is None:
+            self.perf_dialog = PerformanceDialog(self)
+        self.perf_dialog.show()
+        self.perf_dialog.raise_()
+
     def show_about(self):
         """Показывает информацию о программе"""
         QMessageBox.information(self, "О программе",
@@ -0,0 +1,109 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+    QPushButton, QHeaderView, QFileDialog, QMessageBox
+)
+from PyQt6.QtCore import Qt, QTimer
+
+from core import profiling
+
+# Этапы для строки состояния: имя замера -> подпись
+STATUS_STAGES = {
+    "solver.native": "Решатель",
+    "wolfram.evaluate": "Wolfram",
+    "result.convert": "Разбор",
+    "plot.batch": "Графики",
+    "db.save": "Сохранение",
+    "menu.refresh": "Меню",
+    "live.latency": "Отклик",
+}
+
+# Период обновления строки состояния и окна, мс
+REFRESH_INTERVAL = 500
+
+
+def format_duration(seconds):
+    return f"{seconds:.2f} с" if seconds >= 1 else f"{seconds * 1e3:.1f} мс"
+
+
+def status_text():
+    """Последние замеры основных этапов для строки состояния"""
+    parts = []
+    for name, label in STATUS_STAGES.items():
+        value = profiling.last(name)
+        if value is not None:
+            parts.append(f"{label} {format_duration(value)}")
+    return "⏱ " + " · ".join(parts) if parts else ""
+
+
+class PerformanceDialog(QDialog):
+    """Сводка замеров времени (core.profiling) и экспорт трассы Chrome"""
+
+    COLUMNS = ("Замер", "Вызовов", "Всего", "Среднее", "Максимум", "Последний")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Производительность")
+        self.resize(760, 480)
+        self.shown_version = None
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Время горячих путей с запуска программы (или со сброса):"))
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        controls = QHBoxLayout()
+        btn_reset = QPushButton("Сбросить")
+        btn_reset.clicked.connect(self.reset)
+        btn_export = QPushButton("💾 Экспорт трассы...")
+        btn_export.clicked.connect(self.export_trace)
+        btn_close = QPushButton("Закрыть")
+        btn_close.clicked.connect(self.close)
+        controls.addWidget(btn_reset)
+        controls.addWidget(btn_export)
+        controls.addStretch()
+        controls.addWidget(btn_close)
+        layout.addLayout(controls)
+        self.setLayout(layout)
+
+        # Пока окно открыто, сводка обновляется сама
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(REFRESH_INTERVAL)
+        self.refresh()
+
+    def refresh(self):
+        if self.shown_version == profiling.version:
+            return
+        self.shown_version = profiling.version
+
+        rows = profiling.summary()
+        self.table.setRowCount(len(rows))
+        for row, (name, stat) in enumerate(rows):
+            cells = (name, str(stat.count), format_duration(stat.total), format_duration(stat.mean),
+                     format_duration(stat.max), format_duration(stat.last))
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+    def reset(self):
+        profiling.reset()
+        self.refresh()
+
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Экспорт трассы", "trace.json", "Chrome Trace (*.json)")
+        if not path:
+            return
+        try:
+            count = profiling.export_chrome_trace(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Экспорт", f"Не удалось сохранить трассу: {e}")
+            return
+        QMessageBox.information(self, "Экспорт",
+                                f"Сохранено событий: {count}\n\nОткройте файл в chrome://tracing или ui.perfetto.dev")
@@ -0,0 +1,75 @@
+"""Карты устойчивости по сетке параметров (без зависимости от Qt)."""
+import numpy as np
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Patch
+
+from core.stability import lorenz_hopf_rho
+
+
+def _axes(calc):
+    return np.array(calc['x_values']), np.array(calc['y_values'])
+
+
+def _hopf_line(ax, calc):
+    """Аналитический порог Хопфа для Лоренца, если одна из осей — rho"""
+    if calc['stab_model'] != "lorenz" or 'rho' not in calc['axes']:
+        return
+    x, y = _axes(calc)
+    base = calc['base']
+    if calc['axes'] == ['sigma', 'rho']:
+        ax.plot(x, lorenz_hopf_rho(x, base['beta']), 'k--', linewidth=1.5, label='ρ_H (Хопф)')
+    elif calc['axes'] == ['beta', 'rho']:
+        ax.plot(x, lorenz_hopf_rho(base['sigma'], x), 'k--', linewidth=1.5, label='ρ_H (Хопф)')
+    elif calc['axes'][0] == 'rho':
+        ax.axvline(float(lorenz_hopf_rho(base['sigma'], base['beta'])), color='black', linestyle='--',
+                   label='ρ_H (Хопф)')
+    else:
+        return
+    ax.set_xlim(x[0], x[-1])
+    ax.set_ylim(y[0], y[-1])
+
+
+def draw_regimes(fig, calc):
+    x, y = _axes(calc)
+    codes = np.array(calc['codes'])
+    labels = calc['labels']
+
+    fig.subplots_adjust(bottom=0.12, top=0.62 if len(labels) > 4 else 0.75)
+    ax = fig.add_subplot(111)
+    colors = [f"C{i % 10}" for i in range(len(labels))]
+    ax.pcolormesh(x, y, codes.T, shading='auto', cmap=ListedColormap(colors), vmin=-0.5, vmax=len(labels) - 0.5)
+    _hopf_line(ax, calc)
+
+    handles = [Patch(color=color, label=label) for color, label in zip(colors, labels)]
+    handles += [h for h in ax.get_legend_handles_labels()[0]]
+    fig.legend(handles=handles, loc='upper center', fontsize=8, ncol=1, frameon=False)
+    ax.set_xlabel(calc['axes'][0])
+    ax.set_ylabel(calc['axes'][1])
+    ax.set_title(f"Режимы равновесий ({calc['stab_title']})", fontsize=10)
+
+
+def draw_abscissa(fig, calc):
+    x, y = _axes(calc)
+    values = np.array(calc['abscissa'], dtype=float)
+
+    fig.subplots_adjust(bottom=0.12)
+    ax = fig.add_subplot(111)
+    limit = (np.nanmax(np.abs(values)) if np.isfinite(values).any() else 0.0) or 1.0
+    mesh = ax.pcolormesh(x, y, values.T, shading='auto', cmap='RdBu_r', vmin=-limit, vmax=limit)
+    fig.colorbar(mesh, ax=ax, label='max Re λ')
+    # Граница устойчивости: max Re λ = 0
+    if np.nanmin(values) < 0 < np.nanmax(values):
+        ax.contour(x, y, values.T, levels=[0], colors='black', linewidths=1.5)
+    _hopf_line(ax, calc)
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend(loc='upper left', fontsize=8)
+    ax.set_xlabel(calc['axes'][0])
+    ax.set_ylabel(calc['axes'][1])
+    ax.set_title(f"Наибольшая Re λ: {calc['equilibrium']}")
+
+
+# Ключ вкладки -> (размер фигуры, функция отрисовки)
+CHARTS = {
+    "regimes": ((7, 6), draw_regimes),
+    "abscissa": ((7, 5), draw_abscissa),
+}
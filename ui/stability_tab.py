@@ -0,0 +1,183 @@
+import time
+
+import numpy as np
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
+    QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox, QTabWidget
+)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+from core.stability import EQUILIBRIUM_NAMES, MODEL_PARAMS, regime_map, spectral_abscissa
+from ui.figure_view import show_charts
+from ui.stability_charts import CHARTS
+from ui.sweep_tab import SWEEP_MODELS
+
+# Модели с изолированными равновесиями (у SEIR — целая линия равновесий)
+STABILITY_MODELS = {title: model for title, model in SWEEP_MODELS.items() if model[0] in MODEL_PARAMS}
+
+
+class StabilityTab(QWidget):
+    """Вкладка: Равновесия и устойчивость на сетке параметров (без интегрирования)"""
+
+    def __init__(self):
+        super().__init__()
+        self.render_thread = None
+        self.param_inputs = {}
+
+        self.init_ui()
+        self.on_model_changed()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        title = QLabel("Равновесия и устойчивость")
+        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        controls = QHBoxLayout()
+
+        self.model_combo = QComboBox()
+        self.model_combo.addItems(list(STABILITY_MODELS))
+        self.model_combo.currentTextChanged.connect(self.on_model_changed)
+
+        self.base_group = QGroupBox("Базовые параметры")
+        self.base_form = QFormLayout()
+        self.base_group.setLayout(self.base_form)
+
+        model_layout = QVBoxLayout()
+        model_layout.addWidget(self.model_combo)
+        model_layout.addWidget(self.base_group)
+        controls.addLayout(model_layout)
+
+        grid_group = QGroupBox("Сетка")
+        grid_form = QFormLayout()
+        self.axis1_combo = QComboBox()
+        self.axis1_min = QLineEdit()
+        self.axis1_max = QLineEdit()
+        self.axis2_combo = QComboBox()
+        self.axis2_min = QLineEdit()
+        self.axis2_max = QLineEdit()
+        self.axis1_combo.currentTextChanged.connect(lambda name: self.fill_range(name, self.axis1_min, self.axis1_max))
+        self.axis2_combo.currentTextChanged.connect(lambda name: self.fill_range(name, self.axis2_min, self.axis2_max))
+        self.points_input = QLineEdit("200")
+        self.equilibrium_combo = QComboBox()
+
+        grid_form.addRow("Параметр 1:", self.axis1_combo)
+        grid_form.addRow("от / до:", self.row(self.axis1_min, self.axis1_max))
+        grid_form.addRow("Параметр 2:", self.axis2_combo)
+        grid_form.addRow("от / до:", self.row(self.axis2_min, self.axis2_max))
+        grid_form.addRow("Точек на ось:", self.points_input)
+        grid_form.addRow("Равновесие для Re λ:", self.equilibrium_combo)
+        grid_group.setLayout(grid_form)
+        controls.addWidget(grid_group)
+
+        self.calc_button = QPushButton("Построить карты")
+        self.calc_button.clicked.connect(self.on_calculate)
+        self.time_label = QLabel("")
+
+        self.chart_tabs = QTabWidget()
+        self.regimes_tab = QWidget()
+        self.abscissa_tab = QWidget()
+        for tab in [self.regimes_tab, self.abscissa_tab]:
+            tab.setLayout(QVBoxLayout())
+        self.chart_tabs.addTab(self.regimes_tab, "Режимы")
+        self.chart_tabs.addTab(self.abscissa_tab, "Запас устойчивости")
+
+        layout.addWidget(title)
+        layout.addLayout(controls)
+        layout.addWidget(self.calc_button)
+        layout.addWidget(self.time_label)
+        layout.addWidget(self.chart_tabs, 1)
+        self.setLayout(layout)
+
+    @staticmethod
+    def row(*widgets):
+        box = QWidget()
+        box_layout = QHBoxLayout()
+        box_layout.setContentsMargins(0, 0, 0, 0)
+        for widget in widgets:
+            box_layout.addWidget(widget)
+        box.setLayout(box_layout)
+        return box
+
+    def model_key(self):
+        return STABILITY_MODELS[self.model_combo.currentText()][0]
+
+    def on_model_changed(self, *_):
+        key, defaults = STABILITY_MODELS[self.model_combo.currentText()]
+
+        while self.base_form.rowCount():
+            self.base_form.removeRow(0)
+        self.param_inputs = {}
+        for name in MODEL_PARAMS[key]:
+            self.param_inputs[name] = QLineEdit(str(defaults[name]))
+            self.base_form.addRow(f"{name}:", self.param_inputs[name])
+
+        names = list(MODEL_PARAMS[key])
+        self.axis1_combo.clear()
+        self.axis1_combo.addItems(names)
+        self.axis2_combo.clear()
+        self.axis2_combo.addItems(names)
+        self.axis2_combo.setCurrentIndex(1)
+
+        self.equilibrium_combo.clear()
+        self.equilibrium_combo.addItems(list(EQUILIBRIUM_NAMES[key]))
+        self.equilibrium_combo.setCurrentIndex(len(EQUILIBRIUM_NAMES[key]) - 1)
+
+    def fill_range(self, name, min_input, max_input):
+        """Диапазон по умолчанию: от половины до полутора базовых значений"""
+        if name not in self.param_inputs:
+            min_input.clear()
+            max_input.clear()
+            return
+        value = float(self.param_inputs[name].text())
+        min_input.setText(f"{value * 0.5:g}")
+        max_input.setText(f"{value * 1.5:g}" if value else "1")
+
+    def on_calculate(self):
+        try:
+            key = self.model_key()
+            base = {name: float(field.text()) for name, field in self.param_inputs.items()}
+            axes = [self.axis1_combo.currentText(), self.axis2_combo.currentText()]
+            if axes[0] == axes[1]:
+                raise ValueError("Параметры осей должны различаться")
+            n = int(self.points_input.text())
+            if n < 2:
+                raise ValueError("Нужно хотя бы 2 точки")
+
+            x = np.linspace(float(self.axis1_min.text()), float(self.axis1_max.text()), n)
+            y = np.linspace(float(self.axis2_min.text()), float(self.axis2_max.text()), n)
+            grid_x, grid_y = np.meshgrid(x, y, indexing="ij")
+            params = {**base, axes[0]: grid_x, axes[1]: grid_y}
+
+            started = time.perf_counter()
+            codes, labels = regime_map(key, params)
+            index = self.equilibrium_combo.currentIndex()
+            abscissa = spectral_abscissa(key, params, index)
+            elapsed = time.perf_counter() - started
+            self.time_label.setText(f"Сетка {n}×{n}: {elapsed * 1000:.0f} мс")
+        except Exception as e:
+            QMessageBox.critical(self, "Ошибка", f"Не удалось построить карты:\n{e}")
+            return
+
+        calc = {
+            'stab_model': key,
+            'stab_title': self.model_combo.currentText(),
+            'base': base,
+            'axes': axes,
+            'x_values': x.tolist(),
+            'y_values': y.tolist(),
+            'codes': codes.tolist(),
+            'labels': labels,
+            'abscissa': abscissa.tolist(),
+            'equilibrium': self.equilibrium_combo.currentText(),
+        }
+        for tab in [self.regimes_tab, self.abscissa_tab]:
+            layout = tab.layout()
+            while layout.count():
+                layout.takeAt(0).widget().deleteLater()
+        show_charts(self, calc, [
+            (self.regimes_tab, CHARTS["regimes"]),
+            (self.abscissa_tab, CHARTS["abscissa"]),
+        ])
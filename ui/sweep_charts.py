@@ -0,0 +1,52 @@
+"""Графики параметрического анализа (без зависимости от Qt)."""
+import numpy as np
+
+from core.sweep import METRICS
+
+
+def _metric(calc):
+    metric = calc.get('metric') or next(iter(calc['metrics']))
+    label = METRICS[calc['sweep_model']][metric][0]
+    return np.array(calc['metrics'][metric], dtype=float), label
+
+
+def draw_heatmap(fig, calc):
+    values, label = _metric(calc)
+    axes = calc['axes']
+    ax = fig.add_subplot(111)
+
+    # Одна ось — обычная кривая метрики
+    if len(axes) == 1:
+        x = np.array(calc['samples'][axes[0]])
+        order = np.argsort(x)
+        ax.plot(x[order], values[order], 'b-o', markersize=3)
+        ax.set_xlabel(axes[0])
+        ax.set_ylabel(label)
+
+    # Сетка — тепловая карта; незавершенные точки (NaN) остаются пустыми
+    elif calc['method'] == 'grid':
+        n = calc['n']
+        x = np.array(calc['samples'][axes[0]]).reshape(n, n)[:, 0]
+        y = np.array(calc['samples'][axes[1]]).reshape(n, n)[0, :]
+        mesh = ax.pcolormesh(x, y, values.reshape(n, n).T, shading='auto', cmap='viridis')
+        fig.colorbar(mesh, ax=ax, label=label)
+        ax.set_xlabel(axes[0])
+        ax.set_ylabel(axes[1])
+
+    # Латинский гиперкуб — облако точек, окрашенных по значению метрики
+    else:
+        done = np.isfinite(values)
+        points = ax.scatter(np.array(calc['samples'][axes[0]])[done], np.array(calc['samples'][axes[1]])[done],
+                            c=values[done], s=25, cmap='viridis')
+        fig.colorbar(points, ax=ax, label=label)
+        ax.set_xlabel(axes[0])
+        ax.set_ylabel(axes[1])
+
+    ax.set_title(f"{label} ({calc['sweep_title']})")
+    ax.grid(True, alpha=0.3)
+
+
+# Ключ вкладки -> (размер фигуры, функция отрисовки)
+CHARTS = {
+    "heatmap": ((7, 5), draw_heatmap),
+}
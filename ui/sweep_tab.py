@@ -0,0 +1,318 @@
+from datetime import datetime
+import time
+import uuid
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
+    QLabel, QLineEdit, QPushButton, QComboBox, QProgressBar, QMessageBox
+)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+from core.database import save_calculation, load_calculation
+from core.models import MODELS
+from core.native_solver import PARAM_NAMES
+from core.scheduler import scheduler
+from core.sweep import METRICS, grid_samples, latin_hypercube
+from core.sweep_thread import SweepThread
+from ui.figure_view import show_charts
+from ui.sweep_charts import CHARTS
+
+# Модель -> (ключ решателя, значения по умолчанию как на вкладках моделей)
+SWEEP_MODELS = {spec.title: (spec.key, spec.defaults) for spec in MODELS.values()}
+
+# Не чаще стольких секунд записываем промежуточные результаты в базу
+SAVE_INTERVAL = 1.0
+# и перерисовываем графики во время расчета (итоговые рисуются в on_finished)
+REDRAW_INTERVAL = 0.5
+
+NO_AXIS = "—"
+
+
+class SweepTab(QWidget):
+    """Вкладка: Параметрический анализ (метрики модели по сетке параметров)"""
+
+    MODEL_NAME = 'Параметрический анализ'
+
+    def __init__(self):
+        super().__init__()
+        self.sweep_thread = None
+        self.render_thread = None
+        self.record = None
+        self.last_save = 0.0
+        self.last_redraw = 0.0
+        self.param_inputs = {}
+        self.current_calc_id = None
+
+        self.init_ui()
+        self.on_model_changed()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        title = QLabel("Параметрический анализ")
+        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        controls = QHBoxLayout()
+
+        # ---------- Модель и базовые параметры ----------
+        self.model_combo = QComboBox()
+        self.model_combo.addItems(list(SWEEP_MODELS))
+        self.model_combo.currentTextChanged.connect(self.on_model_changed)
+
+        self.base_group = QGroupBox("Базовые параметры")
+        self.base_form = QFormLayout()
+        self.base_group.setLayout(self.base_form)
+
+        model_layout = QVBoxLayout()
+        model_layout.addWidget(self.model_combo)
+        model_layout.addWidget(self.base_group)
+        controls.addLayout(model_layout)
+
+        # ---------- Оси перебора ----------
+        sweep_group = QGroupBox("Перебор")
+        sweep_form = QFormLayout()
+
+        self.axis1_combo = QComboBox()
+        self.axis1_min = QLineEdit()
+        self.axis1_max = QLineEdit()
+        self.axis2_combo = QComboBox()
+        self.axis2_min = QLineEdit()
+        self.axis2_max = QLineEdit()
+        self.axis1_combo.currentTextChanged.connect(lambda name: self.fill_range(name, self.axis1_min, self.axis1_max))
+        self.axis2_combo.currentTextChanged.connect(lambda name: self.fill_range(name, self.axis2_min, self.axis2_max))
+
+        self.method_combo = QComboBox()
+        self.method_combo.addItems(["Сетка", "Латинский гиперкуб"])
+        self.points_input = QLineEdit("30")
+
+        self.metric_combo = QComboBox()
+        self.metric_combo.currentIndexChanged.connect(self.on_metric_changed)
+
+        sweep_form.addRow("Параметр 1:", self.axis1_combo)
+        sweep_form.addRow("от / до:", self.row(self.axis1_min, self.axis1_max))
+        sweep_form.addRow("Параметр 2:", self.axis2_combo)
+        sweep_form.addRow("от / до:", self.row(self.axis2_min, self.axis2_max))
+        sweep_form.addRow("Метод:", self.method_combo)
+        sweep_form.addRow("Точек (на ось для сетки):", self.points_input)
+        sweep_form.addRow("Метрика:", self.metric_combo)
+        sweep_group.setLayout(sweep_form)
+        controls.addWidget(sweep_group)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setRange(0, 100)
+
+        self.calc_button = QPushButton("Запустить анализ")
+        self.calc_button.clicked.connect(self.on_calculate)
+        self.stop_button = QPushButton("Стоп")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.on_stop)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.calc_button)
+        buttons.addWidget(self.stop_button)
+
+        self.chart_tab = QWidget()
+        self.chart_tab.setLayout(QVBoxLayout())
+
+        layout.addWidget(title)
+        layout.addLayout(controls)
+        layout.addWidget(self.progress_bar)
+        layout.addLayout(buttons)
+        layout.addWidget(self.chart_tab, 1)
+
+        self.setLayout(layout)
+
+    @staticmethod
+    def row(*widgets):
+        box = QWidget()
+        box_layout = QHBoxLayout()
+        box_layout.setContentsMargins(0, 0, 0, 0)
+        for widget in widgets:
+            box_layout.addWidget(widget)
+        box.setLayout(box_layout)
+        return box
+
+    def model_key(self):
+        return SWEEP_MODELS[self.model_combo.currentText()][0]
+
+    def on_model_changed(self, *_):
+        key, defaults = SWEEP_MODELS[self.model_combo.currentText()]
+
+        while self.base_form.rowCount():
+            self.base_form.removeRow(0)
+        self.param_inputs = {}
+        for name in PARAM_NAMES[key]:
+            self.param_inputs[name] = QLineEdit(str(defaults[name]))
+            self.base_form.addRow(f"{name}:", self.param_inputs[name])
+
+        names = list(PARAM_NAMES[key])
+        self.axis1_combo.clear()
+        self.axis1_combo.addItems(names)
+        self.axis2_combo.clear()
+        self.axis2_combo.addItems([NO_AXIS] + names)
+        if len(names) > 1:
+            self.axis2_combo.setCurrentIndex(2)
+
+        self.metric_combo.blockSignals(True)
+        self.metric_combo.clear()
+        for metric, (label, _) in METRICS[key].items():
+            self.metric_combo.addItem(label, metric)
+        self.metric_combo.blockSignals(False)
+
+    def fill_range(self, name, min_input, max_input):
+        """Диапазон по умолчанию: от половины до полутора базовых значений"""
+        if name not in self.param_inputs:
+            min_input.clear()
+            max_input.clear()
+            return
+        try:
+            value = float(self.param_inputs[name].text())
+        except ValueError:
+            # В поле параметра не число — диапазон не трогаем
+            return
+        min_input.setText(f"{value * 0.5:g}")
+        max_input.setText(f"{value * 1.5:g}" if value else "1")
+
+    def on_calculate(self):
+        try:
+            key = self.model_key()
+            base = {name: float(field.text()) for name, field in self.param_inputs.items()}
+
+            ranges = {self.axis1_combo.currentText(): (float(self.axis1_min.text()), float(self.axis1_max.text()))}
+            axis2 = self.axis2_combo.currentText()
+            if axis2 != NO_AXIS:
+                if axis2 in ranges:
+                    raise ValueError("Параметры осей должны различаться")
+                ranges[axis2] = (float(self.axis2_min.text()), float(self.axis2_max.text()))
+
+            n = int(self.points_input.text())
+            if n < 2:
+                raise ValueError("Нужно хотя бы 2 точки")
+
+            method = 'grid' if self.method_combo.currentIndex() == 0 else 'lhs'
+            samples = grid_samples(ranges, n) if method == 'grid' else latin_hypercube(ranges, n)
+            n_points = len(next(iter(samples.values())))
+
+            # Запись создается сразу и дополняется по мере прихода пачек
+            self.current_calc_id = str(uuid.uuid4())
+            self.record = {
+                'id': self.current_calc_id,
+                'model_name': self.MODEL_NAME,
+                'timestamp': datetime.now().isoformat(),
+                'sweep_model': key,
+                'sweep_title': self.model_combo.currentText(),
+                'method': method,
+                'n': n,
+                'base': base,
+                'axes': list(ranges),
+                'samples': {name: values.tolist() for name, values in samples.items()},
+                'metrics': {metric: [None] * n_points for metric in METRICS[key]},
+                'metric': self.metric_combo.currentData(),
+            }
+
+            self.calc_button.setEnabled(False)
+            self.calc_button.setText("⏳ Анализ...")
+            self.stop_button.setEnabled(True)
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setValue(0)
+
+            self.sweep_thread = SweepThread(key, base, samples)
+            self.sweep_thread.sweep_chunk.connect(self.on_chunk)
+            self.sweep_thread.task_finished.connect(self.on_finished)
+            self.sweep_thread.task_error.connect(self.on_error)
+            self.sweep_thread.finished.connect(self.on_thread_done)
+            scheduler().submit(self, self.sweep_thread)
+
+        except Exception as e:
+            self.on_error(str(e))
+
+    def on_stop(self):
+        # Из очереди поток снимается без запуска — finished от него не придет
+        if not scheduler().cancel(self):
+            self.on_thread_done()
+
+    def on_chunk(self, start, metrics, percent):
+        for metric, values in metrics.items():
+            self.record['metrics'][metric][start:start + len(values)] = values
+        self.progress_bar.setValue(percent)
+
+        # Промежуточные результаты сразу попадают в базу
+        now = time.monotonic()
+        if now - self.last_save >= SAVE_INTERVAL:
+            save_calculation(self.record)
+            self.last_save = now
+        if now - self.last_redraw >= REDRAW_INTERVAL:
+            self.plot_graphs()
+            self.last_redraw = now
+
+    def on_finished(self, results):
+        self.record['metrics'] = results
+        save_calculation(self.record)
+        self.plot_graphs()
+
+    def on_error(self, error):
+        self.on_thread_done()
+        QMessageBox.critical(self, "Ошибка", f"Не удалось выполнить анализ:\n{error}")
+
+    def on_thread_done(self):
+        self.calc_button.setEnabled(True)
+        self.calc_button.setText("Запустить анализ")
+        self.stop_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+
+    def on_metric_changed(self, *_):
+        if self.record is not None and self.metric_combo.currentData() in self.record['metrics']:
+            self.record['metric'] = self.metric_combo.currentData()
+            self.plot_graphs()
+
+    def plot_graphs(self):
+        layout = self.chart_tab.layout()
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget(): item.widget().deleteLater()
+
+        # Копия: пачки продолжают приходить, пока график рисуется в фоне
+        calc = dict(self.record)
+        calc['metrics'] = {metric: list(values) for metric, values in self.record['metrics'].items()}
+        show_charts(self, calc, [(self.chart_tab, CHARTS["heatmap"])])
+
+    # ================= СОХРАНЕНИЕ И ЗАГРУЗКА =================
+
+    def save_current_calculation(self):
+        if self.record is None:
+            QMessageBox.warning(self, "Предупреждение", "Нет данных для сохранения!")
+            return False
+
+        QMessageBox.information(self, "Сохранение", save_calculation(self.record))
+        return True
+
+    def load_calculation_by_id(self, calc_id):
+        calc = load_calculation(calc_id)
+        if calc:
+            self.current_calc_id = calc_id
+            self.record = dict(calc)
+
+            self.model_combo.setCurrentText(calc['sweep_title'])
+            for name, value in calc['base'].items():
+                if name in self.param_inputs:
+                    self.param_inputs[name].setText(str(value))
+            axes = calc['axes'] + [NO_AXIS]
+            self.axis1_combo.setCurrentText(axes[0])
+            self.axis2_combo.setCurrentText(axes[1])
+            for name, min_input, max_input in zip(axes, (self.axis1_min, self.axis2_min), (self.axis1_max, self.axis2_max)):
+                if name in calc['samples']:
+                    min_input.setText(f"{min(calc['samples'][name]):g}")
+                    max_input.setText(f"{max(calc['samples'][name]):g}")
+            self.method_combo.setCurrentIndex(0 if calc['method'] == 'grid' else 1)
+            self.points_input.setText(str(calc['n']))
+
+            self.metric_combo.blockSignals(True)
+            self.metric_combo.setCurrentIndex(max(0, self.metric_combo.findData(calc.get('metric'))))
+            self.metric_combo.blockSignals(False)
+
+            self.plot_graphs()
+            return True
+        return False
@@ -1,21 +1,35 @@
 from wolframclient.evaluation import WolframLanguageSession
 from wolframclient.language import wlexpr
 import atexit
+import threading
+
+from core.profiling import span
 
 class WolframConnector:
     def __init__(self, kernel_path=None):
-        if kernel_path:
-            self.session = WolframLanguageSession(kernel_path)
+        self.kernel_path = kernel_path
+        # Сессия запускается при первом запросе: встроенному решателю ядро не нужно
+        self.session = None
+        self._start_lock = threading.Lock()
+        atexit.register(self.close_session)
+
+    def _start_session(self):
+        if self.kernel_path:
+            self.session = WolframLanguageSession(self.kernel_path)
         else:
             self.session = WolframLanguageSession()  # если путь прописан в PATH
 
         print("✅ Wolfram session started")
-        atexit.register(self.close_session)
 
     def evaluate(self, expr: str):
         """Безопасное выполнение выражения"""
         try:
-            return self.session.evaluate(wlexpr(expr))
+            with self._start_lock:
+                if self.session is None:
+                    with span("wolfram.start"):
+                        self._start_session()
+            with span("wolfram.evaluate"):
+                return self.session.evaluate(wlexpr(expr))
         except Exception as e:
             print(f"❌ Wolfram error: {e}")
             return None